@@ -82,11 +82,49 @@ def register(subparsers: argparse._SubParsersAction) -> None:
         action="store_true",
         help="Disable fulltext extraction (default: enabled)",
     )
+    db_update.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for PDF extraction "
+        "(default: semantic_search.extraction.workers, or 1)",
+    )
     db_update.add_argument("--config-path", help="Path to semantic search config")
     db_update.add_argument("--db-path", help="Path to Zotero database file")
     _add_local_mode_arg(db_update)
     add_output_arg(db_update)
 
+    db_backfill = semantic_sub.add_parser(
+        "db-backfill",
+        help="Index PDF pages beyond pdf_max_pages, most recent items first",
+    )
+    db_backfill.add_argument(
+        "--limit", type=int, help="Maximum number of items to backfill (default: all)"
+    )
+    db_backfill.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for PDF extraction "
+        "(default: semantic_search.extraction.workers, or 1)",
+    )
+    db_backfill.add_argument("--config-path", help="Path to semantic search config")
+    _add_local_mode_arg(db_backfill)
+    add_output_arg(db_backfill)
+
+    db_gc = semantic_sub.add_parser(
+        "db-gc", help="Delete orphaned and stale documents from the index"
+    )
+    db_gc.add_argument(
+        "--dry-run", action="store_true", help="Only report what would be deleted"
+    )
+    db_gc.add_argument(
+        "--no-vacuum",
+        action="store_true",
+        help="Do not return freed space to the file system",
+    )
+    db_gc.add_argument("--config-path", help="Path to semantic search config")
+    _add_local_mode_arg(db_gc)
+    add_output_arg(db_gc)
+
     db_status = semantic_sub.add_parser("db-status", help="Show database status")
     db_status.add_argument("--config-path", help="Path to semantic search config")
     _add_local_mode_arg(db_status)
@@ -115,7 +153,7 @@ def register(subparsers: argparse._SubParsersAction) -> None:
 def run(args: argparse.Namespace) -> int:
     load_config()
     os.environ["ZOTERO_LOCAL"] = "true" if getattr(args, "local", True) else "false"
-    from zotero_mcp.services.zotero.semantic_search import create_semantic_search
+    from zotero_mcp.services.zotero.semantic_search import get_semantic_search
 
     if args.subcommand == "db-update":
         config_path = args.config_path
@@ -128,7 +166,10 @@ def run(args: argparse.Namespace) -> int:
             )
             _save_zotero_db_path_to_config(cfg_path, db_path)
 
-        search = create_semantic_search(config_path, db_path=db_path)
+        search = get_semantic_search(config_path, db_path=db_path)
+        workers = getattr(args, "workers", None)
+        if workers:
+            search.extraction_config["workers"] = max(1, workers)
         stats = search.update_database(
             force_full_rebuild=args.force_rebuild,
             scan_limit=args.scan_limit,
@@ -139,14 +180,30 @@ def run(args: argparse.Namespace) -> int:
         emit(args, {"operation": "db-update", "stats": stats, "success": not failed})
         return 1 if failed else 0
 
+    if args.subcommand == "db-backfill":
+        search = get_semantic_search(args.config_path)
+        if args.workers:
+            search.extraction_config["workers"] = max(1, args.workers)
+        stats = search.backfill_fulltext(max_items=args.limit)
+        failed = bool(stats.get("error"))
+        emit(args, {"operation": "db-backfill", "stats": stats, "success": not failed})
+        return 1 if failed else 0
+
+    if args.subcommand == "db-gc":
+        search = get_semantic_search(args.config_path)
+        stats = search.collect_garbage(dry_run=args.dry_run, vacuum=not args.no_vacuum)
+        failed = bool(stats.get("error"))
+        emit(args, {"operation": "db-gc", "stats": stats, "success": not failed})
+        return 1 if failed else 0
+
     if args.subcommand == "db-status":
-        search = create_semantic_search(args.config_path)
+        search = get_semantic_search(args.config_path)
         status = search.get_database_status()
         emit(args, status)
         return 0
 
     if args.subcommand == "db-inspect":
-        search = create_semantic_search(args.config_path)
+        search = get_semantic_search(args.config_path)
         col = search.chroma_client.collection
         if args.stats:
             emit(args, {"count": col.count()})
@@ -128,10 +128,10 @@ def run(args: argparse.Namespace) -> int:
 
         try:
             from zotero_mcp.services.zotero.semantic_search import (
-                create_semantic_search,
+                get_semantic_search,
             )
 
-            search = create_semantic_search()
+            search = get_semantic_search()
             status = search.get_database_status()
             payload["semantic_search"] = {
                 "status": "Initialized" if status.get("exists") else "Not Initialized",
@@ -212,7 +212,7 @@ def run(args: argparse.Namespace) -> int:
             }
 
         item_key = normalize_item_key(args.item_key)
-        item = await data_service.get_item(item_key)
+        item = await data_service.get_item(item_key, for_update=True)
         item_data = item.get("data", {})
         existing_tags = normalize_tag_names(item_data.get("tags", []))
         removed_status_tags = [
@@ -263,7 +263,7 @@ def run(args: argparse.Namespace) -> int:
 
     async def _delete_tags() -> dict[str, Any]:
         item_key = normalize_item_key(args.item_key)
-        item = await data_service.get_item(item_key)
+        item = await data_service.get_item(item_key, for_update=True)
         item_data = item.get("data", {})
         existing_tags = normalize_tag_names(item_data.get("tags", []))
 
@@ -331,7 +331,7 @@ def run(args: argparse.Namespace) -> int:
 
         for item in results:
             try:
-                full_item = await data_service.get_item(item.key)
+                full_item = await data_service.get_item(item.key, for_update=True)
                 item_data = full_item.get("data", {})
                 normalized_tag_names = normalize_tag_names(item_data.get("tags", []))
                 changed = False
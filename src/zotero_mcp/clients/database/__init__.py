@@ -1,8 +1,18 @@
 """Database clients - vector databases and caches."""
 
 from .chroma import ChromaClient, create_chroma_client
+from .compact_store import CompactVectorStore
+from .embedding_cache import EmbeddingCache
+from .file_lock import FileLock
+from .lexical_index import LexicalIndex
+from .manifest import IndexManifest
 
 __all__ = [
     "ChromaClient",
     "create_chroma_client",
+    "CompactVectorStore",
+    "EmbeddingCache",
+    "FileLock",
+    "LexicalIndex",
+    "IndexManifest",
 ]
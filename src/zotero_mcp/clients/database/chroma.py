@@ -5,12 +5,16 @@ This module provides persistent vector database storage and embedding functions
 for semantic search over Zotero libraries.
 """
 
+from collections import OrderedDict
+from collections.abc import Iterator
 from contextlib import contextmanager
 import json
 import logging
 import os
 from pathlib import Path
 import sys
+import threading
+import time
 from typing import Any
 
 import chromadb
@@ -18,8 +22,15 @@ from chromadb import EmbeddingFunction
 from chromadb.config import Settings
 import chromadb.utils.embedding_functions
 
+from .compact_store import VECTOR_DTYPES, CompactVectorStore, allocated_bytes
+from .embedding_cache import EmbeddingCache, content_hash, create_embedding_cache
+from .lexical_index import LexicalIndex
+
 logger = logging.getLogger(__name__)
 
+# "chroma": ChromaDB collection; "compact": quantized memmap (CompactVectorStore)
+VECTOR_BACKENDS = ("chroma", "compact")
+
 
 @contextmanager
 def suppress_stdout():
@@ -36,12 +47,19 @@ def suppress_stdout():
 class ChromaClient:
     """ChromaDB client for Zotero semantic search."""
 
+    # Query texts whose embeddings are kept in memory (LRU)
+    QUERY_EMBEDDING_CACHE_SIZE = 1024
+
     def __init__(
         self,
         collection_name: str = "zotero_library",
         persist_directory: str | None = None,
         embedding_model: str = "default",
         embedding_config: dict[str, Any] | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        vector_backend: str = "chroma",
+        vector_dtype: str = "int8",
+        exact_rescore: bool = False,
     ):
         """
         Initialize ChromaDB client.
@@ -51,8 +69,20 @@ class ChromaClient:
             persist_directory: Directory to persist the database
             embedding_model: Deprecated; local embedding is always used
             embedding_config: Deprecated; local embedding has no runtime config
+            embedding_cache: Cache of document embeddings (defaults to a
+                cache file next to the persist directory)
+            vector_backend: Engine storing the vectors, ``chroma`` or
+                ``compact`` (see CompactVectorStore)
+            vector_dtype: Storage type of the compact backend, ``int8`` or
+                ``float16``
+            exact_rescore: Keep a float32 copy of each vector in the compact
+                backend and re-rank its candidates with it
         """
         self.collection_name = collection_name
+        if vector_backend not in VECTOR_BACKENDS:
+            logger.warning(f"Unknown vector backend {vector_backend!r}, using ChromaDB")
+            vector_backend = "chroma"
+        self.vector_backend = vector_backend
         if embedding_model != "default":
             logger.warning(
                 "Ignoring embedding_model=%r; semantic search is local-only and "
@@ -76,6 +106,39 @@ class ChromaClient:
             persist_directory = str(config_dir / "chroma_db")
 
         self.persist_directory = persist_directory
+        persist_path = Path(persist_directory)
+        self.embedding_cache = embedding_cache or create_embedding_cache(
+            persist_path.parent / f"{persist_path.name}_embeddings.sqlite"
+        )
+        # The compact backend indexes its own documents for BM25 search
+        self.lexical_index: LexicalIndex | None = (
+            None
+            if self.vector_backend == "compact"
+            else LexicalIndex(
+                persist_path.parent
+                / f"{persist_path.name}_lexical"
+                / f"{self.collection_name}.sqlite"
+            )
+        )
+        self._query_embeddings: OrderedDict[str, Any] = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
+
+        if self.vector_backend == "compact":
+            # Skips opening ChromaDB, whose segments dominate cold start
+            if vector_dtype not in VECTOR_DTYPES:
+                logger.warning(f"Unknown vector dtype {vector_dtype!r}, using int8")
+                vector_dtype = "int8"
+            self.client = None
+            self.embedding_function = self._create_embedding_function()
+            self.collection = CompactVectorStore(
+                persist_path.parent
+                / f"{persist_path.name}_compact"
+                / self.collection_name,
+                embedding_function=self.embedding_function,
+                dtype=vector_dtype,
+                rescore=exact_rescore,
+            )
+            return
 
         # Initialize ChromaDB client with stdout suppression
         with suppress_stdout():
@@ -122,6 +185,93 @@ class ChromaClient:
         # Note: This is the all-MiniLM-L6-v2 model that runs locally
         return chromadb.utils.embedding_functions.DefaultEmbeddingFunction()
 
+    def _embedding_model_id(self) -> str:
+        """Identifier of the active embedding function, used as cache namespace."""
+        try:
+            return str(self.embedding_function.name())
+        except Exception:
+            return type(self.embedding_function).__name__
+
+    def _embed_documents(self, documents: list[str]) -> list[Any] | None:
+        """
+        Embed documents, reusing cached vectors for known texts.
+
+        Only texts missing from the embedding cache are passed to the
+        embedding function.
+
+        Args:
+            documents: Document texts
+
+        Returns:
+            One vector per document, or None to let ChromaDB embed the
+            documents itself (cache disabled or unavailable, or no
+            embedding function to call)
+        """
+        embedding_function = self.embedding_function
+        if self.embedding_cache is None or embedding_function is None or not documents:
+            return None
+
+        try:
+            model = self._embedding_model_id()
+            hashes = [content_hash(doc) for doc in documents]
+            vectors = self.embedding_cache.get_many(model, hashes)
+            texts = dict(zip(hashes, documents, strict=True))
+            missing = [key for key in texts if key not in vectors]
+            if missing:
+                embedded = embedding_function([texts[key] for key in missing])
+                new_vectors = dict(zip(missing, embedded, strict=True))
+                self.embedding_cache.put_many(model, new_vectors)
+                vectors.update(new_vectors)
+            logger.debug(
+                f"Embedding cache: {len(texts) - len(missing)} hits, "
+                f"{len(missing)} embedded"
+            )
+            return [vectors[key] for key in hashes]
+        except Exception as e:
+            logger.warning(f"Embedding cache unavailable, embedding directly: {e}")
+            return None
+
+    def _embed_queries(self, query_texts: list[str]) -> list[Any] | None:
+        """
+        Embed query texts through an in-memory LRU cache.
+
+        Agents repeat the same queries across turns; cached texts skip
+        ONNX inference entirely and the rest are embedded in one batch.
+
+        Args:
+            query_texts: Query texts
+
+        Returns:
+            One vector per query, or None to let ChromaDB embed the queries
+        """
+        embedding_function = self.embedding_function
+        if embedding_function is None or not query_texts:
+            return None
+
+        try:
+            with self._query_embeddings_lock:
+                vectors = {}
+                for text in query_texts:
+                    if text in self._query_embeddings:
+                        self._query_embeddings.move_to_end(text)
+                        vectors[text] = self._query_embeddings[text]
+            missing = [
+                text for text in dict.fromkeys(query_texts) if text not in vectors
+            ]
+            if missing:
+                embed = getattr(embedding_function, "embed_query", embedding_function)
+                embedded = embed(input=missing)
+                new_vectors = dict(zip(missing, embedded, strict=True))
+                vectors.update(new_vectors)
+                with self._query_embeddings_lock:
+                    self._query_embeddings.update(new_vectors)
+                    while len(self._query_embeddings) > self.QUERY_EMBEDDING_CACHE_SIZE:
+                        self._query_embeddings.popitem(last=False)
+            return [vectors[text] for text in query_texts]
+        except Exception as e:
+            logger.warning(f"Query embedding cache unavailable: {e}")
+            return None
+
     def add_documents(
         self,
         documents: list[str],
@@ -137,8 +287,14 @@ class ChromaClient:
             ids: List of unique IDs for each document
         """
         try:
-            self.collection.add(documents=documents, metadatas=metadatas, ids=ids)  # type: ignore[arg-type]
+            self.collection.add(
+                documents=documents,
+                metadatas=metadatas,  # type: ignore[arg-type]
+                ids=ids,
+                embeddings=self._embed_documents(documents),  # type: ignore[arg-type]
+            )
             logger.info(f"Added {len(documents)} documents to ChromaDB collection")
+            self._mirror_lexical(ids, documents, metadatas)
         except Exception as e:
             logger.error(f"Error adding documents to ChromaDB: {e}")
             raise
@@ -158,18 +314,115 @@ class ChromaClient:
             ids: List of unique IDs for each document
         """
         try:
-            self.collection.upsert(documents=documents, metadatas=metadatas, ids=ids)  # type: ignore[arg-type]
+            self.collection.upsert(
+                documents=documents,
+                metadatas=metadatas,  # type: ignore[arg-type]
+                ids=ids,
+                embeddings=self._embed_documents(documents),  # type: ignore[arg-type]
+            )
             logger.info(f"Upserted {len(documents)} documents to ChromaDB collection")
+            self._mirror_lexical(ids, documents, metadatas)
         except Exception as e:
             logger.error(f"Error upserting documents to ChromaDB: {e}")
             raise
 
+    def _mirror_lexical(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict[str, str | int | float | None]],
+    ) -> None:
+        """
+        Copy written documents into the lexical index.
+
+        Until a hybrid-mode update or the first lexical search builds the
+        index (see ensure_lexical_index), writes skip it so vector-only
+        setups never pay for the BM25 mirror.
+        """
+        index = self.lexical_index
+        if index is None:
+            return
+        try:
+            if not index.is_synced():
+                return
+            index.upsert(ids, documents, metadatas)
+        except Exception as e:
+            logger.warning(f"Lexical index update failed, will resync: {e}")
+            try:
+                index.set_synced(False)
+            except Exception:
+                pass
+
+    def ensure_lexical_index(self, page_size: int = 1000) -> float:
+        """
+        Build the lexical index from the collection if it is not in sync.
+
+        Index updates call this so that hybrid searches find the index
+        ready; a search that finds it out of sync builds it first.
+
+        Returns:
+            Seconds spent building (0.0 when the index was in sync)
+        """
+        index = self.lexical_index
+        if index is None or index.is_synced():
+            return 0.0
+
+        logger.info("Building lexical index from ChromaDB collection...")
+        started = time.perf_counter()
+        # An out-of-sync index may hold documents deleted since
+        index.clear()
+        index.set_synced(False)
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=["documents", "metadatas"],
+                limit=page_size,
+                offset=offset,
+            )
+            ids = page.get("ids") or []
+            if not ids:
+                break
+            index.upsert(
+                ids,
+                page.get("documents") or [""] * len(ids),
+                page.get("metadatas") or [None] * len(ids),
+            )
+            offset += len(ids)
+        index.set_synced(True)
+        seconds = time.perf_counter() - started
+        logger.info(f"Lexical index built with {offset} documents in {seconds:.2f}s")
+        return seconds
+
+    def lexical_search(
+        self,
+        query: str,
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        BM25 search over the collection's documents.
+
+        Args:
+            query: Search text
+            n_results: Number of results to return
+            where: Metadata filter conditions
+
+        Returns:
+            Hits with ``id``, ``document``, ``metadata`` and ``score``
+        """
+        if isinstance(self.collection, CompactVectorStore):
+            return self.collection.search_text(query, limit=n_results, where=where)
+        self.ensure_lexical_index()
+        assert self.lexical_index is not None
+        return self.lexical_index.search(query, limit=n_results, where=where)
+
     def search(
         self,
         query_texts: list[str],
         n_results: int = 10,
         where: dict[str, Any] | None = None,
         where_document: dict[str, Any] | None = None,
+        include: list[str] | None = None,
     ) -> dict[str, Any]:
         """
         Search for similar documents.
@@ -179,16 +432,25 @@ class ChromaClient:
             n_results: Number of results to return
             where: Metadata filter conditions
             where_document: Document content filter conditions
+            include: Result fields to return (ChromaDB default when None)
 
         Returns:
             Search results from ChromaDB
         """
         try:
+            kwargs: dict[str, Any] = {}
+            if include is not None:
+                kwargs["include"] = include
+            query_embeddings = self._embed_queries(query_texts)
+            if query_embeddings is not None:
+                kwargs["query_embeddings"] = query_embeddings
+            else:
+                kwargs["query_texts"] = query_texts
             results = self.collection.query(
-                query_texts=query_texts,
                 n_results=n_results,
                 where=where,
                 where_document=where_document,  # type: ignore[arg-type]
+                **kwargs,
             )
             logger.info(
                 f"Semantic search returned {len(results.get('ids', [[]])[0])} results"
@@ -208,20 +470,95 @@ class ChromaClient:
         try:
             self.collection.delete(ids=ids)
             logger.info(f"Deleted {len(ids)} documents from ChromaDB collection")
+            if self.lexical_index is not None and self.lexical_index.is_synced():
+                self.lexical_index.delete(ids)
         except Exception as e:
             logger.error(f"Error deleting documents from ChromaDB: {e}")
             raise
 
+    def iter_document_ids(self, page_size: int = 1000) -> Iterator[list[str]]:
+        """
+        Yield the ids of all documents in the collection, one page at a time.
+
+        Args:
+            page_size: Ids fetched per ``collection.get`` call
+
+        Yields:
+            Lists of document ids
+        """
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=[],  # type: ignore[arg-type]
+                limit=page_size,
+                offset=offset,
+            )
+            ids = list(page.get("ids") or [])
+            if not ids:
+                return
+            yield ids
+            offset += len(ids)
+
+    def storage_bytes(self) -> int:
+        """Disk space allocated to the vector store and the lexical index."""
+        if isinstance(self.collection, CompactVectorStore):
+            return self.collection.storage_bytes()
+        total = sum(
+            allocated_bytes(path)
+            for path in Path(self.persist_directory).rglob("*")
+            if path.is_file()
+        )
+        assert self.lexical_index is not None
+        index_path = self.lexical_index.index_path
+        return total + sum(
+            allocated_bytes(path)
+            for path in index_path.parent.glob(f"{index_path.name}*")
+            if path.is_file()
+        )
+
+    def vacuum(self) -> None:
+        """
+        Return space freed by deleted documents to the file system.
+
+        ChromaDB's own files are left alone: rewriting chroma.sqlite3 under
+        a live PersistentClient (which other processes may share) can
+        corrupt it, and SQLite reuses the freed pages for new documents.
+        """
+        try:
+            if isinstance(self.collection, CompactVectorStore):
+                self.collection.vacuum()
+            if self.lexical_index is not None and self.lexical_index.is_synced():
+                self.lexical_index.vacuum()
+        except Exception as e:
+            logger.warning(f"Vacuuming the vector store failed: {e}")
+
+    def close(self) -> None:
+        """
+        Close the compact store, lexical index and embedding cache files.
+
+        ChromaDB shares one system per persist directory between clients,
+        so a PersistentClient is left to other clients of the directory.
+        """
+        if isinstance(self.collection, CompactVectorStore):
+            self.collection.close()
+        if self.lexical_index is not None:
+            self.lexical_index.close()
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+
     def get_collection_info(self) -> dict[str, Any]:
         """Get information about the collection."""
         try:
             count = self.collection.count()
-            return {
+            info = {
                 "name": self.collection_name,
                 "count": count,
                 "embedding_model": self.embedding_model,
                 "persist_directory": self.persist_directory,
+                "vector_backend": self.vector_backend,
             }
+            info["storage_bytes"] = self.storage_bytes()
+            return info
         except Exception as e:
             logger.error(f"Error getting collection info: {e}")
             return {
@@ -235,10 +572,16 @@ class ChromaClient:
     def reset_collection(self) -> None:
         """Reset (clear) the collection."""
         try:
-            self.client.delete_collection(name=self.collection_name)
-            self.collection = self.client.create_collection(
-                name=self.collection_name, embedding_function=self.embedding_function
-            )
+            if isinstance(self.collection, CompactVectorStore):
+                self.collection.reset()
+            else:
+                self.client.delete_collection(name=self.collection_name)
+                self.collection = self.client.create_collection(
+                    name=self.collection_name,
+                    embedding_function=self.embedding_function,
+                )
+            if self.lexical_index is not None and self.lexical_index.is_synced():
+                self.lexical_index.clear()
             logger.info(f"Reset ChromaDB collection '{self.collection_name}'")
         except Exception as e:
             logger.error(f"Error resetting collection: {e}")
@@ -275,6 +618,9 @@ def create_chroma_client(config_path: str | None = None) -> ChromaClient:
     """
     Create a ChromaClient instance from configuration.
 
+    The vector engine is chosen by ``semantic_search.vector_store``, e.g.
+    ``{"backend": "compact", "dtype": "int8", "rescore": false}``.
+
     Args:
         config_path: Path to configuration file
 
@@ -282,8 +628,11 @@ def create_chroma_client(config_path: str | None = None) -> ChromaClient:
         Configured ChromaClient instance
     """
     # Default configuration
-    config = {
+    config: dict[str, Any] = {
         "collection_name": "zotero_library",
+        "vector_backend": "chroma",
+        "vector_dtype": "int8",
+        "exact_rescore": False,
     }
 
     # Load configuration from file if it exists
@@ -306,9 +655,20 @@ def create_chroma_client(config_path: str | None = None) -> ChromaClient:
                         )
                     if semantic_cfg.get("collection_name"):
                         config["collection_name"] = semantic_cfg["collection_name"]
+                    store_cfg = semantic_cfg.get("vector_store")
+                    if isinstance(store_cfg, dict):
+                        if store_cfg.get("backend"):
+                            config["vector_backend"] = str(store_cfg["backend"])
+                        if store_cfg.get("dtype"):
+                            config["vector_dtype"] = str(store_cfg["dtype"])
+                        if "rescore" in store_cfg:
+                            config["exact_rescore"] = bool(store_cfg["rescore"])
         except Exception as e:
             logger.warning(f"Error loading config from {config_path}: {e}")
 
     return ChromaClient(
         collection_name=str(config["collection_name"]),
+        vector_backend=config["vector_backend"],
+        vector_dtype=config["vector_dtype"],
+        exact_rescore=config["exact_rescore"],
     )
@@ -0,0 +1,859 @@
+"""
+Compact vector store with quantized, memory-mapped embeddings.
+
+A ChromaDB directory holding a fulltext index grows to several GB, and the
+HNSW segments are loaded before the first query can run. This store keeps
+one int8 (or float16) row per document in a numpy memmap, documents and
+metadata in a sidecar SQLite database, and answers queries with a chunked,
+vectorized exact scan. Opening it only maps the file.
+
+Optionally a float32 copy of each vector is kept in a second memmap that
+is only read for the top candidates of a query, to re-rank them exactly.
+The BM25 index for hybrid search is an external-content FTS5 table over
+the sidecar's documents, built on the first lexical search, so document
+text is stored once.
+
+The CLI and the server may open the same store, so writes hold an
+exclusive file lock and reads a shared one, and each process reloads the
+store layout when another one has committed changes.
+
+It implements the subset of the ChromaDB collection API used by
+ChromaClient, so either engine can sit behind the client.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any
+
+import numpy as np
+
+from .file_lock import FileLock
+from .lexical_index import build_lexical_query
+from .where import where_to_sql
+
+logger = logging.getLogger(__name__)
+
+VECTOR_DTYPES: dict[str, type[np.generic]] = {
+    "int8": np.int8,
+    "float16": np.float16,
+}
+
+
+class CompactVectorStore:
+    """ChromaDB-compatible collection backed by a quantized memmap."""
+
+    # Rows added to the vector file at least when it has to grow
+    MIN_GROWTH_ROWS = 1024
+    # Rows dequantized per step of a scan, bounding scratch memory
+    SCAN_CHUNK_ROWS = 32768
+    # Candidates re-ranked per requested result when exact rescoring is on
+    RESCORE_FACTOR = 4
+
+    DEFAULT_INCLUDE = ["metadatas", "documents", "distances"]
+
+    def __init__(
+        self,
+        directory: str | Path,
+        embedding_function: Callable[..., Any] | None = None,
+        dtype: str = "int8",
+        rescore: bool = False,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the vector file and sidecar database
+            embedding_function: Embeds texts when no embeddings are given
+            dtype: Storage type of new stores, ``int8`` or ``float16``
+                (an existing store keeps the type it was created with)
+            rescore: Keep float32 copies of new stores' vectors and re-rank
+                the quantized top candidates with them (an existing store
+                keeps the layout it was created with)
+        """
+        if dtype not in VECTOR_DTYPES:
+            raise ValueError(
+                f"Unsupported vector dtype {dtype!r}; "
+                f"expected one of {sorted(VECTOR_DTYPES)}"
+            )
+        self.directory = Path(directory)
+        self.embedding_function = embedding_function
+        self.rescore = rescore
+        self._requested_dtype = dtype
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+        self._vectors: np.memmap | None = None
+        self._scales: np.memmap | None = None
+        self._exact: np.memmap | None = None
+        self._free_slots: list[int] | None = None
+        self._state: dict[str, Any] | None = None
+        self._data_version: int | None = None
+        self._file_lock = FileLock(self.directory / "store.lock")
+
+    # -------------------- Storage --------------------
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.directory / "vectors.bin"
+
+    @property
+    def _scales_path(self) -> Path:
+        return self.directory / "scales.bin"
+
+    @property
+    def _exact_path(self) -> Path:
+        return self.directory / "exact.bin"
+
+    @contextmanager
+    def _locked(self, shared: bool = False) -> Iterator[None]:
+        """
+        Hold the thread lock and the store's file lock.
+
+        Cached layout is dropped when another connection (usually another
+        process) committed since the last look, so slots are never
+        allocated from, or read through, a stale row count or mapping.
+        """
+        with self._lock, self._file_lock.hold(shared=shared):
+            data_version = (
+                self._get_connection().execute("PRAGMA data_version").fetchone()[0]
+            )
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self._state = self._free_slots = None
+                self._vectors = self._scales = self._exact = None
+            yield
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the sidecar connection, creating the schema if needed."""
+        if self._connection is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.directory / "store.sqlite", check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS docs (
+                    slot INTEGER PRIMARY KEY,
+                    doc_id TEXT NOT NULL UNIQUE,
+                    document TEXT NOT NULL,
+                    metadata TEXT NOT NULL
+                );
+                """
+            )
+            self._connection = conn
+        return self._connection
+
+    def _load_state(self) -> dict[str, Any]:
+        """Read dimension, storage type, capacity and row count."""
+        if self._state is None:
+            meta = dict(self._get_connection().execute("SELECT name, value FROM meta"))
+            dtype = meta.get("dtype", self._requested_dtype)
+            if dtype != self._requested_dtype:
+                logger.warning(
+                    f"Compact vector store at {self.directory} uses {dtype}; "
+                    f"ignoring requested {self._requested_dtype} until it is reset"
+                )
+            # Stores created before exact vectors existed have no flag
+            exact = int(meta.get("exact", 0)) if "dim" in meta else int(self.rescore)
+            if exact != int(self.rescore) and "dim" in meta:
+                logger.warning(
+                    f"Compact vector store at {self.directory} "
+                    f"{'keeps' if exact else 'has no'} exact vectors; "
+                    f"ignoring rescore={self.rescore} until it is reset"
+                )
+            self._state = {
+                "dim": int(meta["dim"]) if "dim" in meta else None,
+                "dtype": dtype,
+                "exact": exact,
+                "capacity": int(meta.get("capacity", 0)),
+                "rows": int(meta.get("rows", 0)),
+            }
+        return self._state
+
+    def _save_state(self) -> None:
+        state = self._load_state()
+        self._get_connection().executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [(name, str(value)) for name, value in state.items() if value is not None],
+        )
+
+    def _row_files(self) -> list[tuple[Path, np.dtype, int]]:
+        """Path, element type and elements per row of each per-row file."""
+        state = self._load_state()
+        files = [
+            (self._vectors_path, np.dtype(VECTOR_DTYPES[state["dtype"]]), state["dim"]),
+            (self._scales_path, np.dtype(np.float32), 1),
+        ]
+        if state["exact"]:
+            files.append((self._exact_path, np.dtype(np.float32), state["dim"]))
+        return files
+
+    def _map_files(self) -> None:
+        """Memory-map the vector, scale and exact files at the current capacity."""
+        state = self._load_state()
+        self._vectors = self._scales = self._exact = None
+        if not state["capacity"]:
+            return
+        self._vectors = np.memmap(
+            self._vectors_path,
+            dtype=VECTOR_DTYPES[state["dtype"]],
+            mode="r+",
+            shape=(state["capacity"], state["dim"]),
+        )
+        self._scales = np.memmap(
+            self._scales_path,
+            dtype=np.float32,
+            mode="r+",
+            shape=(state["capacity"],),
+        )
+        if state["exact"]:
+            self._exact = np.memmap(
+                self._exact_path,
+                dtype=np.float32,
+                mode="r+",
+                shape=(state["capacity"], state["dim"]),
+            )
+
+    def _arrays(self) -> tuple[np.memmap, np.memmap] | None:
+        """Mapped vectors and scales, or None while the store is empty."""
+        if self._vectors is None and self._load_state()["capacity"]:
+            self._map_files()
+        if self._vectors is None or self._scales is None:
+            return None
+        return self._vectors, self._scales
+
+    def _ensure_capacity(self, rows: int) -> None:
+        """Grow the vector and scale files to hold at least ``rows`` rows."""
+        state = self._load_state()
+        if rows <= state["capacity"]:
+            return
+
+        capacity = max(rows, state["capacity"] * 2, self.MIN_GROWTH_ROWS)
+        self._flush()
+        self._vectors = self._scales = self._exact = None
+        for path, dtype, width in self._row_files():
+            # New bytes read as zero, and a zero scale marks a free slot
+            with open(path, "r+b" if path.exists() else "w+b") as f:
+                f.truncate(capacity * dtype.itemsize * width)
+        state["capacity"] = capacity
+        self._map_files()
+        logger.debug(f"Compact vector store grown to {capacity} rows")
+
+    def _flush(self) -> None:
+        for array in (self._vectors, self._scales, self._exact):
+            if array is not None:
+                array.flush()
+
+    def _take_free_slots(self, count: int) -> list[int]:
+        """Allocate slots, reusing those freed by deletes first."""
+        state = self._load_state()
+        if self._free_slots is None:
+            arrays = self._arrays()
+            self._free_slots = (
+                np.flatnonzero(arrays[1][: state["rows"]] == 0).tolist()
+                if arrays
+                else []
+            )
+        reused = self._free_slots[:count]
+        del self._free_slots[:count]
+        start = state["rows"]
+        state["rows"] += count - len(reused)
+        return reused + list(range(start, state["rows"]))
+
+    def _quantize(self, vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Convert float vectors to the storage type and per-row scales."""
+        if self._load_state()["dtype"] == "float16":
+            return vectors.astype(np.float16), np.ones(len(vectors), np.float32)
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        # A positive scale marks the slot as live, even for a zero vector
+        scales = np.maximum(scales, np.finfo(np.float32).tiny).astype(np.float32)
+        quantized = np.rint(vectors / scales[:, None]).clip(-127, 127)
+        return quantized.astype(np.int8), scales
+
+    @staticmethod
+    def _dequantize(rows: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        return rows.astype(np.float32) * scales[:, None]
+
+    # -------------------- Collection API --------------------
+
+    def count(self) -> int:
+        """Number of stored documents."""
+        with self._locked(shared=True):
+            return (
+                self._get_connection()
+                .execute("SELECT COUNT(*) FROM docs")
+                .fetchone()[0]
+            )
+
+    def add(self, **kwargs: Any) -> None:
+        """Add documents (existing ids are overwritten)."""
+        self.upsert(**kwargs)
+
+    def upsert(
+        self,
+        ids: list[str],
+        documents: list[str] | None = None,
+        metadatas: Sequence[dict[str, Any] | None] | None = None,
+        embeddings: Sequence[Any] | None = None,
+    ) -> None:
+        """
+        Insert or replace documents.
+
+        Args:
+            ids: Document ids
+            documents: Document texts
+            metadatas: Document metadata
+            embeddings: Document vectors (embedded from documents when None)
+        """
+        if not ids:
+            return
+        documents = documents or [""] * len(ids)
+        metadatas = metadatas or [None] * len(ids)
+        if embeddings is None:
+            if self.embedding_function is None:
+                raise ValueError(
+                    "Embeddings are required without an embedding function"
+                )
+            embeddings = self.embedding_function(documents)
+        vectors = np.asarray(embeddings, dtype=np.float32)
+
+        with self._locked():
+            state = self._load_state()
+            if state["dim"] is None:
+                state["dim"] = int(vectors.shape[1])
+            elif vectors.shape[1] != state["dim"]:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match "
+                    f"the store dimension {state['dim']}"
+                )
+
+            conn = self._get_connection()
+            existing = dict(
+                conn.execute(
+                    "SELECT doc_id, slot FROM docs "
+                    "WHERE doc_id IN (SELECT value FROM json_each(?))",
+                    (json.dumps(ids),),
+                )
+            )
+            new_ids = [
+                doc_id for doc_id in dict.fromkeys(ids) if doc_id not in existing
+            ]
+            existing.update(
+                zip(new_ids, self._take_free_slots(len(new_ids)), strict=True)
+            )
+            slots = np.array([existing[doc_id] for doc_id in ids], dtype=np.int64)
+            self._ensure_capacity(state["rows"])
+
+            quantized, scales = self._quantize(vectors)
+            arrays = self._arrays()
+            assert arrays is not None
+            arrays[0][slots] = quantized
+            arrays[1][slots] = scales
+            if self._exact is not None:
+                self._exact[slots] = vectors
+            self._flush()
+
+            # An upsert (not REPLACE) keeps the text index triggers firing
+            conn.executemany(
+                "INSERT INTO docs VALUES (?, ?, ?, ?) ON CONFLICT (slot) DO UPDATE "
+                "SET doc_id = excluded.doc_id, document = excluded.document, "
+                "metadata = excluded.metadata",
+                [
+                    (int(slot), doc_id, document or "", json.dumps(metadata or {}))
+                    for slot, doc_id, document, metadata in zip(
+                        slots, ids, documents, metadatas, strict=True
+                    )
+                ],
+            )
+            self._save_state()
+            conn.commit()
+
+    def delete(
+        self,
+        ids: list[str] | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Delete documents by id and/or metadata filter.
+
+        Args:
+            ids: Document ids
+            where: ChromaDB-style metadata filter
+        """
+        if ids is None and not where:
+            return
+        with self._locked():
+            rows = self._select(ids=ids, where=where, columns="slot")
+            slots = [row[0] for row in rows]
+            if not slots:
+                return
+            arrays = self._arrays()
+            if arrays is not None:
+                arrays[1][np.array(slots, dtype=np.int64)] = 0
+                self._flush()
+            conn = self._get_connection()
+            conn.execute(
+                "DELETE FROM docs WHERE slot IN (SELECT value FROM json_each(?))",
+                (json.dumps(slots),),
+            )
+            conn.commit()
+            if self._free_slots is not None:
+                self._free_slots.extend(slots)
+
+    def get(
+        self,
+        ids: list[str] | None = None,
+        where: dict[str, Any] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        include: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch documents by id and/or metadata filter, in storage order.
+
+        Args:
+            ids: Document ids
+            where: ChromaDB-style metadata filter
+            limit: Maximum number of documents
+            offset: Number of matching documents to skip
+            include: Fields to return (metadatas and documents by default)
+
+        Returns:
+            Dict with ``ids`` and the included fields
+        """
+        include = ["metadatas", "documents"] if include is None else include
+        with self._locked(shared=True):
+            rows = self._select(
+                ids=ids,
+                where=where,
+                columns="slot, doc_id, document, metadata",
+                limit=limit,
+                offset=offset,
+            )
+            result: dict[str, Any] = {"ids": [row[1] for row in rows]}
+            if "documents" in include:
+                result["documents"] = [row[2] for row in rows]
+            if "metadatas" in include:
+                result["metadatas"] = [json.loads(row[3]) for row in rows]
+            if "embeddings" in include:
+                result["embeddings"] = list(
+                    self._read_vectors([row[0] for row in rows])
+                )
+        return result
+
+    def query(
+        self,
+        query_embeddings: Sequence[Any] | None = None,
+        query_texts: list[str] | None = None,
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+        where_document: dict[str, Any] | None = None,
+        include: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Find the nearest documents of each query by squared L2 distance.
+
+        Args:
+            query_embeddings: Query vectors
+            query_texts: Query texts, embedded when no vectors are given
+            n_results: Results per query
+            where: ChromaDB-style metadata filter
+            where_document: ``$contains`` / ``$not_contains`` document filter
+            include: Fields to return (metadatas, documents and distances by
+                default; ``embeddings`` returns the dequantized vectors)
+
+        Returns:
+            ChromaDB-shaped results with one inner list per query
+        """
+        include = self.DEFAULT_INCLUDE if include is None else include
+        if query_embeddings is None:
+            if self.embedding_function is None or query_texts is None:
+                raise ValueError(
+                    "Query embeddings or texts with an embedding function are required"
+                )
+            embed = getattr(
+                self.embedding_function, "embed_query", self.embedding_function
+            )
+            query_embeddings = embed(input=query_texts)
+        queries = np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32))
+
+        with self._locked(shared=True):
+            candidates = None
+            if where or where_document:
+                candidates = np.array(
+                    [
+                        row[0]
+                        for row in self._select(
+                            where=where, where_document=where_document, columns="slot"
+                        )
+                    ],
+                    dtype=np.int64,
+                )
+            exact = bool(self._load_state()["exact"])
+            fetch = n_results * self.RESCORE_FACTOR if exact else n_results
+            ranked = self._scan(queries, candidates, fetch)
+            hit_slots = sorted({int(slot) for slots, _ in ranked for slot in slots})
+            rows = {
+                row[0]: row
+                for row in self._select(
+                    slots=hit_slots, columns="slot, doc_id, document, metadata"
+                )
+            }
+            vectors = dict(zip(hit_slots, self._read_vectors(hit_slots), strict=True))
+            per_query = []
+            for query, (slots, distances) in zip(queries, ranked, strict=True):
+                hits = [
+                    (float(distance), rows[int(slot)])
+                    for slot, distance in zip(slots, distances, strict=True)
+                    if int(slot) in rows
+                ]
+                if exact and hits:
+                    hits = self._rescore(query, hits)
+                per_query.append(hits[:n_results])
+
+        results: dict[str, list[list[Any]]] = {"ids": []}
+        for field in ("documents", "metadatas", "distances", "embeddings"):
+            if field in include:
+                results[field] = []
+        for hits in per_query:
+            results["ids"].append([row[1] for _, row in hits])
+            if "documents" in results:
+                results["documents"].append([row[2] for _, row in hits])
+            if "metadatas" in results:
+                results["metadatas"].append([json.loads(row[3]) for _, row in hits])
+            if "distances" in results:
+                results["distances"].append([distance for distance, _ in hits])
+            if "embeddings" in results:
+                results["embeddings"].append([vectors[row[0]] for _, row in hits])
+        return results
+
+    def reset(self) -> None:
+        """Remove all documents and the vector files."""
+        with self._locked():
+            self._vectors = self._scales = self._exact = None
+            for path in (self._vectors_path, self._scales_path, self._exact_path):
+                path.unlink(missing_ok=True)
+            conn = self._get_connection()
+            conn.executescript("DELETE FROM docs; DELETE FROM meta;")
+            conn.commit()
+            self._state = None
+            self._free_slots = None
+
+    def close(self) -> None:
+        """Flush the vector files and close the sidecar connection."""
+        with self._lock:
+            self._flush()
+            self._vectors = self._scales = self._exact = None
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+            self._data_version = None
+
+    def vacuum(self) -> None:
+        """
+        Return space freed by deletes to the file system.
+
+        Live rows stored past the live row count are moved into freed
+        slots, the vector files are truncated to the live rows and the
+        sidecar database is vacuumed.
+        """
+        with self._locked():
+            conn = self._get_connection()
+            state = self._load_state()
+            arrays = self._arrays()
+            if arrays is not None:
+                vectors, scales = arrays
+                live = self.count()
+                moved = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT slot FROM docs WHERE slot >= ? ORDER BY slot", (live,)
+                    )
+                ]
+                holes = np.flatnonzero(scales[:live] == 0)[: len(moved)].tolist()
+                if moved:
+                    vectors[holes] = vectors[moved]
+                    scales[holes] = scales[moved]
+                    if self._exact is not None:
+                        self._exact[holes] = self._exact[moved]
+                    conn.executemany(
+                        "UPDATE docs SET slot = ? WHERE slot = ?",
+                        zip(holes, moved, strict=True),
+                    )
+                self._flush()
+                self._vectors = self._scales = self._exact = None
+                for path, dtype, width in self._row_files():
+                    with open(path, "r+b") as f:
+                        f.truncate(live * dtype.itemsize * width)
+                state["rows"] = state["capacity"] = live
+                self._free_slots = None
+                self._save_state()
+                conn.commit()
+                self._map_files()
+            if self._has_text_index(conn):
+                conn.execute("INSERT INTO docs_fts (docs_fts) VALUES ('optimize')")
+                conn.commit()
+            conn.execute("VACUUM")
+            # In WAL mode the rewritten pages land in the log first
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def storage_bytes(self) -> int:
+        """Disk space allocated to the vector files and sidecar database."""
+        return sum(
+            allocated_bytes(path) for path in self.directory.glob("*") if path.is_file()
+        )
+
+    # -------------------- Text search --------------------
+
+    @staticmethod
+    def _has_text_index(conn: sqlite3.Connection) -> bool:
+        return (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'docs_fts'"
+            ).fetchone()
+            is not None
+        )
+
+    def _ensure_text_index(self) -> None:
+        """Create the BM25 index over the stored documents on first use."""
+        conn = self._get_connection()
+        if self._has_text_index(conn):
+            return
+        with self._locked():
+            if self._has_text_index(conn):
+                return
+            logger.info(f"Building text index of compact store {self.directory}...")
+            # External content: the index reads document text from docs, and
+            # the triggers keep it in step with every write
+            conn.executescript(
+                """
+                BEGIN;
+                CREATE VIRTUAL TABLE docs_fts USING fts5(
+                    document,
+                    content = 'docs',
+                    content_rowid = 'slot',
+                    tokenize = 'unicode61 remove_diacritics 2'
+                );
+                CREATE TRIGGER docs_fts_insert AFTER INSERT ON docs BEGIN
+                    INSERT INTO docs_fts (rowid, document)
+                    VALUES (new.slot, new.document);
+                END;
+                CREATE TRIGGER docs_fts_delete AFTER DELETE ON docs BEGIN
+                    INSERT INTO docs_fts (docs_fts, rowid, document)
+                    VALUES ('delete', old.slot, old.document);
+                END;
+                CREATE TRIGGER docs_fts_update AFTER UPDATE ON docs BEGIN
+                    INSERT INTO docs_fts (docs_fts, rowid, document)
+                    VALUES ('delete', old.slot, old.document);
+                    INSERT INTO docs_fts (rowid, document)
+                    VALUES (new.slot, new.document);
+                END;
+                INSERT INTO docs_fts (docs_fts) VALUES ('rebuild');
+                COMMIT;
+                """
+            )
+
+    def search_text(
+        self,
+        query: str,
+        limit: int = 10,
+        where: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search documents with BM25 ranking (see LexicalIndex.search).
+
+        Args:
+            query: User search text
+            limit: Maximum results
+            where: ChromaDB-style metadata filter, evaluated in SQL
+
+        Returns:
+            Hits with ``id``, ``document``, ``metadata`` and ``score``
+            (higher is better), best first
+        """
+        match = build_lexical_query(query)
+        if not match or limit <= 0:
+            return []
+
+        self._ensure_text_index()
+        condition, params = where_to_sql(where, column="d.metadata")
+        sql = f"""
+            SELECT d.doc_id, d.document, d.metadata, bm25(docs_fts)
+            FROM docs_fts
+            JOIN docs d ON d.slot = docs_fts.rowid
+            WHERE docs_fts MATCH ? AND {condition}
+            ORDER BY bm25(docs_fts)
+            LIMIT ?
+        """
+        with self._locked(shared=True):
+            rows = (
+                self._get_connection().execute(sql, (match, *params, limit)).fetchall()
+            )
+        return [
+            {
+                "id": doc_id,
+                "document": document,
+                "metadata": json.loads(raw_metadata),
+                "score": -rank,
+            }
+            for doc_id, document, raw_metadata, rank in rows
+        ]
+
+    # -------------------- Scanning --------------------
+
+    def _select(
+        self,
+        columns: str,
+        ids: list[str] | None = None,
+        slots: list[int] | None = None,
+        where: dict[str, Any] | None = None,
+        where_document: dict[str, Any] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """Select document rows matching ids, slots and filters."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if ids is not None:
+            clauses.append("doc_id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(ids))
+        if slots is not None:
+            clauses.append("slot IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(slots))
+        if where:
+            sql, where_params = where_to_sql(where)
+            clauses.append(sql)
+            params.extend(where_params)
+        for operator, operand in (where_document or {}).items():
+            if operator == "$contains":
+                clauses.append("instr(document, ?) > 0")
+            elif operator == "$not_contains":
+                clauses.append("instr(document, ?) = 0")
+            else:
+                raise ValueError(f"Unsupported where_document operator: {operator}")
+            params.append(operand)
+
+        sql = f"SELECT {columns} FROM docs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY slot"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset or 0])
+        return self._get_connection().execute(sql, params).fetchall()
+
+    def _read_vectors(self, slots: list[int]) -> list[np.ndarray]:
+        """Dequantized vectors of the given slots."""
+        arrays = self._arrays()
+        if arrays is None or not slots:
+            return []
+        index = np.array(slots, dtype=np.int64)
+        return list(self._dequantize(arrays[0][index], arrays[1][index]))
+
+    def _scan(
+        self,
+        queries: np.ndarray,
+        candidates: np.ndarray | None,
+        k: int,
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        Rank stored vectors against every query in one pass over the file.
+
+        Args:
+            queries: Query matrix, one row per query
+            candidates: Slots to consider (all live slots when None)
+            k: Results to keep per query
+
+        Returns:
+            Per query, the best slots and their squared L2 distances
+        """
+        arrays = self._arrays()
+        empty = (np.empty(0, np.int64), np.empty(0, np.float32))
+        if arrays is None or k <= 0 or (candidates is not None and not len(candidates)):
+            return [empty for _ in queries]
+
+        vectors, scales = arrays
+        total = self._load_state()["rows"] if candidates is None else len(candidates)
+        query_norms = np.einsum("ij,ij->i", queries, queries)
+        best_slots = np.empty((len(queries), 0), np.int64)
+        best_distances = np.empty((len(queries), 0), np.float32)
+
+        for start in range(0, total, self.SCAN_CHUNK_ROWS):
+            stop = min(start + self.SCAN_CHUNK_ROWS, total)
+            if candidates is None:
+                slots = np.arange(start, stop, dtype=np.int64)
+                block, block_scales = vectors[start:stop], scales[start:stop]
+            else:
+                slots = candidates[start:stop]
+                block, block_scales = vectors[slots], scales[slots]
+            rows = block.astype(np.float32)
+            # |q - s*v|^2 = |q|^2 + s^2 |v|^2 - 2 s (q . v)
+            row_norms = np.einsum("ij,ij->i", rows, rows) * block_scales**2
+            distances = (
+                query_norms[:, None]
+                + row_norms[None, :]
+                - 2 * (queries @ rows.T) * block_scales[None, :]
+            )
+            distances[:, block_scales == 0] = np.inf
+
+            best_slots = np.concatenate(
+                [best_slots, np.broadcast_to(slots, distances.shape)], axis=1
+            )
+            best_distances = np.concatenate([best_distances, distances], axis=1)
+            if best_distances.shape[1] > k:
+                keep = np.argpartition(best_distances, k - 1, axis=1)[:, :k]
+                best_slots = np.take_along_axis(best_slots, keep, axis=1)
+                best_distances = np.take_along_axis(best_distances, keep, axis=1)
+
+        ranked = []
+        for slots, distances in zip(best_slots, best_distances, strict=True):
+            order = np.argsort(distances, kind="stable")
+            order = order[np.isfinite(distances[order])]
+            ranked.append((slots[order], distances[order]))
+        return ranked
+
+    def _rescore(
+        self, query: np.ndarray, hits: list[tuple[float, tuple[Any, ...]]]
+    ) -> list[tuple[float, tuple[Any, ...]]]:
+        """Re-rank quantized hits by their distance to the stored exact vectors."""
+        assert self._exact is not None
+        exact = self._exact[np.array([row[0] for _, row in hits], dtype=np.int64)]
+        diff = exact - query[None, :]
+        distances = np.einsum("ij,ij->i", diff, diff)
+        rescored = [
+            (float(distance), row)
+            for distance, (_, row) in zip(distances, hits, strict=True)
+        ]
+        rescored.sort(key=lambda hit: hit[0])
+        return rescored
+
+
+def allocated_bytes(path: Path) -> int:
+    """
+    Disk space allocated to a file.
+
+    Files grown with ``truncate`` are sparse until written, so their
+    apparent size overstates what they use; block counts report the real
+    usage where the platform provides them.
+
+    Args:
+        path: File path
+
+    Returns:
+        Allocated bytes (the apparent size where block counts are unknown)
+    """
+    stat = path.stat()
+    blocks = getattr(stat, "st_blocks", None)
+    return stat.st_size if blocks is None else blocks * 512
@@ -0,0 +1,206 @@
+"""
+On-disk cache of document embeddings.
+
+Re-indexing after a small edit re-sends mostly unchanged chunks to ChromaDB.
+Embeddings are stored in SQLite keyed by embedding model and the SHA-256 of
+the chunk text, so only new text goes through ONNX inference. The cache is
+size-capped with LRU eviction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """Return the cache key of a document text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Content-addressed SQLite store of float32 embedding vectors."""
+
+    DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_path: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: Path of the cache SQLite database
+            max_bytes: Size cap for stored vectors
+        """
+        self.cache_path = Path(cache_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the cache connection, creating the schema if needed."""
+        if self._connection is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.cache_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (model, content_hash)
+                );
+                CREATE INDEX IF NOT EXISTS embeddings_last_access
+                    ON embeddings (last_access);
+                """
+            )
+            self._connection = conn
+        return self._connection
+
+    def close(self) -> None:
+        """Close the cache connection."""
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    def get_many(self, model: str, hashes: list[str]) -> dict[str, np.ndarray]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            model: Embedding model identifier
+            hashes: Content hashes (see content_hash)
+
+        Returns:
+            Mapping of content hash to vector for the hits
+        """
+        unique = list(dict.fromkeys(hashes))
+        if not unique:
+            return {}
+
+        with self._lock:
+            conn = self._get_connection()
+            rows = conn.execute(
+                "SELECT content_hash, vector FROM embeddings "
+                "WHERE model = ? AND content_hash IN (SELECT value FROM json_each(?))",
+                (model, json.dumps(unique)),
+            ).fetchall()
+            found = {row[0]: np.frombuffer(row[1], dtype=np.float32) for row in rows}
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET last_access = ? "
+                    "WHERE model = ? AND content_hash = ?",
+                    [(now, model, key) for key in found],
+                )
+                conn.commit()
+
+        self.hits += len(found)
+        self.misses += len(unique) - len(found)
+        return found
+
+    def put_many(self, model: str, vectors: dict[str, Any]) -> None:
+        """
+        Store embeddings.
+
+        Args:
+            model: Embedding model identifier
+            vectors: Mapping of content hash to vector
+        """
+        if not vectors:
+            return
+
+        now = time.time()
+        rows = [
+            (model, key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in vectors.items()
+        ]
+        with self._lock:
+            conn = self._get_connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows
+            )
+            conn.commit()
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used vectors until the cache fits its cap."""
+        conn = self._get_connection()
+        total = conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        row = conn.execute("SELECT AVG(LENGTH(vector)) FROM embeddings").fetchone()
+        excess = total - int(self.max_bytes * 0.9)
+        count = int(excess / row[0]) + 1 if row and row[0] else 0
+        conn.execute(
+            "DELETE FROM embeddings WHERE rowid IN ("
+            "SELECT rowid FROM embeddings ORDER BY last_access ASC LIMIT ?)",
+            (count,),
+        )
+        conn.commit()
+        logger.debug(f"Evicted {count} cached embeddings")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and hit statistics."""
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+                )
+                .fetchone()
+            )
+        return {
+            "entries": row[0],
+            "stored_bytes": row[1],
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def create_embedding_cache(cache_path: str | Path) -> EmbeddingCache | None:
+    """
+    Create an embedding cache honouring the size setting.
+
+    Environment Variables:
+        ZOTERO_EMBEDDING_CACHE_MB: Size cap in megabytes (default: 1024,
+            ``0`` disables the cache)
+
+    Args:
+        cache_path: Path of the cache SQLite database
+
+    Returns:
+        EmbeddingCache, or None when disabled
+    """
+    try:
+        max_mb = int(os.getenv("ZOTERO_EMBEDDING_CACHE_MB", "1024"))
+    except ValueError:
+        max_mb = 1024
+    if max_mb <= 0:
+        return None
+
+    return EmbeddingCache(cache_path, max_bytes=max_mb * 1024 * 1024)
@@ -0,0 +1,122 @@
+"""
+Advisory file lock shared between processes.
+
+The CLI and the MCP server can open the same index files at the same time.
+Thread locks only serialize one process, so writers of shared files also
+take this lock, an OS-level lock on a small file next to the data. The
+lock is released by the OS if the holding process dies.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+
+class FileLock:
+    """
+    Re-entrant advisory lock on a file.
+
+    The lock is shared (readers) or exclusive (writers) across processes
+    on POSIX systems; Windows only offers exclusive locks, which shared
+    requests fall back to. Within one process, nested acquisitions through
+    the same object keep the mode of the outermost one.
+    """
+
+    # Interval between attempts while waiting for another holder
+    POLL_SECONDS = 0.05
+
+    def __init__(self, lock_path: str | Path):
+        """
+        Initialize the lock.
+
+        Args:
+            lock_path: Path of the lock file (created on first use)
+        """
+        self.lock_path = Path(lock_path)
+        self._fd: int | None = None
+        self._depth = 0
+        self._lock = threading.RLock()
+
+    def _try_lock(self, fd: int, shared: bool) -> bool:
+        try:
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                fcntl.flock(fd, mode | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def acquire(self, shared: bool = False, timeout: float | None = None) -> bool:
+        """
+        Acquire the lock, waiting for other processes to release it.
+
+        Args:
+            shared: Take a shared (read) lock instead of an exclusive one
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the lock is held, False if the timeout expired
+        """
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        if self._depth:
+            self._depth += 1
+            return True
+
+        try:
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            self._lock.release()
+            raise
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._try_lock(fd, shared):
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                self._lock.release()
+                return False
+            time.sleep(self.POLL_SECONDS)
+        self._fd = fd
+        self._depth = 1
+        return True
+
+    def release(self) -> None:
+        """Release one level of the lock (the OS lock with the last one)."""
+        if self._depth == 0:
+            raise RuntimeError(f"File lock {self.lock_path} is not held")
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fd, self._fd = self._fd, None
+            try:
+                if sys.platform == "win32":
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+        self._lock.release()
+
+    @contextmanager
+    def hold(self, shared: bool = False) -> Iterator[None]:
+        """Hold the lock for the duration of a ``with`` block."""
+        self.acquire(shared=shared)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,237 @@
+"""
+BM25 lexical index over the documents stored in ChromaDB.
+
+Vector search misses exact identifiers (DOIs, gene names, acronyms). This
+SQLite FTS5 sidecar is built from the collection on the first lexical search
+and from then on mirrors every document written through ChromaClient, so
+hybrid search can combine lexical and vector rankings.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import json
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import threading
+from typing import Any
+
+from .where import where_to_sql
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_lexical_query(query: str) -> str:
+    """
+    Convert free text into an FTS5 MATCH expression.
+
+    Tokens are quoted (no FTS syntax injection) and OR-ed, leaving the
+    ranking to BM25 so partial matches still surface.
+
+    Args:
+        query: User search text
+
+    Returns:
+        MATCH expression, or an empty string if the query has no tokens
+    """
+    tokens = dict.fromkeys(_TOKEN_RE.findall(query.lower()))
+    return " OR ".join(f'"{token}"' for token in tokens)
+
+
+class LexicalIndex:
+    """FTS5 mirror of a ChromaDB collection's documents and metadata."""
+
+    def __init__(self, index_path: str | Path):
+        """
+        Initialize the lexical index.
+
+        Args:
+            index_path: Path of the sidecar SQLite database
+        """
+        self.index_path = Path(index_path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the index connection, creating the schema if needed."""
+        if self._connection is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.index_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS docs (
+                    rowid INTEGER PRIMARY KEY,
+                    doc_id TEXT NOT NULL UNIQUE,
+                    metadata TEXT NOT NULL
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+                    document,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                );
+                """
+            )
+            self._connection = conn
+        return self._connection
+
+    def close(self) -> None:
+        """Close the index connection."""
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    def is_synced(self) -> bool:
+        """Whether the index was backfilled from the collection."""
+        with self._lock:
+            if self._connection is None and not self.index_path.exists():
+                return False
+            row = (
+                self._get_connection()
+                .execute("SELECT value FROM meta WHERE name = 'synced'")
+                .fetchone()
+            )
+        return bool(row and row[0] == "1")
+
+    def set_synced(self, synced: bool) -> None:
+        """Record whether the index mirrors the whole collection."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('synced', ?)",
+                ("1" if synced else "0",),
+            )
+            conn.commit()
+
+    def count(self) -> int:
+        """Number of indexed documents."""
+        with self._lock:
+            return (
+                self._get_connection()
+                .execute("SELECT COUNT(*) FROM docs")
+                .fetchone()[0]
+            )
+
+    def upsert(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: Iterable[Mapping[str, Any] | None],
+    ) -> None:
+        """
+        Insert or replace documents.
+
+        Args:
+            ids: Document ids
+            documents: Document texts
+            metadatas: Document metadata
+        """
+        with self._lock:
+            conn = self._get_connection()
+            self._delete(conn, ids)
+            for doc_id, document, metadata in zip(
+                ids, documents, metadatas, strict=True
+            ):
+                cursor = conn.execute(
+                    "INSERT INTO docs (doc_id, metadata) VALUES (?, ?)",
+                    (doc_id, json.dumps(dict(metadata or {}))),
+                )
+                conn.execute(
+                    "INSERT INTO docs_fts (rowid, document) VALUES (?, ?)",
+                    (cursor.lastrowid, document or ""),
+                )
+            conn.commit()
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, ids: list[str]) -> None:
+        params = (json.dumps(ids),)
+        conn.execute(
+            "DELETE FROM docs_fts WHERE rowid IN ("
+            "SELECT rowid FROM docs WHERE doc_id IN (SELECT value FROM json_each(?)))",
+            params,
+        )
+        conn.execute(
+            "DELETE FROM docs WHERE doc_id IN (SELECT value FROM json_each(?))",
+            params,
+        )
+
+    def delete(self, ids: list[str]) -> None:
+        """Delete documents by id."""
+        if not ids:
+            return
+        with self._lock:
+            conn = self._get_connection()
+            self._delete(conn, ids)
+            conn.commit()
+
+    def vacuum(self) -> None:
+        """Return space freed by deletes to the file system."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("INSERT INTO docs_fts (docs_fts) VALUES ('optimize')")
+            conn.commit()
+            conn.execute("VACUUM")
+            # In WAL mode the rewritten pages land in the log first
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def clear(self) -> None:
+        """Remove all documents (the empty index counts as synced)."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.executescript("DELETE FROM docs; DELETE FROM docs_fts;")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('synced', '1')")
+            conn.commit()
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        where: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Search documents with BM25 ranking.
+
+        Args:
+            query: User search text
+            limit: Maximum results
+            where: ChromaDB-style metadata filter, evaluated in SQL
+
+        Returns:
+            Hits with ``id``, ``document``, ``metadata`` and ``score``
+            (higher is better), best first
+        """
+        match = build_lexical_query(query)
+        if not match or limit <= 0:
+            return []
+
+        condition, params = where_to_sql(where, column="d.metadata")
+        sql = f"""
+            SELECT d.doc_id, docs_fts.document, d.metadata, bm25(docs_fts)
+            FROM docs_fts
+            JOIN docs d ON d.rowid = docs_fts.rowid
+            WHERE docs_fts MATCH ? AND {condition}
+            ORDER BY bm25(docs_fts)
+            LIMIT ?
+        """
+        with self._lock:
+            rows = (
+                self._get_connection().execute(sql, (match, *params, limit)).fetchall()
+            )
+        return [
+            {
+                "id": doc_id,
+                "document": document,
+                "metadata": json.loads(raw_metadata),
+                "score": -rank,
+            }
+            for doc_id, document, raw_metadata, rank in rows
+        ]
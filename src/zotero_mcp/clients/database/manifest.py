@@ -0,0 +1,190 @@
+"""
+Sidecar manifest for incremental semantic indexing.
+
+Records, per parent item, the modification stamp that was indexed and the
+ChromaDB document ids that were written for it. Updates compare current
+stamps against the manifest to find added, changed and removed items, and
+use the stored document ids to delete fragments that no longer exist.
+
+Progressive fulltext indexing adds a second pass per item: its
+``backfill_stamp`` records the stamp for which the remaining PDF pages
+were indexed. Re-recording an item resets it, so changed items are
+backfilled again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class IndexManifest:
+    """Per-item stamps and document ids of the semantic index."""
+
+    def __init__(self, manifest_path: str | Path):
+        """
+        Initialize the manifest.
+
+        Args:
+            manifest_path: Path of the manifest SQLite database
+        """
+        self.manifest_path = Path(manifest_path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the manifest connection, creating the schema if needed."""
+        if self._connection is None:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.manifest_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS items (
+                    item_key TEXT PRIMARY KEY,
+                    stamp TEXT NOT NULL,
+                    doc_ids TEXT NOT NULL,
+                    backfill_stamp TEXT
+                );
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(items)")}
+            if "backfill_stamp" not in columns:
+                # Manifests written before progressive indexing
+                conn.execute("ALTER TABLE items ADD COLUMN backfill_stamp TEXT")
+            self._connection = conn
+        return self._connection
+
+    def close(self) -> None:
+        """Close the manifest connection."""
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    def get_meta(self, name: str) -> str | None:
+        """Get a manifest-level value (e.g. the indexed library version)."""
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute("SELECT value FROM meta WHERE name = ?", (name,))
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: str) -> None:
+        """Set a manifest-level value."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (name, value))
+            conn.commit()
+
+    def get_stamps(self) -> dict[str, str]:
+        """Get the indexed stamp of every item."""
+        with self._lock:
+            rows = self._get_connection().execute("SELECT item_key, stamp FROM items")
+            return dict(rows.fetchall())
+
+    def get_doc_ids(self, item_keys: list[str]) -> dict[str, list[str]]:
+        """
+        Get the document ids written for the given items.
+
+        Args:
+            item_keys: Parent item keys
+
+        Returns:
+            Mapping of item key to document ids (unknown keys are omitted)
+        """
+        if not item_keys:
+            return {}
+        with self._lock:
+            rows = self._get_connection().execute(
+                "SELECT item_key, doc_ids FROM items "
+                "WHERE item_key IN (SELECT value FROM json_each(?))",
+                (json.dumps(item_keys),),
+            )
+            return {key: json.loads(doc_ids) for key, doc_ids in rows}
+
+    def record_items(self, entries: list[tuple[str, str, list[str]]]) -> None:
+        """
+        Record indexed items (clearing their backfill state).
+
+        Args:
+            entries: (item key, stamp, document ids) tuples
+        """
+        if not entries:
+            return
+        with self._lock:
+            conn = self._get_connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO items (item_key, stamp, doc_ids) "
+                "VALUES (?, ?, ?)",
+                [(key, stamp, json.dumps(ids)) for key, stamp, ids in entries],
+            )
+            conn.commit()
+
+    def get_backfill_pending(self) -> dict[str, str]:
+        """Get the stamp of every item not backfilled at its current stamp."""
+        with self._lock:
+            rows = self._get_connection().execute(
+                "SELECT item_key, stamp FROM items "
+                "WHERE backfill_stamp IS NULL OR backfill_stamp != stamp"
+            )
+            return dict(rows.fetchall())
+
+    def record_backfill(self, entries: list[tuple[str, str, list[str] | None]]) -> None:
+        """
+        Record backfilled items.
+
+        Entries whose stamp no longer matches the recorded one (the item was
+        reindexed meanwhile) are ignored.
+
+        Args:
+            entries: (item key, stamp, all document ids) tuples; None keeps
+                the recorded document ids
+        """
+        if not entries:
+            return
+        with self._lock:
+            conn = self._get_connection()
+            conn.executemany(
+                "UPDATE items SET doc_ids = COALESCE(?, doc_ids), "
+                "backfill_stamp = stamp WHERE item_key = ? AND stamp = ?",
+                [
+                    (json.dumps(ids) if ids is not None else None, key, stamp)
+                    for key, stamp, ids in entries
+                ],
+            )
+            conn.commit()
+
+    def remove_items(self, item_keys: list[str]) -> None:
+        """Forget the given items."""
+        if not item_keys:
+            return
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute(
+                "DELETE FROM items WHERE item_key IN (SELECT value FROM json_each(?))",
+                (json.dumps(item_keys),),
+            )
+            conn.commit()
+
+    def clear(self) -> None:
+        """Forget everything (used when the collection is rebuilt)."""
+        with self._lock:
+            conn = self._get_connection()
+            # The token of the running update outlives the rebuild it starts
+            conn.executescript(
+                "DELETE FROM items; DELETE FROM meta WHERE name != 'update_run';"
+            )
+            conn.commit()
+        logger.info("Cleared semantic index manifest")
@@ -0,0 +1,129 @@
+"""
+Evaluation of ChromaDB-style ``where`` filters against metadata dicts.
+
+Used by stores that keep metadata outside ChromaDB (the lexical index and
+the compact vector store) so the same filter means the same thing for every
+retrieval path.
+"""
+
+import json
+from typing import Any
+
+_COMPARATORS = {
+    "$eq": lambda value, operand: value == operand,
+    "$ne": lambda value, operand: value != operand,
+    "$gt": lambda value, operand: value is not None and value > operand,
+    "$gte": lambda value, operand: value is not None and value >= operand,
+    "$lt": lambda value, operand: value is not None and value < operand,
+    "$lte": lambda value, operand: value is not None and value <= operand,
+    "$in": lambda value, operand: value in operand,
+    "$nin": lambda value, operand: value not in operand,
+}
+
+
+def matches_where(metadata: dict[str, Any], where: dict[str, Any] | None) -> bool:
+    """
+    Check whether metadata satisfies a ChromaDB ``where`` filter.
+
+    Supports ``$and``/``$or``, plain equality and the comparison operators
+    ``$eq``, ``$ne``, ``$gt``, ``$gte``, ``$lt``, ``$lte``, ``$in`` and
+    ``$nin``.
+
+    Args:
+        metadata: Document metadata
+        where: Filter expression (None or empty matches everything)
+
+    Returns:
+        True if the metadata matches
+    """
+    if not where:
+        return True
+
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_where(metadata, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_where(metadata, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for operator, operand in condition.items():
+                compare = _COMPARATORS.get(operator)
+                if compare is None:
+                    raise ValueError(f"Unsupported where operator: {operator}")
+                try:
+                    if not compare(value, operand):
+                        return False
+                except TypeError:
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+
+    return True
+
+
+_SQL_COMPARATORS = {
+    "$eq": "{value} IS ?",
+    "$ne": "{value} IS NOT ?",
+    "$gt": "{value} > ?",
+    "$gte": "{value} >= ?",
+    "$lt": "{value} < ?",
+    "$lte": "{value} <= ?",
+    "$in": "{value} IN (SELECT value FROM json_each(?))",
+    "$nin": "COALESCE({value} NOT IN (SELECT value FROM json_each(?)), 1)",
+}
+
+
+def where_to_sql(
+    where: dict[str, Any] | None, column: str = "metadata"
+) -> tuple[str, list[Any]]:
+    """
+    Translate a ChromaDB ``where`` filter into an SQLite condition.
+
+    The condition reads fields with ``json_extract`` from a column holding
+    the metadata as JSON, and matches the same rows as matches_where.
+
+    Args:
+        where: Filter expression (None or empty matches everything)
+        column: Name of the JSON metadata column
+
+    Returns:
+        SQL condition and its parameters
+
+    Raises:
+        ValueError: If the filter uses an unsupported operator or key
+    """
+    if not where:
+        return "1", []
+
+    clauses: list[str] = []
+    params: list[Any] = []
+    for key, condition in where.items():
+        if key in ("$and", "$or"):
+            parts = [where_to_sql(sub, column) for sub in condition]
+            if not parts:
+                clauses.append("1" if key == "$and" else "0")
+                continue
+            joiner = " AND " if key == "$and" else " OR "
+            clauses.append("(" + joiner.join(sql for sql, _ in parts) + ")")
+            params.extend(param for _, sub_params in parts for param in sub_params)
+            continue
+
+        if '"' in key:
+            raise ValueError(f"Unsupported where key: {key}")
+        # The path is bound, so keys (e.g. user tag names) never reach the SQL
+        value = f"json_extract({column}, ?)"
+        path = f'$."{key}"'
+        operators = condition if isinstance(condition, dict) else {"$eq": condition}
+        for operator, operand in operators.items():
+            template = _SQL_COMPARATORS.get(operator)
+            if template is None:
+                raise ValueError(f"Unsupported where operator: {operator}")
+            clauses.append(template.format(value=value))
+            params.append(path)
+            params.append(
+                json.dumps(list(operand)) if operator in ("$in", "$nin") else operand
+            )
+
+    return " AND ".join(clauses), params
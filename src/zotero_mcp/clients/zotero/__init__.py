@@ -1,6 +1,7 @@
 """Zotero clients - API and local DB integration."""
 
 from .api_client import ZoteroAPIClient, get_zotero_client
+from .fulltext_cache import FulltextCache, get_fulltext_cache
 from .local_db import LocalDatabaseClient, ZoteroItem, get_local_database_client
 
 __all__ = [
@@ -9,4 +10,6 @@ __all__ = [
     "LocalDatabaseClient",
     "ZoteroItem",
     "get_local_database_client",
+    "FulltextCache",
+    "get_fulltext_cache",
 ]
@@ -13,6 +13,7 @@ from typing import Any, Literal
 
 from pyzotero import zotero
 
+from zotero_mcp.clients.zotero.fulltext_cache import get_fulltext_cache
 from zotero_mcp.utils.config.logging import get_logger
 from zotero_mcp.utils.formatting.helpers import is_local_mode
 from zotero_mcp.utils.formatting.tags import (
@@ -269,25 +270,32 @@ class ZoteroAPIClient:
 
         def extract_text_from_pdf_bytes(pdf_bytes: bytes) -> str | None:
             """Extract text directly from PDF bytes without Zotero fulltext index."""
+            import fitz  # PyMuPDF
+
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+            parts: list[str] = []
+            for page in doc:
+                txt = page.get_text("text") or ""
+                txt = txt.strip()
+                if txt:
+                    parts.append(txt)
+            doc.close()
+            return "\n\n".join(parts) if parts else None
+
+        fulltext_cache = get_fulltext_cache()
+
+        def parse_pdf_bytes(pdf_bytes: bytes) -> str | None:
+            """Parse downloaded PDF bytes, reusing cached text for known content."""
+            # Failures raise out of the extractor, so they are never cached
             try:
-                import fitz  # PyMuPDF
-            except Exception:
-                return None
-
-            try:
-                doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-                parts: list[str] = []
-                for page in doc:
-                    txt = page.get_text("text") or ""
-                    txt = txt.strip()
-                    if txt:
-                        parts.append(txt)
-                doc.close()
-                if parts:
-                    return "\n\n".join(parts)
-            except Exception:
+                if fulltext_cache is None:
+                    return extract_text_from_pdf_bytes(pdf_bytes)
+                return fulltext_cache.get_or_extract_bytes(
+                    pdf_bytes, "pymupdf", extract_text_from_pdf_bytes
+                )
+            except Exception as e:
+                logger.debug(f"PDF text extraction failed: {e}")
                 return None
-            return None
 
         # 1. Try direct fetch (works if item_key IS the attachment)
         text = await fetch_text(item_key)
@@ -331,9 +339,7 @@ class ZoteroAPIClient:
                     if pdf_bytes and len(pdf_bytes) > 100:
                         parsed = await loop.run_in_executor(
                             None,
-                            lambda raw_pdf=pdf_bytes: extract_text_from_pdf_bytes(
-                                raw_pdf
-                            ),
+                            lambda raw_pdf=pdf_bytes: parse_pdf_bytes(raw_pdf),
                         )
                         if parsed and parsed.strip():
                             pdf_text = parsed
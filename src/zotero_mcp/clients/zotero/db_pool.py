@@ -0,0 +1,118 @@
+"""
+Per-thread read-only connections to zotero.sqlite.
+
+``LocalDatabaseClient`` is used from the event loop and from executor
+threads (semantic search, batch loading) at the same time. A single shared
+``sqlite3.Connection`` either fails with "objects created in a thread" errors
+or serializes every read. The pool gives each thread its own tuned,
+read-only connection, reuses it (and its prepared-statement cache) for all
+later reads on that thread, and closes every connection on shutdown.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ReadConnectionPool:
+    """Hands out one read-only SQLite connection per thread."""
+
+    DEFAULT_MMAP_BYTES = 256 * 1024 * 1024
+    DEFAULT_CACHE_KIB = 16 * 1024
+    DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        mmap_bytes: int = DEFAULT_MMAP_BYTES,
+        cache_kib: int = DEFAULT_CACHE_KIB,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            mmap_bytes: ``PRAGMA mmap_size`` of each connection
+            cache_kib: Page cache per connection in KiB (``PRAGMA cache_size``)
+            statement_cache_size: Prepared statements kept per connection
+        """
+        self.mmap_bytes = mmap_bytes
+        self.cache_kib = cache_kib
+        self.statement_cache_size = statement_cache_size
+        self.opened = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: set[sqlite3.Connection] = set()
+        # Bumped by close() so threads drop connections closed under them
+        self._generation = 0
+
+    def get(self, uri: str) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection to ``uri``.
+
+        A thread asking for a different URI (e.g. a newer snapshot) gets a
+        new connection, and its connection to the previous URI is closed so
+        it does not keep the old snapshot open.
+
+        Args:
+            uri: SQLite URI of the database to read
+
+        Returns:
+            Connection owned by the calling thread
+        """
+        state = getattr(self._local, "state", None)
+        if state is not None and state[0] == self._generation and state[1] == uri:
+            return state[2]
+
+        conn = self._open(uri)
+        previous = None
+        with self._lock:
+            if state is not None and state[0] == self._generation:
+                previous = state[2]
+                self._connections.discard(previous)
+            self._connections.add(conn)
+            self._local.state = (self._generation, uri, conn)
+        if previous is not None:
+            self._close_connection(previous)
+        return conn
+
+    def close(self) -> None:
+        """Close the connections of all threads (the pool stays usable)."""
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+            self._generation += 1
+        for conn in connections:
+            self._close_connection(conn)
+
+    def stats(self) -> dict[str, int]:
+        """Connection counts for status reporting."""
+        with self._lock:
+            return {"open": len(self._connections), "opened": self.opened}
+
+    @staticmethod
+    def _close_connection(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to close pooled connection: {e}")
+
+    def _open(self, uri: str) -> sqlite3.Connection:
+        # Connections are only used by the thread that opened them;
+        # check_same_thread is off so close() may run on any thread
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=self.statement_cache_size,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_bytes)}")
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_kib)}")
+        with self._lock:
+            self.opened += 1
+        return conn
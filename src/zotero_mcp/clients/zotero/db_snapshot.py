@@ -0,0 +1,334 @@
+"""
+Lock-free snapshots of zotero.sqlite.
+
+While the desktop app runs, Zotero keeps an exclusive lock on its database,
+so read-only opens fail with "database is locked" or stall until the busy
+timeout. A snapshot is a private copy of the database file (WAL folded in)
+opened with ``immutable=1``, which SQLite reads without taking any locks.
+
+The copy is only refreshed when the database's mtime or size changes, and
+refreshes run on a background thread: readers keep using the previous
+snapshot (or one left on disk by an earlier process) until the new copy has
+been completed and verified, so they only wait when no snapshot exists yet.
+Clients share one ``DatabaseSnapshot`` per database (see ``shared_snapshot``),
+so short-lived clients do not copy the database again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+import shutil
+import sqlite3
+import threading
+
+from zotero_mcp.utils.config import get_config_path
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size, change counter) of the database file and (mtime_ns, size)
+# of its WAL file, None for missing files
+SourceStamp = tuple[tuple[int, ...] | None, tuple[int, ...] | None]
+
+# Offset of the file change counter in the SQLite header; rollback-journal
+# commits bump it even when they leave mtime (coarse clocks) and size alone
+_CHANGE_COUNTER_OFFSET = 24
+
+# Stamp of a snapshot adopted from disk, whose source state is unknown
+_UNKNOWN_STAMP: SourceStamp = (None, None)
+
+
+def default_snapshot_dir(db_path: str | Path) -> Path:
+    """Return the snapshot directory for a given zotero.sqlite."""
+    digest = hashlib.sha1(str(Path(db_path).resolve()).encode()).hexdigest()[:12]
+    return get_config_path() / "db_snapshots" / digest
+
+
+def snapshot_uri(path: str | Path) -> str:
+    """SQLite URI opening a snapshot read-only without any locking."""
+    return f"file:{Path(path)}?mode=ro&immutable=1"
+
+
+def is_lock_error(error: sqlite3.Error) -> bool:
+    """Whether an SQLite error means another process holds the database lock."""
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+class DatabaseSnapshot:
+    """Keeps an up-to-date, immutable copy of a SQLite database."""
+
+    # Copies retried when the database changes while it is being copied
+    COPY_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        source: str | Path,
+        snapshot_dir: str | Path | None = None,
+    ):
+        """
+        Initialize the snapshot.
+
+        Args:
+            source: Path to the live database (zotero.sqlite)
+            snapshot_dir: Directory for snapshot files
+                (defaults to a per-database directory under the config path)
+        """
+        self.source = Path(source)
+        self.snapshot_dir = (
+            Path(snapshot_dir) if snapshot_dir else default_snapshot_dir(self.source)
+        )
+        self.copies = 0
+        self._current: tuple[SourceStamp, Path] | None = None
+        # Guards _current and _thread; copies themselves run under _copy_lock
+        self._lock = threading.Lock()
+        self._copy_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def source_stamp(self) -> SourceStamp:
+        """Stat the live database and its WAL file."""
+        return (
+            _database_stamp(self.source),
+            _file_stamp(self.source.with_name(f"{self.source.name}-wal")),
+        )
+
+    def current(self) -> Path:
+        """
+        Get the newest complete snapshot.
+
+        Calls return at once when a snapshot exists, even one left on disk
+        by an earlier process; if the database changed since, a background
+        refresh is started and the previous snapshot is returned until it
+        finishes. Only the very first call on a machine copies synchronously.
+
+        Returns:
+            Path of a snapshot file to open with ``snapshot_uri``
+        """
+        stamp = self.source_stamp()
+        with self._lock:
+            current = self._current
+            # Another process may have removed our snapshot after replacing it
+            if current is not None and current[1].exists():
+                if current[0] != stamp:
+                    self._start_refresh()
+                return current[1]
+            previous = self._latest_on_disk()
+            if previous is not None and previous != self._snapshot_path(stamp):
+                self._current = (_UNKNOWN_STAMP, previous)
+                self._start_refresh()
+                return previous
+        return self.refresh()
+
+    def refresh(self) -> Path:
+        """
+        Copy the database now unless the snapshot is already up to date.
+
+        Returns:
+            Path of the new current snapshot
+        """
+        with self._copy_lock:
+            stamp = self.source_stamp()
+            with self._lock:
+                if self._current is not None and self._current[0] == stamp:
+                    return self._current[1]
+
+            existing = self._snapshot_path(stamp)
+            if existing.exists() and _is_readable(existing):
+                path = existing
+            else:
+                stamp, path = self._copy()
+
+            with self._lock:
+                self._current = (stamp, path)
+            self._remove_stale(keep=path)
+            return path
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for a running background refresh to finish."""
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Wait for a running refresh; snapshot files are kept for reuse."""
+        self.wait(timeout)
+
+    # -------------------- Internals --------------------
+
+    def _start_refresh(self) -> None:
+        """Start a background refresh unless one is running (holds _lock)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._refresh_in_background,
+            name="zotero-db-snapshot",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except (OSError, sqlite3.Error) as e:
+            # Readers keep the previous snapshot; the next read retries
+            logger.warning(f"Failed to refresh database snapshot: {e}")
+
+    def _snapshot_path(self, stamp: SourceStamp) -> Path:
+        digest = hashlib.sha1(repr(stamp).encode()).hexdigest()[:16]
+        return self.snapshot_dir / f"zotero-{digest}.sqlite"
+
+    def _copy(self) -> tuple[SourceStamp, Path]:
+        """
+        Copy the database and its WAL, fold the WAL in and publish the copy.
+
+        The copy is written under a temporary name and renamed into place,
+        so a snapshot path never refers to a partial file. If the database
+        changes during the copy it is retried; the last attempt is kept.
+
+        Returns:
+            (stamp of the copied state, snapshot path)
+        """
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        wal = self.source.with_name(f"{self.source.name}-wal")
+        attempt = 0
+        while True:
+            attempt += 1
+            last_attempt = attempt >= self.COPY_ATTEMPTS
+            stamp = self.source_stamp()
+            target = self._snapshot_path(stamp)
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            tmp_wal = tmp.with_name(f"{tmp.name}-wal")
+
+            shutil.copyfile(self.source, tmp)
+            if stamp[1] is not None:
+                try:
+                    shutil.copyfile(wal, tmp_wal)
+                except FileNotFoundError:
+                    # Checkpointed and removed while copying; stamps differ
+                    pass
+            if self.source_stamp() != stamp and not last_attempt:
+                _remove(tmp, tmp_wal)
+                continue
+
+            try:
+                # Folds the WAL into the copy; immutable opens ignore WAL files
+                conn = sqlite3.connect(tmp)
+                try:
+                    conn.execute("PRAGMA journal_mode=DELETE")
+                    conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+                finally:
+                    conn.close()
+            except sqlite3.DatabaseError:
+                _remove(tmp, tmp_wal)
+                if last_attempt:
+                    raise
+                continue
+
+            os.replace(tmp, target)
+            self.copies += 1
+            logger.debug(f"Copied {self.source} to snapshot {target.name}")
+            return stamp, target
+
+    def _latest_on_disk(self) -> Path | None:
+        """Newest readable snapshot in the snapshot directory, if any."""
+        candidates = []
+        for path in self.snapshot_dir.glob("zotero-*.sqlite"):
+            try:
+                candidates.append((path.stat().st_mtime_ns, path))
+            except FileNotFoundError:
+                continue
+        for _, path in sorted(candidates, reverse=True):
+            if _is_readable(path):
+                return path
+        return None
+
+    def _remove_stale(self, keep: Path) -> None:
+        """Delete older snapshots (still-open files are retried next time)."""
+        for path in self.snapshot_dir.glob("zotero-*.sqlite"):
+            if path != keep:
+                _remove(path)
+
+
+_shared: dict[tuple[Path, Path | None], DatabaseSnapshot] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_snapshot(
+    source: str | Path,
+    snapshot_dir: str | Path | None = None,
+    create: bool = True,
+) -> DatabaseSnapshot | None:
+    """
+    Get the process-wide snapshot of a database.
+
+    Args:
+        source: Path to the live database
+        snapshot_dir: Directory for snapshot files (see DatabaseSnapshot)
+        create: Create the snapshot if this process has none yet
+
+    Returns:
+        The shared snapshot, or None if there is none and create is False
+    """
+    key = (
+        Path(source).resolve(),
+        Path(snapshot_dir).resolve() if snapshot_dir else None,
+    )
+    with _shared_lock:
+        snapshot = _shared.get(key)
+        if snapshot is None and create:
+            snapshot = _shared[key] = DatabaseSnapshot(source, snapshot_dir)
+        return snapshot
+
+
+def close_shared_snapshots(timeout: float | None = 10.0) -> None:
+    """Wait for the background refreshes of all shared snapshots."""
+    with _shared_lock:
+        snapshots = list(_shared.values())
+    for snapshot in snapshots:
+        snapshot.close(timeout)
+
+
+def _file_stamp(path: Path) -> tuple[int, ...] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _database_stamp(path: Path) -> tuple[int, ...] | None:
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return None
+    try:
+        with path.open("rb") as f:
+            f.seek(_CHANGE_COUNTER_OFFSET)
+            counter = int.from_bytes(f.read(4), "big")
+    except OSError:
+        counter = 0
+    return (*stamp, counter)
+
+
+def _is_readable(path: Path) -> bool:
+    try:
+        conn = sqlite3.connect(snapshot_uri(path), uri=True)
+        try:
+            conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError:
+        return False
+    return True
+
+
+def _remove(*paths: Path) -> None:
+    for path in paths:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove snapshot file {path}: {e}")
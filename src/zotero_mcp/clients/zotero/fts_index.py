@@ -0,0 +1,314 @@
+"""
+SQLite FTS5 shadow index for local-mode search.
+
+Zotero's own database is opened read-only, so full-text search over the
+library is served from a separate sidecar database. The index is refreshed
+incrementally by comparing per-item modification stamps with the stamps
+recorded at the last refresh. Attachment text is added per item the first
+time a search asks for it, and searches without it skip that column.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from zotero_mcp.utils.config import get_config_path
+
+if TYPE_CHECKING:
+    from .local_db import LocalDatabaseClient, ZoteroItem
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Column order of the FTS table; weights are passed to bm25() in this order.
+_FTS_COLUMNS = (
+    "title",
+    "creators",
+    "abstract",
+    "notes",
+    "tags",
+    "annotations",
+    "fulltext",
+)
+_BM25_WEIGHTS = (10.0, 5.0, 3.0, 1.0, 4.0, 1.0, 0.5)
+# Column filter for searches that leave attachment text out
+_METADATA_COLUMNS = "{" + " ".join(_FTS_COLUMNS[:-1]) + "}"
+
+
+def default_index_path(db_path: str | Path) -> Path:
+    """Return the sidecar index path for a given zotero.sqlite."""
+    digest = hashlib.sha1(str(Path(db_path).resolve()).encode()).hexdigest()[:12]
+    return get_config_path() / "search_index" / f"local_fts_{digest}.sqlite"
+
+
+def build_match_query(query: str) -> str:
+    """
+    Convert free text into an FTS5 MATCH expression.
+
+    Every token is quoted (so user input cannot inject FTS syntax) and
+    prefix-matched; tokens are combined with implicit AND.
+
+    Args:
+        query: User search text
+
+    Returns:
+        MATCH expression, or an empty string if the query has no tokens
+    """
+    tokens = _TOKEN_RE.findall(query.lower())
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+class LocalSearchIndex:
+    """FTS5 index over title, creators, abstract, notes, tags and annotations."""
+
+    SCHEMA_VERSION = "2"
+    REFRESH_BATCH_SIZE = 500
+
+    def __init__(self, index_path: str | Path):
+        """
+        Initialize the search index.
+
+        Args:
+            index_path: Path of the sidecar SQLite database
+        """
+        self.index_path = Path(index_path)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the index connection, creating the schema if needed."""
+        if self._connection is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.index_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_schema(conn)
+            self._connection = conn
+        return self._connection
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create tables, rebuilding them when the schema version changed."""
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+        )
+        row = conn.execute(
+            "SELECT value FROM meta WHERE name = 'schema_version'"
+        ).fetchone()
+        if row and row[0] != self.SCHEMA_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS item_fts; DROP TABLE IF EXISTS item_state;"
+                "DELETE FROM meta;"
+            )
+
+        columns = ", ".join(_FTS_COLUMNS)
+        conn.executescript(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS item_fts USING fts5(
+                {columns},
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            );
+            CREATE TABLE IF NOT EXISTS item_state (
+                item_id INTEGER PRIMARY KEY,
+                item_key TEXT NOT NULL,
+                stamp TEXT NOT NULL,
+                fulltext_indexed INTEGER NOT NULL DEFAULT 0
+            );
+            """
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+            (self.SCHEMA_VERSION,),
+        )
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the index connection."""
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    # -------------------- Refresh --------------------
+
+    def _get_meta(self, name: str) -> str | None:
+        row = (
+            self._get_connection()
+            .execute("SELECT value FROM meta WHERE name = ?", (name,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def _set_meta(self, name: str, value: str) -> None:
+        self._get_connection().execute(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)", (name, value)
+        )
+
+    @staticmethod
+    def _item_columns(item: ZoteroItem) -> tuple[str, ...]:
+        """Map a ZoteroItem to the FTS column values."""
+        notes = _HTML_TAG_RE.sub(" ", item.notes or "")
+        annotations = "\n".join(
+            " ".join(filter(None, [ann.get("text", ""), ann.get("comment", "")]))
+            for ann in item.annotations
+        )
+        return (
+            item.title or "",
+            item.creators or "",
+            item.abstract or "",
+            notes,
+            " ".join(item.tags),
+            annotations,
+            item.fulltext or "",
+        )
+
+    def refresh(
+        self,
+        client: LocalDatabaseClient,
+        include_fulltext: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Bring the index up to date with the Zotero database.
+
+        A cheap library fingerprint (item count, newest ``dateModified``) is
+        checked first; only when it differs are per-item stamps compared and
+        added/changed/removed items re-indexed. With ``include_fulltext``,
+        items whose attachment text was never indexed are re-indexed too;
+        without it, rows that already carry the text keep it.
+
+        Args:
+            client: Local database client to read items from
+            include_fulltext: Whether to index extracted attachment text
+
+        Returns:
+            Refresh statistics
+        """
+        with self._lock:
+            started = time.perf_counter()
+            stats: dict[str, Any] = {
+                "skipped": False,
+                "indexed": 0,
+                "removed": 0,
+                "duration_ms": 0.0,
+            }
+
+            conn = self._get_connection()
+            fingerprint = client.get_library_fingerprint()
+            missing_fulltext = include_fulltext and (
+                conn.execute(
+                    "SELECT 1 FROM item_state WHERE fulltext_indexed = 0 LIMIT 1"
+                ).fetchone()
+                is not None
+            )
+            if self._get_meta("fingerprint") == fingerprint and not missing_fulltext:
+                stats["skipped"] = True
+                return stats
+
+            current = client.get_item_stamps()
+            known = {
+                row[0]: (row[1], bool(row[2]))
+                for row in conn.execute(
+                    "SELECT item_id, stamp, fulltext_indexed FROM item_state"
+                )
+            }
+
+            removed = [item_id for item_id in known if item_id not in current]
+            changed_keys = [
+                key
+                for item_id, (key, stamp) in current.items()
+                if item_id not in known
+                or known[item_id][0] != stamp
+                or (include_fulltext and not known[item_id][1])
+            ]
+
+            for item_id in removed:
+                conn.execute("DELETE FROM item_fts WHERE rowid = ?", (item_id,))
+                conn.execute("DELETE FROM item_state WHERE item_id = ?", (item_id,))
+
+            for i in range(0, len(changed_keys), self.REFRESH_BATCH_SIZE):
+                batch_keys = changed_keys[i : i + self.REFRESH_BATCH_SIZE]
+                items = client.get_items_by_keys(
+                    batch_keys, include_fulltext=include_fulltext
+                )
+                for item in items:
+                    conn.execute(
+                        "DELETE FROM item_fts WHERE rowid = ?", (item.item_id,)
+                    )
+                    conn.execute(
+                        f"INSERT INTO item_fts (rowid, {', '.join(_FTS_COLUMNS)}) "
+                        f"VALUES (?, {', '.join('?' for _ in _FTS_COLUMNS)})",
+                        (item.item_id, *self._item_columns(item)),
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO item_state VALUES (?, ?, ?, ?)",
+                        (
+                            item.item_id,
+                            item.key,
+                            current[item.item_id][1],
+                            int(include_fulltext),
+                        ),
+                    )
+                stats["indexed"] += len(items)
+
+            self._set_meta("fingerprint", fingerprint)
+            conn.commit()
+
+            stats["removed"] = len(removed)
+            stats["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            logger.info(
+                f"Refreshed local search index: indexed={stats['indexed']}, "
+                f"removed={stats['removed']} in {stats['duration_ms']}ms"
+            )
+            return stats
+
+    # -------------------- Search --------------------
+
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        offset: int = 0,
+        include_fulltext: bool = False,
+    ) -> list[str]:
+        """
+        Search the index with BM25 ranking.
+
+        Args:
+            query: User search text
+            limit: Maximum results
+            offset: Pagination offset
+            include_fulltext: Also match attachment text (refresh the index
+                with the same flag first)
+
+        Returns:
+            Matching item keys, best match first
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        if not include_fulltext:
+            match = f"{_METADATA_COLUMNS} : ({match})"
+
+        weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+        sql = f"""
+            SELECT s.item_key
+            FROM item_fts
+            JOIN item_state s ON s.item_id = item_fts.rowid
+            WHERE item_fts MATCH ?
+            ORDER BY bm25(item_fts, {weights})
+            LIMIT ? OFFSET ?
+        """
+        with self._lock:
+            rows = self._get_connection().execute(
+                sql, (match, max(limit, 0), max(offset, 0))
+            )
+            return [row[0] for row in rows]
@@ -0,0 +1,353 @@
+"""
+Persistent cache of text extracted from attachments.
+
+Parsing PDFs is by far the most expensive part of semantic indexing, bundle
+fetching and workflow runs. Extracted text is stored in a SQLite file keyed
+by content hash and extractor, and a small file table remembers
+(attachment key, path, size, mtime) -> hash, so unchanged files are neither
+parsed nor re-hashed. The cache is size-capped with LRU eviction.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+import hashlib
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+import zlib
+
+from zotero_mcp.utils.config import get_config_path
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class FulltextCache:
+    """Content-addressed on-disk cache of extracted attachment text."""
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_path: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: Path of the cache SQLite database
+            max_bytes: Size cap for stored (compressed) text
+        """
+        self.cache_path = Path(cache_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the cache connection, creating the schema if needed."""
+        if self._connection is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.cache_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    attachment_key TEXT,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entries (
+                    content_hash TEXT NOT NULL,
+                    extractor TEXT NOT NULL,
+                    text BLOB NOT NULL,
+                    stored_bytes INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (content_hash, extractor)
+                );
+                CREATE INDEX IF NOT EXISTS entries_last_access
+                    ON entries (last_access);
+                """
+            )
+            self._connection = conn
+        return self._connection
+
+    def close(self) -> None:
+        """Close the cache connection."""
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    # -------------------- Hashing --------------------
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _content_hash(self, path: Path, attachment_key: str | None) -> str:
+        """Return the file hash, re-hashing only when size or mtime changed."""
+        stat = path.stat()
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT size, mtime_ns, content_hash FROM files WHERE path = ?",
+            (str(path),),
+        ).fetchone()
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+
+        content_hash = self._hash_file(path)
+        conn.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+            (
+                str(path),
+                attachment_key or path.parent.name,
+                stat.st_size,
+                stat.st_mtime_ns,
+                content_hash,
+            ),
+        )
+        conn.commit()
+        return content_hash
+
+    # -------------------- Entries --------------------
+
+    def _get_entry(self, content_hash: str, extractor: str) -> str | None:
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT text FROM entries WHERE content_hash = ? AND extractor = ?",
+            (content_hash, extractor),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        conn.execute(
+            "UPDATE entries SET last_access = ? "
+            "WHERE content_hash = ? AND extractor = ?",
+            (time.time(), content_hash, extractor),
+        )
+        conn.commit()
+        self.hits += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def _put_entry(self, content_hash: str, extractor: str, text: str) -> None:
+        payload = zlib.compress(text.encode("utf-8"))
+        conn = self._get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (content_hash, extractor, payload, len(payload), time.time()),
+        )
+        conn.commit()
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its cap."""
+        conn = self._get_connection()
+        total = conn.execute(
+            "SELECT COALESCE(SUM(stored_bytes), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        rows = conn.execute(
+            "SELECT content_hash, extractor, stored_bytes FROM entries "
+            "ORDER BY last_access ASC"
+        ).fetchall()
+        for content_hash, extractor, stored_bytes in rows:
+            if total <= target:
+                break
+            conn.execute(
+                "DELETE FROM entries WHERE content_hash = ? AND extractor = ?",
+                (content_hash, extractor),
+            )
+            total -= stored_bytes
+            evicted += 1
+        conn.execute(
+            "DELETE FROM files WHERE content_hash NOT IN "
+            "(SELECT content_hash FROM entries)"
+        )
+        conn.commit()
+        logger.debug(f"Evicted {evicted} fulltext cache entries")
+
+    # -------------------- Public API --------------------
+
+    def get(
+        self,
+        path: Path,
+        extractor: str,
+        attachment_key: str | None = None,
+    ) -> str | None:
+        """
+        Look up cached text for a file.
+
+        Args:
+            path: Attachment file path
+            extractor: Extractor identifier (e.g. ``"pdfminer:10"``)
+            attachment_key: Zotero attachment key (defaults to the storage
+                directory name)
+
+        Returns:
+            Cached text, or None on a miss
+        """
+        with self._lock:
+            try:
+                content_hash = self._content_hash(path, attachment_key)
+                return self._get_entry(content_hash, extractor)
+            except (OSError, sqlite3.Error) as e:
+                logger.debug(f"Fulltext cache lookup failed for {path}: {e}")
+                return None
+
+    def put(
+        self,
+        path: Path,
+        extractor: str,
+        text: str,
+        attachment_key: str | None = None,
+    ) -> None:
+        """
+        Store extracted text for a file.
+
+        Args:
+            path: Attachment file path
+            extractor: Extractor identifier
+            text: Extracted text (empty results are cached too, so only
+                store the output of a successful extraction)
+            attachment_key: Zotero attachment key
+        """
+        with self._lock:
+            try:
+                content_hash = self._content_hash(path, attachment_key)
+                self._put_entry(content_hash, extractor, text)
+            except (OSError, sqlite3.Error) as e:
+                logger.debug(f"Fulltext cache store failed for {path}: {e}")
+
+    def get_or_extract(
+        self,
+        path: Path,
+        extractor: str,
+        extract: Callable[[Path], str],
+        attachment_key: str | None = None,
+    ) -> str:
+        """
+        Return cached text for a file, extracting and storing it on a miss.
+
+        Args:
+            path: Attachment file path
+            extractor: Extractor identifier
+            extract: Function performing the actual extraction; it must
+                raise on failure, as whatever it returns is cached
+            attachment_key: Zotero attachment key
+
+        Returns:
+            Extracted text
+
+        Raises:
+            Exception: Whatever ``extract`` raises; nothing is cached then,
+                so the file is extracted again on the next call
+        """
+        cached = self.get(path, extractor, attachment_key)
+        if cached is not None:
+            return cached
+
+        text = extract(path)
+        self.put(path, extractor, text, attachment_key)
+        return text
+
+    def get_or_extract_bytes(
+        self,
+        data: bytes,
+        extractor: str,
+        extract: Callable[[bytes], str | None],
+    ) -> str | None:
+        """
+        Like get_or_extract, for attachment content already in memory.
+
+        Args:
+            data: Raw attachment bytes
+            extractor: Extractor identifier
+            extract: Function performing the actual extraction; it must
+                raise on failure, as whatever it returns is cached
+
+        Returns:
+            Extracted text, or None if extraction produced nothing
+
+        Raises:
+            Exception: Whatever ``extract`` raises (nothing is cached then)
+        """
+        content_hash = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            try:
+                cached = self._get_entry(content_hash, extractor)
+            except sqlite3.Error as e:
+                logger.debug(f"Fulltext cache lookup failed: {e}")
+                cached = None
+        if cached is not None:
+            return cached or None
+
+        text = extract(data)
+        with self._lock:
+            try:
+                self._put_entry(content_hash, extractor, text or "")
+            except sqlite3.Error as e:
+                logger.debug(f"Fulltext cache store failed: {e}")
+        return text
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and hit statistics."""
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute("SELECT COUNT(*), COALESCE(SUM(stored_bytes), 0) FROM entries")
+                .fetchone()
+            )
+        return {
+            "entries": row[0],
+            "stored_bytes": row[1],
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_fulltext_cache() -> FulltextCache | None:
+    """
+    Get the shared fulltext cache.
+
+    Environment Variables:
+        ZOTERO_FULLTEXT_CACHE_MB: Size cap in megabytes (default: 512,
+            ``0`` disables the cache)
+
+    Returns:
+        FulltextCache, or None when disabled
+    """
+    try:
+        max_mb = int(os.getenv("ZOTERO_FULLTEXT_CACHE_MB", "512"))
+    except ValueError:
+        max_mb = 512
+    if max_mb <= 0:
+        return None
+
+    return FulltextCache(
+        get_config_path() / "fulltext_cache.sqlite",
+        max_bytes=max_mb * 1024 * 1024,
+    )
@@ -5,18 +5,66 @@ Provides direct SQLite access to Zotero's local database for faster
 operations when running in local mode.
 """
 
-from collections.abc import Iterator
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+import json
 import logging
 import os
 from pathlib import Path
 import platform
 import sqlite3
+import sys
+import threading
+import time
 from typing import Any
 
+from .db_pool import ReadConnectionPool
+from .db_snapshot import (
+    DatabaseSnapshot,
+    is_lock_error,
+    shared_snapshot,
+    snapshot_uri,
+)
+from .fts_index import LocalSearchIndex, default_index_path
+from .fulltext_cache import FulltextCache, get_fulltext_cache
+
 logger = logging.getLogger(__name__)
 
 
+# Zotero's itemAttachments.linkMode values as named by the Web API
+_LINK_MODES = {
+    0: "imported_file",
+    1: "imported_url",
+    2: "linked_file",
+    3: "linked_url",
+    4: "embedded_image",
+}
+# Zotero's numeric annotation types as named by the Web API
+_ANNOTATION_TYPES = {
+    1: "highlight",
+    2: "note",
+    3: "image",
+    4: "ink",
+    5: "underline",
+    6: "text",
+}
+
+
+def _annotation_type_name(value: Any) -> str:
+    """Name an annotation type stored either as a number or as a name."""
+    if isinstance(value, int):
+        return _ANNOTATION_TYPES.get(value, str(value))
+    return str(value or "")
+
+
+def _api_timestamp(value: str | None) -> str:
+    """Convert a ``YYYY-MM-DD HH:MM:SS`` UTC timestamp to the API's ISO form."""
+    if not value:
+        return ""
+    return f"{value.replace(' ', 'T')}Z"
+
+
 @dataclass
 class ZoteroItem:
     """Represents a Zotero item with text content."""
@@ -35,8 +83,12 @@ class ZoteroItem:
     extra: str | None = None
     date_added: str | None = None
     date_modified: str | None = None
+    date: str | None = None
     tags: list[str] = field(default_factory=list)
+    collections: list[str] = field(default_factory=list)
     annotations: list[dict[str, str]] = field(default_factory=list)
+    # All itemData fields by Zotero field name (e.g. "publicationTitle", "url")
+    fields: dict[str, str] = field(default_factory=dict)
 
     def get_searchable_text(self, max_fulltext: int = 5000) -> str:
         """
@@ -105,10 +157,18 @@ class LocalDatabaseClient:
     Provides fast read-only access to item metadata and content.
     """
 
+    # Page ends remembered for keyset pagination (see get_items)
+    MAX_PAGE_CURSORS = 256
+    SNAPSHOT_MODES = ("auto", "always", "never")
+
     def __init__(
         self,
         db_path: str | Path | None = None,
         pdf_max_pages: int = 10,
+        search_index_path: str | Path | None = None,
+        fulltext_cache: FulltextCache | None = None,
+        snapshot_mode: str | None = None,
+        snapshot_dir: str | Path | None = None,
     ):
         """
         Initialize the database client.
@@ -116,10 +176,55 @@ class LocalDatabaseClient:
         Args:
             db_path: Path to zotero.sqlite (auto-detected if None)
             pdf_max_pages: Maximum pages to extract from PDFs
+            search_index_path: Path to the FTS5 sidecar index
+                (defaults to a per-database file under the config directory)
+            fulltext_cache: Cache for extracted attachment text
+                (defaults to the shared cache, see get_fulltext_cache)
+            snapshot_mode: "auto" reads a snapshot copy (see DatabaseSnapshot)
+                once the live database turns out to be locked by Zotero,
+                "always" reads only snapshots, "never" only the live file
+                (defaults to ZOTERO_DB_SNAPSHOT, else "auto")
+            snapshot_dir: Directory for snapshot copies
+                (defaults to a per-database directory under the config path)
         """
         self.db_path = Path(db_path) if db_path else self._find_database()
         self.pdf_max_pages = pdf_max_pages
-        self._connection: sqlite3.Connection | None = None
+        self.search_index_path = (
+            Path(search_index_path)
+            if search_index_path
+            else default_index_path(self.db_path)
+        )
+        self.fulltext_cache = fulltext_cache or get_fulltext_cache()
+        self.snapshot_mode = (
+            snapshot_mode or os.getenv("ZOTERO_DB_SNAPSHOT", "auto")
+        ).lower()
+        if self.snapshot_mode not in self.SNAPSHOT_MODES:
+            raise ValueError(
+                f"Invalid snapshot mode {self.snapshot_mode!r}, "
+                f"expected one of {self.SNAPSHOT_MODES}"
+            )
+        self.snapshot_dir = snapshot_dir
+        self._snapshot: DatabaseSnapshot | None = None
+        if self.snapshot_mode == "always":
+            self._snapshot = shared_snapshot(self.db_path, snapshot_dir)
+        # One read-only connection per calling thread (see ReadConnectionPool)
+        self._pool = ReadConnectionPool()
+        # Guards lazily created shared state (lock probe, cursors, index)
+        self._lock = threading.RLock()
+        self._lock_probed = False
+        # fieldID -> fieldName, resolved once per client (see _get_field_names)
+        self._field_names: dict[int, str] | None = None
+        # libraryID of My Library, resolved once (see _user_library_id)
+        self._library_id: int | None = None
+        # (filters, position) -> (dateModified, itemID) where a page ended
+        self._page_cursors: OrderedDict[
+            tuple[tuple[Any, ...], int], tuple[str, int]
+        ] = OrderedDict()
+        # Library fingerprint the remembered page ends are valid for
+        self._cursor_fingerprint: str | None = None
+        self._search_index: LocalSearchIndex | None = None
+        # Timings of the most recent item load (see _build_items)
+        self.last_load_stats: dict[str, Any] = {}
 
         # Suppress noisy PDF warnings
         logging.getLogger("pdfminer").setLevel(logging.ERROR)
@@ -170,19 +275,79 @@ class LocalDatabaseClient:
         """Get the Zotero storage directory."""
         return self.db_path.parent / "storage"
 
+    @property
+    def reads_snapshot(self) -> bool:
+        """Whether reads go to a snapshot copy instead of the live database."""
+        return self._snapshot is not None
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Get or create database connection (read-only)."""
-        if self._connection is None:
-            uri = f"file:{self.db_path}?mode=ro"
-            self._connection = sqlite3.connect(uri, uri=True)
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
+        """
+        Get the calling thread's read-only database connection.
+
+        Each thread gets its own pooled connection, so reads from the event
+        loop and from executor threads run in parallel. In snapshot mode the
+        connection follows the newest snapshot: when a background refresh
+        has published a new copy, the next call opens it.
+        """
+        if self.snapshot_mode == "auto" and not self._lock_probed:
+            self._probe_lock()
+        if self._snapshot is not None:
+            return self._pool.get(snapshot_uri(self._snapshot.current()))
+        return self._pool.get(f"file:{self.db_path}?mode=ro")
+
+    def _probe_lock(self) -> None:
+        """
+        Switch to snapshot reads if Zotero holds the database lock.
+
+        Once any client of this process found the database locked, later
+        clients read the shared snapshot without probing again.
+        """
+        with self._lock:
+            if self._lock_probed:
+                return
+            self._snapshot = shared_snapshot(
+                self.db_path, self.snapshot_dir, create=False
+            )
+            if self._snapshot is not None:
+                self._lock_probed = True
+                return
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            try:
+                locked = self._is_locked(conn)
+            finally:
+                conn.close()
+            if locked:
+                logger.info(
+                    f"{self.db_path} is locked by Zotero, reading from a snapshot"
+                )
+                self._snapshot = shared_snapshot(self.db_path, self.snapshot_dir)
+            self._lock_probed = True
+
+    @staticmethod
+    def _is_locked(conn: sqlite3.Connection) -> bool:
+        """Probe without waiting whether another process locks the database."""
+        conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            conn.execute("PRAGMA schema_version").fetchone()
+        except sqlite3.OperationalError as e:
+            if is_lock_error(e):
+                return True
+            raise
+        return False
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the connections of all threads and the search index."""
+        self._pool.close()
+        with self._lock:
+            if self._snapshot is None:
+                # Zotero may have been started since; probe again on reuse
+                self._lock_probed = False
+        # The snapshot is shared with other clients and stays open for them
+        self._field_names = None
+        self._library_id = None
+        if self._search_index:
+            self._search_index.close()
+            self._search_index = None
 
     def __enter__(self) -> "LocalDatabaseClient":
         return self
@@ -207,20 +372,150 @@ class LocalDatabaseClient:
         self,
         limit: int | None = None,
         include_fulltext: bool = False,
+        offset: int = 0,
+        item_type: str | None = None,
+        collection_key: str | None = None,
+        tag: str | None = None,
+        after: tuple[str, int] | None = None,
     ) -> list[ZoteroItem]:
         """
-        Get all items with their metadata.
+        Get items with their metadata, most recently modified first.
+
+        Pages are cut with keyset pagination on (dateModified, itemID): the
+        position where each returned page ends is remembered, so asking for
+        the next ``offset`` continues from there instead of skipping all
+        earlier rows again. Remembered positions are dropped whenever the
+        library fingerprint changes, so ``offset`` always means the same as
+        SQL OFFSET. Filters are applied in SQL before paging.
 
         Args:
             limit: Maximum items to return
             include_fulltext: Whether to extract full text from attachments
+            offset: Number of matching items to skip
+            item_type: Only return items of this type (e.g. "journalArticle")
+            collection_key: Only return items in this collection
+            tag: Only return items with this tag
+            after: Cursor ``(date_modified, item_id)`` of the last item of the
+                previous page; ``offset`` then counts from the cursor
 
         Returns:
             List of ZoteroItem objects
         """
-        conn = self._get_connection()
+        filters = (item_type, collection_key, tag)
+        by_offset = after is None and bool(limit or offset)
+        position = 0
+        if by_offset:
+            self._validate_page_cursors()
+            if offset > 0:
+                position, after = self._nearest_page_cursor(filters, offset)
+
+        where, params = self._item_filters(item_type, collection_key, tag)
+        if after is not None:
+            where += (
+                " AND (i.dateModified < ? OR (i.dateModified = ? AND i.itemID < ?))"
+            )
+            params += (after[0], after[0], after[1])
+
+        items = self._fetch_items(
+            where=where,
+            params=params,
+            limit=limit,
+            offset=max(offset - position, 0),
+            include_fulltext=include_fulltext,
+        )
+        if by_offset and items:
+            self._remember_page_cursor(filters, offset + len(items), items[-1])
+        return items
 
-        query = """
+    @staticmethod
+    def _item_filters(
+        item_type: str | None,
+        collection_key: str | None,
+        tag: str | None,
+    ) -> tuple[str, tuple[Any, ...]]:
+        """Build the SQL conditions for the item-type, collection and tag filters."""
+        where = ""
+        params: tuple[Any, ...] = ()
+        if item_type:
+            where += " AND it.typeName = ?"
+            params += (item_type,)
+        if collection_key:
+            where += """ AND i.itemID IN (
+                SELECT ci.itemID FROM collectionItems ci
+                JOIN collections c ON c.collectionID = ci.collectionID
+                WHERE c.key = ?
+            )"""
+            params += (collection_key,)
+        if tag:
+            where += """ AND i.itemID IN (
+                SELECT itg.itemID FROM itemTags itg
+                JOIN tags t ON t.tagID = itg.tagID
+                WHERE t.name = ?
+            )"""
+            params += (tag,)
+        return where, params
+
+    def _validate_page_cursors(self) -> None:
+        """Forget remembered page ends once items were added, changed or removed."""
+        fingerprint = self.get_library_fingerprint()
+        with self._lock:
+            if fingerprint != self._cursor_fingerprint:
+                self._page_cursors.clear()
+                self._cursor_fingerprint = fingerprint
+
+    def _nearest_page_cursor(
+        self, filters: tuple[Any, ...], offset: int
+    ) -> tuple[int, tuple[str, int] | None]:
+        """Find the remembered page end closest to (and not past) ``offset``."""
+        best: tuple[int, tuple[str, int] | None] = (0, None)
+        with self._lock:
+            for (cached_filters, position), cursor in self._page_cursors.items():
+                if cached_filters == filters and best[0] < position <= offset:
+                    best = (position, cursor)
+        return best
+
+    def _remember_page_cursor(
+        self, filters: tuple[Any, ...], position: int, last: ZoteroItem
+    ) -> None:
+        """Remember where a page ended so the next page can seek to it."""
+        with self._lock:
+            self._page_cursors[(filters, position)] = (
+                str(last.date_modified or ""),
+                last.item_id,
+            )
+            self._page_cursors.move_to_end((filters, position))
+            while len(self._page_cursors) > self.MAX_PAGE_CURSORS:
+                self._page_cursors.popitem(last=False)
+
+    @staticmethod
+    def _item_query(where: str = "") -> str:
+        """
+        Build the item metadata query.
+
+        Field values are not joined in here; ``_build_items`` loads them for
+        the whole result set with ``_load_fields_bulk``. Filtering and paging
+        run on ``items`` alone, so notes and creators are only aggregated for
+        the items of the requested page.
+
+        Args:
+            where: Extra SQL condition on ``i`` (items) and ``it``
+                (itemTypes) appended to the WHERE clause (must start with
+                ``AND``)
+
+        Returns:
+            SQL selecting one row per parent item; its last two parameters
+            are LIMIT and OFFSET
+        """
+        return f"""
+        WITH page AS (
+            SELECT i.itemID
+            FROM items i
+            JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
+            WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
+            {where}
+            ORDER BY i.dateModified DESC, i.itemID DESC
+            LIMIT ? OFFSET ?
+        )
         SELECT
             i.itemID,
             i.key,
@@ -228,10 +523,6 @@ class LocalDatabaseClient:
             it.typeName as item_type,
             i.dateAdded,
             i.dateModified,
-            title_val.value as title,
-            abstract_val.value as abstract,
-            extra_val.value as extra,
-            doi_val.value as doi,
             GROUP_CONCAT(n.note, ' ') as notes,
             GROUP_CONCAT(
                 CASE
@@ -242,35 +533,10 @@ class LocalDatabaseClient:
                     ELSE NULL
                 END, '; '
             ) as creators
-        FROM items i
+        FROM page
+        JOIN items i ON i.itemID = page.itemID
         JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
 
-        -- Title (fieldID = 1)
-        LEFT JOIN itemData title_data
-            ON i.itemID = title_data.itemID
-            AND title_data.fieldID = 1
-        LEFT JOIN itemDataValues title_val ON title_data.valueID = title_val.valueID
-
-        -- Abstract (fieldID = 2)
-        LEFT JOIN itemData abstract_data
-            ON i.itemID = abstract_data.itemID
-            AND abstract_data.fieldID = 2
-        LEFT JOIN itemDataValues abstract_val
-            ON abstract_data.valueID = abstract_val.valueID
-
-        -- Extra (fieldID = 16)
-        LEFT JOIN itemData extra_data
-            ON i.itemID = extra_data.itemID
-            AND extra_data.fieldID = 16
-        LEFT JOIN itemDataValues extra_val ON extra_data.valueID = extra_val.valueID
-
-        -- DOI
-        LEFT JOIN fields doi_f ON doi_f.fieldName = 'DOI'
-        LEFT JOIN itemData doi_data
-            ON i.itemID = doi_data.itemID
-            AND doi_data.fieldID = doi_f.fieldID
-        LEFT JOIN itemDataValues doi_val ON doi_data.valueID = doi_val.valueID
-
         -- Notes
         LEFT JOIN itemNotes n ON i.itemID = n.parentItemID OR i.itemID = n.itemID
 
@@ -278,23 +544,68 @@ class LocalDatabaseClient:
         LEFT JOIN itemCreators ic ON i.itemID = ic.itemID
         LEFT JOIN creators c ON ic.creatorID = c.creatorID
 
-        WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
+        GROUP BY i.itemID
+
+        ORDER BY i.dateModified DESC, i.itemID DESC
+        """
+
+    def _fetch_items(
+        self,
+        where: str = "",
+        params: tuple[Any, ...] = (),
+        limit: int | None = None,
+        offset: int = 0,
+        include_fulltext: bool = False,
+    ) -> list[ZoteroItem]:
+        """Run the item metadata query and assemble ZoteroItem objects."""
+        conn = self._get_connection()
+        query = self._item_query(where)
+
+        started = time.perf_counter()
+        rows = conn.execute(query, (*params, limit or -1, offset)).fetchall()
+        query_ms = (time.perf_counter() - started) * 1000
+
+        return self._build_items(
+            rows,
+            include_fulltext=include_fulltext,
+            query_ms=query_ms,
+        )
+
+    def _build_items(
+        self,
+        rows: list[sqlite3.Row],
+        include_fulltext: bool = False,
+        query_ms: float = 0.0,
+    ) -> list[ZoteroItem]:
+        """
+        Assemble ZoteroItem objects from item rows without per-row queries.
 
-        GROUP BY
-                 i.itemID, i.key, i.itemTypeID, it.typeName,
-                 i.dateAdded, i.dateModified,
-                 title_val.value, abstract_val.value, extra_val.value
+        Fields, tags, collections and annotations for the whole result set
+        are loaded with one set-based query each and grouped by itemID in
+        memory. Timings are stored in ``last_load_stats`` and logged at debug
+        level.
 
-        ORDER BY i.dateModified DESC
+        Args:
+            rows: Rows produced by the item metadata query
+            include_fulltext: Whether to extract full text from attachments
+            query_ms: Time spent running the item metadata query
+
+        Returns:
+            List of ZoteroItem objects in row order
         """
+        item_ids = [row["itemID"] for row in rows]
 
-        if limit:
-            query += f" LIMIT {limit}"
+        started = time.perf_counter()
+        fields_by_item = self._load_fields_bulk(item_ids)
+        fields_done = time.perf_counter()
+        tags_by_item = self._load_tags_bulk(item_ids)
+        collections_by_item = self._load_collections_bulk(item_ids)
+        tags_done = time.perf_counter()
+        annotations_by_item = self._load_annotations_bulk(item_ids)
+        annotations_done = time.perf_counter()
 
-        cursor = conn.execute(query)
         items = []
-
-        for row in cursor:
+        for row in rows:
             fulltext = None
             fulltext_source = None
 
@@ -303,35 +614,92 @@ class LocalDatabaseClient:
                 if result:
                     fulltext, fulltext_source = result
 
+            fields = fields_by_item.get(row["itemID"], {})
             item = ZoteroItem(
                 item_id=row["itemID"],
                 key=row["key"],
                 item_type_id=row["itemTypeID"],
                 item_type=row["item_type"],
-                doi=row["doi"],
-                title=row["title"],
-                abstract=row["abstract"],
+                doi=fields.get("DOI"),
+                title=fields.get("title"),
+                abstract=fields.get("abstractNote"),
                 creators=row["creators"],
                 fulltext=fulltext,
                 fulltext_source=fulltext_source,
                 notes=row["notes"],
-                extra=row["extra"],
+                extra=fields.get("extra"),
                 date_added=row["dateAdded"],
                 date_modified=row["dateModified"],
-                tags=self._get_item_tags(row["itemID"]),
-                annotations=self._get_item_annotations(row["itemID"]),
+                date=fields.get("date"),
+                tags=tags_by_item.get(row["itemID"], []),
+                collections=collections_by_item.get(row["itemID"], []),
+                annotations=annotations_by_item.get(row["itemID"], []),
+                fields=fields,
             )
             items.append(item)
 
+        finished = time.perf_counter()
+        self.last_load_stats = {
+            "items": len(items),
+            "queries": 5 if item_ids else 1,
+            "items_query_ms": round(query_ms, 2),
+            "fields_ms": round((fields_done - started) * 1000, 2),
+            "tags_ms": round((tags_done - fields_done) * 1000, 2),
+            "annotations_ms": round((annotations_done - tags_done) * 1000, 2),
+            "assemble_ms": round((finished - annotations_done) * 1000, 2),
+            "total_ms": round(query_ms + (finished - started) * 1000, 2),
+        }
+        logger.debug(f"Loaded local items: {self.last_load_stats}")
         return items
 
-    def get_item_by_key(self, key: str) -> ZoteroItem | None:
-        """Get a specific item by its key."""
-        items = self.get_items()
-        for item in items:
-            if item.key == key:
-                return item
-        return None
+    def get_item_by_key(
+        self,
+        key: str,
+        include_fulltext: bool = False,
+    ) -> ZoteroItem | None:
+        """
+        Get a specific item by its key.
+
+        Args:
+            key: Item key (8-character string)
+            include_fulltext: Whether to extract full text from attachments
+
+        Returns:
+            ZoteroItem or None if not found
+        """
+        items = self._fetch_items(
+            where="AND i.key = ?",
+            params=(key,),
+            include_fulltext=include_fulltext,
+        )
+        return items[0] if items else None
+
+    def get_items_by_keys(
+        self,
+        keys: list[str],
+        include_fulltext: bool = False,
+    ) -> list[ZoteroItem]:
+        """
+        Get several items by key with a single query.
+
+        Args:
+            keys: Item keys to look up
+            include_fulltext: Whether to extract full text from attachments
+
+        Returns:
+            Found items, in the order of ``keys`` (missing keys are skipped)
+        """
+        unique_keys = list(dict.fromkeys(k for k in keys if k))
+        if not unique_keys:
+            return []
+
+        items = self._fetch_items(
+            where="AND i.key IN (SELECT value FROM json_each(?))",
+            params=(json.dumps(unique_keys),),
+            include_fulltext=include_fulltext,
+        )
+        by_key = {item.key: item for item in items}
+        return [by_key[k] for k in unique_keys if k in by_key]
 
     def get_item_id_by_key(self, key: str) -> int | None:
         """
@@ -379,22 +747,157 @@ class LocalDatabaseClient:
             logger.error(f"Failed to extract fulltext for {key}: {e}")
             return None
 
+    def get_library_fingerprint(self) -> str:
+        """
+        Get a cheap fingerprint that changes whenever any item changes.
+
+        Returns:
+            String combining the item count and newest ``dateModified``
+        """
+        conn = self._get_connection()
+        row = conn.execute("SELECT COUNT(*), MAX(dateModified) FROM items").fetchone()
+        return f"{row[0]}:{row[1] or ''}"
+
+    def get_item_stamps(self) -> dict[int, tuple[str, str]]:
+        """
+        Get modification stamps for all parent items.
+
+        The stamp of a parent item combines the newest ``dateModified``
+        among the item itself and its child notes, attachments and
+        annotations with the number of children and the item's collection
+        membership, so editing, adding or removing a child, or moving the
+        item between collections, marks the parent as changed.
+
+        Returns:
+            Mapping of itemID to (key, stamp)
+        """
+        conn = self._get_connection()
+        query = """
+            WITH children AS (
+                SELECT parentItemID AS parent_id, itemID AS child_id
+                FROM itemNotes WHERE parentItemID IS NOT NULL
+                UNION ALL
+                SELECT parentItemID, itemID
+                FROM itemAttachments WHERE parentItemID IS NOT NULL
+                UNION ALL
+                SELECT att.parentItemID, a.itemID
+                FROM itemAnnotations a
+                JOIN itemAttachments att ON att.itemID = a.parentItemID
+                WHERE att.parentItemID IS NOT NULL
+            ),
+            child_stamps AS (
+                SELECT ch.parent_id,
+                       MAX(ci.dateModified) AS stamp,
+                       COUNT(*) AS child_count
+                FROM children ch
+                JOIN items ci ON ci.itemID = ch.child_id
+                GROUP BY ch.parent_id
+            ),
+            memberships AS (
+                SELECT itemID, GROUP_CONCAT(collectionID) AS collection_ids
+                FROM (
+                    SELECT itemID, collectionID FROM collectionItems
+                    ORDER BY itemID, collectionID
+                )
+                GROUP BY itemID
+            )
+            SELECT i.itemID, i.key, i.dateModified,
+                   cs.stamp AS child_stamp, cs.child_count,
+                   m.collection_ids
+            FROM items i
+            JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
+            LEFT JOIN child_stamps cs ON cs.parent_id = i.itemID
+            LEFT JOIN memberships m ON m.itemID = i.itemID
+            WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
+        """
+        stamps: dict[int, tuple[str, str]] = {}
+        for row in conn.execute(query):
+            stamp = max(str(row["dateModified"] or ""), str(row["child_stamp"] or ""))
+            stamps[row["itemID"]] = (
+                row["key"],
+                f"{stamp}#{row['child_count'] or 0}#{row['collection_ids'] or ''}",
+            )
+        return stamps
+
+    def get_pdf_activity(self) -> dict[str, str]:
+        """
+        Get the latest activity of every parent item with a PDF attachment.
+
+        Activity is the newest of the item's and its PDF attachments'
+        ``dateModified`` and, on Zotero 7+, the time an attachment was last
+        opened in the reader (``itemAttachments.lastRead``).
+
+        Returns:
+            Mapping of item key to a sortable ``YYYY-MM-DD HH:MM:SS`` stamp
+        """
+        conn = self._get_connection()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(itemAttachments)")}
+        last_read = (
+            "COALESCE(datetime(ia.lastRead, 'unixepoch'), '')"
+            if "lastRead" in columns
+            else "''"
+        )
+        query = f"""
+            SELECT parent.key AS item_key,
+                   MAX(MAX(parent.dateModified, att.dateModified, {last_read}))
+                       AS activity
+            FROM itemAttachments ia
+            JOIN items att ON att.itemID = ia.itemID
+            JOIN items parent ON parent.itemID = ia.parentItemID
+            WHERE ia.contentType = 'application/pdf'
+               OR LOWER(ia.path) LIKE '%.pdf'
+            GROUP BY parent.key
+        """
+        return {
+            row["item_key"]: str(row["activity"] or "") for row in conn.execute(query)
+        }
+
+    def _get_search_index(self) -> LocalSearchIndex:
+        """Get or create the FTS5 sidecar index."""
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = LocalSearchIndex(self.search_index_path)
+            return self._search_index
+
     def search_items(
         self,
         query: str,
         limit: int = 50,
+        offset: int = 0,
+        include_fulltext: bool = False,
     ) -> list[ZoteroItem]:
         """
-        Simple text search through items.
+        Full-text search through items.
+
+        Uses the FTS5 sidecar index (BM25 ranking, prefix matching,
+        pagination in SQL), refreshing it incrementally first. Falls back
+        to a substring scan when FTS5 is unavailable.
 
         Args:
             query: Search query
             limit: Maximum results
+            offset: Pagination offset
+            include_fulltext: Also match the text of PDF/HTML attachments;
+                the first search with it extracts every attachment (the text
+                is kept in the fulltext cache)
 
         Returns:
-            Matching items
+            Matching items, best match first
         """
-        items = self.get_items()
+        if not query.strip():
+            return self.get_items(limit=limit, offset=offset)
+
+        try:
+            index = self._get_search_index()
+            index.refresh(self, include_fulltext=include_fulltext)
+            keys = index.search(
+                query, limit=limit, offset=offset, include_fulltext=include_fulltext
+            )
+            return self.get_items_by_keys(keys, include_fulltext=include_fulltext)
+        except sqlite3.Error as e:
+            logger.warning(f"FTS5 search unavailable, falling back to scan: {e}")
+
+        items = self.get_items(include_fulltext=include_fulltext)
         query_lower = query.lower()
         matches = []
 
@@ -402,10 +905,459 @@ class LocalDatabaseClient:
             text = item.get_searchable_text().lower()
             if query_lower in text:
                 matches.append(item)
-                if len(matches) >= limit:
+                if len(matches) >= limit + offset:
                     break
 
-        return matches
+        return matches[offset:]
+
+    # -------------------- API-shaped Reads --------------------
+
+    def get_item_data(self, key: str) -> dict[str, Any] | None:
+        """
+        Get an item in the shape returned by the Zotero API.
+
+        The result mirrors the local state: ``version`` is the version of the
+        last sync, so it must not be sent back as If-Unmodified-Since-Version.
+        Callers that write the item back should read it from the API.
+
+        Args:
+            key: Item key (8-character string)
+
+        Returns:
+            ``{"key", "version", "data"}`` dict, or None if not found
+        """
+        items = self._fetch_api_items("i.key = :key", {"key": key})
+        return items[0] if items else None
+
+    def get_item_children_data(
+        self,
+        key: str,
+        item_type: str | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Get the direct children of an item in Zotero API shape.
+
+        Children of a regular item are its notes and attachments; children
+        of an attachment are its annotations.
+
+        Args:
+            key: Parent item key
+            item_type: Only return children of this type
+
+        Returns:
+            Child items oldest first, or None if the parent is not found
+        """
+        parent_id = self._get_library_item_id(key)
+        if parent_id is None:
+            return None
+
+        where = """i.itemID IN (
+                SELECT itemID FROM itemNotes WHERE parentItemID = :parent
+                UNION ALL
+                SELECT itemID FROM itemAttachments WHERE parentItemID = :parent
+                UNION ALL
+                SELECT itemID FROM itemAnnotations WHERE parentItemID = :parent
+            )"""
+        params: dict[str, Any] = {"parent": parent_id}
+        if item_type:
+            where += " AND it.typeName = :item_type"
+            params["item_type"] = item_type
+        return self._fetch_api_items(where, params, order="i.dateAdded, i.itemID")
+
+    def get_annotations_data(self, key: str) -> list[dict[str, Any]] | None:
+        """
+        Get the annotations of an item in Zotero API shape.
+
+        For a regular item this covers the annotations of all its
+        attachments; for an attachment, its own annotations.
+
+        Args:
+            key: Item or attachment key
+
+        Returns:
+            Annotations grouped by attachment in creation order, or None
+            if the item is not found
+        """
+        item_id = self._get_library_item_id(key)
+        if item_id is None:
+            return None
+
+        where = """i.itemID IN (
+                SELECT a.itemID
+                FROM itemAnnotations a
+                LEFT JOIN itemAttachments att ON att.itemID = a.parentItemID
+                WHERE a.parentItemID = :item OR att.parentItemID = :item
+            )"""
+        return self._fetch_api_items(
+            where, {"item": item_id}, order="an.parentItemID, i.itemID"
+        )
+
+    def get_collections_data(self) -> list[dict[str, Any]]:
+        """
+        Get all collections in Zotero API shape.
+
+        Returns:
+            Collections with ``data.name`` and ``data.parentCollection``
+            (False for top-level collections) and ``meta.numItems``
+        """
+        conn = self._get_connection()
+        query = """
+            SELECT c.key, c.version, c.collectionName,
+                   parent.key AS parent_key,
+                   (SELECT COUNT(*) FROM collectionItems ci
+                    WHERE ci.collectionID = c.collectionID) AS num_items
+            FROM collections c
+            LEFT JOIN collections parent
+                ON parent.collectionID = c.parentCollectionID
+            WHERE c.libraryID = ?
+            ORDER BY c.collectionName COLLATE NOCASE, c.collectionID
+        """
+        return [
+            {
+                "key": row["key"],
+                "version": row["version"] or 0,
+                "meta": {"numItems": row["num_items"]},
+                "data": {
+                    "key": row["key"],
+                    "version": row["version"] or 0,
+                    "name": row["collectionName"] or "",
+                    "parentCollection": row["parent_key"] or False,
+                    "relations": {},
+                },
+            }
+            for row in conn.execute(query, (self._user_library_id(),))
+        ]
+
+    def get_collection_items_data(
+        self,
+        collection_key: str,
+        limit: int | None = 100,
+        start: int = 0,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Get the items of a collection in Zotero API shape.
+
+        Args:
+            collection_key: Collection key
+            limit: Maximum results (all items if None or 0)
+            start: Pagination offset
+
+        Returns:
+            Items, most recently modified first, or None if the collection
+            is not found
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT collectionID FROM collections WHERE key = ? AND libraryID = ?",
+            (collection_key, self._user_library_id()),
+        ).fetchone()
+        if row is None:
+            return None
+
+        where = """i.itemID IN (
+                SELECT itemID FROM collectionItems WHERE collectionID = :collection
+            )"""
+        return self._fetch_api_items(
+            where,
+            {"collection": row["collectionID"]},
+            limit=limit,
+            start=start,
+        )
+
+    def get_tags_data(self, limit: int | None = 100) -> list[dict[str, Any]]:
+        """
+        Get the tags in use in Zotero API shape.
+
+        Args:
+            limit: Maximum tags to return (all if None or 0)
+
+        Returns:
+            ``{"tag", "meta": {"type", "numItems"}}`` dicts sorted by name
+        """
+        conn = self._get_connection()
+        query = """
+            SELECT t.name, MIN(it.type) AS type, COUNT(*) AS num_items
+            FROM tags t
+            JOIN itemTags it ON it.tagID = t.tagID
+            JOIN items i ON i.itemID = it.itemID
+            WHERE i.libraryID = ?
+            GROUP BY t.tagID
+            ORDER BY t.name COLLATE NOCASE
+            LIMIT ?
+        """
+        return [
+            {
+                "tag": row["name"],
+                "meta": {"type": row["type"] or 0, "numItems": row["num_items"]},
+            }
+            for row in conn.execute(query, (self._user_library_id(), limit or -1))
+        ]
+
+    def _fetch_api_items(
+        self,
+        where: str,
+        params: dict[str, Any],
+        order: str = "i.dateModified DESC, i.itemID DESC",
+        limit: int | None = None,
+        start: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Load items of any type and assemble Zotero API-shaped dicts.
+
+        Only items of My Library are returned, the library the API client
+        targets; group libraries may hold items with the same keys. Fields,
+        creators, tags, collections and relations for the whole result set
+        are loaded with one set-based query each, like ``_build_items``.
+
+        Args:
+            where: SQL condition on ``i`` (items), ``it`` (itemTypes) and
+                the type-specific tables ``n``, ``ia`` and ``an``
+            params: Named query parameters for ``where``
+            order: SQL ORDER BY expression
+            limit: Maximum results (all if None or 0)
+            start: Pagination offset
+
+        Returns:
+            List of ``{"key", "version", "data"}`` dicts
+        """
+        conn = self._get_connection()
+        query = f"""
+            SELECT
+                i.itemID, i.key, i.version, i.dateAdded, i.dateModified,
+                it.typeName AS item_type,
+                n.note,
+                ia.linkMode AS link_mode,
+                ia.contentType AS content_type,
+                ia.path,
+                an.annotationType AS annotation_type,
+                an.text AS annotation_text,
+                an.comment AS annotation_comment,
+                an.pageLabel AS page_label,
+                parent.key AS parent_key,
+                d.itemID IS NOT NULL AS deleted
+            FROM items i
+            JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
+            LEFT JOIN itemNotes n ON n.itemID = i.itemID
+            LEFT JOIN itemAttachments ia ON ia.itemID = i.itemID
+            LEFT JOIN itemAnnotations an ON an.itemID = i.itemID
+            LEFT JOIN items parent ON parent.itemID = COALESCE(
+                n.parentItemID, ia.parentItemID, an.parentItemID
+            )
+            LEFT JOIN deletedItems d ON d.itemID = i.itemID
+            WHERE i.libraryID = :_library_id AND {where}
+            ORDER BY {order}
+        """
+        params = {**params, "_library_id": self._user_library_id()}
+        if limit or start:
+            query += " LIMIT :_limit OFFSET :_start"
+            params = {**params, "_limit": limit or -1, "_start": max(start, 0)}
+
+        rows = conn.execute(query, params).fetchall()
+        item_ids = [row["itemID"] for row in rows]
+        fields_by_item = self._load_fields_bulk(item_ids)
+        creators_by_item = self._load_creators_bulk(item_ids)
+        tags_by_item = self._load_api_tags_bulk(item_ids)
+        collections_by_item = self._load_collections_bulk(item_ids)
+        relations_by_item = self._load_relations_bulk(item_ids)
+
+        items = []
+        for row in rows:
+            item_id = row["itemID"]
+            item_type = row["item_type"]
+            data: dict[str, Any] = {
+                "key": row["key"],
+                "version": row["version"] or 0,
+                "itemType": item_type,
+            }
+            if row["parent_key"]:
+                data["parentItem"] = row["parent_key"]
+            data.update(fields_by_item.get(item_id, {}))
+
+            if item_type == "attachment":
+                data.update(self._attachment_fields(row))
+            elif item_type == "annotation":
+                data.update(
+                    {
+                        "annotationType": _annotation_type_name(row["annotation_type"]),
+                        "annotationText": row["annotation_text"] or "",
+                        "annotationComment": row["annotation_comment"] or "",
+                        "annotationPageLabel": row["page_label"] or "",
+                    }
+                )
+            elif item_type != "note":
+                data["creators"] = creators_by_item.get(item_id, [])
+            if row["note"] is not None or item_type == "note":
+                data["note"] = row["note"] or ""
+
+            data["tags"] = tags_by_item.get(item_id, [])
+            if not row["parent_key"]:
+                data["collections"] = collections_by_item.get(item_id, [])
+            data["relations"] = relations_by_item.get(item_id, {})
+            data["dateAdded"] = _api_timestamp(row["dateAdded"])
+            data["dateModified"] = _api_timestamp(row["dateModified"])
+            if row["deleted"]:
+                data["deleted"] = 1
+
+            items.append({"key": row["key"], "version": data["version"], "data": data})
+        return items
+
+    @staticmethod
+    def _attachment_fields(row: sqlite3.Row) -> dict[str, Any]:
+        """Map an itemAttachments row to the API's attachment fields."""
+        link_mode = row["link_mode"]
+        path = row["path"] or ""
+        fields: dict[str, Any] = {
+            "linkMode": _LINK_MODES.get(link_mode, str(link_mode or "")),
+            "contentType": row["content_type"] or "",
+        }
+        if path.startswith("storage:"):
+            fields["filename"] = path.split(":", 1)[1]
+        elif path:
+            fields["path"] = path
+        return fields
+
+    def _user_library_id(self) -> int:
+        """Get the libraryID of My Library (the user library), read once."""
+        if self._library_id is None:
+            conn = self._get_connection()
+            row = conn.execute(
+                "SELECT libraryID FROM libraries WHERE type = 'user'"
+            ).fetchone()
+            self._library_id = row["libraryID"] if row else 1
+        return self._library_id
+
+    def _get_library_item_id(self, key: str) -> int | None:
+        """Look up the itemID of a key in My Library."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT itemID FROM items WHERE key = ? AND libraryID = ?",
+            (key, self._user_library_id()),
+        ).fetchone()
+        return row["itemID"] if row else None
+
+    def _get_field_names(self) -> dict[int, str]:
+        """Get the fieldID to fieldName map, read from ``fields`` once."""
+        if self._field_names is None:
+            conn = self._get_connection()
+            self._field_names = {
+                row["fieldID"]: row["fieldName"]
+                for row in conn.execute("SELECT fieldID, fieldName FROM fields")
+            }
+        return self._field_names
+
+    def _load_fields_bulk(self, item_ids: list[int]) -> dict[int, dict[str, str]]:
+        """
+        Load all itemData fields for a set of items in one pass.
+
+        Rows of ``(itemID, fieldID, value)`` are pivoted in Python into one
+        field map per item, so any field (date, publicationTitle, url, ...)
+        is available without a join per field.
+
+        Args:
+            item_ids: Items to load
+
+        Returns:
+            Mapping of itemID to {fieldName: value}
+        """
+        fields: dict[int, dict[str, str]] = {}
+        if not item_ids:
+            return fields
+
+        field_names = self._get_field_names()
+        conn = self._get_connection()
+        query = """
+            SELECT d.itemID, d.fieldID, v.value
+            FROM itemData d
+            JOIN itemDataValues v ON v.valueID = d.valueID
+            WHERE d.itemID IN (SELECT value FROM json_each(?))
+        """
+        for item_id, field_id, value in conn.execute(query, (json.dumps(item_ids),)):
+            name = field_names.get(field_id)
+            if name is not None and value is not None:
+                fields.setdefault(item_id, {})[name] = str(value)
+        return fields
+
+    def _load_creators_bulk(
+        self, item_ids: list[int]
+    ) -> dict[int, list[dict[str, str]]]:
+        """Load creators in API shape for a set of items, in author order."""
+        creators: dict[int, list[dict[str, str]]] = {}
+        if not item_ids:
+            return creators
+
+        conn = self._get_connection()
+        query = """
+            SELECT ic.itemID, c.firstName, c.lastName, c.fieldMode,
+                   COALESCE(ct.creatorType, 'author') AS creator_type
+            FROM itemCreators ic
+            JOIN creators c ON c.creatorID = ic.creatorID
+            LEFT JOIN creatorTypes ct ON ct.creatorTypeID = ic.creatorTypeID
+            WHERE ic.itemID IN (SELECT value FROM json_each(?))
+            ORDER BY ic.itemID, ic.orderIndex
+        """
+        for row in conn.execute(query, (json.dumps(item_ids),)):
+            creator = {"creatorType": row["creator_type"]}
+            if row["fieldMode"] == 1:
+                # Single-field creators (institutions) keep their name in lastName
+                creator["name"] = row["lastName"] or ""
+            else:
+                creator["firstName"] = row["firstName"] or ""
+                creator["lastName"] = row["lastName"] or ""
+            creators.setdefault(row["itemID"], []).append(creator)
+        return creators
+
+    def _load_api_tags_bulk(
+        self, item_ids: list[int]
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Load tags in API shape (automatic tags carry ``type: 1``)."""
+        tags: dict[int, list[dict[str, Any]]] = {}
+        if not item_ids:
+            return tags
+
+        conn = self._get_connection()
+        query = """
+            SELECT it.itemID, t.name, it.type
+            FROM itemTags it
+            JOIN tags t ON t.tagID = it.tagID
+            WHERE it.itemID IN (SELECT value FROM json_each(?))
+            ORDER BY it.itemID, t.name
+        """
+        for row in conn.execute(query, (json.dumps(item_ids),)):
+            tag: dict[str, Any] = {"tag": row["name"]}
+            if row["type"]:
+                tag["type"] = row["type"]
+            tags.setdefault(row["itemID"], []).append(tag)
+        return tags
+
+    def _load_relations_bulk(self, item_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Load item relations in API shape for a set of items.
+
+        Like the API, a predicate with one object maps to a string and a
+        predicate with several objects to a list.
+        """
+        relations: dict[int, dict[str, Any]] = {}
+        if not item_ids:
+            return relations
+
+        conn = self._get_connection()
+        query = """
+            SELECT ir.itemID, rp.predicate, ir.object
+            FROM itemRelations ir
+            JOIN relationPredicates rp ON rp.predicateID = ir.predicateID
+            WHERE ir.itemID IN (SELECT value FROM json_each(?))
+            ORDER BY ir.itemID, rp.predicate, ir.object
+        """
+        for row in conn.execute(query, (json.dumps(item_ids),)):
+            item_relations = relations.setdefault(row["itemID"], {})
+            existing = item_relations.get(row["predicate"])
+            if existing is None:
+                item_relations[row["predicate"]] = row["object"]
+            elif isinstance(existing, list):
+                existing.append(row["object"])
+            else:
+                item_relations[row["predicate"]] = [existing, row["object"]]
+        return relations
 
     # -------------------- Fulltext Extraction --------------------
 
@@ -421,7 +1373,9 @@ class LocalDatabaseClient:
             JOIN items att ON att.itemID = ia.itemID
             WHERE ia.parentItemID = ?
         """
-        for row in conn.execute(query, (parent_item_id,)):
+        # Fetched up front: reads made while the caller iterates may move
+        # this thread to a newer snapshot, closing this connection
+        for row in conn.execute(query, (parent_item_id,)).fetchall():
             yield row["key"], row["path"], row["contentType"]
 
     def iter_pdf_attachments(self, parent_item_id: int) -> Iterator[tuple[str, Path]]:
@@ -522,41 +1476,70 @@ class LocalDatabaseClient:
         merged_text = "\n\n---\n\n".join(merged_parts)
         return (merged_text[:30000], source)
 
-    def _get_item_tags(self, item_id: int) -> list[str]:
-        """Load tags for an item from local database."""
+    def _load_tags_bulk(self, item_ids: list[int]) -> dict[int, list[str]]:
+        """Load tags for a set of items, grouped by itemID."""
+        tags: dict[int, list[str]] = {}
+        if not item_ids:
+            return tags
+
         conn = self._get_connection()
         query = """
-            SELECT t.name
+            SELECT it.itemID, t.name
             FROM itemTags it
             JOIN tags t ON t.tagID = it.tagID
-            WHERE it.itemID = ?
+            WHERE it.itemID IN (SELECT value FROM json_each(?))
         """
-        tags = []
         try:
-            for row in conn.execute(query, (item_id,)):
+            for row in conn.execute(query, (json.dumps(item_ids),)):
                 tag = row["name"]
                 if isinstance(tag, str) and tag.strip():
-                    tags.append(tag.strip())
+                    tags.setdefault(row["itemID"], []).append(tag.strip())
         except sqlite3.Error as e:
-            logger.debug(f"Failed to query tags for item {item_id}: {e}")
+            logger.debug(f"Failed to query tags for {len(item_ids)} items: {e}")
         return tags
 
-    def _get_item_annotations(self, item_id: int) -> list[dict[str, str]]:
-        """Load PDF annotation text/comment for a parent item."""
+    def _load_collections_bulk(self, item_ids: list[int]) -> dict[int, list[str]]:
+        """Load the keys of the collections containing each item."""
+        collections: dict[int, list[str]] = {}
+        if not item_ids:
+            return collections
+
+        conn = self._get_connection()
+        query = """
+            SELECT ci.itemID, c.key
+            FROM collectionItems ci
+            JOIN collections c ON c.collectionID = ci.collectionID
+            WHERE ci.itemID IN (SELECT value FROM json_each(?))
+        """
+        try:
+            for row in conn.execute(query, (json.dumps(item_ids),)):
+                collections.setdefault(row["itemID"], []).append(row["key"])
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to query collections for {len(item_ids)} items: {e}")
+        return collections
+
+    def _load_annotations_bulk(
+        self, item_ids: list[int]
+    ) -> dict[int, list[dict[str, str]]]:
+        """Load PDF annotation text/comment for a set of parent items."""
+        annotations: dict[int, list[dict[str, str]]] = {}
+        if not item_ids:
+            return annotations
+
         conn = self._get_connection()
         query = """
             SELECT
+                att.parentItemID AS parent_item_id,
                 COALESCE(a.annotationType, '') AS annotation_type,
                 COALESCE(a.text, '') AS annotation_text,
                 COALESCE(a.comment, '') AS annotation_comment,
                 COALESCE(a.pageLabel, '') AS page_label
             FROM itemAttachments att
             JOIN itemAnnotations a ON a.parentItemID = att.itemID
-            WHERE att.parentItemID = ?
+            WHERE att.parentItemID IN (SELECT value FROM json_each(?))
         """
-        annotations: list[dict[str, str]] = []
         try:
-            for row in conn.execute(query, (item_id,)):
+            for row in conn.execute(query, (json.dumps(item_ids),)):
                 entry = {
                     "type": str(row["annotation_type"] or ""),
                     "text": str(row["annotation_text"] or ""),
@@ -564,9 +1547,9 @@ class LocalDatabaseClient:
                     "page": str(row["page_label"] or ""),
                 }
                 if any(entry.values()):
-                    annotations.append(entry)
+                    annotations.setdefault(row["parent_item_id"], []).append(entry)
         except sqlite3.Error as e:
-            logger.debug(f"Failed to query annotations for item {item_id}: {e}")
+            logger.debug(f"Failed to query annotations for {len(item_ids)} items: {e}")
         return annotations
 
     def _extract_text(self, file_path: Path) -> str:
@@ -584,35 +1567,128 @@ class LocalDatabaseClient:
                 return ""
 
     def _extract_pdf_text(self, file_path: Path) -> str:
-        """Extract text from PDF."""
-        try:
-            from pdfminer.high_level import extract_text
+        """Extract text from PDF, reusing cached text for unchanged files."""
+        return self._extract_cached(
+            file_path, self.pdf_extractor_id, self._parse_pdf_text
+        )
 
-            return extract_text(str(file_path), maxpages=self.pdf_max_pages) or ""
-        except Exception as e:
-            logger.debug(f"PDF extraction failed: {e}")
+    def _parse_pdf_text(self, file_path: Path) -> str:
+        """Parse text from PDF with pdfminer."""
+        return parse_pdf_text(file_path, self.pdf_max_pages)
+
+    def _extract_pdf_tail_text(self, file_path: Path) -> str:
+        """
+        Extract the PDF pages beyond ``pdf_max_pages``, reusing cached text.
+
+        Returns an empty string when the page limit is disabled, since the
+        first pass then already covers the whole document.
+        """
+        if self.pdf_max_pages <= 0:
             return ""
+        return self._extract_cached(
+            file_path, self.pdf_tail_extractor_id, self._parse_pdf_tail_text
+        )
+
+    def _parse_pdf_tail_text(self, file_path: Path) -> str:
+        """Parse the PDF pages beyond ``pdf_max_pages`` with pdfminer."""
+        return parse_pdf_text(file_path, 0, first_page=self.pdf_max_pages)
 
     def _extract_html_text(self, file_path: Path) -> str:
-        """Extract text from HTML."""
-        try:
-            from markitdown import MarkItDown
+        """Extract text from HTML, reusing cached text for unchanged files."""
+        return self._extract_cached(file_path, "html", self._parse_html_text)
 
-            md = MarkItDown()
-            result = md.convert(str(file_path))
-            return result.text_content or ""
-        except Exception:
-            pass
+    def _extract_cached(
+        self, file_path: Path, extractor: str, parse: Callable[[Path], str]
+    ) -> str:
+        """
+        Run a parser through the fulltext cache.
 
-        # Fallback to BeautifulSoup
+        A parser that raises yields an empty string without a cache entry,
+        so the file is parsed again next time instead of staying empty.
+        """
         try:
-            from bs4 import BeautifulSoup
-
-            html = file_path.read_text(errors="ignore")
-            return BeautifulSoup(html, "html.parser").get_text(" ")
-        except Exception:
+            if self.fulltext_cache is None:
+                return parse(file_path)
+            return self.fulltext_cache.get_or_extract(file_path, extractor, parse)
+        except Exception as e:
+            logger.warning(f"Text extraction failed for {file_path}: {e}")
             return ""
 
+    @staticmethod
+    def _parse_html_text(file_path: Path) -> str:
+        """Parse text from HTML."""
+        return parse_html_text(file_path)
+
+    @property
+    def pdf_extractor_id(self) -> str:
+        """Fulltext cache extractor identifier for PDF text."""
+        return f"pdfminer:{self.pdf_max_pages}"
+
+    @property
+    def pdf_tail_extractor_id(self) -> str:
+        """Fulltext cache extractor identifier for PDF pages past the limit."""
+        return f"pdfminer-tail:{self.pdf_max_pages}"
+
+
+def parse_pdf_text(file_path: Path, max_pages: int, first_page: int = 0) -> str:
+    """
+    Parse text from a PDF with pdfminer.
+
+    Module-level so it can run in extraction worker processes.
+
+    Args:
+        file_path: PDF file path
+        max_pages: Maximum number of pages to parse (0 for all)
+        first_page: Zero-based index of the first page to parse; pages
+            before it are skipped without being laid out
+
+    Returns:
+        Extracted text
+
+    Raises:
+        Exception: If the PDF cannot be parsed; failures are reported rather
+            than returned as empty text so they are never cached
+    """
+    from pdfminer.high_level import extract_text
+
+    if first_page > 0:
+        # pdfminer's maxpages counts from the start of the document
+        last_page = first_page + max_pages if max_pages > 0 else sys.maxsize
+        return (
+            extract_text(str(file_path), page_numbers=range(first_page, last_page))
+            or ""
+        )
+    return extract_text(str(file_path), maxpages=max_pages) or ""
+
+
+def parse_html_text(file_path: Path) -> str:
+    """
+    Parse text from an HTML snapshot.
+
+    Args:
+        file_path: HTML file path
+
+    Returns:
+        Extracted text
+
+    Raises:
+        Exception: If neither MarkItDown nor BeautifulSoup can parse the file
+    """
+    try:
+        from markitdown import MarkItDown
+
+        md = MarkItDown()
+        result = md.convert(str(file_path))
+        return result.text_content or ""
+    except Exception:
+        pass
+
+    # Fallback to BeautifulSoup
+    from bs4 import BeautifulSoup
+
+    html = file_path.read_text(errors="ignore")
+    return BeautifulSoup(html, "html.parser").get_text(" ")
+
 
 def get_local_database_client(
     db_path: str | Path | None = None,
@@ -13,6 +13,7 @@ from zotero_mcp.models.common import (
     AnnotationItem,
     AnnotationsResponse,
     BaseResponse,
+    BatchSearchResponse,
     BundleResponse,
     CollectionsResponse,
     DatabaseStatusResponse,
@@ -33,6 +34,7 @@ from zotero_mcp.models.schemas import (
     AdvancedSearchInput,
     BatchAnalyzeInput,
     BatchGetMetadataInput,
+    BatchSemanticSearchInput,
     CreateCollectionInput,
     CreateNoteInput,
     DatabaseStatusInput,
@@ -54,6 +56,7 @@ from zotero_mcp.models.schemas import (
     SearchByTagInput,
     SearchItemsInput,
     SearchNotesInput,
+    SemanticFilterInput,
     SemanticSearchInput,
     UpdateDatabaseInput,
     UploadPdfInput,
@@ -124,6 +127,35 @@ def _build_search_response(
     return SearchResponse(**response_kwargs)
 
 
+def _semantic_result_item(result: dict[str, Any]) -> SearchResultItem:
+    return SearchResultItem(
+        key=result.get("key", ""),
+        title=result.get("title", "Untitled"),
+        authors=result.get("authors"),
+        date=result.get("date"),
+        item_type=result.get("item_type", "unknown"),
+        abstract=result.get("abstract"),
+        doi=result.get("doi"),
+        tags=result.get("tags", []),
+        similarity_score=result.get("similarity_score"),
+        matched_text=result.get("matched_text"),
+        fragment_count=result.get("fragment_count"),
+    )
+
+
+def _semantic_where(params: SemanticFilterInput) -> dict[str, Any] | None:
+    from zotero_mcp.services.zotero.semantic_search import build_metadata_filter
+
+    return build_metadata_filter(
+        filters=params.filters,
+        collection_key=params.collection_key,
+        tags=params.tags,
+        item_type=params.item_type,
+        year_from=params.year_from,
+        year_to=params.year_to,
+    )
+
+
 def _split_tags(tags: Sequence[str]) -> tuple[list[str], list[str]]:
     include_tags: list[str] = []
     exclude_tags: list[str] = []
@@ -241,6 +273,13 @@ class ToolHandler:
                     inputSchema=SemanticSearchInput.model_json_schema(),
                 )
             )
+            tools.append(
+                Tool(
+                    name=ToolName.SEMANTIC_SEARCH_BATCH,
+                    description="Run several semantic searches in one call",
+                    inputSchema=BatchSemanticSearchInput.model_json_schema(),
+                )
+            )
 
         if settings.enable_collection_tools:
             tools.extend(
@@ -453,22 +492,11 @@ class ToolHandler:
                     results = await semantic_search(
                         query=params.query,
                         limit=params.limit,
-                        filters=params.filters,
+                        filters=_semantic_where(params),
+                        mode=params.mode,
+                        collapse_parents=params.collapse_parents,
                     )
-                    items = [
-                        SearchResultItem(
-                            key=r.get("key", ""),
-                            title=r.get("title", "Untitled"),
-                            authors=r.get("authors"),
-                            date=r.get("date"),
-                            item_type=r.get("item_type", "unknown"),
-                            abstract=r.get("abstract"),
-                            doi=r.get("doi"),
-                            tags=r.get("tags", []),
-                            similarity_score=r.get("similarity_score"),
-                        )
-                        for r in results
-                    ]
+                    items = [_semantic_result_item(r) for r in results]
                     response = _build_search_response(
                         query=f"semantic: {params.query}",
                         items=items,
@@ -478,6 +506,36 @@ class ToolHandler:
                         has_more=False,
                     )
 
+                case ToolName.SEMANTIC_SEARCH_BATCH:
+                    if not settings.enable_semantic_search:
+                        raise ValueError("Semantic search is disabled by configuration")
+                    params = BatchSemanticSearchInput(**args)
+                    from zotero_mcp.services.zotero.semantic_search import (
+                        semantic_search_many,
+                    )
+
+                    batches = await semantic_search_many(
+                        queries=params.queries,
+                        limit=params.limit,
+                        filters=_semantic_where(params),
+                        mode=params.mode,
+                        collapse_parents=params.collapse_parents,
+                    )
+                    searches = []
+                    for batch in batches:
+                        items = [_semantic_result_item(r) for r in batch["results"]]
+                        searches.append(
+                            _build_search_response(
+                                query=f"semantic: {batch['query']}",
+                                items=items,
+                                params=params,
+                                total=len(items),
+                                offset=0,
+                                has_more=False,
+                            )
+                        )
+                    response = BatchSearchResponse(searches=searches)
+
                 case ToolName.GET_RECENT:
                     params = GetRecentInput(**args)
                     results = await data_service.get_recent_items(
@@ -982,6 +1040,9 @@ class ToolHandler:
                     if not settings.enable_database_tools:
                         raise ValueError("Database tools are disabled by configuration")
                     params = DatabaseStatusInput(**args)
+                    from zotero_mcp.services.zotero.index_scheduler import (
+                        get_index_scheduler,
+                    )
                     from zotero_mcp.services.zotero.semantic_search import (
                         get_database_status,
                     )
@@ -989,10 +1050,11 @@ class ToolHandler:
                     status = await get_database_status()
                     if not isinstance(status, dict):
                         status = {}
+                    scheduler = get_index_scheduler()
                     response = DatabaseStatusResponse(
                         exists=status.get("exists", False),
                         item_count=status.get("item_count", 0),
-                        last_updated=status.get("last_updated", "Unknown"),
+                        last_updated=status.get("last_update") or "Unknown",
                         embedding_model=status.get("embedding_model", "default"),
                         model_name=status.get("model_name"),
                         fulltext_enabled=status.get("fulltext_enabled", False),
@@ -1002,6 +1064,7 @@ class ToolHandler:
                         update_frequency=status.get("update_config", {}).get(
                             "update_frequency", "manual"
                         ),
+                        scheduler=scheduler.status() if scheduler else None,
                         message=status.get("message"),
                     )
 
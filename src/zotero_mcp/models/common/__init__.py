@@ -5,6 +5,7 @@ from .responses import (
     AnnotationsResponse,
     BaseInput,
     BaseResponse,
+    BatchSearchResponse,
     BundleResponse,
     CollectionItem,
     CollectionsResponse,
@@ -42,6 +43,7 @@ __all__ = [
     "PdfUploadResponse",
     "NotesResponse",
     "SearchResponse",
+    "BatchSearchResponse",
     "CollectionItem",
     "CollectionsResponse",
 ]
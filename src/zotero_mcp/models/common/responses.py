@@ -3,6 +3,7 @@ Common Pydantic models and enums used across all tools.
 """
 
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -85,6 +86,10 @@ class SearchResultItem(ZoteroItemResult):
     matched_text: str | None = Field(
         default=None, description="Text snippet that matched the query"
     )
+    fragment_count: int | None = Field(
+        default=None,
+        description="Number of matching fragments of this item (collapsed search)",
+    )
     # Extended fields for note search
     creators: list[str] = Field(
         default_factory=list, description="List of creator names"
@@ -141,6 +146,14 @@ class SearchResponse(PaginatedResponse):
     )
 
 
+class BatchSearchResponse(BaseResponse):
+    """Response for batched search operations (one search per query)."""
+
+    searches: list[SearchResponse] = Field(
+        default_factory=list, description="Search responses in query order"
+    )
+
+
 # ===== Item Detail Models =====
 
 
@@ -272,6 +285,10 @@ class DatabaseStatusResponse(BaseResponse):
     update_frequency: str = Field(
         default="manual", description="Update frequency setting"
     )
+    scheduler: dict[str, Any] | None = Field(
+        default=None,
+        description="Background auto-update scheduler state, when it runs",
+    )
     message: str | None = Field(default=None, description="Status message")
 
 
@@ -11,6 +11,7 @@ class ToolName(StrEnum):
     SEARCH_BY_TAG = "zotero_search_by_tag"
     ADVANCED_SEARCH = "zotero_advanced_search"
     SEMANTIC_SEARCH = "zotero_semantic_search"
+    SEMANTIC_SEARCH_BATCH = "zotero_semantic_search_batch"
     GET_RECENT = "zotero_get_recent"
 
     # Content Access
@@ -10,6 +10,7 @@ from zotero_mcp.models.common import ResponseFormat
 from zotero_mcp.models.common.responses import (
     AnnotationsResponse,
     BaseResponse,
+    BatchSearchResponse,
     BundleResponse,
     CollectionsResponse,
     DatabaseStatusResponse,
@@ -75,6 +76,11 @@ class Formatters:
                 limit=response.limit,
             )
 
+        if isinstance(response, BatchSearchResponse):
+            return "\n\n---\n\n".join(
+                cls._format_markdown(search) for search in response.searches
+            )
+
         if isinstance(response, ItemDetailResponse):
             lines = [
                 f"# {response.title}",
@@ -167,6 +173,14 @@ class Formatters:
             ]
             if response.last_updated:
                 lines.append(f"**Last Updated:** {response.last_updated}")
+            if response.scheduler:
+                lines.append(
+                    f"**Auto-update:** {response.scheduler.get('state')} "
+                    f"({response.update_frequency}, "
+                    f"{response.scheduler.get('runs', 0)} runs)"
+                )
+                if error := response.scheduler.get("last_error"):
+                    lines.append(f"**Last Auto-update Error:** {error}")
             if response.message:
                 lines.append(f"**Message:** {response.message}")
             return "\n".join(lines)
@@ -4,9 +4,11 @@ from zotero_mcp.models.common import BaseInput
 from zotero_mcp.models.database.semantic import DatabaseStatusInput, UpdateDatabaseInput
 from zotero_mcp.models.search.queries import (
     AdvancedSearchInput,
+    BatchSemanticSearchInput,
     GetRecentInput,
     SearchByTagInput,
     SearchItemsInput,
+    SemanticFilterInput,
     SemanticSearchInput,
 )
 from zotero_mcp.models.workflow.analysis import (
@@ -48,6 +50,7 @@ __all__ = [
     "AdvancedSearchInput",
     "BatchAnalyzeInput",
     "BatchGetMetadataInput",
+    "BatchSemanticSearchInput",
     "CreateCollectionInput",
     "CreateNoteInput",
     "DatabaseStatusInput",
@@ -69,6 +72,7 @@ __all__ = [
     "SearchByTagInput",
     "SearchItemsInput",
     "SearchNotesInput",
+    "SemanticFilterInput",
     "SemanticSearchInput",
     "UploadPdfInput",
     "UpdateDatabaseInput",
@@ -2,9 +2,11 @@
 
 from .queries import (
     AdvancedSearchInput,
+    BatchSemanticSearchInput,
     GetRecentInput,
     SearchByTagInput,
     SearchItemsInput,
+    SemanticFilterInput,
     SemanticSearchInput,
 )
 
@@ -12,6 +14,8 @@ __all__ = [
     "AdvancedSearchInput",
     "SearchItemsInput",
     "SearchByTagInput",
+    "SemanticFilterInput",
     "SemanticSearchInput",
+    "BatchSemanticSearchInput",
     "GetRecentInput",
 ]
@@ -4,7 +4,7 @@ Pydantic models for search-related tools.
 
 from typing import Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 
 from zotero_mcp.models.common import BaseInput, PaginatedInput, SearchMode
 
@@ -106,7 +106,63 @@ class AdvancedSearchInput(PaginatedInput):
         return v
 
 
-class SemanticSearchInput(PaginatedInput):
+class SemanticFilterInput(BaseInput):
+    """Retrieval options and metadata filters shared by semantic search tools."""
+
+    filters: dict[str, str] | None = Field(
+        default=None,
+        description=(
+            "Optional metadata filters as key-value pairs. "
+            "Example: {'item_type': 'journalArticle'}"
+        ),
+    )
+    collection_key: str | None = Field(
+        default=None,
+        description="Only return items in this collection (collection key)",
+    )
+    tags: list[str] | None = Field(
+        default=None,
+        description="Only return items carrying all of these tags (case-insensitive)",
+    )
+    item_type: str | None = Field(
+        default=None,
+        description="Only return items of this type (e.g., 'journalArticle')",
+    )
+    year_from: int | None = Field(
+        default=None, description="Only return items published in or after this year"
+    )
+    year_to: int | None = Field(
+        default=None, description="Only return items published in or before this year"
+    )
+    mode: Literal["vector", "hybrid"] | None = Field(
+        default=None,
+        description=(
+            "Retrieval mode: 'vector' (embeddings only) or 'hybrid' (BM25 "
+            "keyword + vector, better for DOIs, gene names and acronyms). "
+            "Defaults to the configured mode."
+        ),
+    )
+    collapse_parents: bool | None = Field(
+        default=None,
+        description=(
+            "Return distinct papers (best matching passage plus how many "
+            "passages matched) instead of individual text fragments. "
+            "Defaults to the configured behaviour."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def validate_year_range(self) -> "SemanticFilterInput":
+        if (
+            self.year_from is not None
+            and self.year_to is not None
+            and self.year_from > self.year_to
+        ):
+            raise ValueError("year_from must not be after year_to")
+        return self
+
+
+class SemanticSearchInput(SemanticFilterInput, PaginatedInput):
     """Input for zotero_semantic_search tool."""
 
     query: str = Field(
@@ -120,13 +176,6 @@ class SemanticSearchInput(PaginatedInput):
             "'research on climate change impacts on agriculture'"
         ),
     )
-    filters: dict[str, str] | None = Field(
-        default=None,
-        description=(
-            "Optional metadata filters as key-value pairs. "
-            "Example: {'item_type': 'journalArticle'}"
-        ),
-    )
 
     @field_validator("query")
     @classmethod
@@ -136,6 +185,34 @@ class SemanticSearchInput(PaginatedInput):
         return v.strip()
 
 
+class BatchSemanticSearchInput(SemanticFilterInput):
+    """Input for zotero_semantic_search_batch tool."""
+
+    queries: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=20,
+        description=(
+            "Natural language queries to run together, e.g. several angles "
+            "of one literature-review question (max 20)"
+        ),
+    )
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Maximum number of results per query (1-50)",
+    )
+
+    @field_validator("queries")
+    @classmethod
+    def validate_queries(cls, v: list[str]) -> list[str]:
+        queries = [query.strip() for query in v]
+        if any(len(query) < 2 for query in queries):
+            raise ValueError("Queries must have at least 2 non-space characters")
+        return queries
+
+
 class GetRecentInput(PaginatedInput):
     """Input for zotero_get_recent tool."""
 
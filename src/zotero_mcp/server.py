@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import nullcontext
 import os
 from typing import Any
 
 from zotero_mcp.handlers import PromptHandler, ToolHandler
+from zotero_mcp.services.data_access import close_data_service
+from zotero_mcp.services.zotero.index_scheduler import (
+    start_index_scheduler,
+    stop_index_scheduler,
+)
 from zotero_mcp.settings import settings
 from zotero_mcp.utils.config import load_config
 from zotero_mcp.utils.config.logging import initialize_logging
@@ -76,6 +82,11 @@ async def serve() -> None:
 
     tool_handler = ToolHandler()
     prompt_handler = PromptHandler()
+    scheduler = (
+        start_index_scheduler()
+        if settings.enable_semantic_search and settings.enable_index_scheduler
+        else None
+    )
 
     server = Server(settings.server_name)
 
@@ -86,7 +97,9 @@ async def serve() -> None:
     @server.call_tool()
     async def _call_tool(request: Any) -> Any:
         name, arguments = _extract_name_and_args(request)
-        content = await tool_handler.handle_tool(name, arguments)
+        # Background indexing pauses while tool calls are served
+        with scheduler.interactive() if scheduler else nullcontext():
+            content = await tool_handler.handle_tool(name, arguments)
         content_items: list[Any] = list(content)
         return CallToolResult(content=content_items)
 
@@ -105,19 +118,24 @@ async def serve() -> None:
         "yes",
     }
 
-    while True:
-        try:
-            async with stdio_server() as (read_stream, write_stream):
-                await server.run(
-                    read_stream,
-                    write_stream,
-                    server.create_initialization_options(),
-                )
-        except ExceptionGroup:
-            # Graceful shutdown when stdio is closed or client disconnects.
-            if not keepalive:
-                return
-            await asyncio.sleep(0.25)
+    try:
+        while True:
+            try:
+                async with stdio_server() as (read_stream, write_stream):
+                    await server.run(
+                        read_stream,
+                        write_stream,
+                        server.create_initialization_options(),
+                    )
+            except ExceptionGroup:
+                # Graceful shutdown when stdio is closed or client disconnects.
+                if not keepalive:
+                    return
+                await asyncio.sleep(0.25)
+    finally:
+        if scheduler is not None:
+            await asyncio.to_thread(stop_index_scheduler)
+        await asyncio.to_thread(close_data_service)
 
 
 def run() -> None:
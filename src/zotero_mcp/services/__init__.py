@@ -4,9 +4,10 @@ Services for Zotero MCP.
 Provides high-level business logic and data access abstraction.
 """
 
-from .data_access import DataAccessService, get_data_service
+from .data_access import DataAccessService, close_data_service, get_data_service
 
 __all__ = [
     "DataAccessService",
+    "close_data_service",
     "get_data_service",
 ]
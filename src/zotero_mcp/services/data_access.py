@@ -17,6 +17,7 @@ from zotero_mcp.clients.zotero import (
     get_local_database_client,
     get_zotero_client,
 )
+from zotero_mcp.clients.zotero.db_snapshot import close_shared_snapshots
 from zotero_mcp.models.common import SearchResultItem
 from zotero_mcp.services.zotero.item_service import ItemService
 from zotero_mcp.services.zotero.metadata_service import MetadataService
@@ -117,6 +118,11 @@ class DataAccessService:
             self._metadata_service = MetadataService()
         return self._metadata_service
 
+    def close(self) -> None:
+        """Close local database connections (they reopen on the next read)."""
+        if self._local_client is not None:
+            self._local_client.close()
+
     # -------------------- Search Operations --------------------
 
     async def search_items(
@@ -160,9 +166,15 @@ class DataAccessService:
     async def get_item(
         self,
         item_key: str,
+        for_update: bool = False,
     ) -> dict[str, Any]:
-        """Get item by key."""
-        return await self.item_service.get_item(item_key)
+        """
+        Get item by key.
+
+        Pass ``for_update=True`` when the item will be sent back to
+        ``update_item``, so it is read from the API (see ItemService.get_item).
+        """
+        return await self.item_service.get_item(item_key, for_update=for_update)
 
     async def get_all_items(
         self,
@@ -335,3 +347,11 @@ def get_data_service() -> DataAccessService:
         Configured DataAccessService
     """
     return DataAccessService()
+
+
+def close_data_service() -> None:
+    """Close the singleton data access service if it was created."""
+    if get_data_service.cache_info().currsize:
+        get_data_service().close()
+    # Let running snapshot refreshes finish instead of leaving partial copies
+    close_shared_snapshots()
@@ -1143,7 +1143,7 @@ class WorkflowService:
 
             # Remove from source collections
             # Get current item data to find its collections
-            item_data = await self.data_service.get_item(item.key)
+            item_data = await self.data_service.get_item(item.key, for_update=True)
             if item_data:
                 data = item_data.get("data", {})
                 current_collections = data.get("collections", [])
@@ -0,0 +1,221 @@
+"""
+Parallel attachment text extraction for semantic indexing.
+
+PDF parsing with pdfminer is CPU bound and single threaded, so building
+fragments for a large library pins one core. This module runs extraction
+and chunking in a process pool. Worker functions are module-level so they
+can be pickled; every attachment is isolated so a bad file only costs its
+own fragments.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import partial
+import logging
+import multiprocessing
+from pathlib import Path
+
+from zotero_mcp.clients.zotero.local_db import parse_html_text, parse_pdf_text
+
+logger = logging.getLogger(__name__)
+
+
+def chunk_text(
+    text: str,
+    chunk_size: int,
+    overlap: int,
+    max_source_chars: int,
+) -> list[str]:
+    """
+    Split text into overlapping chunks for fragment indexing.
+
+    Chunks prefer to end on a paragraph break or whitespace.
+
+    Args:
+        text: Source text
+        chunk_size: Target chunk size in characters
+        overlap: Characters shared between consecutive chunks
+        max_source_chars: Source text is truncated to this length first
+
+    Returns:
+        List of non-empty chunks
+    """
+    if not text:
+        return []
+
+    if max_source_chars > 0 and len(text) > max_source_chars:
+        logger.warning(
+            "Source text too large (%s chars), truncating to %s before chunking",
+            len(text),
+            max_source_chars,
+        )
+        text = text[:max_source_chars]
+
+    safe_overlap = max(0, min(overlap, chunk_size - 1))
+    chunks: list[str] = []
+    text_len = len(text)
+    start = 0
+    while start < text_len and text[start].isspace():
+        start += 1
+
+    end_limit = text_len
+    while end_limit > start and text[end_limit - 1].isspace():
+        end_limit -= 1
+
+    if start >= end_limit:
+        return []
+
+    while start < end_limit:
+        end = min(start + chunk_size, end_limit)
+        if end < end_limit:
+            soft_floor = min(start + 200, end)
+            paragraph_break = text.rfind("\n\n", soft_floor, end)
+            whitespace_break = text.rfind(" ", soft_floor, end)
+            split_at = max(paragraph_break, whitespace_break)
+            if split_at > start:
+                end = split_at
+
+        if end <= start:
+            end = min(start + chunk_size, end_limit)
+            if end <= start:
+                break
+
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+
+        if end >= end_limit:
+            break
+        next_start = end - safe_overlap
+        start = next_start if next_start > start else end
+
+    return chunks
+
+
+@dataclass
+class ExtractionResult:
+    """Text and chunks extracted from one attachment."""
+
+    text: str = ""
+    chunks: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+def extract_and_chunk(
+    path: str,
+    kind: str,
+    pdf_max_pages: int,
+    chunk_size: int,
+    overlap: int,
+    max_source_chars: int,
+    first_page: int = 0,
+) -> ExtractionResult:
+    """
+    Extract and chunk one attachment (runs in a worker process).
+
+    Never raises: failures are reported through ``ExtractionResult.error``
+    so one broken file cannot take down the worker.
+
+    Args:
+        path: Attachment file path
+        kind: ``"pdf"`` or ``"html"``
+        pdf_max_pages: Maximum PDF pages to parse
+        chunk_size: Target chunk size in characters
+        overlap: Chunk overlap in characters
+        max_source_chars: Truncation limit before chunking
+        first_page: Zero-based first PDF page to parse; with a positive
+            value, ``pdf_max_pages`` counts from this page (0 for all)
+
+    Returns:
+        ExtractionResult
+    """
+    try:
+        file_path = Path(path)
+        if kind == "html":
+            text = parse_html_text(file_path)
+        else:
+            text = parse_pdf_text(file_path, pdf_max_pages, first_page)
+        text = text.strip()
+        return ExtractionResult(
+            text=text,
+            chunks=chunk_text(text, chunk_size, overlap, max_source_chars),
+        )
+    except MemoryError:
+        return ExtractionResult(error="MemoryError")
+    except Exception as e:
+        return ExtractionResult(error=f"{type(e).__name__}: {e}")
+
+
+class AttachmentExtractionPool:
+    """
+    Process pool for attachment extraction.
+
+    Workers are started with ``spawn`` (the caller may be multi-threaded)
+    and recycled after ``max_tasks_per_child`` tasks to bound pdfminer's
+    memory growth. If the pool breaks (e.g. a worker is OOM-killed) it is
+    recreated on the next submit.
+    """
+
+    def __init__(self, workers: int, max_tasks_per_child: int = 50):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Number of worker processes
+            max_tasks_per_child: Tasks after which a worker is replaced
+        """
+        self.workers = max(1, workers)
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> AttachmentExtractionPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return self._executor
+
+    def submit(
+        self,
+        path: Path,
+        kind: str,
+        pdf_max_pages: int,
+        chunk_size: int,
+        overlap: int,
+        max_source_chars: int,
+        first_page: int = 0,
+    ) -> Future[ExtractionResult]:
+        """Queue one attachment for extraction."""
+        task = partial(
+            extract_and_chunk,
+            str(path),
+            kind,
+            pdf_max_pages,
+            chunk_size,
+            overlap,
+            max_source_chars,
+            first_page,
+        )
+        try:
+            return self._get_executor().submit(task)
+        except BrokenProcessPool:
+            logger.warning("Extraction pool broke, restarting workers")
+            self.shutdown()
+            return self._get_executor().submit(task)
+
+    def shutdown(self) -> None:
+        """Stop all workers, cancelling queued tasks."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
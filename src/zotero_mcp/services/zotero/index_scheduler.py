@@ -0,0 +1,311 @@
+"""
+Background scheduler for semantic index updates.
+
+``semantic_search.update_config`` says how often the index should be
+refreshed (``startup``, ``daily`` or ``every_N`` days). Inside the MCP
+server the scheduler applies it: a daemon thread periodically checks
+whether an update is due and runs an incremental update with the shared,
+already warm engine. The update waits for the server to be idle and pauses
+between batches while tool calls are being served.
+
+With progressive fulltext indexing (``extraction.progressive``), idle time
+between updates is spent backfilling the PDF pages beyond
+``pdf_max_pages``, a slice of items at a time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from zotero_mcp.utils.config import get_config_path
+from zotero_mcp.utils.formatting.helpers import is_local_mode
+
+if TYPE_CHECKING:
+    from zotero_mcp.services.zotero.semantic_search import ZoteroSemanticSearch
+
+logger = logging.getLogger(__name__)
+
+
+class IndexUpdateScheduler:
+    """Runs due semantic index updates on a background thread."""
+
+    DEFAULT_CHECK_INTERVAL_SECONDS = 300.0
+    # Quiet period after the last tool call before indexing (re)starts
+    DEFAULT_IDLE_SECONDS = 5.0
+    # Items backfilled before checking again whether an update is due
+    BACKFILL_ITEMS_PER_RUN = 50
+
+    def __init__(
+        self,
+        config_path: str | None = None,
+        engine_factory: Callable[[], ZoteroSemanticSearch] | None = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            config_path: Path to configuration file (default config if omitted)
+            engine_factory: Returns the engine to update (the shared engine
+                by default)
+            check_interval: Seconds between checks whether an update is due
+            idle_seconds: Quiet period required after the last tool call
+        """
+        self.config_path = config_path or str(get_config_path() / "config.json")
+        self.engine_factory = engine_factory or self._shared_engine
+        self.check_interval = check_interval
+        self.idle_seconds = idle_seconds
+
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._active_calls = 0
+        self._last_activity = float("-inf")
+        self._startup_done = False
+        self._status: dict[str, Any] = {
+            "state": "stopped",
+            "runs": 0,
+            "last_run": None,
+            "last_stats": None,
+            "last_error": None,
+            "last_backfill": None,
+            "next_check": None,
+        }
+
+    def _shared_engine(self) -> ZoteroSemanticSearch:
+        # Imported here so starting the server does not load ChromaDB
+        from zotero_mcp.services.zotero.semantic_search import get_semantic_search
+
+        return get_semantic_search(self.config_path)
+
+    # -------------------- Lifecycle --------------------
+
+    def start(self) -> None:
+        """Start the background thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="zotero-index-scheduler", daemon=True
+        )
+        self._set_status(state="idle")
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        """
+        Stop the background thread.
+
+        A running update stops at its next pause point (after the current
+        batch); items indexed so far stay committed.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning("Index scheduler did not stop within timeout")
+            self._thread = None
+        self._set_status(state="stopped", next_check=None)
+
+    # -------------------- Interactive calls --------------------
+
+    @contextmanager
+    def interactive(self) -> Iterator[None]:
+        """Mark a tool call in progress; indexing pauses until it ends."""
+        with self._condition:
+            self._active_calls += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active_calls -= 1
+                self._last_activity = time.monotonic()
+                self._condition.notify_all()
+
+    def wait_until_idle(self) -> None:
+        """Block while tool calls run or ended less than idle_seconds ago."""
+        with self._condition:
+            paused = False
+            while not self._stop.is_set():
+                if self._active_calls:
+                    remaining = self.idle_seconds
+                else:
+                    idle_for = time.monotonic() - self._last_activity
+                    remaining = self.idle_seconds - idle_for
+                    if remaining <= 0:
+                        break
+                if not paused:
+                    paused = True
+                    self._status["state"] = "paused"
+                self._condition.wait(remaining)
+            if paused:
+                self._status["state"] = "running"
+        if self._stop.is_set():
+            raise InterruptedError("Index scheduler stopped")
+
+    # -------------------- Scheduling --------------------
+
+    def is_due(self) -> bool:
+        """Whether the configured update frequency calls for an update now."""
+        from zotero_mcp.services.zotero.semantic_search import load_update_config
+
+        update_config = load_update_config(self.config_path)
+        if not update_config.get("auto_update"):
+            return False
+        if update_config.get("update_frequency") == "startup":
+            return not self._startup_done
+        return self.engine_factory().should_update_database()
+
+    def run_once(self) -> dict[str, Any] | None:
+        """
+        Run an incremental update if one is due.
+
+        Returns:
+            Update statistics, or None when no update was due
+        """
+        if not self.is_due():
+            return None
+
+        engine = self.engine_factory()
+        self.wait_until_idle()
+        self._set_status(state="running", last_error=None)
+        logger.info("Starting scheduled semantic index update")
+        try:
+            stats = engine.update_database(
+                extract_fulltext=engine.default_extract_fulltext(),
+                pause_hook=self.wait_until_idle,
+            )
+        except Exception as e:
+            stats = {"error": str(e)}
+        finally:
+            self._startup_done = True
+
+        error = stats.get("error")
+        if self._stop.is_set():
+            # Items committed before the interruption stay indexed
+            logger.info("Scheduled index update interrupted by shutdown")
+        elif error:
+            logger.warning(f"Scheduled index update failed: {error}")
+        else:
+            logger.info(
+                f"Scheduled index update finished: "
+                f"{stats.get('processed_items', 0)} items processed"
+            )
+        with self._condition:
+            self._status["runs"] += 1
+        self._set_status(
+            state="idle",
+            last_run=datetime.now().isoformat(),
+            last_stats=stats,
+            last_error=error,
+        )
+        return stats
+
+    def run_backfill(self) -> bool:
+        """
+        Backfill the next slice of PDF pages if progressive indexing is on.
+
+        Returns:
+            True if items remain to be backfilled
+        """
+        engine = self.engine_factory()
+        if not engine.extraction_config.get("progressive") or not is_local_mode():
+            return False
+        if not engine.pending_backfill():
+            return False
+
+        self.wait_until_idle()
+        self._set_status(state="backfilling")
+        stats = engine.backfill_fulltext(
+            max_items=self.BACKFILL_ITEMS_PER_RUN,
+            pause_hook=self.wait_until_idle,
+        )
+        self._set_status(state="idle", last_backfill=stats)
+        if self._stop.is_set():
+            raise InterruptedError("Index scheduler stopped")
+        if stats.get("error"):
+            logger.warning(f"Fulltext backfill failed: {stats['error']}")
+            return False
+        # Stop early if nothing could be recorded (e.g. every batch failed)
+        return stats["remaining_items"] > 0 and stats["processed_items"] > 0
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+                if self.run_backfill():
+                    # More to backfill: recheck for due updates, then go on
+                    continue
+            except InterruptedError:
+                break
+            except Exception as e:
+                logger.error(f"Index scheduler check failed: {e}")
+                self._set_status(last_error=str(e))
+            self._set_status(
+                state="idle",
+                next_check=(
+                    datetime.now() + timedelta(seconds=self.check_interval)
+                ).isoformat(),
+            )
+            self._stop.wait(self.check_interval)
+
+    # -------------------- Status --------------------
+
+    def _set_status(self, **fields: Any) -> None:
+        with self._condition:
+            self._status.update(fields)
+
+    def status(self) -> dict[str, Any]:
+        """Snapshot of the scheduler state for status reporting."""
+        with self._condition:
+            status = dict(self._status)
+            status["active_calls"] = self._active_calls
+        status["alive"] = self._thread is not None and self._thread.is_alive()
+        return status
+
+
+_scheduler: IndexUpdateScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_index_scheduler() -> IndexUpdateScheduler | None:
+    """Return the running process-wide scheduler, if any."""
+    return _scheduler
+
+
+def start_index_scheduler(config_path: str | None = None) -> IndexUpdateScheduler:
+    """
+    Start the process-wide index update scheduler.
+
+    Args:
+        config_path: Path to configuration file (default config if omitted)
+
+    Returns:
+        The running scheduler
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = IndexUpdateScheduler(config_path=config_path)
+        _scheduler.start()
+        return _scheduler
+
+
+def stop_index_scheduler() -> None:
+    """Stop and drop the process-wide scheduler."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.stop()
+            _scheduler = None
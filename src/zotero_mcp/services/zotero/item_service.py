@@ -5,10 +5,12 @@ Handles CRUD operations for Zotero items, collections, and tags.
 """
 
 import asyncio
+from collections.abc import Callable
 import logging
 import os
 import re
-from typing import Any, Literal
+import sqlite3
+from typing import Any, Literal, TypeVar
 from urllib.parse import urlsplit, urlunsplit
 
 from zotero_mcp.clients.zotero import LocalDatabaseClient, ZoteroAPIClient
@@ -23,6 +25,8 @@ from zotero_mcp.utils.formatting.helpers import clean_title
 logger = logging.getLogger(__name__)
 _CHILD_ITEM_TYPES = {"attachment", "note", "annotation"}
 
+T = TypeVar("T")
+
 
 def _normalize_doi(raw_doi: str | None) -> str:
     """Normalize DOI for exact duplicate matching."""
@@ -100,10 +104,53 @@ class ItemService:
         # Internal cache for slow, infrequent changing data (collections, tags)
         self._cache = ResponseCache(ttl_seconds=300)
 
+    def _read_local(
+        self, operation: str, read: Callable[[LocalDatabaseClient], T | None]
+    ) -> T | None:
+        """
+        Run a read against the local database if it is available.
+
+        Args:
+            operation: Name of the read, for logging
+            read: Callable querying the local client it is given
+
+        Returns:
+            The local result, or None when there is no local database, the
+            object is not in it, or the read failed (callers then use the API)
+        """
+        if self.local_client is None:
+            return None
+        if getattr(self.api_client, "library_type", "user") == "group":
+            # The local reads cover My Library only, not the targeted group
+            return None
+        try:
+            return read(self.local_client)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Local {operation} failed, falling back to API: {e}")
+            return None
+
     # -------------------- Item Operations --------------------
 
-    async def get_item(self, item_key: str) -> dict[str, Any]:
-        """Get item by key."""
+    async def get_item(self, item_key: str, for_update: bool = False) -> dict[str, Any]:
+        """
+        Get item by key.
+
+        Args:
+            item_key: Item key
+            for_update: Read from the API even when the item is in the local
+                database. Items passed back to ``update_item`` need the
+                server's current version and all of its fields and relations.
+
+        Returns:
+            Item in Zotero API shape
+        """
+        if for_update:
+            return await self.api_client.get_item(item_key)
+        local_item = self._read_local(
+            "get_item", lambda local: local.get_item_data(item_key)
+        )
+        if local_item is not None:
+            return local_item
         return await self.api_client.get_item(item_key)
 
     async def get_all_items(
@@ -126,24 +173,12 @@ class ItemService:
                 )
                 return [api_item_to_search_result(item) for item in api_items]
 
-            if item_type:
-                # Apply item-type filtering before paging to avoid dropped results.
-                all_items = self.local_client.get_items(
-                    limit=None,
-                    include_fulltext=False,
-                )
-                filtered_items = [
-                    item for item in all_items if item.item_type == item_type
-                ]
-                local_items = filtered_items[start : start + limit]
-            else:
-                fetch_limit = limit + max(start, 0) if start else limit
-                local_items = self.local_client.get_items(
-                    limit=fetch_limit, include_fulltext=False
-                )
-                if start:
-                    local_items = local_items[start:]
-                local_items = local_items[:limit]
+            local_items = self.local_client.get_items(
+                limit=limit,
+                offset=max(start, 0),
+                item_type=item_type,
+                include_fulltext=False,
+            )
             return [zotero_item_to_search_result(item) for item in local_items]
 
         api_items = await self.api_client.get_all_items(
@@ -155,6 +190,12 @@ class ItemService:
         self, item_key: str, item_type: str | None = None
     ) -> list[dict[str, Any]]:
         """Get child items (attachments, notes)."""
+        local_children = self._read_local(
+            "get_item_children",
+            lambda local: local.get_item_children_data(item_key, item_type),
+        )
+        if local_children is not None:
+            return local_children
         return await self.api_client.get_item_children(item_key, item_type)
 
     async def get_fulltext(self, item_key: str) -> str | None:
@@ -226,8 +267,11 @@ class ItemService:
             logger.debug("Returning cached collections list")
             return cached
 
-        # Fetch from API
-        collections = await self.api_client.get_collections()
+        collections = self._read_local(
+            "get_collections", lambda local: local.get_collections_data()
+        )
+        if collections is None:
+            collections = await self.api_client.get_collections()
 
         # Update cache
         self._cache.set("get_collections", {"key": cache_key}, collections)
@@ -282,7 +326,14 @@ class ItemService:
         self, collection_key: str, limit: int = 100, start: int = 0
     ) -> list[SearchResultItem]:
         """Get items in a collection."""
-        items = await self.api_client.get_collection_items(collection_key, limit, start)
+        items = self._read_local(
+            "get_collection_items",
+            lambda local: local.get_collection_items_data(collection_key, limit, start),
+        )
+        if items is None:
+            items = await self.api_client.get_collection_items(
+                collection_key, limit, start
+            )
         return [api_item_to_search_result(item) for item in items]
 
     async def find_collection_by_name(
@@ -324,7 +375,9 @@ class ItemService:
             logger.debug("Returning cached tags list")
             return cached
 
-        tags = await self.api_client.get_tags(limit)
+        tags = self._read_local("get_tags", lambda local: local.get_tags_data(limit))
+        if tags is None:
+            tags = await self.api_client.get_tags(limit)
         tag_list = [t.get("tag", "") for t in tags if t.get("tag")]
 
         self._cache.set("get_tags", cache_params, tag_list)
@@ -336,6 +389,12 @@ class ItemService:
         self, item_key: str, library_id: int = 1
     ) -> list[dict[str, Any]]:
         """Get annotations for an item."""
+        local_annotations = self._read_local(
+            "get_annotations",
+            lambda local: local.get_annotations_data(item_key),
+        )
+        if local_annotations is not None:
+            return local_annotations
         children = await self.get_item_children(item_key, item_type="annotation")
         return children
 
@@ -190,7 +190,9 @@ class LibraryMaintenanceService:
                     seen_item_keys.add(item.key)
 
                     try:
-                        full_item = await self.data_service.get_item(item.key)
+                        full_item = await self.data_service.get_item(
+                            item.key, for_update=True
+                        )
                         item_data = full_item.get("data", {})
                         existing_tags = normalize_tag_names(item_data.get("tags", []))
                         if not existing_tags:
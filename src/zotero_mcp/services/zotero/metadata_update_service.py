@@ -182,7 +182,7 @@ class MetadataUpdateService:
             Dict with update result (success, updated, message, source)
         """
         try:
-            item = await self.item_service.get_item(item_key)
+            item = await self.item_service.get_item(item_key, for_update=True)
             if not item:
                 return {
                     "success": False,
@@ -72,7 +72,7 @@ class NoteRelationService:
     ) -> dict[str, Any]:
         """Analyze note relevance and optionally write relations + note section."""
         target_note_key = normalize_item_key(note_key)
-        target_item = await self.data_service.get_item(target_note_key)
+        target_item = await self.data_service.get_item(target_note_key, for_update=True)
         target_data = target_item.get("data", {})
         if str(target_data.get("itemType", "")).lower() != "note":
             raise ValueError(f"Item {target_note_key} is not a note")
@@ -148,7 +148,9 @@ class NoteRelationService:
                     if not candidate_key:
                         continue
                     try:
-                        candidate_item = await self.data_service.get_item(candidate_key)
+                        candidate_item = await self.data_service.get_item(
+                            candidate_key, for_update=True
+                        )
                         changed = self._merge_dc_relation_uris(
                             item=candidate_item,
                             related_item_keys=[target_note_key],
@@ -236,7 +238,7 @@ class NoteRelationService:
 
         try:
             from zotero_mcp.services.zotero.semantic_search import (
-                create_semantic_search,
+                get_semantic_search,
             )
         except Exception:
             return []
@@ -245,7 +247,7 @@ class NoteRelationService:
         try:
             payload = await loop.run_in_executor(
                 None,
-                lambda: create_semantic_search().search(
+                lambda: get_semantic_search().search(
                     query=query_text,
                     limit=self._semantic_pool,
                     filters={"fragment_type": "note"},
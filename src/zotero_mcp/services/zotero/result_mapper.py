@@ -37,4 +37,9 @@ def zotero_item_to_search_result(item: ZoteroItem) -> SearchResultItem:
         abstract=item.abstract,
         doi=item.doi,
         tags=item.tags or [],
+        raw_data=(
+            {"key": item.key, "itemType": item.item_type, **item.fields}
+            if item.fields
+            else None
+        ),
     )
@@ -16,6 +16,7 @@ from zotero_mcp.services.zotero.result_mapper import (
     api_item_to_search_result,
     zotero_item_to_search_result,
 )
+from zotero_mcp.settings import settings
 from zotero_mcp.utils.formatting.tags import normalize_input_tags, normalize_tag_names
 
 logger = logging.getLogger(__name__)
@@ -65,13 +66,13 @@ class SearchService:
         # Try local database first for speed
         if self.local_client and qmode == "everything":
             try:
-                items = self.local_client.search_items(query, limit=limit + offset)
-                if offset >= len(items):
-                    return []
-                return [
-                    zotero_item_to_search_result(item)
-                    for item in items[offset : offset + limit]
-                ]
+                items = self.local_client.search_items(
+                    query,
+                    limit=limit,
+                    offset=offset,
+                    include_fulltext=settings.local_search_fulltext,
+                )
+                return [zotero_item_to_search_result(item) for item in items]
             except Exception as e:
                 logger.warning(f"Local search failed, falling back to API: {e}")
 
@@ -7,7 +7,11 @@ over research libraries.
 """
 
 import asyncio
-from contextlib import contextmanager
+from collections import deque
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import Future
+from contextlib import closing, contextmanager, nullcontext
+import copy
 from datetime import datetime, timedelta
 import json
 import logging
@@ -15,13 +19,30 @@ import os
 from pathlib import Path
 import re
 import sys
+import threading
+import time
 from typing import Any
+import uuid
 
-from zotero_mcp.clients.database import ChromaClient, create_chroma_client
+import numpy as np
+
+from zotero_mcp.clients.database import (
+    ChromaClient,
+    FileLock,
+    IndexManifest,
+    create_chroma_client,
+)
 from zotero_mcp.clients.zotero import (
     LocalDatabaseClient,
     get_zotero_client,
 )
+from zotero_mcp.services.zotero.fragment_extraction import (
+    AttachmentExtractionPool,
+    ExtractionResult,
+    chunk_text,
+)
+from zotero_mcp.services.zotero.upsert_batching import AdaptiveBatcher
+from zotero_mcp.utils.async_helpers.cache import ResponseCache
 from zotero_mcp.utils.config import get_config_path
 from zotero_mcp.utils.data.mapper import ZoteroMapper
 from zotero_mcp.utils.formatting.helpers import is_local_mode
@@ -41,12 +62,79 @@ def suppress_stdout():
             sys.stdout = old_stdout
 
 
+def load_update_config(config_path: str | None) -> dict[str, Any]:
+    """
+    Load the index update configuration (``semantic_search.update_config``).
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Update configuration merged over the defaults
+    """
+    config = {
+        "auto_update": False,
+        "update_frequency": "manual",
+        "last_update": None,
+        "update_days": 7,
+    }
+
+    if config_path and os.path.exists(config_path):
+        try:
+            with open(config_path) as f:
+                file_config = json.load(f)
+                config.update(
+                    file_config.get("semantic_search", {}).get("update_config", {})
+                )
+        except Exception as e:
+            logger.warning(f"Error loading update config: {e}")
+
+    return config
+
+
 class ZoteroSemanticSearch:
     """Semantic search interface for Zotero libraries using ChromaDB."""
 
     DEFAULT_CHUNK_SIZE = 1800
     DEFAULT_CHUNK_OVERLAP = 200
     DEFAULT_MAX_SOURCE_CHARS = 200_000
+    DEFAULT_EXTRACTION_WORKERS = 1
+    # In-flight attachments per extraction worker before the producer waits.
+    EXTRACTION_QUEUE_FACTOR = 4
+    # Upper bound of documents per upsert batch; batches are normally cut by
+    # the adaptive character budget (see AdaptiveBatcher) first
+    UPSERT_BATCH_SIZE = 256
+    DEFAULT_BATCH_CHARS = 60_000
+    DEFAULT_MAX_BATCH_CHARS = 500_000
+    DELETE_BATCH_SIZE = 500
+    # Document ids fetched per collection.get page by garbage collection
+    GC_PAGE_SIZE = 5000
+    # Zotero web API accepts at most 50 keys per itemKey= request.
+    ITEM_KEY_BATCH_SIZE = 50
+    ITEM_CACHE_TTL_SECONDS = 60
+    # Search responses are reused until the index changes; the TTL only
+    # bounds how stale enriched Zotero item data can get.
+    RESULT_CACHE_TTL_SECONDS = 600
+    RESULT_CACHE_SIZE = 256
+    SEARCH_MODES = ("vector", "hybrid")
+    DEFAULT_RRF_K = 60
+    # Candidates fetched from each retriever per requested hybrid result
+    HYBRID_CANDIDATE_FACTOR = 4
+    # Fragments fetched per requested paper when collapsing to parents
+    DEFAULT_OVERFETCH_FACTOR = 5
+    MAX_COLLAPSE_CANDIDATES = 200
+    DEFAULT_MMR_LAMBDA = 0.7
+    COLLAPSE_INCLUDE = ["documents", "metadatas", "distances", "embeddings"]
+    # Bump when ZoteroMapper.create_metadata gains fields, so existing
+    # indexes are rewritten once by the next update.
+    METADATA_VERSION = 2
+    # Stamp suffix of items indexed with PDF fulltext (first pages only)
+    FULLTEXT_STAMP_SUFFIX = "|fulltext=1"
+    # How long a tool-triggered update waits for a running one to reach its
+    # next pause point before giving up
+    UPDATE_LOCK_TIMEOUT_SECONDS = 30.0
+    # Source key suffix of fragments from PDF pages beyond pdf_max_pages
+    TAIL_SOURCE_SUFFIX = ":tail"
 
     def __init__(
         self,
@@ -69,29 +157,63 @@ class ZoteroSemanticSearch:
         self.db_path = db_path  # CLI override for Zotero database path
 
         # Load update configuration
+        self.config_mtime = self._read_config_mtime()
         self.update_config = self._load_update_config()
         self.extraction_config = self._load_extraction_config()
+        self.search_config = self._load_search_config()
+
+        # Incremental indexing state
+        self.manifest = IndexManifest(self._manifest_path())
+        self._pending_stamps: dict[str, str] = {}
+        self._pending_library_version: int | None = None
+
+        # Short-lived cache of parent items used to enrich search results
+        self._item_cache = ResponseCache(ttl_seconds=self.ITEM_CACHE_TTL_SECONDS)
+        # Search responses keyed by request and index generation
+        self._result_cache = ResponseCache(
+            ttl_seconds=self.RESULT_CACHE_TTL_SECONDS,
+            max_entries=self.RESULT_CACHE_SIZE,
+        )
+        self._collection_changed = False
+        # Engines are shared across threads, and a reloaded engine may run
+        # next to the one it replaces; updates of one index must not interleave
+        self._update_lock = _index_update_lock(config_path, db_path)
+        # The CLI and the server can update the same index; the file lock
+        # keeps their updates, backfills and garbage collections apart
+        self._index_file_lock = FileLock(
+            self.manifest.manifest_path.with_suffix(".lock")
+        )
+        # Token of the run holding the locks, also stored in the manifest so
+        # a paused run sees that another one (in any process) ran meanwhile
+        self._run_token: str | None = None
+        self._closed = False
 
-    def _load_update_config(self) -> dict[str, Any]:
-        """Load update configuration from file or use defaults."""
-        config = {
-            "auto_update": False,
-            "update_frequency": "manual",
-            "last_update": None,
-            "update_days": 7,
-        }
+    def _read_config_mtime(self) -> int | None:
+        """Return the config file's modification time, or None if missing."""
+        if not self.config_path:
+            return None
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
 
-        if self.config_path and os.path.exists(self.config_path):
-            try:
-                with open(self.config_path) as f:
-                    file_config = json.load(f)
-                    config.update(
-                        file_config.get("semantic_search", {}).get("update_config", {})
-                    )
-            except Exception as e:
-                logger.warning(f"Error loading update config: {e}")
+    def _manifest_path(self) -> Path:
+        """Return the index manifest path for this config and collection."""
+        base_dir = (
+            Path(self.config_path).parent if self.config_path else get_config_path()
+        )
+        collection_name = getattr(self.chroma_client, "collection_name", None)
+        if not isinstance(collection_name, str):
+            collection_name = "zotero_library"
+        # Each vector backend keeps its own store, so each needs its own manifest
+        backend = getattr(self.chroma_client, "vector_backend", None)
+        if isinstance(backend, str) and backend != "chroma":
+            collection_name = f"{collection_name}_{backend}"
+        return base_dir / "semantic_index" / f"{collection_name}_manifest.sqlite"
 
-        return config
+    def _load_update_config(self) -> dict[str, Any]:
+        """Load update configuration from file or use defaults."""
+        return load_update_config(self.config_path)
 
     def _save_update_config(self) -> None:
         """Save update configuration to file."""
@@ -119,6 +241,8 @@ class ZoteroSemanticSearch:
         try:
             with open(self.config_path, "w") as f:
                 json.dump(full_config, f, indent=2)
+            # Our own write must not make the shared engine look stale
+            self.config_mtime = self._read_config_mtime()
         except Exception as e:
             logger.error(f"Error saving update config: {e}")
 
@@ -135,18 +259,23 @@ class ZoteroSemanticSearch:
 
     def _load_extraction_config(self) -> dict[str, int]:
         """Load extraction/chunking configuration with safe defaults."""
-        config = {
+        config: dict[str, int] = {
             "chunk_size": self.DEFAULT_CHUNK_SIZE,
             "chunk_overlap": self.DEFAULT_CHUNK_OVERLAP,
             "max_source_chars": self.DEFAULT_MAX_SOURCE_CHARS,
+            "workers": self.DEFAULT_EXTRACTION_WORKERS,
+            "batch_chars": self.DEFAULT_BATCH_CHARS,
+            "max_batch_chars": self.DEFAULT_MAX_BATCH_CHARS,
+            # Backfill PDF pages beyond pdf_max_pages in the background
+            "progressive": False,
         }
 
         if self.config_path and os.path.exists(self.config_path):
             try:
                 with open(self.config_path) as f:
                     file_config = json.load(f)
-                extraction = (
-                    file_config.get("semantic_search", {}).get("extraction", {})
+                extraction = file_config.get("semantic_search", {}).get(
+                    "extraction", {}
                 )
                 if isinstance(extraction, dict):
                     config["chunk_size"] = self._positive_int(
@@ -161,6 +290,20 @@ class ZoteroSemanticSearch:
                         extraction.get("max_source_chars"),
                         config["max_source_chars"],
                     )
+                    config["workers"] = self._positive_int(
+                        extraction.get("workers"),
+                        config["workers"],
+                    )
+                    config["batch_chars"] = self._positive_int(
+                        extraction.get("batch_chars"),
+                        config["batch_chars"],
+                    )
+                    config["max_batch_chars"] = self._positive_int(
+                        extraction.get("max_batch_chars"),
+                        config["max_batch_chars"],
+                    )
+                    if isinstance(extraction.get("progressive"), bool):
+                        config["progressive"] = extraction["progressive"]
             except Exception as e:
                 logger.warning(f"Error loading extraction config: {e}")
 
@@ -169,6 +312,58 @@ class ZoteroSemanticSearch:
 
         return config
 
+    @staticmethod
+    def _non_negative_float(value: Any, default: float) -> float:
+        """Parse a non-negative float with safe fallback."""
+        try:
+            parsed = float(value)
+            if parsed >= 0:
+                return parsed
+        except Exception:
+            pass
+        return default
+
+    def _load_search_config(self) -> dict[str, Any]:
+        """Load retrieval configuration (mode and hybrid fusion weights)."""
+        config: dict[str, Any] = {
+            "mode": "vector",
+            "vector_weight": 1.0,
+            "lexical_weight": 1.0,
+            "rrf_k": self.DEFAULT_RRF_K,
+            "collapse_parents": False,
+            "overfetch_factor": self.DEFAULT_OVERFETCH_FACTOR,
+            "mmr_lambda": self.DEFAULT_MMR_LAMBDA,
+        }
+
+        if self.config_path and os.path.exists(self.config_path):
+            try:
+                with open(self.config_path) as f:
+                    file_config = json.load(f)
+                search_cfg = file_config.get("semantic_search", {}).get("search", {})
+                if isinstance(search_cfg, dict):
+                    if search_cfg.get("mode") in self.SEARCH_MODES:
+                        config["mode"] = search_cfg["mode"]
+                    for weight in ("vector_weight", "lexical_weight"):
+                        config[weight] = self._non_negative_float(
+                            search_cfg.get(weight), config[weight]
+                        )
+                    config["rrf_k"] = self._positive_int(
+                        search_cfg.get("rrf_k"), config["rrf_k"]
+                    )
+                    if isinstance(search_cfg.get("collapse_parents"), bool):
+                        config["collapse_parents"] = search_cfg["collapse_parents"]
+                    config["overfetch_factor"] = self._positive_int(
+                        search_cfg.get("overfetch_factor"), config["overfetch_factor"]
+                    )
+                    mmr_lambda = self._non_negative_float(
+                        search_cfg.get("mmr_lambda"), config["mmr_lambda"]
+                    )
+                    config["mmr_lambda"] = min(mmr_lambda, 1.0)
+            except Exception as e:
+                logger.warning(f"Error loading search config: {e}")
+
+        return config
+
     def _parse_last_update(self) -> datetime | None:
         """Parse `last_update` from config, returning None when invalid/missing."""
         raw_last_update = self.update_config.get("last_update")
@@ -220,77 +415,29 @@ class ZoteroSemanticSearch:
         """Remove HTML tags from note content."""
         return re.sub(r"<[^>]+>", "", text)
 
+    def _chunk_params(self) -> dict[str, int]:
+        """Resolve chunking parameters from the extraction config."""
+        return {
+            "chunk_size": self._positive_int(
+                self.extraction_config.get("chunk_size"),
+                self.DEFAULT_CHUNK_SIZE,
+            ),
+            "overlap": self._positive_int(
+                self.extraction_config.get("chunk_overlap"),
+                self.DEFAULT_CHUNK_OVERLAP,
+            ),
+            "max_source_chars": self._positive_int(
+                self.extraction_config.get("max_source_chars"),
+                self.DEFAULT_MAX_SOURCE_CHARS,
+            ),
+        }
+
     def _chunk_text(
         self,
         text: str,
     ) -> list[str]:
         """Split text into overlapping chunks for fragment indexing."""
-        if not text:
-            return []
-
-        chunk_size = self._positive_int(
-            self.extraction_config.get("chunk_size"),
-            self.DEFAULT_CHUNK_SIZE,
-        )
-        overlap = self._positive_int(
-            self.extraction_config.get("chunk_overlap"),
-            self.DEFAULT_CHUNK_OVERLAP,
-        )
-        max_source_chars = self._positive_int(
-            self.extraction_config.get("max_source_chars"),
-            self.DEFAULT_MAX_SOURCE_CHARS,
-        )
-
-        if max_source_chars > 0 and len(text) > max_source_chars:
-            logger.warning(
-                "Source text too large (%s chars), truncating to %s before chunking",
-                len(text),
-                max_source_chars,
-            )
-            text = text[:max_source_chars]
-
-        if chunk_size <= 0:
-            chunk_size = self.DEFAULT_CHUNK_SIZE
-
-        safe_overlap = max(0, min(overlap, chunk_size - 1))
-        chunks: list[str] = []
-        text_len = len(text)
-        start = 0
-        while start < text_len and text[start].isspace():
-            start += 1
-
-        end_limit = text_len
-        while end_limit > start and text[end_limit - 1].isspace():
-            end_limit -= 1
-
-        if start >= end_limit:
-            return []
-
-        while start < end_limit:
-            end = min(start + chunk_size, end_limit)
-            if end < end_limit:
-                soft_floor = min(start + 200, end)
-                paragraph_break = text.rfind("\n\n", soft_floor, end)
-                whitespace_break = text.rfind(" ", soft_floor, end)
-                split_at = max(paragraph_break, whitespace_break)
-                if split_at > start:
-                    end = split_at
-
-            if end <= start:
-                end = min(start + chunk_size, end_limit)
-                if end <= start:
-                    break
-
-            chunk = text[start:end].strip()
-            if chunk:
-                chunks.append(chunk)
-
-            if end >= end_limit:
-                break
-            next_start = end - safe_overlap
-            start = next_start if next_start > start else end
-
-        return chunks
+        return chunk_text(text, **self._chunk_params())
 
     def _build_fragment_record(
         self,
@@ -307,9 +454,7 @@ class ZoteroSemanticSearch:
         parent_key = str(parent_metadata.get("item_key") or parent_item.get("key", ""))
         safe_source_key = source_key or source_label or "unknown"
 
-        fragment_id = (
-            f"{parent_key}::{fragment_type}::{safe_source_key}::{chunk_index}"
-        )
+        fragment_id = f"{parent_key}::{fragment_type}::{safe_source_key}::{chunk_index}"
 
         metadata = dict(parent_metadata)
         metadata.update(
@@ -329,6 +474,28 @@ class ZoteroSemanticSearch:
             "metadata": metadata,
         }
 
+    def _build_chunk_records(
+        self,
+        parent_item: dict[str, Any],
+        fragment_type: str,
+        source_key: str,
+        source_label: str,
+        chunks: list[str],
+    ) -> list[dict[str, Any]]:
+        """Build fragment records for all chunks of one source."""
+        return [
+            self._build_fragment_record(
+                parent_item=parent_item,
+                fragment_type=fragment_type,
+                source_key=source_key,
+                source_label=source_label,
+                text=chunk,
+                chunk_index=idx,
+                chunk_count=len(chunks),
+            )
+            for idx, chunk in enumerate(chunks, start=1)
+        ]
+
     def _collect_local_fragment_records(
         self,
         reader: LocalDatabaseClient,
@@ -348,19 +515,15 @@ class ZoteroSemanticSearch:
 
                 note_index += 1
                 note_key = str(note.get("key") or f"note-{note_index}")
-                chunks = self._chunk_text(note_text)
-                for idx, chunk in enumerate(chunks, start=1):
-                    records.append(
-                        self._build_fragment_record(
-                            parent_item=parent_item,
-                            fragment_type="note",
-                            source_key=note_key,
-                            source_label=f"note-{note_index}",
-                            text=chunk,
-                            chunk_index=idx,
-                            chunk_count=len(chunks),
-                        )
+                records.extend(
+                    self._build_chunk_records(
+                        parent_item,
+                        "note",
+                        note_key,
+                        f"note-{note_index}",
+                        self._chunk_text(note_text),
                     )
+                )
             except MemoryError:
                 logger.warning(
                     "Skipping note fragments for item %s due MemoryError", item.key
@@ -381,19 +544,15 @@ class ZoteroSemanticSearch:
                 if not pdf_text:
                     continue
 
-                chunks = self._chunk_text(pdf_text)
-                for idx, chunk in enumerate(chunks, start=1):
-                    records.append(
-                        self._build_fragment_record(
-                            parent_item=parent_item,
-                            fragment_type="pdf",
-                            source_key=pdf_key,
-                            source_label=pdf_path.name,
-                            text=chunk,
-                            chunk_index=idx,
-                            chunk_count=len(chunks),
-                        )
+                records.extend(
+                    self._build_chunk_records(
+                        parent_item,
+                        "pdf",
+                        pdf_key,
+                        pdf_path.name,
+                        self._chunk_text(pdf_text),
                     )
+                )
             except MemoryError:
                 logger.warning(
                     "Skipping pdf fragments for item %s attachment %s due MemoryError",
@@ -412,17 +571,212 @@ class ZoteroSemanticSearch:
 
         return records
 
-    def _get_items_from_source(
+    @staticmethod
+    def _local_item_to_api_item(item: Any) -> dict[str, Any]:
+        """Convert a local ZoteroItem to the API item shape used for indexing."""
+        api_item: dict[str, Any] = {
+            "key": item.key,
+            "version": 0,
+            "data": {
+                "key": item.key,
+                "itemType": item.item_type or "journalArticle",
+                "title": item.title or "",
+                "abstractNote": item.abstract or "",
+                "extra": item.extra or "",
+                "fulltext": "",
+                "fulltextSource": "",
+                "dateAdded": item.date_added,
+                "dateModified": item.date_modified,
+                "date": item.date or "",
+                "creators": ZoteroMapper.parse_creators_string(item.creators),
+                "collections": list(item.collections),
+            },
+        }
+
+        if item.notes:
+            api_item["data"]["note"] = item.notes
+            api_item["data"]["notes"] = item.notes
+        if item.tags:
+            api_item["data"]["tags"] = [{"tag": tag} for tag in item.tags]
+        if item.annotations:
+            api_item["data"]["annotations"] = item.annotations
+
+        return api_item
+
+    def _iter_local_documents(
+        self,
+        reader: LocalDatabaseClient,
+        local_items: list[Any],
+        extract_fulltext: bool,
+    ) -> Iterator[tuple[dict[str, Any], list[dict[str, Any]]]]:
+        """
+        Yield (parent item, fragment records) for local items, in item order.
+
+        PDF extraction runs in a process pool when more than one extraction
+        worker is configured; otherwise everything runs in-process.
+        """
+        workers = self._positive_int(
+            self.extraction_config.get("workers"),
+            self.DEFAULT_EXTRACTION_WORKERS,
+        )
+        if extract_fulltext and workers > 1:
+            yield from self._iter_local_documents_parallel(reader, local_items, workers)
+            return
+
+        for item in local_items:
+            api_item = self._local_item_to_api_item(item)
+            yield (
+                api_item,
+                self._collect_local_fragment_records(
+                    reader=reader,
+                    item=item,
+                    parent_item=api_item,
+                    extract_fulltext=extract_fulltext,
+                ),
+            )
+
+    def _iter_local_documents_parallel(
+        self,
+        reader: LocalDatabaseClient,
+        local_items: list[Any],
+        workers: int,
+    ) -> Iterator[tuple[dict[str, Any], list[dict[str, Any]]]]:
+        """
+        Pipelined variant of _iter_local_documents.
+
+        Notes and cached PDF text are handled in-process while uncached PDFs
+        are queued to the pool. Items are yielded in their original order as
+        soon as all of their attachments are done, and the producer waits on
+        the oldest item once too many extractions are in flight, so memory
+        stays bounded regardless of library size.
+        """
+        chunk_params = self._chunk_params()
+        cache = reader.fulltext_cache
+        max_in_flight = workers * self.EXTRACTION_QUEUE_FACTOR
+        pending: deque[tuple] = deque()
+        in_flight = 0
+
+        with AttachmentExtractionPool(workers) as pool:
+            for item in local_items:
+                api_item = self._local_item_to_api_item(item)
+                records = self._collect_local_fragment_records(
+                    reader=reader,
+                    item=item,
+                    parent_item=api_item,
+                    extract_fulltext=False,
+                )
+                sources: list[
+                    tuple[str, Path, Future[ExtractionResult] | list[str]]
+                ] = []
+                for pdf_key, pdf_path in reader.iter_pdf_attachments(item.item_id):
+                    cached = (
+                        cache.get(pdf_path, reader.pdf_extractor_id, pdf_key)
+                        if cache is not None
+                        else None
+                    )
+                    if cached is not None:
+                        sources.append(
+                            (pdf_key, pdf_path, self._chunk_text(cached.strip()))
+                        )
+                        continue
+                    future = pool.submit(
+                        pdf_path, "pdf", reader.pdf_max_pages, **chunk_params
+                    )
+                    sources.append((pdf_key, pdf_path, future))
+                    in_flight += 1
+
+                pending.append((item, api_item, records, sources))
+                while in_flight > max_in_flight:
+                    done = pending.popleft()
+                    in_flight -= sum(isinstance(src[2], Future) for src in done[3])
+                    yield self._finish_local_document(reader, pool, *done)
+
+            while pending:
+                yield self._finish_local_document(reader, pool, *pending.popleft())
+
+    def _finish_local_document(
+        self,
+        reader: LocalDatabaseClient,
+        pool: AttachmentExtractionPool,
+        item: Any,
+        api_item: dict[str, Any],
+        records: list[dict[str, Any]],
+        sources: list[tuple[str, Path, Future[ExtractionResult] | list[str]]],
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Wait for an item's PDF extractions and append their fragments."""
+        for pdf_key, pdf_path, source in sources:
+            if isinstance(source, Future):
+                try:
+                    result: ExtractionResult = source.result()
+                except Exception as e:
+                    # Pool failure (e.g. worker killed): every task of the
+                    # broken pool fails, so retry once on a fresh pool. Never
+                    # parse in-process, where a PDF that crashed a worker
+                    # would take the indexer down with it.
+                    logger.warning(
+                        "Extraction worker failed for item %s attachment %s: %s",
+                        item.key,
+                        pdf_key,
+                        e,
+                    )
+                    result = self._retry_extraction(reader, pool, pdf_path)
+
+                if result.error:
+                    logger.warning(
+                        "Skipping one pdf fragment source for item %s "
+                        "attachment %s: %s",
+                        item.key,
+                        pdf_key,
+                        result.error,
+                    )
+                    continue
+                if reader.fulltext_cache is not None:
+                    reader.fulltext_cache.put(
+                        pdf_path, reader.pdf_extractor_id, result.text, pdf_key
+                    )
+                chunks = result.chunks
+            else:
+                chunks = source
+
+            records.extend(
+                self._build_chunk_records(
+                    api_item, "pdf", pdf_key, pdf_path.name, chunks
+                )
+            )
+
+        return api_item, records
+
+    def _retry_extraction(
+        self,
+        reader: LocalDatabaseClient,
+        pool: AttachmentExtractionPool,
+        pdf_path: Path,
+    ) -> ExtractionResult:
+        """Extract a PDF once more in the pool, recording a second failure."""
+        try:
+            return pool.submit(
+                pdf_path, "pdf", reader.pdf_max_pages, **self._chunk_params()
+            ).result()
+        except Exception as e:
+            return ExtractionResult(error=f"extraction worker failed twice: {e}")
+
+    def _iter_items_from_source(
         self,
         scan_limit: int = 100,
         treated_limit: int | None = None,
         extract_fulltext: bool = False,
         chroma_client: ChromaClient | None = None,
         force_rebuild: bool = False,
-    ) -> list[dict[str, Any]]:
-        """Get items from either local database or API."""
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Stream documents from either local database or API.
+
+        When ``chroma_client`` is given and no rebuild is forced, only items
+        added or changed since the last run are produced and removed items
+        are deleted from the collection first.
+        """
         if is_local_mode():
-            return self._get_items_from_local_db(
+            return self._iter_items_from_local_db(
                 scan_limit,
                 treated_limit,
                 extract_fulltext=extract_fulltext,
@@ -430,7 +784,11 @@ class ZoteroSemanticSearch:
                 force_rebuild=force_rebuild,
             )
         else:
-            return self._get_items_from_api(scan_limit, treated_limit)
+            return self._iter_api_documents(
+                scan_limit,
+                treated_limit,
+                chroma_client=chroma_client if not force_rebuild else None,
+            )
 
     def _get_items_from_local_db(
         self,
@@ -440,25 +798,56 @@ class ZoteroSemanticSearch:
         chroma_client: ChromaClient | None = None,
         force_rebuild: bool = False,
     ) -> list[dict[str, Any]]:
-        """Get items from local Zotero database."""
+        """Get all documents from local Zotero database as a list."""
+        return list(
+            self._iter_items_from_local_db(
+                scan_limit,
+                treated_limit,
+                extract_fulltext=extract_fulltext,
+                chroma_client=chroma_client,
+                force_rebuild=force_rebuild,
+            )
+        )
+
+    def _load_local_db_settings(self) -> tuple[str | None, int | None]:
+        """Resolve the Zotero database path and PDF page limit from config."""
+        pdf_max_pages = None
+        zotero_db_path = self.db_path
+        try:
+            if self.config_path and os.path.exists(self.config_path):
+                with open(self.config_path) as _f:
+                    _cfg = json.load(_f)
+                    semantic_cfg = _cfg.get("semantic_search", {})
+                    pdf_max_pages = semantic_cfg.get("extraction", {}).get(
+                        "pdf_max_pages"
+                    )
+                    if not zotero_db_path:
+                        zotero_db_path = semantic_cfg.get("zotero_db_path")
+        except Exception:
+            pass
+        return zotero_db_path, pdf_max_pages
+
+    def _iter_items_from_local_db(
+        self,
+        scan_limit: int = 100,
+        treated_limit: int | None = None,
+        extract_fulltext: bool = False,
+        chroma_client: ChromaClient | None = None,
+        force_rebuild: bool = False,
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Stream documents from local Zotero database.
+
+        Each parent item is followed directly by its fragment records, so
+        only one item's text is held at a time. If the database cannot be
+        read before the first document is produced, falls back to the API;
+        later errors are raised to the caller.
+        """
         logger.info("Fetching items from local Zotero database...")
 
+        started = False
         try:
-            # Load per-run config
-            pdf_max_pages = None
-            zotero_db_path = self.db_path
-            try:
-                if self.config_path and os.path.exists(self.config_path):
-                    with open(self.config_path) as _f:
-                        _cfg = json.load(_f)
-                        semantic_cfg = _cfg.get("semantic_search", {})
-                        pdf_max_pages = semantic_cfg.get("extraction", {}).get(
-                            "pdf_max_pages"
-                        )
-                        if not zotero_db_path:
-                            zotero_db_path = semantic_cfg.get("zotero_db_path")
-            except Exception:
-                pass
+            zotero_db_path, pdf_max_pages = self._load_local_db_settings()
 
             # Use new LocalDatabaseClient wrapper
             with (
@@ -470,9 +859,36 @@ class ZoteroSemanticSearch:
                 # Phase 1: fetch metadata only (fast)
                 sys.stderr.write("Scanning local Zotero database for items...\n")
 
-                # Get items using the new client method
-                local_items = reader.get_items(
-                    limit=treated_limit, include_fulltext=False
+                suffix = (
+                    self.FULLTEXT_STAMP_SUFFIX if extract_fulltext else "|fulltext=0"
+                )
+                stamps = {
+                    key: f"{stamp}{suffix}"
+                    for key, stamp in reader.get_item_stamps().values()
+                }
+                if chroma_client is not None and not force_rebuild:
+                    known = self.manifest.get_stamps()
+                    removed = [key for key in known if key not in stamps]
+                    self._remove_indexed_items(removed, chroma_client)
+                    changed = [
+                        key for key, stamp in stamps.items() if known.get(key) != stamp
+                    ]
+                    logger.info(
+                        "Incremental update: %s changed, %s removed, %s unchanged",
+                        len(changed),
+                        len(removed),
+                        len(stamps) - len(changed),
+                    )
+                    if treated_limit is not None:
+                        changed = changed[:treated_limit]
+                    local_items = reader.get_items_by_keys(changed)
+                else:
+                    # Get items using the new client method
+                    local_items = reader.get_items(
+                        limit=treated_limit, include_fulltext=False
+                    )
+                self._pending_stamps.update(
+                    {item.key: stamps.get(item.key, "") for item in local_items}
                 )
                 candidate_count = len(local_items)
                 sys.stderr.write(f"Found {candidate_count} candidate items.\n")
@@ -484,47 +900,19 @@ class ZoteroSemanticSearch:
                 except Exception:
                     pass
 
-                # Convert to API-compatible format
-                api_items: list[dict[str, Any]] = []
-                fragment_records: list[dict[str, Any]] = []
+                # Convert to API-compatible format and stream per item
                 total_local_items = len(local_items)
-                for idx_item, item in enumerate(local_items, start=1):
-                    api_item: dict[str, Any] = {
-                        "key": item.key,
-                        "version": 0,
-                        "data": {
-                            "key": item.key,
-                            "itemType": item.item_type or "journalArticle",
-                            "title": item.title or "",
-                            "abstractNote": item.abstract or "",
-                            "extra": item.extra or "",
-                            "fulltext": "",
-                            "fulltextSource": "",
-                            "dateAdded": item.date_added,
-                            "dateModified": item.date_modified,
-                            "creators": ZoteroMapper.parse_creators_string(
-                                item.creators
-                            ),
-                        },
-                    }
-
-                    if item.notes:
-                        api_item["data"]["note"] = item.notes
-                        api_item["data"]["notes"] = item.notes
-                    if item.tags:
-                        api_item["data"]["tags"] = [{"tag": tag} for tag in item.tags]
-                    if item.annotations:
-                        api_item["data"]["annotations"] = item.annotations
-
-                    api_items.append(api_item)
-                    fragment_records.extend(
-                        self._collect_local_fragment_records(
-                            reader=reader,
-                            item=item,
-                            parent_item=api_item,
-                            extract_fulltext=extract_fulltext,
-                        )
-                    )
+                total_fragments = 0
+                documents = self._iter_local_documents(
+                    reader, local_items, extract_fulltext
+                )
+                for idx_item, (api_item, item_fragments) in enumerate(
+                    documents, start=1
+                ):
+                    started = True
+                    total_fragments += len(item_fragments)
+                    yield api_item
+                    yield from item_fragments
                     try:
                         pct_items = (
                             idx_item / total_local_items * 100
@@ -535,22 +923,23 @@ class ZoteroSemanticSearch:
                             "Prepared local documents: "
                             f"{idx_item}/{total_local_items} "
                             f"({pct_items:.1f}%), "
-                            f"fragments={len(fragment_records)}\n"
+                            f"fragments={total_fragments}\n"
                         )
                     except Exception:
                         pass
 
                 logger.info(
                     "Prepared %s parent items and %s fragment documents from local DB",
-                    len(api_items),
-                    len(fragment_records),
+                    total_local_items,
+                    total_fragments,
                 )
-                return [*api_items, *fragment_records]
 
         except Exception as e:
+            if started:
+                raise
             logger.exception(f"Error reading from local database: {e}")
             logger.info("Falling back to API...")
-            return self._get_items_from_api(
+            yield from self._get_items_from_api(
                 scan_limit=scan_limit,
                 treated_limit=treated_limit,
             )
@@ -558,7 +947,53 @@ class ZoteroSemanticSearch:
     def _get_items_from_api(
         self, scan_limit: int = 100, treated_limit: int | None = None
     ) -> list[dict[str, Any]]:
-        """Get items from Zotero API with batch scanning."""
+        """Get items from Zotero API as a list."""
+        return list(self._iter_items_from_api(scan_limit, treated_limit))
+
+    def _iter_api_documents(
+        self,
+        scan_limit: int = 100,
+        treated_limit: int | None = None,
+        chroma_client: ChromaClient | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Stream API items, recording their versions for the manifest.
+
+        With a ``chroma_client``, only items changed since the library
+        version recorded by the last complete run are fetched (``since=``),
+        and items deleted since then are removed from the collection.
+        """
+        library_version = self.zotero_client.last_modified_version()
+        since: int | None = None
+        if chroma_client is not None:
+            raw_since = self.manifest.get_meta("library_version")
+            since = int(raw_since) if raw_since and raw_since.isdigit() else None
+            if since is not None:
+                deleted = self.zotero_client.deleted(since=since) or {}
+                self._remove_indexed_items(
+                    list(deleted.get("items", [])), chroma_client
+                )
+                logger.info(
+                    f"Incremental update since library version {since} "
+                    f"(current {library_version})"
+                )
+
+        for item in self._iter_items_from_api(scan_limit, treated_limit, since=since):
+            self._pending_stamps[str(item.get("key", ""))] = str(
+                item.get("version", "")
+            )
+            yield item
+
+        if treated_limit is None and isinstance(library_version, int):
+            self._pending_library_version = library_version
+
+    def _iter_items_from_api(
+        self,
+        scan_limit: int = 100,
+        treated_limit: int | None = None,
+        since: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream items from Zotero API with batch scanning."""
         logger.info(
             "Fetching items from Zotero API "
             f"(batch: {scan_limit}, max: {treated_limit or 'all'})..."
@@ -566,11 +1001,13 @@ class ZoteroSemanticSearch:
 
         batch_size = max(1, scan_limit)
         start = 0
-        all_items = []
+        yielded = 0
 
         while True:
-            batch_params = {"start": start, "limit": batch_size}
-            if treated_limit is not None and len(all_items) >= treated_limit:
+            batch_params: dict[str, Any] = {"start": start, "limit": batch_size}
+            if since is not None:
+                batch_params["since"] = since
+            if treated_limit is not None and yielded >= treated_limit:
                 break
 
             try:
@@ -585,24 +1022,24 @@ class ZoteroSemanticSearch:
             if not items:
                 break
 
-            filtered_items = [
-                item
-                for item in items
-                if item.get("data", {}).get("itemType")
-                not in ["attachment", "note", "annotation"]
-            ]
+            for item in items:
+                if item.get("data", {}).get("itemType") in [
+                    "attachment",
+                    "note",
+                    "annotation",
+                ]:
+                    continue
+                if treated_limit is not None and yielded >= treated_limit:
+                    break
+                yield item
+                yielded += 1
 
-            all_items.extend(filtered_items)
             start += batch_size
 
             if len(items) < batch_size:
                 break
 
-        if treated_limit is not None:
-            all_items = all_items[:treated_limit]
-
-        logger.info(f"Retrieved {len(all_items)} items from API")
-        return all_items
+        logger.info(f"Retrieved {yielded} items from API")
 
     def update_database(
         self,
@@ -610,8 +1047,165 @@ class ZoteroSemanticSearch:
         scan_limit: int = 100,
         treated_limit: int | None = None,
         extract_fulltext: bool = False,
+        pause_hook: Callable[[], None] | None = None,
+        lock_timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Update the semantic search database (one update at a time).
+
+        Args:
+            force_full_rebuild: Drop the index and rebuild it from scratch
+            scan_limit: Items fetched per page from the source
+            treated_limit: Maximum number of items to index
+            extract_fulltext: Index PDF fulltext fragments
+            pause_hook: Called between upsert batches; a background
+                updater blocks in it while interactive requests run. The
+                update lock is released meanwhile, and the run stops if
+                another update ran during the pause.
+            lock_timeout: Seconds to wait for a running update before
+                raising RuntimeError (wait indefinitely if None)
+
+        Returns:
+            Update statistics
+        """
+        with self._exclusive_update(lock_timeout):
+            stats = self._update_database(
+                force_full_rebuild=force_full_rebuild,
+                scan_limit=scan_limit,
+                treated_limit=treated_limit,
+                extract_fulltext=extract_fulltext,
+                pause_hook=pause_hook,
+            )
+            # Item stamps carry the mode, so later runs should keep it
+            self.manifest.set_meta("extract_fulltext", "1" if extract_fulltext else "0")
+            return stats
+
+    def default_extract_fulltext(self) -> bool:
+        """
+        Fulltext mode for updates that do not choose one (scheduled runs).
+
+        ``update_config.extract_fulltext`` wins. Otherwise the mode of the
+        last update is kept, since switching it re-indexes every item, and
+        a new index extracts fulltext like the CLI's ``db-update``.
+        """
+        configured = self.update_config.get("extract_fulltext")
+        if configured is not None:
+            return bool(configured)
+        return self.manifest.get_meta("extract_fulltext") != "0"
+
+    @contextmanager
+    def _exclusive_update(self, lock_timeout: float | None = None) -> Iterator[None]:
+        """
+        Hold the update locks for one update, backfill or garbage collection.
+
+        The thread lock orders the engines of this process and the file lock
+        those of other processes (e.g. a CLI run next to the server).
+
+        Args:
+            lock_timeout: Seconds to wait for the locks (indefinitely if None)
+
+        Raises:
+            RuntimeError: If another update still holds a lock at the timeout
+        """
+        if lock_timeout is None:
+            deadline = None
+            acquired = self._update_lock.acquire()
+        else:
+            deadline = time.monotonic() + lock_timeout
+            acquired = self._update_lock.acquire(timeout=lock_timeout)
+        if not acquired:
+            raise RuntimeError("Another semantic index update is already running")
+        try:
+            remaining = (
+                None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+            if not self._index_file_lock.acquire(timeout=remaining):
+                raise RuntimeError(
+                    "Another process is updating the semantic index "
+                    f"({self._index_file_lock.lock_path})"
+                )
+            try:
+                self._run_token = uuid.uuid4().hex
+                self.manifest.set_meta("update_run", self._run_token)
+                self._collection_changed = False
+                try:
+                    yield
+                finally:
+                    if self._collection_changed and not self._closed:
+                        self._bump_index_generation()
+            finally:
+                self._index_file_lock.release()
+        finally:
+            self._update_lock.release()
+
+    def _pause(self, pause_hook: Callable[[], None] | None) -> None:
+        """
+        Call a run's pause hook without holding the update locks.
+
+        A scheduled update blocks in its hook while tool calls are served;
+        one of them may be an update of its own, which must not wait for the
+        paused run, and a CLI run may start in another process. Everything
+        up to the pause is committed, so if another run took the locks
+        meanwhile this one stops instead of resuming with stale state.
+
+        Raises:
+            InterruptedError: If another update ran during the pause or the
+                engine was closed
+        """
+        if pause_hook is None:
+            return
+        if self._collection_changed:
+            # Let searches served during the pause see the new documents
+            self._bump_index_generation()
+            self._collection_changed = False
+        token = self._run_token
+        self._index_file_lock.release()
+        self._update_lock.release()
+        try:
+            pause_hook()
+        finally:
+            self._update_lock.acquire()
+            self._index_file_lock.acquire()
+        if self._closed:
+            raise InterruptedError("Semantic search engine was closed")
+        if self._run_token != token or self.manifest.get_meta("update_run") != token:
+            raise InterruptedError("Another index update ran during the pause")
+
+    def close(self) -> None:
+        """
+        Close the manifest and index files once no update is running.
+
+        Waits for a running update, backfill or garbage collection to finish
+        or reach its next pause point; a paused run stops when it resumes.
+        """
+        with self._update_lock:
+            self._closed = True
+            self.manifest.close()
+            close_chroma = getattr(self.chroma_client, "close", None)
+            if close_chroma is not None:
+                close_chroma()
+            self._item_cache.clear()
+            self._result_cache.clear()
+
+    def _index_generation(self) -> str:
+        """Return the token identifying the current state of the index."""
+        return self.manifest.get_meta("generation") or ""
+
+    def _bump_index_generation(self) -> None:
+        """Mark the index as changed, invalidating cached search results."""
+        # Stored in the manifest so other processes sharing the index see it
+        self.manifest.set_meta("generation", uuid.uuid4().hex)
+        self._result_cache.clear()
+
+    def _update_database(
+        self,
+        force_full_rebuild: bool,
+        scan_limit: int,
+        treated_limit: int | None,
+        extract_fulltext: bool,
+        pause_hook: Callable[[], None] | None = None,
     ) -> dict[str, Any]:
-        """Update the semantic search database."""
+        """Run one database update; see update_database."""
         logger.info("Starting database update...")
         start_time = datetime.now()
 
@@ -624,6 +1218,7 @@ class ZoteroSemanticSearch:
             "updated_items": 0,
             "skipped_items": 0,
             "errors": 0,
+            "upsert_seconds": 0.0,
             "start_time": start_time.isoformat(),
             "duration": None,
         }
@@ -631,9 +1226,24 @@ class ZoteroSemanticSearch:
         try:
             if force_full_rebuild:
                 logger.info("Force rebuilding database...")
+                self._collection_changed = True
                 self.chroma_client.reset_collection()
-
-            all_items = self._get_items_from_source(
+                self.manifest.clear()
+            elif self.manifest.get_meta("metadata_version") != str(
+                self.METADATA_VERSION
+            ):
+                # Forgetting all stamps makes this run reindex every item
+                logger.info("Index metadata format changed, reindexing all items")
+                self.manifest.clear()
+            self.manifest.set_meta("metadata_version", str(self.METADATA_VERSION))
+
+            self._pending_stamps = {}
+            self._pending_library_version = None
+            # Document ids per parent item, collected until the item is done
+            open_items: dict[str, list[str]] = {}
+            failed_items: set[str] = set()
+
+            documents = self._iter_items_from_source(
                 scan_limit=scan_limit,
                 treated_limit=treated_limit,
                 extract_fulltext=extract_fulltext,
@@ -641,60 +1251,92 @@ class ZoteroSemanticSearch:
                 force_rebuild=force_full_rebuild,
             )
 
-            total_fragments = sum(
-                1 for item in all_items if bool(item.get("__semantic_fragment__"))
-            )
-            stats["total_fragments"] = total_fragments
-            stats["total_items"] = len(all_items) - total_fragments
-            stats["total_documents"] = len(all_items)
-            logger.info(
-                "Found %s parent items and %s fragments to process",
-                stats["total_items"],
-                stats["total_fragments"],
+            batcher = AdaptiveBatcher(
+                initial_chars=self.extraction_config["batch_chars"],
+                max_chars=self.extraction_config["max_batch_chars"],
+                max_documents=self.UPSERT_BATCH_SIZE,
             )
+            # Documents are upserted as they are produced; only one batch
+            # (plus the producer's current item) is held in memory.
+            with closing(documents):
+                for batch_idx, batch in enumerate(
+                    batcher.batches(documents, self._document_size), start=1
+                ):
+                    fragments = sum(
+                        1 for item in batch if item.get("__semantic_fragment__")
+                    )
+                    stats["total_fragments"] += fragments
+                    stats["total_items"] += len(batch) - fragments
+                    stats["total_documents"] += len(batch)
+
+                    batch_chars = sum(self._document_size(item) for item in batch)
+                    batch_start = time.perf_counter()
+                    batch_stats = self._process_item_batch(batch)
+                    batch_seconds = time.perf_counter() - batch_start
+                    stats["upsert_seconds"] += batch_seconds
+                    batcher.record(batch_chars, batch_seconds)
+                    logger.debug(
+                        f"Upsert batch {batch_idx}: {len(batch)} documents, "
+                        f"{batch_chars} chars in {batch_seconds:.2f}s "
+                        f"({batch_chars / max(batch_seconds, 1e-9):.0f} chars/s), "
+                        f"next budget {batcher.budget} chars"
+                    )
 
-            try:
-                sys.stderr.write(
-                    f"Total documents to index: {stats['total_documents']}\n"
-                )
-            except Exception:
-                pass
+                    batch_parents = [self._parent_key(item) for item in batch]
+                    for parent_key, item in zip(batch_parents, batch, strict=True):
+                        open_items.setdefault(parent_key, []).append(
+                            str(item.get("key", ""))
+                        )
+                    if batch_stats["errors"]:
+                        failed_items.update(batch_parents)
+                    # The source groups documents per item, so every item
+                    # except the last one in the batch is complete.
+                    self._commit_indexed_items(
+                        {
+                            key: open_items.pop(key)
+                            for key in list(open_items)
+                            if key != batch_parents[-1]
+                        },
+                        failed_items,
+                    )
 
-            batch_size = 50
-            total_docs = len(all_items)
-            total_batches = (
-                (total_docs + batch_size - 1) // batch_size if total_docs else 0
-            )
-            for batch_idx, i in enumerate(range(0, total_docs, batch_size), start=1):
-                batch = all_items[i : i + batch_size]
-                batch_stats = self._process_item_batch(batch)
+                    stats["processed_items"] += batch_stats["processed"]
+                    stats["added_items"] += batch_stats["added"]
+                    stats["updated_items"] += batch_stats["updated"]
+                    stats["skipped_items"] += batch_stats["skipped"]
+                    stats["errors"] += batch_stats["errors"]
 
-                stats["processed_items"] += batch_stats["processed"]
-                stats["added_items"] += batch_stats["added"]
-                stats["updated_items"] += batch_stats["updated"]
-                stats["skipped_items"] += batch_stats["skipped"]
-                stats["errors"] += batch_stats["errors"]
+                    self._pause(pause_hook)
 
-                try:
-                    pct = (
-                        (stats["processed_items"] + stats["skipped_items"])
-                        / total_docs
-                        * 100
-                        if total_docs
-                        else 100.0
-                    )
-                    sys.stderr.write(
-                        "Indexing progress: "
-                        f"batch {batch_idx}/{total_batches}, "
-                        f"processed={stats['processed_items']}, "
-                        f"skipped={stats['skipped_items']}, "
-                        f"errors={stats['errors']}, "
-                        f"{pct:.1f}%\n"
-                    )
-                except Exception:
-                    pass
+                    try:
+                        sys.stderr.write(
+                            "Indexing progress: "
+                            f"batch {batch_idx}, "
+                            f"documents={stats['total_documents']}, "
+                            f"processed={stats['processed_items']}, "
+                            f"skipped={stats['skipped_items']}, "
+                            f"errors={stats['errors']}\n"
+                        )
+                    except Exception:
+                        pass
+
+            self._commit_indexed_items(open_items, failed_items)
+            logger.info(
+                "Indexed %s parent items and %s fragments",
+                stats["total_items"],
+                stats["total_fragments"],
+            )
+            if self.search_config["mode"] == "hybrid":
+                # Built here rather than inside the first hybrid search
+                stats["lexical_index_seconds"] = round(
+                    self.chroma_client.ensure_lexical_index(), 2
+                )
 
             if stats["errors"] == 0:
+                if self._pending_library_version is not None:
+                    self.manifest.set_meta(
+                        "library_version", str(self._pending_library_version)
+                    )
                 self.update_config["last_update"] = datetime.now().isoformat()
                 self._save_update_config()
             else:
@@ -716,6 +1358,72 @@ class ZoteroSemanticSearch:
             stats["error"] = str(e)
             return stats
 
+    @staticmethod
+    def _document_size(document: dict[str, Any]) -> int:
+        """Approximate indexed text length of an item or fragment document."""
+        if document.get("__semantic_fragment__"):
+            return len(str(document.get("document", "")))
+        data = document.get("data") or {}
+        return sum(len(value) for value in data.values() if isinstance(value, str))
+
+    @staticmethod
+    def _parent_key(document: dict[str, Any]) -> str:
+        """Return the parent item key of an item or fragment document."""
+        if document.get("__semantic_fragment__"):
+            metadata = document.get("metadata") or {}
+            return str(metadata.get("item_key") or document.get("key", ""))
+        return str(document.get("key", ""))
+
+    def _remove_indexed_items(
+        self, item_keys: list[str], chroma_client: ChromaClient
+    ) -> None:
+        """Delete all documents of the given items and forget them."""
+        if not item_keys:
+            return
+
+        known = self.manifest.get_doc_ids(item_keys)
+        doc_ids = list(item_keys)
+        for key in item_keys:
+            doc_ids.extend(doc_id for doc_id in known.get(key, []) if doc_id != key)
+        self._collection_changed = True
+        for i in range(0, len(doc_ids), self.DELETE_BATCH_SIZE):
+            chroma_client.delete_documents(doc_ids[i : i + self.DELETE_BATCH_SIZE])
+        self.manifest.remove_items(item_keys)
+        logger.info(f"Removed {len(item_keys)} deleted items from semantic index")
+
+    def _commit_indexed_items(
+        self, items: dict[str, list[str]], failed_items: set[str]
+    ) -> None:
+        """
+        Record completely indexed items in the manifest.
+
+        Documents from the previous run that were not rewritten (removed
+        notes or attachments, fewer chunks) are deleted. Items with a failed
+        batch are left unrecorded so the next update retries them.
+        """
+        done = {key: ids for key, ids in items.items() if key not in failed_items}
+        for key in items:
+            if key in failed_items:
+                self._pending_stamps.pop(key, None)
+        if not done:
+            return
+
+        previous = self.manifest.get_doc_ids(list(done))
+        stale = [
+            doc_id
+            for key, ids in done.items()
+            for doc_id in previous.get(key, [])
+            if doc_id not in set(ids)
+        ]
+        if stale:
+            self._collection_changed = True
+        for i in range(0, len(stale), self.DELETE_BATCH_SIZE):
+            self.chroma_client.delete_documents(stale[i : i + self.DELETE_BATCH_SIZE])
+
+        self.manifest.record_items(
+            [(key, self._pending_stamps.pop(key, ""), ids) for key, ids in done.items()]
+        )
+
     def _process_item_batch(self, items: list[dict[str, Any]]) -> dict[str, int]:
         """Process a batch of items."""
         stats = {"processed": 0, "added": 0, "updated": 0, "skipped": 0, "errors": 0}
@@ -758,6 +1466,7 @@ class ZoteroSemanticSearch:
                 stats["errors"] += 1
 
         if documents:
+            self._collection_changed = True
             try:
                 self.chroma_client.upsert_documents(documents, metadatas, ids)
                 stats["added"] += len(documents)
@@ -767,6 +1476,388 @@ class ZoteroSemanticSearch:
 
         return stats
 
+    # -------------------- Progressive fulltext backfill --------------------
+
+    def backfill_fulltext(
+        self,
+        max_items: int | None = None,
+        pause_hook: Callable[[], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Index the PDF pages beyond ``pdf_max_pages`` (progressive indexing).
+
+        Updates with ``extract_fulltext`` index only the first pages of each
+        PDF so the library becomes searchable quickly. This second pass adds
+        the remaining pages, most recently modified or read items first.
+        Progress is recorded per item in the manifest, so an interrupted
+        backfill resumes where it stopped; items changed by a later update
+        are backfilled again.
+
+        Args:
+            max_items: Maximum number of items to backfill in this run
+            pause_hook: Called between upsert batches (see update_database)
+
+        Returns:
+            Backfill statistics, including the items still remaining
+        """
+        with self._exclusive_update():
+            return self._backfill_fulltext(max_items, pause_hook)
+
+    def pending_backfill(self) -> dict[str, str]:
+        """Return stamps of fulltext-indexed items not yet backfilled."""
+        return {
+            key: stamp
+            for key, stamp in self.manifest.get_backfill_pending().items()
+            if stamp.endswith(self.FULLTEXT_STAMP_SUFFIX)
+        }
+
+    def _backfill_fulltext(
+        self,
+        max_items: int | None,
+        pause_hook: Callable[[], None] | None,
+    ) -> dict[str, Any]:
+        """Run one backfill pass; see backfill_fulltext."""
+        start_time = datetime.now()
+        stats: dict[str, Any] = {
+            "pending_items": 0,
+            "processed_items": 0,
+            "total_fragments": 0,
+            "errors": 0,
+            "remaining_items": 0,
+            "start_time": start_time.isoformat(),
+            "duration": None,
+        }
+
+        try:
+            if not is_local_mode():
+                raise RuntimeError("Fulltext backfill requires local mode")
+            pending = self.pending_backfill()
+            stats["pending_items"] = len(pending)
+            if pending:
+                self._run_backfill(pending, max_items, pause_hook, stats)
+            stats["remaining_items"] = len(self.pending_backfill())
+        except Exception as e:
+            logger.exception(f"Error backfilling fulltext: {e}")
+            stats["error"] = str(e)
+
+        stats["duration"] = str(datetime.now() - start_time)
+        return stats
+
+    def _run_backfill(
+        self,
+        pending: dict[str, str],
+        max_items: int | None,
+        pause_hook: Callable[[], None] | None,
+        stats: dict[str, Any],
+    ) -> None:
+        """Extract, upsert and record the tails of pending items."""
+        zotero_db_path, pdf_max_pages = self._load_local_db_settings()
+        with (
+            suppress_stdout(),
+            LocalDatabaseClient(
+                db_path=zotero_db_path, pdf_max_pages=pdf_max_pages or 10
+            ) as reader,
+        ):
+            activity = reader.get_pdf_activity()
+            # Items without PDFs have nothing to backfill
+            self.manifest.record_backfill(
+                [
+                    (key, stamp, None)
+                    for key, stamp in pending.items()
+                    if key not in activity
+                ]
+            )
+            ordered = sorted(
+                (key for key in pending if key in activity),
+                key=lambda key: activity[key],
+                reverse=True,
+            )
+            if max_items is not None:
+                ordered = ordered[:max_items]
+            logger.info(
+                f"Backfilling fulltext of {len(ordered)} items "
+                f"(pages beyond {reader.pdf_max_pages})"
+            )
+
+            # Filled by the producer once all records of an item were consumed
+            finished: list[tuple[str, list[str]]] = []
+            failed_items: set[str] = set()
+            records = self._iter_backfill_records(reader, ordered, finished)
+            batcher = AdaptiveBatcher(
+                initial_chars=self.extraction_config["batch_chars"],
+                max_chars=self.extraction_config["max_batch_chars"],
+                max_documents=self.UPSERT_BATCH_SIZE,
+            )
+            with closing(records):
+                for batch in batcher.batches(records, self._document_size):
+                    batch_chars = sum(self._document_size(doc) for doc in batch)
+                    batch_start = time.perf_counter()
+                    batch_stats = self._process_item_batch(batch)
+                    batcher.record(batch_chars, time.perf_counter() - batch_start)
+                    stats["total_fragments"] += batch_stats["processed"]
+                    stats["errors"] += batch_stats["errors"]
+                    if batch_stats["errors"]:
+                        failed_items.update(self._parent_key(doc) for doc in batch)
+                    stats["processed_items"] += self._commit_backfill(
+                        finished, pending, failed_items
+                    )
+                    finished.clear()
+                    self._pause(pause_hook)
+
+            stats["processed_items"] += self._commit_backfill(
+                finished, pending, failed_items
+            )
+
+    def _iter_backfill_records(
+        self,
+        reader: LocalDatabaseClient,
+        item_keys: list[str],
+        finished: list[tuple[str, list[str]]],
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Yield tail fragment records of the given items, in order.
+
+        After the last record of an item has been consumed, the item key and
+        its tail document ids are appended to ``finished``. With more than
+        one extraction worker, the tails of the next few items are parsed in
+        the process pool while earlier ones are embedded.
+        """
+        workers = self._positive_int(
+            self.extraction_config.get("workers"),
+            self.DEFAULT_EXTRACTION_WORKERS,
+        )
+        slice_size = workers * self.EXTRACTION_QUEUE_FACTOR
+        with (
+            AttachmentExtractionPool(workers) if workers > 1 else nullcontext()
+        ) as pool:
+            for offset in range(0, len(item_keys), slice_size):
+                keys = item_keys[offset : offset + slice_size]
+                queued = []
+                for item in reader.get_items_by_keys(keys):
+                    sources = [
+                        (key, path, self._start_tail(reader, pool, key, path))
+                        for key, path in reader.iter_pdf_attachments(item.item_id)
+                    ]
+                    queued.append((item, sources))
+
+                for item, sources in queued:
+                    api_item = self._local_item_to_api_item(item)
+                    doc_ids: list[str] = []
+                    for pdf_key, pdf_path, source in sources:
+                        chunks = self._finish_tail(
+                            reader, item.key, pdf_key, pdf_path, source
+                        )
+                        for record in self._build_chunk_records(
+                            api_item,
+                            "pdf",
+                            f"{pdf_key}{self.TAIL_SOURCE_SUFFIX}",
+                            pdf_path.name,
+                            chunks,
+                        ):
+                            doc_ids.append(record["key"])
+                            yield record
+                    finished.append((item.key, doc_ids))
+
+    def _start_tail(
+        self,
+        reader: LocalDatabaseClient,
+        pool: AttachmentExtractionPool | None,
+        pdf_key: str,
+        pdf_path: Path,
+    ) -> Future[ExtractionResult] | str:
+        """Return cached tail text, or start extracting it."""
+        cache = reader.fulltext_cache
+        cached = (
+            cache.get(pdf_path, reader.pdf_tail_extractor_id, pdf_key)
+            if cache is not None
+            else None
+        )
+        if cached is not None or reader.pdf_max_pages <= 0:
+            return cached or ""
+        if pool is None:
+            return reader._extract_pdf_tail_text(pdf_path)
+        return pool.submit(
+            pdf_path,
+            "pdf",
+            0,
+            **self._chunk_params(),
+            first_page=reader.pdf_max_pages,
+        )
+
+    def _finish_tail(
+        self,
+        reader: LocalDatabaseClient,
+        item_key: str,
+        pdf_key: str,
+        pdf_path: Path,
+        source: Future[ExtractionResult] | str,
+    ) -> list[str]:
+        """Chunk tail text, waiting for its extraction if it runs in the pool."""
+        if not isinstance(source, Future):
+            return self._chunk_text(source.strip())
+        try:
+            result: ExtractionResult = source.result()
+        except Exception as e:
+            result = ExtractionResult(error=str(e))
+        if result.error:
+            logger.warning(
+                "Skipping pdf tail of item %s attachment %s: %s",
+                item_key,
+                pdf_key,
+                result.error,
+            )
+            return []
+        if reader.fulltext_cache is not None:
+            reader.fulltext_cache.put(
+                pdf_path, reader.pdf_tail_extractor_id, result.text, pdf_key
+            )
+        return result.chunks
+
+    def _commit_backfill(
+        self,
+        finished: list[tuple[str, list[str]]],
+        pending: dict[str, str],
+        failed_items: set[str],
+    ) -> int:
+        """
+        Record backfilled items, deleting tail fragments that were not rewritten.
+
+        Returns:
+            Number of items recorded
+        """
+        done = {key: ids for key, ids in finished if key not in failed_items}
+        if not done:
+            return 0
+
+        previous = self.manifest.get_doc_ids(list(done))
+        entries = []
+        stale = []
+        for key, tail_ids in done.items():
+            keep = []
+            for doc_id in previous.get(key, []):
+                if self.TAIL_SOURCE_SUFFIX + "::" not in doc_id:
+                    keep.append(doc_id)
+                elif doc_id not in tail_ids:
+                    stale.append(doc_id)
+            entries.append((key, pending[key], keep + tail_ids))
+        if stale:
+            self._collection_changed = True
+        for i in range(0, len(stale), self.DELETE_BATCH_SIZE):
+            self.chroma_client.delete_documents(stale[i : i + self.DELETE_BATCH_SIZE])
+        self.manifest.record_backfill(entries)
+        return len(entries)
+
+    # -------------------- Garbage collection --------------------
+
+    def collect_garbage(
+        self,
+        dry_run: bool = False,
+        vacuum: bool = True,
+        lock_timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Delete documents that no longer belong to the library.
+
+        All document ids in the collection are diffed against the library
+        and the manifest: documents of items that were deleted from the
+        library are orphans, and documents of indexed items that the last
+        indexing run did not write (removed attachments, chunks left over
+        from a different ``chunk_size``) are stale. Items that are in the
+        library but not in the manifest are left alone.
+
+        Args:
+            dry_run: Only count what would be deleted
+            vacuum: Return freed space to the file system afterwards
+                (ChromaDB keeps its freed pages for reuse, see
+                ChromaClient.vacuum)
+            lock_timeout: Seconds to wait for a running update before
+                raising RuntimeError (wait indefinitely if None)
+
+        Returns:
+            Statistics, including the bytes reclaimed on disk
+        """
+        with self._exclusive_update(lock_timeout):
+            return self._collect_garbage(dry_run, vacuum)
+
+    def _library_item_keys(self) -> set[str]:
+        """Return the keys of all items currently in the library."""
+        if is_local_mode():
+            zotero_db_path, _ = self._load_local_db_settings()
+            with (
+                suppress_stdout(),
+                LocalDatabaseClient(db_path=zotero_db_path) as reader,
+            ):
+                return {key for key, _ in reader.get_item_stamps().values()}
+        return set(self.zotero_client.item_versions())
+
+    def _collect_garbage(self, dry_run: bool, vacuum: bool) -> dict[str, Any]:
+        """Run one garbage collection; see collect_garbage."""
+        start_time = datetime.now()
+        stats: dict[str, Any] = {
+            "dry_run": dry_run,
+            "scanned_documents": 0,
+            "orphaned_documents": 0,
+            "stale_documents": 0,
+            "removed_documents": 0,
+            "removed_items": 0,
+            "storage_bytes_before": 0,
+            "storage_bytes_after": 0,
+            "bytes_reclaimed": 0,
+            "duration": None,
+        }
+
+        try:
+            stats["storage_bytes_before"] = self.chroma_client.storage_bytes()
+            # Listed before scanning, so items indexed meanwhile are known
+            library = self._library_item_keys()
+            indexed: set[str] = set()
+            for page in self.chroma_client.iter_document_ids(self.GC_PAGE_SIZE):
+                indexed.update(page)
+            stats["scanned_documents"] = len(indexed)
+
+            by_parent: dict[str, set[str]] = {}
+            for doc_id in indexed:
+                by_parent.setdefault(doc_id.split("::", 1)[0], set()).add(doc_id)
+            orphaned_items = by_parent.keys() - library
+            orphans = set().union(*(by_parent[key] for key in orphaned_items))
+            known = self.manifest.get_doc_ids(sorted(by_parent.keys() & library))
+            stale = set().union(
+                *(by_parent[key] - set(doc_ids) for key, doc_ids in known.items())
+            )
+            stats["orphaned_documents"] = len(orphans)
+            stats["stale_documents"] = len(stale)
+
+            removed_items = sorted(self.manifest.get_stamps().keys() - library)
+            stats["removed_items"] = len(removed_items)
+            garbage = sorted(orphans | stale)
+            if not dry_run:
+                if garbage:
+                    self._collection_changed = True
+                for i in range(0, len(garbage), self.DELETE_BATCH_SIZE):
+                    self.chroma_client.delete_documents(
+                        garbage[i : i + self.DELETE_BATCH_SIZE]
+                    )
+                stats["removed_documents"] = len(garbage)
+                self.manifest.remove_items(removed_items)
+                if vacuum and garbage:
+                    self.chroma_client.vacuum()
+
+            stats["storage_bytes_after"] = self.chroma_client.storage_bytes()
+            stats["bytes_reclaimed"] = max(
+                0, stats["storage_bytes_before"] - stats["storage_bytes_after"]
+            )
+            logger.info(
+                f"Garbage collection{' (dry run)' if dry_run else ''}: "
+                f"{len(orphans)} orphaned and {len(stale)} stale documents "
+                f"of {len(indexed)}"
+            )
+        except Exception as e:
+            logger.exception(f"Error collecting index garbage: {e}")
+            stats["error"] = str(e)
+
+        stats["duration"] = str(datetime.now() - start_time)
+        return stats
+
     @staticmethod
     def _first_nested_list(values: Any) -> list[Any]:
         """Safely unwrap Chroma nested-list fields."""
@@ -779,8 +1870,28 @@ class ZoteroSemanticSearch:
         query: str,
         limit: int = 10,
         filters: dict[str, Any] | None = None,
+        mode: str | None = None,
+        collapse_parents: bool | None = None,
     ) -> dict[str, Any]:
-        """Perform semantic search."""
+        """
+        Perform semantic search.
+
+        Args:
+            query: Search text
+            limit: Maximum results
+            filters: ChromaDB metadata filter
+            mode: ``"vector"`` or ``"hybrid"`` (BM25 + vector fused with
+                reciprocal rank fusion); defaults to ``search.mode`` config
+            collapse_parents: Return ``limit`` distinct parent items (best
+                fragment plus fragment count, diversified with MMR) instead
+                of raw fragments; defaults to ``search.collapse_parents``
+
+        Returns:
+            Search response with enriched results
+        """
+        mode = mode if mode in self.SEARCH_MODES else self.search_config["mode"]
+        if collapse_parents is None:
+            collapse_parents = self.search_config["collapse_parents"]
         if limit <= 0:
             return {
                 "query": query,
@@ -790,22 +1901,34 @@ class ZoteroSemanticSearch:
                 "total_found": 0,
             }
 
-        try:
-            results = self.chroma_client.search(
-                query_texts=[query],
-                n_results=limit,
-                where=filters,
-            )
+        cache_params = {
+            "queries": [query],
+            "limit": limit,
+            "filters": filters,
+            "mode": mode,
+            "collapse_parents": collapse_parents,
+            "generation": self._index_generation(),
+        }
+        cached = self._result_cache.get("search", cache_params)
+        if cached is not None:
+            # Callers own the response; the cached one must stay intact
+            return copy.deepcopy(cached)
 
+        try:
+            (results,) = self._retrieve([query], limit, filters, mode, collapse_parents)
             enriched_results = self._enrich_search_results(results, query)
 
-            return {
+            response = {
                 "query": query,
                 "limit": limit,
                 "filters": filters,
+                "mode": mode,
+                "collapse_parents": collapse_parents,
                 "results": enriched_results,
                 "total_found": len(enriched_results),
             }
+            self._result_cache.set("search", cache_params, copy.deepcopy(response))
+            return response
 
         except Exception as e:
             logger.exception(f"Error performing semantic search: {e}")
@@ -815,10 +1938,469 @@ class ZoteroSemanticSearch:
                 "error": str(e),
             }
 
+    def search_many(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        filters: dict[str, Any] | None = None,
+        mode: str | None = None,
+        collapse_parents: bool | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run several semantic searches in one round trip.
+
+        All queries are embedded in one batch and sent as one ChromaDB
+        query; the parent items of the union of hits are fetched once.
+
+        Args:
+            queries: Search texts
+            limit: Maximum results per query
+            filters: ChromaDB metadata filter applied to every query
+            mode: Retrieval mode (see search)
+            collapse_parents: Collapse fragments to parent items (see search)
+
+        Returns:
+            Response with one ``searches`` entry per query, in input order
+        """
+        mode = mode if mode in self.SEARCH_MODES else self.search_config["mode"]
+        if collapse_parents is None:
+            collapse_parents = self.search_config["collapse_parents"]
+        if limit <= 0 or not queries:
+            return {
+                "queries": queries,
+                "limit": limit,
+                "filters": filters,
+                "searches": [
+                    {"query": query, "results": [], "total_found": 0}
+                    for query in queries
+                ],
+            }
+
+        cache_params = {
+            "queries": queries,
+            "limit": limit,
+            "filters": filters,
+            "mode": mode,
+            "collapse_parents": collapse_parents,
+            "generation": self._index_generation(),
+        }
+        cached = self._result_cache.get("search_many", cache_params)
+        if cached is not None:
+            # Callers own the response; the cached one must stay intact
+            return copy.deepcopy(cached)
+
+        try:
+            per_query = self._retrieve(queries, limit, filters, mode, collapse_parents)
+            parent_keys = [
+                key
+                for results in per_query
+                for key in self._result_parent_keys(results)
+            ]
+            parent_items = self._fetch_parent_items(parent_keys)
+
+            searches = []
+            for query, results in zip(queries, per_query, strict=True):
+                enriched_results = self._enrich_search_results(
+                    results, query, parent_items=parent_items
+                )
+                searches.append(
+                    {
+                        "query": query,
+                        "results": enriched_results,
+                        "total_found": len(enriched_results),
+                    }
+                )
+
+            response = {
+                "queries": queries,
+                "limit": limit,
+                "filters": filters,
+                "mode": mode,
+                "collapse_parents": collapse_parents,
+                "searches": searches,
+            }
+            self._result_cache.set("search_many", cache_params, copy.deepcopy(response))
+            return response
+
+        except Exception as e:
+            logger.exception(f"Error performing batched semantic search: {e}")
+            return {
+                "queries": queries,
+                "searches": [],
+                "error": str(e),
+            }
+
+    def _retrieve(
+        self,
+        queries: list[str],
+        limit: int,
+        filters: dict[str, Any] | None,
+        mode: str,
+        collapse_parents: bool,
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieve ranked hits for each query with a single vector query.
+
+        Returns:
+            One Chroma-shaped single-query result per query
+        """
+        n_results = limit
+        if collapse_parents:
+            n_results = max(
+                limit,
+                min(
+                    limit * self.search_config["overfetch_factor"],
+                    self.MAX_COLLAPSE_CANDIDATES,
+                ),
+            )
+
+        if mode == "hybrid":
+            per_query = self._hybrid_search_many(
+                queries, n_results, filters, include_embeddings=collapse_parents
+            )
+        else:
+            results = self.chroma_client.search(
+                query_texts=queries,
+                n_results=n_results,
+                where=filters,
+                include=self.COLLAPSE_INCLUDE if collapse_parents else None,
+            )
+            per_query = self._split_query_results(results, len(queries))
+
+        if collapse_parents:
+            per_query = [
+                self._collapse_results(results, limit) for results in per_query
+            ]
+        return per_query
+
+    @staticmethod
+    def _split_query_results(
+        results: dict[str, Any], count: int
+    ) -> list[dict[str, Any]]:
+        """Split a multi-query Chroma result into single-query results."""
+        split = []
+        for index in range(count):
+            single: dict[str, Any] = {}
+            for field in ("ids", "documents", "metadatas", "distances", "embeddings"):
+                values = results.get(field)
+                if values is not None and len(values) > index:
+                    single[field] = [values[index]]
+            split.append(single)
+        return split
+
+    def _hybrid_search(
+        self,
+        query: str,
+        limit: int,
+        filters: dict[str, Any] | None,
+        include_embeddings: bool = False,
+    ) -> dict[str, Any]:
+        """Run hybrid retrieval for one query (see _hybrid_search_many)."""
+        return self._hybrid_search_many(
+            [query], limit, filters, include_embeddings=include_embeddings
+        )[0]
+
+    def _hybrid_search_many(
+        self,
+        queries: list[str],
+        limit: int,
+        filters: dict[str, Any] | None,
+        include_embeddings: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Run vector and BM25 retrieval and fuse them with reciprocal rank fusion.
+
+        Each document scores ``sum(weight / (rrf_k + rank))`` over the
+        retrievers that returned it. The fused score is normalized to 0..1
+        (1 = ranked first by every retriever) and reported as
+        ``1 - distance`` so results look like plain vector results. The
+        vector side of all queries is a single ChromaDB query.
+
+        Args:
+            queries: Search texts
+            limit: Number of fused results per query
+            filters: ChromaDB metadata filter
+            include_embeddings: Also return vector-side embeddings (for MMR)
+
+        Returns:
+            One Chroma-shaped result dict per query with the combined top-k
+        """
+        pool = max(limit * self.HYBRID_CANDIDATE_FACTOR, limit)
+        rrf_k = self.search_config["rrf_k"]
+        weights = {
+            "vector": self.search_config["vector_weight"],
+            "lexical": self.search_config["lexical_weight"],
+        }
+
+        if include_embeddings:
+            vector = self.chroma_client.search(
+                query_texts=queries,
+                n_results=pool,
+                where=filters,
+                include=self.COLLAPSE_INCLUDE,
+            )
+        else:
+            vector = self.chroma_client.search(
+                query_texts=queries, n_results=pool, where=filters
+            )
+
+        fused_results = []
+        for query, vector_results in zip(
+            queries, self._split_query_results(vector, len(queries)), strict=True
+        ):
+            vector_ids = self._first_nested_list(vector_results.get("ids"))
+            vector_docs = self._first_nested_list(vector_results.get("documents"))
+            vector_metas = self._first_nested_list(vector_results.get("metadatas"))
+            vector_embeddings = self._first_embeddings(vector_results)
+
+            candidates: dict[str, dict[str, Any]] = {}
+            for rank, doc_id in enumerate(vector_ids, start=1):
+                candidates[doc_id] = {
+                    "document": (
+                        vector_docs[rank - 1] if rank <= len(vector_docs) else ""
+                    ),
+                    "metadata": (
+                        vector_metas[rank - 1] if rank <= len(vector_metas) else {}
+                    ),
+                    "embedding": (
+                        vector_embeddings[rank - 1]
+                        if rank <= len(vector_embeddings)
+                        else None
+                    ),
+                    "score": weights["vector"] / (rrf_k + rank),
+                }
+
+            try:
+                lexical = self.chroma_client.lexical_search(
+                    query, n_results=pool, where=filters
+                )
+            except Exception as e:
+                logger.warning(f"Lexical retrieval failed, using vector only: {e}")
+                lexical = []
+            for rank, hit in enumerate(lexical, start=1):
+                entry = candidates.setdefault(
+                    hit["id"],
+                    {
+                        "document": hit["document"],
+                        "metadata": hit["metadata"],
+                        "embedding": None,
+                        "score": 0,
+                    },
+                )
+                entry["score"] += weights["lexical"] / (rrf_k + rank)
+
+            best = sum(weights.values()) / (rrf_k + 1) or 1.0
+            ranked = sorted(
+                candidates.items(), key=lambda pair: pair[1]["score"], reverse=True
+            )[:limit]
+            fused = {
+                "ids": [[doc_id for doc_id, _ in ranked]],
+                "documents": [[entry["document"] for _, entry in ranked]],
+                "metadatas": [[entry["metadata"] for _, entry in ranked]],
+                "distances": [[1 - entry["score"] / best for _, entry in ranked]],
+            }
+            if include_embeddings:
+                fused["embeddings"] = [[entry["embedding"] for _, entry in ranked]]
+            fused_results.append(fused)
+        return fused_results
+
+    @staticmethod
+    def _first_embeddings(results: dict[str, Any]) -> list[Any]:
+        """Unwrap the first query's embeddings (a list or a numpy array)."""
+        embeddings = results.get("embeddings")
+        if embeddings is None or len(embeddings) == 0:
+            return []
+        return list(embeddings[0])
+
+    def _collapse_results(self, results: dict[str, Any], limit: int) -> dict[str, Any]:
+        """
+        Collapse fragment hits to distinct parent items.
+
+        Each parent keeps its best-ranked fragment and the number of its
+        fragments among the candidates. Parents are then picked with
+        maximal marginal relevance::
+
+            lambda * relevance - (1 - lambda) * max cosine(selected)
+
+        so near-duplicate papers do not crowd out the rest. Candidates
+        without an embedding (lexical-only hybrid hits) count as dissimilar.
+
+        Args:
+            results: Chroma-shaped results ordered best first
+            limit: Number of parents to return
+
+        Returns:
+            Chroma-shaped results with an extra ``fragment_counts`` field
+        """
+        ids = self._first_nested_list(results.get("ids"))
+        documents = self._first_nested_list(results.get("documents"))
+        metadatas = self._first_nested_list(results.get("metadatas"))
+        distances = self._first_nested_list(results.get("distances"))
+        embeddings = self._first_embeddings(results)
+
+        groups: dict[str, dict[str, Any]] = {}
+        for i, result_id in enumerate(ids):
+            metadata = metadatas[i] if i < len(metadatas) else {}
+            parent_key = str((metadata or {}).get("item_key") or result_id)
+            group = groups.get(parent_key)
+            if group is not None:
+                group["fragment_count"] += 1
+                continue
+
+            vector = embeddings[i] if i < len(embeddings) else None
+            if vector is not None:
+                vector = np.asarray(vector, dtype=np.float32)
+                norm = float(np.linalg.norm(vector))
+                vector = vector / norm if norm else None
+            groups[parent_key] = {
+                "id": result_id,
+                "document": documents[i] if i < len(documents) else "",
+                "metadata": metadata,
+                "distance": distances[i] if i < len(distances) else 1.0,
+                "vector": vector,
+                "fragment_count": 1,
+            }
+
+        mmr_lambda = self.search_config["mmr_lambda"]
+        candidates = list(groups.values())
+        selected: list[dict[str, Any]] = []
+        while candidates and len(selected) < limit:
+            best_index, best_score = 0, float("-inf")
+            for index, candidate in enumerate(candidates):
+                redundancy = 0.0
+                if candidate["vector"] is not None:
+                    redundancy = max(
+                        (
+                            float(candidate["vector"] @ chosen["vector"])
+                            for chosen in selected
+                            if chosen["vector"] is not None
+                        ),
+                        default=0.0,
+                    )
+                score = (
+                    mmr_lambda * (1 - candidate["distance"])
+                    - (1 - mmr_lambda) * redundancy
+                )
+                if score > best_score:
+                    best_index, best_score = index, score
+            selected.append(candidates.pop(best_index))
+
+        logger.debug(
+            f"Collapsed {len(ids)} fragments to {len(groups)} parents, "
+            f"returning {len(selected)}"
+        )
+        return {
+            "ids": [[entry["id"] for entry in selected]],
+            "documents": [[entry["document"] for entry in selected]],
+            "metadatas": [[entry["metadata"] for entry in selected]],
+            "distances": [[entry["distance"] for entry in selected]],
+            "fragment_counts": [[entry["fragment_count"] for entry in selected]],
+        }
+
+    def _fetch_items_from_local_db(self, item_keys: list[str]) -> dict[str, Any]:
+        """Load parent items from the local Zotero database in one query."""
+        zotero_db_path, _ = self._load_local_db_settings()
+        try:
+            with LocalDatabaseClient(db_path=zotero_db_path) as reader:
+                return {
+                    item.key: self._local_item_to_api_item(item)
+                    for item in reader.get_items_by_keys(item_keys)
+                }
+        except Exception as e:
+            logger.debug(f"Local enrichment unavailable, using API: {e}")
+            return {}
+
+    def _fetch_parent_items(
+        self, item_keys: list[str]
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """
+        Fetch the parent items of search hits.
+
+        Keys are deduplicated and served from the short-lived item cache,
+        then the local database (in local mode), then the API in batches of
+        up to 50 keys.
+
+        Args:
+            item_keys: Parent item keys (may contain duplicates)
+
+        Returns:
+            Tuple of (items by key, error message by key)
+        """
+        items: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(item_keys):
+            cached = self._item_cache.get("item", {"key": key})
+            if cached is not None:
+                items[key] = cached
+            else:
+                missing.append(key)
+
+        fetched: dict[str, Any] = {}
+        if missing and is_local_mode():
+            fetched.update(self._fetch_items_from_local_db(missing))
+            missing = [key for key in missing if key not in fetched]
+
+        for i in range(0, len(missing), self.ITEM_KEY_BATCH_SIZE):
+            batch = missing[i : i + self.ITEM_KEY_BATCH_SIZE]
+            try:
+                # Use synchronous pyzotero client here as this runs in thread
+                if len(batch) == 1:
+                    fetched[batch[0]] = self.zotero_client.item(batch[0])
+                    continue
+
+                result = self.zotero_client.items(
+                    itemKey=",".join(batch), limit=len(batch)
+                )
+                if not isinstance(result, list):
+                    raise RuntimeError(f"Zotero API returned {result!r}")
+                for zotero_item in result:
+                    key = zotero_item.get("key") or zotero_item.get("data", {}).get(
+                        "key"
+                    )
+                    if key:
+                        fetched[str(key)] = zotero_item
+                for key in batch:
+                    if key not in fetched:
+                        errors[key] = f"Item not found: {key}"
+            except Exception as e:
+                for key in batch:
+                    errors[key] = str(e)
+
+        for key, zotero_item in fetched.items():
+            self._item_cache.set("item", {"key": key}, zotero_item)
+        items.update(fetched)
+        return items, errors
+
+    def _result_parent_keys(self, chroma_results: dict[str, Any]) -> list[str]:
+        """Return the parent item key of every hit of a single-query result."""
+        ids = self._first_nested_list(chroma_results.get("ids"))
+        metadatas = self._first_nested_list(chroma_results.get("metadatas"))
+        parent_keys: list[str] = []
+        for i, result_id in enumerate(ids):
+            raw_metadata = metadatas[i] if i < len(metadatas) else {}
+            metadata = dict(raw_metadata) if isinstance(raw_metadata, dict) else {}
+            parent_keys.append(str(metadata.get("item_key") or result_id))
+        return parent_keys
+
     def _enrich_search_results(
-        self, chroma_results: dict[str, Any], query: str
+        self,
+        chroma_results: dict[str, Any],
+        query: str,
+        parent_items: tuple[dict[str, Any], dict[str, str]] | None = None,
     ) -> list[dict[str, Any]]:
-        """Enrich ChromaDB results with full Zotero item data."""
+        """
+        Enrich ChromaDB results with full Zotero item data.
+
+        Args:
+            chroma_results: Single-query Chroma-shaped results
+            query: Search text
+            parent_items: Already fetched ``(items, errors)`` (see
+                _fetch_parent_items); fetched here when None
+
+        Returns:
+            Enriched results
+        """
         enriched = []
 
         ids = self._first_nested_list(chroma_results.get("ids"))
@@ -828,46 +2410,38 @@ class ZoteroSemanticSearch:
         distances = self._first_nested_list(chroma_results.get("distances"))
         documents = self._first_nested_list(chroma_results.get("documents"))
         metadatas = self._first_nested_list(chroma_results.get("metadatas"))
+        fragment_counts = self._first_nested_list(chroma_results.get("fragment_counts"))
 
-        for i, result_id in enumerate(ids):
-            try:
-                raw_metadata = metadatas[i] if i < len(metadatas) else {}
-                metadata = dict(raw_metadata) if isinstance(raw_metadata, dict) else {}
-                parent_item_key = str(metadata.get("item_key") or result_id)
-
-                # Use synchronous pyzotero client here as this runs in thread
-                zotero_item = self.zotero_client.item(parent_item_key)
-
-                enriched_result = {
-                    "item_key": parent_item_key,
-                    "result_id": result_id,
-                    "similarity_score": 1 - distances[i] if i < len(distances) else 0,
-                    "matched_text": documents[i] if i < len(documents) else "",
-                    "metadata": metadata,
-                    "zotero_item": zotero_item,
-                    "query": query,
-                }
+        parent_keys = self._result_parent_keys(chroma_results)
+        if parent_items is None:
+            parent_items = self._fetch_parent_items(parent_keys)
+        items, errors = parent_items
 
-                enriched.append(enriched_result)
+        for i, result_id in enumerate(ids):
+            raw_metadata = metadatas[i] if i < len(metadatas) else {}
+            metadata = dict(raw_metadata) if isinstance(raw_metadata, dict) else {}
+            parent_item_key = parent_keys[i]
+            enriched_result = {
+                "item_key": parent_item_key,
+                "result_id": result_id,
+                "similarity_score": 1 - distances[i] if i < len(distances) else 0,
+                "matched_text": documents[i] if i < len(documents) else "",
+                "metadata": metadata,
+                "query": query,
+            }
+            if i < len(fragment_counts):
+                enriched_result["fragment_count"] = fragment_counts[i]
 
-            except Exception as e:
-                raw_metadata = metadatas[i] if i < len(metadatas) else {}
-                metadata = dict(raw_metadata) if isinstance(raw_metadata, dict) else {}
-                parent_item_key = str(metadata.get("item_key") or result_id)
-                logger.error(f"Error enriching result for item {parent_item_key}: {e}")
-                enriched.append(
-                    {
-                        "item_key": parent_item_key,
-                        "result_id": result_id,
-                        "similarity_score": (
-                            1 - distances[i] if i < len(distances) else 0
-                        ),
-                        "matched_text": documents[i] if i < len(documents) else "",
-                        "metadata": metadata,
-                        "query": query,
-                        "error": str(e),
-                    }
+            if parent_item_key in items:
+                enriched_result["zotero_item"] = items[parent_item_key]
+            else:
+                error = errors.get(parent_item_key, "Item not found")
+                logger.error(
+                    f"Error enriching result for item {parent_item_key}: {error}"
                 )
+                enriched_result["error"] = error
+
+            enriched.append(enriched_result)
 
         return enriched
 
@@ -883,24 +2457,150 @@ class ZoteroSemanticSearch:
             "exists": collection_info.get("count", 0) > 0,
             "item_count": collection_info.get("count", 0),
             "embedding_model": collection_info.get("embedding_model", "unknown"),
+            "fulltext_backfill": {
+                "progressive": bool(self.extraction_config.get("progressive")),
+                "pending_items": len(self.pending_backfill()),
+            },
         }
 
 
 def create_semantic_search(
     config_path: str | None = None, db_path: str | None = None
 ) -> ZoteroSemanticSearch:
-    """Create a ZoteroSemanticSearch instance."""
+    """
+    Create a new ZoteroSemanticSearch instance.
+
+    Prefer get_semantic_search, which reuses a warm engine.
+    """
     if not config_path:
         config_path = str(get_config_path() / "config.json")
 
     return ZoteroSemanticSearch(config_path=config_path, db_path=db_path)
 
 
+_engines: dict[tuple[str, str | None], ZoteroSemanticSearch] = {}
+_engines_lock = threading.Lock()
+_update_locks: dict[tuple[str, str | None], threading.Lock] = {}
+# Separate from _engines_lock, which is held while engines are created
+_update_locks_lock = threading.Lock()
+
+
+def get_semantic_search(
+    config_path: str | None = None, db_path: str | None = None
+) -> ZoteroSemanticSearch:
+    """
+    Get the process-wide semantic search engine.
+
+    The engine (Chroma client, loaded embedding model, caches) is created
+    on first use and shared by the MCP server, CLI and services. It is
+    rebuilt when the config file was changed by someone else; the replaced
+    engine is closed once its running update is done.
+
+    Args:
+        config_path: Path to configuration file (default config if omitted)
+        db_path: Optional path to Zotero database
+
+    Returns:
+        Shared ZoteroSemanticSearch instance
+    """
+    if not config_path:
+        config_path = str(get_config_path() / "config.json")
+    key = (config_path, db_path)
+
+    with _engines_lock:
+        previous = _engines.get(key)
+        if (
+            previous is not None
+            and previous.config_mtime == previous._read_config_mtime()
+        ):
+            return previous
+        if previous is not None:
+            logger.info("Semantic search config changed, reloading engine")
+
+        engine = create_semantic_search(config_path, db_path=db_path)
+        _engines[key] = engine
+
+    if previous is not None:
+        # Outside _engines_lock: waits for an update of the old engine
+        previous.close()
+    return engine
+
+
+def _index_update_lock(config_path: str | None, db_path: str | None) -> threading.Lock:
+    """Return the update lock shared by all engines of one index."""
+    if not config_path:
+        config_path = str(get_config_path() / "config.json")
+    with _update_locks_lock:
+        return _update_locks.setdefault((config_path, db_path), threading.Lock())
+
+
+def reset_semantic_search() -> None:
+    """Close and drop all shared semantic search engines."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.close()
+
+
+def build_metadata_filter(
+    filters: dict[str, Any] | None = None,
+    collection_key: str | None = None,
+    tags: list[str] | None = None,
+    item_type: str | list[str] | None = None,
+    year_from: int | None = None,
+    year_to: int | None = None,
+) -> dict[str, Any] | None:
+    """
+    Build a ChromaDB ``where`` clause from semantic search filters.
+
+    The clause is evaluated by ChromaDB (and the lexical index), so only
+    matching documents are scanned and enriched.
+
+    Args:
+        filters: Raw metadata conditions, combined with the others
+        collection_key: Only items in this collection
+        tags: Only items carrying all of these tags (case-insensitive)
+        item_type: Only items of this type (or any of these types)
+        year_from: Only items published in or after this year
+        year_to: Only items published in or before this year
+
+    Returns:
+        ``where`` clause, or None when nothing is filtered
+    """
+    conditions: list[dict[str, Any]] = []
+    if filters:
+        conditions.extend({key: value} for key, value in filters.items())
+    if collection_key:
+        conditions.append({ZoteroMapper.collection_filter_key(collection_key): True})
+    for tag in tags or []:
+        if tag.strip():
+            conditions.append({ZoteroMapper.tag_filter_key(tag): True})
+    if isinstance(item_type, str) and item_type:
+        conditions.append({"item_type": item_type})
+    elif item_type:
+        conditions.append({"item_type": {"$in": list(item_type)}})
+    if year_from is not None:
+        conditions.append({"year": {"$gte": year_from}})
+    if year_to is not None:
+        conditions.append({"year": {"$lte": year_to}})
+
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
 # -------------------- Async Wrapper Functions --------------------
 
 
 async def semantic_search(
-    query: str, limit: int = 10, filters: dict[str, Any] | None = None
+    query: str,
+    limit: int = 10,
+    filters: dict[str, Any] | None = None,
+    mode: str | None = None,
+    collapse_parents: bool | None = None,
 ) -> list[dict[str, Any]]:
     """
     Async wrapper for semantic search.
@@ -908,29 +2608,62 @@ async def semantic_search(
     Returns simplified list of results compatible with MCP tools.
     """
     loop = asyncio.get_event_loop()
-    searcher = create_semantic_search()
+    searcher = get_semantic_search()
 
     result = await loop.run_in_executor(
-        None, lambda: searcher.search(query, limit, filters)
+        None,
+        lambda: searcher.search(
+            query, limit, filters, mode=mode, collapse_parents=collapse_parents
+        ),
     )
 
-    # Transform to simplified format for MCP tools
-    simplified = []
-    for item in result.get("results", []):
-        zotero_item = item.get("zotero_item", {})
-        simplified.append(
-            {
-                "key": item.get("item_key"),
-                "similarity_score": item.get("similarity_score"),
-                "matched_text": item.get("matched_text"),
-                "data": zotero_item.get("data", {}),
-                # Flatten some fields for easier access
-                "title": zotero_item.get("data", {}).get("title"),
-                "itemType": zotero_item.get("data", {}).get("itemType"),
-            }
-        )
+    return [_simplify_result(item) for item in result.get("results", [])]
 
-    return simplified
+
+async def semantic_search_many(
+    queries: list[str],
+    limit: int = 10,
+    filters: dict[str, Any] | None = None,
+    mode: str | None = None,
+    collapse_parents: bool | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Async wrapper for batched semantic search.
+
+    Returns one ``{"query", "results"}`` entry per query, with results in
+    the same simplified format as semantic_search.
+    """
+    loop = asyncio.get_event_loop()
+    searcher = get_semantic_search()
+
+    result = await loop.run_in_executor(
+        None,
+        lambda: searcher.search_many(
+            queries, limit, filters, mode=mode, collapse_parents=collapse_parents
+        ),
+    )
+    return [
+        {
+            "query": search["query"],
+            "results": [_simplify_result(item) for item in search["results"]],
+        }
+        for search in result.get("searches", [])
+    ]
+
+
+def _simplify_result(item: dict[str, Any]) -> dict[str, Any]:
+    """Transform an enriched result to the simplified format for MCP tools."""
+    zotero_item = item.get("zotero_item", {})
+    return {
+        "key": item.get("item_key"),
+        "similarity_score": item.get("similarity_score"),
+        "matched_text": item.get("matched_text"),
+        "fragment_count": item.get("fragment_count"),
+        "data": zotero_item.get("data", {}),
+        # Flatten some fields for easier access
+        "title": zotero_item.get("data", {}).get("title"),
+        "itemType": zotero_item.get("data", {}).get("itemType"),
+    }
 
 
 async def update_database(
@@ -940,7 +2673,7 @@ async def update_database(
 ) -> dict[str, Any]:
     """Async wrapper for database update."""
     loop = asyncio.get_event_loop()
-    searcher = create_semantic_search()
+    searcher = get_semantic_search()
 
     return await loop.run_in_executor(
         None,
@@ -948,6 +2681,20 @@ async def update_database(
             force_full_rebuild=force_rebuild,
             treated_limit=limit,
             extract_fulltext=include_fulltext,
+            lock_timeout=searcher.UPDATE_LOCK_TIMEOUT_SECONDS,
+        ),
+    )
+
+
+async def collect_garbage(dry_run: bool = False) -> dict[str, Any]:
+    """Async wrapper for index garbage collection."""
+    loop = asyncio.get_event_loop()
+    searcher = get_semantic_search()
+
+    return await loop.run_in_executor(
+        None,
+        lambda: searcher.collect_garbage(
+            dry_run=dry_run, lock_timeout=searcher.UPDATE_LOCK_TIMEOUT_SECONDS
         ),
     )
 
@@ -955,6 +2702,6 @@ async def update_database(
 async def get_database_status() -> dict[str, Any]:
     """Async wrapper for database status."""
     loop = asyncio.get_event_loop()
-    searcher = create_semantic_search()
+    searcher = get_semantic_search()
 
     return await loop.run_in_executor(None, lambda: searcher.get_database_status())
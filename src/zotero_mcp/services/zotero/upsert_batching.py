@@ -0,0 +1,128 @@
+"""
+Adaptive batching of documents written to the semantic index.
+
+Embedding cost grows with text length, so batches are cut by a character
+budget instead of a document count: 50 PDF chunks and 50 short notes take
+very different time and memory. The budget is tuned while indexing by hill
+climbing on measured throughput (characters embedded and upserted per
+second), and shrunk whenever a batch runs longer than the latency target so
+the indexer still reaches its pause points often enough.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveBatcher:
+    """Cuts a document stream into batches sized by a self-tuning char budget."""
+
+    # Budget is multiplied or divided by this factor per tuning step
+    STEP_FACTOR = 1.5
+    # Throughput drops smaller than this fraction are treated as noise
+    TOLERANCE = 0.05
+    # Batches filled below this fraction of the budget are not used for tuning
+    MIN_FILL_FOR_TUNING = 0.5
+
+    def __init__(
+        self,
+        initial_chars: int = 60_000,
+        min_chars: int = 4_000,
+        max_chars: int = 500_000,
+        max_documents: int = 256,
+        max_seconds: float = 10.0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            initial_chars: Character budget of the first batch
+            min_chars: Lower bound of the budget (lowered to initial_chars
+                if that is smaller)
+            max_chars: Upper bound of the budget (caps memory per batch)
+            max_documents: Upper bound of documents per batch
+            max_seconds: Latency target; slower batches shrink the budget
+        """
+        self.min_chars = max(1, min(min_chars, initial_chars))
+        self.max_chars = max(self.min_chars, max_chars)
+        self.budget = min(max(initial_chars, self.min_chars), self.max_chars)
+        self.max_documents = max(1, max_documents)
+        self.max_seconds = max_seconds
+        self._direction = 1
+        self._last_throughput: float | None = None
+
+    def batches(
+        self,
+        documents: Iterable[dict[str, Any]],
+        size_of: Callable[[dict[str, Any]], int],
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Group documents into batches within the current budget.
+
+        The budget is read when each batch starts, so calls to record
+        between batches take effect immediately. A document larger than the
+        budget forms a batch of its own.
+
+        Args:
+            documents: Documents in indexing order
+            size_of: Character size of a document
+
+        Yields:
+            Lists of documents
+        """
+        batch: list[dict[str, Any]] = []
+        chars = 0
+        for document in documents:
+            size = size_of(document)
+            if batch and chars + size > self.budget:
+                yield batch
+                batch, chars = [], 0
+            batch.append(document)
+            chars += size
+            # Full batches are released without waiting for the next document
+            if chars >= self.budget or len(batch) >= self.max_documents:
+                yield batch
+                batch, chars = [], 0
+        if batch:
+            yield batch
+
+    def record(self, chars: int, seconds: float) -> None:
+        """
+        Tune the budget from the timing of a finished batch.
+
+        Args:
+            chars: Characters in the batch
+            seconds: Wall time spent embedding and upserting it
+        """
+        if seconds <= 0 or chars <= 0:
+            return
+
+        if seconds > self.max_seconds:
+            self._direction = -1
+            self._resize(
+                max(self.min_chars, int(self.budget * self.max_seconds / seconds))
+            )
+            self._last_throughput = None
+            return
+        if chars < self.budget * self.MIN_FILL_FOR_TUNING:
+            # Partial batches (stream end, limits) say little about the budget
+            return
+
+        throughput = chars / seconds
+        last = self._last_throughput
+        if last is not None and throughput < last * (1 - self.TOLERANCE):
+            self._direction = -self._direction
+        self._last_throughput = throughput
+        factor = self.STEP_FACTOR if self._direction > 0 else 1 / self.STEP_FACTOR
+        self._resize(int(self.budget * factor))
+
+    def _resize(self, budget: int) -> None:
+        budget = min(max(budget, self.min_chars), self.max_chars)
+        if budget in (self.min_chars, self.max_chars) and budget == self.budget:
+            # Pinned at a bound: probe back towards the other side next time
+            self._direction = 1 if budget == self.min_chars else -1
+        self.budget = budget
@@ -32,6 +32,11 @@ class ZoteroSettings(BaseSettings):
     enable_workflows: bool = Field(default=True)
     enable_database_tools: bool = Field(default=True)
     enable_collection_tools: bool = Field(default=True)
+    # Runs due semantic index updates (update_config) inside the server
+    enable_index_scheduler: bool = Field(default=True)
+    # Local "everything" searches also match attachment text; the first
+    # search extracts every PDF/HTML attachment of the library
+    local_search_fulltext: bool = Field(default=False)
 
 
 settings = ZoteroSettings()
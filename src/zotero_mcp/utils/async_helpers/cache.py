@@ -2,24 +2,30 @@
 Response caching layer.
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import hashlib
 import json
+import threading
 from typing import Any
 
 
 class ResponseCache:
     """Simple in-memory cache for tool responses."""
 
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(self, ttl_seconds: int = 300, max_entries: int | None = None):
         """
         Initialize cache.
 
         Args:
             ttl_seconds: Time-to-live for cache entries (default: 5 minutes)
+            max_entries: Optional size bound; least recently used entries
+                are evicted beyond it
         """
-        self._cache: dict[str, tuple[Any, datetime]] = {}
+        self._cache: OrderedDict[str, tuple[Any, datetime]] = OrderedDict()
         self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
 
     def _make_key(self, tool_name: str, params: dict) -> str:
         """Generate cache key from tool name and parameters."""
@@ -32,29 +38,40 @@ class ResponseCache:
         """Get cached response if available and not expired."""
         key = self._make_key(tool_name, params)
 
-        if key in self._cache:
-            response, timestamp = self._cache[key]
+        with self._lock:
+            if key in self._cache:
+                response, timestamp = self._cache[key]
 
-            # Check if expired
-            if datetime.now() - timestamp < self._ttl:
-                return response
-            else:
-                # Remove expired entry
-                del self._cache[key]
+                # Check if expired
+                if datetime.now() - timestamp < self._ttl:
+                    self._cache.move_to_end(key)
+                    return response
+                else:
+                    # Remove expired entry
+                    del self._cache[key]
 
         return None
 
     def set(self, tool_name: str, params: dict, response: Any) -> None:
         """Cache a response."""
         key = self._make_key(tool_name, params)
-        self._cache[key] = (response, datetime.now())
+        with self._lock:
+            self._cache[key] = (response, datetime.now())
+            self._cache.move_to_end(key)
+            if self._max_entries is not None:
+                while len(self._cache) > self._max_entries:
+                    self._cache.popitem(last=False)
 
     def clear(self) -> None:
         """Clear all cached entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     def invalidate(self, tool_name: str, params: dict) -> None:
         """Invalidate specific cache entry."""
         key = self._make_key(tool_name, params)
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -10,10 +10,40 @@ from typing import Any
 
 from zotero_mcp.utils.formatting.helpers import format_creators
 
+_YEAR_RE = re.compile(r"\b(\d{4})\b")
+
 
 class ZoteroMapper:
     """Helper class for mapping Zotero data."""
 
+    # Multi-valued fields are stored as one boolean metadata key per value
+    # (ChromaDB metadata has no list type), e.g. {"tag:deep learning": True}.
+    COLLECTION_KEY_PREFIX = "collection:"
+    TAG_KEY_PREFIX = "tag:"
+
+    @staticmethod
+    def normalize_tag(tag: str) -> str:
+        """Normalize a tag for filtering (case and whitespace insensitive)."""
+        return " ".join(tag.split()).casefold()
+
+    @staticmethod
+    def parse_year(date: str | None) -> int | None:
+        """Extract the year from a Zotero date string (e.g. "2020-05-00 May 2020")."""
+        if not date:
+            return None
+        match = _YEAR_RE.search(date)
+        return int(match.group(1)) if match else None
+
+    @classmethod
+    def collection_filter_key(cls, collection_key: str) -> str:
+        """Metadata key marking membership in a collection."""
+        return f"{cls.COLLECTION_KEY_PREFIX}{collection_key.strip().upper()}"
+
+    @classmethod
+    def tag_filter_key(cls, tag: str) -> str:
+        """Metadata key marking a (normalized) tag."""
+        return f"{cls.TAG_KEY_PREFIX}{cls.normalize_tag(tag)}"
+
     @staticmethod
     def _strip_html(value: str) -> str:
         """Strip HTML tags from text."""
@@ -124,11 +154,16 @@ class ZoteroMapper:
         text_parts = [title, creators_text, abstract] + extra_fields
         return " ".join(filter(None, text_parts))
 
-    @staticmethod
-    def create_metadata(item: dict[str, Any]) -> dict[str, Any]:
+    @classmethod
+    def create_metadata(cls, item: dict[str, Any]) -> dict[str, Any]:
         """
         Create metadata for a Zotero item for ChromaDB.
 
+        Besides display fields, the metadata carries filterable fields:
+        ``item_type``, ``year`` (int, when the date has one) and one
+        boolean key per collection and normalized tag (see
+        collection_filter_key and tag_filter_key).
+
         Args:
             item: Zotero item dictionary
 
@@ -155,12 +190,22 @@ class ZoteroMapper:
             if data.get("fulltextSource"):
                 metadata["fulltext_source"] = data.get("fulltextSource")
 
+        if (year := cls.parse_year(data.get("date"))) is not None:
+            metadata["year"] = year
+
         # Add tags as a single string
         if tags := data.get("tags"):
             metadata["tags"] = " ".join([tag.get("tag", "") for tag in tags])
         else:
             metadata["tags"] = ""
 
+        for tag in tags or []:
+            if (name := tag.get("tag", "")) and name.strip():
+                metadata[cls.tag_filter_key(name)] = True
+        for collection_key in data.get("collections") or []:
+            if collection_key:
+                metadata[cls.collection_filter_key(collection_key)] = True
+
         # Add citation key if available
         extra = data.get("extra", "")
         citation_key = ""
@@ -0,0 +1,204 @@
+from chromadb import Documents, EmbeddingFunction, Embeddings
+import numpy as np
+import pytest
+
+from zotero_mcp.clients.database.chroma import ChromaClient
+from zotero_mcp.clients.database.embedding_cache import EmbeddingCache
+
+
+class CountingEmbeddingFunction(EmbeddingFunction[Documents]):
+    def __init__(self):
+        self.embedded: list[str] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.embedded.extend(input)
+        return [
+            np.array([len(text), text.count("a"), 1.0], dtype=np.float32)
+            for text in input
+        ]
+
+    @staticmethod
+    def name() -> str:
+        return "counting"
+
+    def get_config(self) -> dict:
+        return {}
+
+    @staticmethod
+    def build_from_config(config: dict) -> "CountingEmbeddingFunction":
+        return CountingEmbeddingFunction()
+
+
+@pytest.fixture
+def chroma(monkeypatch, tmp_path):
+    embedding_function = CountingEmbeddingFunction()
+    monkeypatch.setattr(
+        ChromaClient,
+        "_create_embedding_function",
+        lambda self: embedding_function,
+    )
+    client = ChromaClient(
+        collection_name="test",
+        persist_directory=str(tmp_path / "chroma"),
+        embedding_cache=EmbeddingCache(tmp_path / "embeddings.sqlite"),
+    )
+    return client, embedding_function
+
+
+def test_upsert_only_embeds_new_text(chroma):
+    client, embedding_function = chroma
+
+    client.upsert_documents(
+        ["alpha text", "beta text"], [{"n": 1}, {"n": 2}], ["A", "B"]
+    )
+    client.upsert_documents(
+        ["alpha text", "beta text edited"], [{"n": 1}, {"n": 2}], ["A", "B"]
+    )
+
+    assert embedding_function.embedded == [
+        "alpha text",
+        "beta text",
+        "beta text edited",
+    ]
+    stored = client.collection.get(ids=["B"], include=["embeddings"])
+    assert stored["embeddings"][0].tolist() == [16.0, 1.0, 1.0]
+
+
+def test_documents_are_left_to_chromadb_without_embedding_function(chroma):
+    client, _ = chroma
+    client.embedding_function = None
+
+    assert client._embed_documents(["alpha text"]) is None
+
+
+def test_embedding_cache_is_namespaced_by_model(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite")
+    cache.put_many("model-a", {"hash": np.ones(3)})
+
+    assert list(cache.get_many("model-a", ["hash"])) == ["hash"]
+    assert cache.get_many("model-b", ["hash"]) == {}
+    cache.close()
+
+
+def test_embedding_cache_evicts_least_recently_used(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite", max_bytes=4 * 4 * 10)
+    for idx in range(10):
+        cache.put_many("m", {f"h{idx}": np.full(4, idx)})
+    cache.get_many("m", ["h0"])
+    cache.put_many("m", {"h10": np.zeros(4)})
+
+    stats = cache.get_stats()
+    assert stats["stored_bytes"] <= cache.max_bytes
+    assert "h0" in cache.get_many("m", ["h0"])
+    assert cache.get_many("m", ["h1"]) == {}
+    cache.close()
+
+
+def test_lexical_index_is_built_lazily_then_mirrors_writes(chroma):
+    client, _ = chroma
+
+    client.upsert_documents(
+        ["CRISPR screen of BRCA1 mutants", "deep learning for images"],
+        [{"item_key": "A"}, {"item_key": "B"}],
+        ["A", "B"],
+    )
+    assert not client.lexical_index.index_path.exists()
+
+    hits = client.lexical_search("brca1", n_results=5)
+    assert [hit["id"] for hit in hits] == ["A"]
+
+    client.upsert_documents(["BRCA1 knockout"], [{"item_key": "C"}], ["C"])
+    client.delete_documents(["A"])
+    hits = client.lexical_search("brca1", n_results=5)
+    assert [hit["id"] for hit in hits] == ["C"]
+
+    client.delete_documents(["C"])
+    assert client.lexical_search("brca1", n_results=5) == []
+
+
+def test_lexical_index_backfills_from_collection(chroma):
+    client, _ = chroma
+    client.upsert_documents(
+        ["doi 10.1000/xyz123 paper", "unrelated text"],
+        [{"item_key": "A"}, {"item_key": "B"}],
+        ["A", "B"],
+    )
+    client.lexical_index.clear()
+    client.lexical_index.set_synced(False)
+
+    hits = client.lexical_search("10.1000/xyz123", n_results=5)
+
+    assert [hit["id"] for hit in hits] == ["A"]
+    assert client.lexical_index.is_synced()
+
+
+def test_search_reuses_cached_query_embeddings(chroma):
+    client, embedding_function = chroma
+    client.upsert_documents(["alpha", "beta"], [{"n": 1}, {"n": 2}], ["A", "B"])
+    embedding_function.embedded.clear()
+
+    client.search(["banana query"], n_results=1)
+    results = client.search(["banana query", "other"], n_results=1)
+
+    assert embedding_function.embedded == ["banana query", "other"]
+    assert len(results["ids"]) == 2
+
+
+def test_compact_backend_serves_the_collection_api(monkeypatch, tmp_path):
+    embedding_function = CountingEmbeddingFunction()
+    monkeypatch.setattr(
+        ChromaClient,
+        "_create_embedding_function",
+        lambda self: embedding_function,
+    )
+    client = ChromaClient(
+        collection_name="test",
+        persist_directory=str(tmp_path / "chroma"),
+        embedding_cache=EmbeddingCache(tmp_path / "embeddings.sqlite"),
+        vector_backend="compact",
+        exact_rescore=True,
+    )
+
+    client.upsert_documents(
+        ["aaaa", "bb", "cccccccc"],
+        [{"n": 1}, {"n": 2}, {"n": 3}],
+        ["A", "B", "C"],
+    )
+    results = client.search(["aaaa"], n_results=2, where={"n": {"$lte": 2}})
+
+    assert client.client is None
+    assert not (tmp_path / "chroma").exists()
+    assert results["ids"] == [["A", "B"]]
+    assert results["distances"][0][0] == pytest.approx(0.0, abs=1e-6)
+    assert client.get_document_metadata("C") == {"n": 3}
+    assert client.get_collection_info()["vector_backend"] == "compact"
+
+    assert [hit["id"] for hit in client.lexical_search("bb")] == ["B"]
+    assert client.lexical_index is None
+    client.delete_documents(["A"])
+    assert client.lexical_search("aaaa") == []
+    client.reset_collection()
+    assert client.get_collection_info()["count"] == 0
+
+
+def test_deleted_documents_are_paged_out_and_vacuumed(chroma):
+    client, _ = chroma
+    ids = [f"D{idx:04d}" for idx in range(600)]
+    client.upsert_documents(
+        [f"document {idx} " + "padding " * 100 for idx in range(600)],
+        [{"n": idx} for idx in range(600)],
+        ids,
+    )
+    client.ensure_lexical_index()
+
+    pages = list(client.iter_document_ids(page_size=250))
+    assert [len(page) for page in pages] == [250, 250, 100]
+    assert sorted(doc_id for page in pages for doc_id in page) == ids
+
+    before = client.storage_bytes()
+    client.delete_documents(ids[:550])
+    client.vacuum()
+
+    assert client.storage_bytes() < before
+    assert client.collection.count() == 50
+    assert client.lexical_index.count() == 50
@@ -0,0 +1,218 @@
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from zotero_mcp.clients.database.compact_store import CompactVectorStore
+from zotero_mcp.clients.database.where import matches_where, where_to_sql
+
+
+def _vectors(count, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _fill(store, vectors):
+    ids = [f"D{idx}" for idx in range(len(vectors))]
+    store.upsert(
+        ids=ids,
+        documents=[f"document {idx}" for idx in range(len(vectors))],
+        metadatas=[
+            {"item_key": f"ITEM{idx % 3}", "year": 2000 + idx}
+            for idx in range(len(vectors))
+        ],
+        embeddings=vectors,
+    )
+    return ids
+
+
+@pytest.mark.parametrize("dtype", ["int8", "float16"])
+def test_query_ranks_like_exact_search(tmp_path, dtype):
+    vectors = _vectors(300)
+    store = CompactVectorStore(tmp_path / "store", dtype=dtype)
+    store.SCAN_CHUNK_ROWS = 64
+    _fill(store, vectors)
+
+    query = vectors[:2] + 0.01
+    results = store.query(query_embeddings=query, n_results=5)
+
+    for row, ids in enumerate(results["ids"]):
+        exact = np.argsort(((vectors - query[row]) ** 2).sum(axis=1))[:5]
+        assert ids[0] == f"D{exact[0]}"
+        assert len(set(ids) & {f"D{idx}" for idx in exact}) >= 4
+    assert results["distances"][0] == sorted(results["distances"][0])
+    assert results["metadatas"][0][0]["item_key"].startswith("ITEM")
+
+
+def test_where_filters_are_pushed_into_the_sidecar(tmp_path):
+    store = CompactVectorStore(tmp_path / "store")
+    _fill(store, _vectors(30))
+
+    results = store.query(
+        query_embeddings=_vectors(1, seed=1),
+        n_results=50,
+        where={"$and": [{"item_key": "ITEM1"}, {"year": {"$gte": 2010}}]},
+    )
+
+    assert results["ids"][0]
+    assert all(
+        meta["item_key"] == "ITEM1" and meta["year"] >= 2010
+        for meta in results["metadatas"][0]
+    )
+    assert len(results["ids"][0]) == len(
+        store.get(where={"$and": [{"item_key": "ITEM1"}, {"year": {"$gte": 2010}}]})[
+            "ids"
+        ]
+    )
+
+
+def test_upsert_delete_reuse_slots_and_persist(tmp_path):
+    vectors = _vectors(10)
+    store = CompactVectorStore(tmp_path / "store")
+    ids = _fill(store, vectors)
+    store.delete(ids=ids[:4])
+    store.upsert(
+        ids=["NEW", "D5"],
+        documents=["new", "moved"],
+        metadatas=[{"n": 1}, {"n": 2}],
+        embeddings=vectors[:2],
+    )
+    store.close()
+
+    reopened = CompactVectorStore(tmp_path / "store")
+    assert reopened.count() == 7
+    assert reopened._load_state()["rows"] == 10
+    assert reopened.get(ids=["D5"])["documents"] == ["moved"]
+    hits = reopened.query(query_embeddings=vectors[:1], n_results=1)
+    assert hits["ids"] == [["NEW"]]
+    assert reopened.get(ids=["D0"])["ids"] == []
+
+
+def test_int8_store_is_smaller_than_float32(tmp_path):
+    store = CompactVectorStore(tmp_path / "store", dtype="int8")
+    _fill(store, _vectors(2048, dim=384))
+
+    vector_bytes = (tmp_path / "store" / "vectors.bin").stat().st_size
+    assert vector_bytes == 2048 * 384
+    assert vector_bytes * 4 == 2048 * 384 * np.dtype(np.float32).itemsize
+
+
+def test_exact_rescoring_uses_float32_vectors_kept_in_the_store(tmp_path):
+    vectors = _vectors(200)
+    store = CompactVectorStore(tmp_path / "store", rescore=True)
+    _fill(store, vectors)
+    store.close()
+
+    reopened = CompactVectorStore(tmp_path / "store")
+    query = vectors[:1] + 0.05
+    results = reopened.query(query_embeddings=query, n_results=3)
+
+    exact = ((vectors - query[0]) ** 2).sum(axis=1)
+    assert results["ids"][0] == [f"D{idx}" for idx in np.argsort(exact)[:3]]
+    assert results["distances"][0] == pytest.approx(np.sort(exact)[:3].tolist())
+    exact_bytes = (tmp_path / "store" / "exact.bin").stat().st_size
+    assert exact_bytes >= 200 * 16 * np.dtype(np.float32).itemsize
+
+
+def test_text_search_indexes_stored_documents_once(tmp_path):
+    store = CompactVectorStore(tmp_path / "store")
+    ids = _fill(store, _vectors(6))
+    conn = sqlite3.connect(tmp_path / "store" / "store.sqlite")
+    tables = "SELECT name FROM sqlite_master WHERE name = 'docs_fts'"
+    assert conn.execute(tables).fetchall() == []
+
+    hits = store.search_text("document 4", limit=3, where={"item_key": "ITEM1"})
+
+    assert [hit["id"] for hit in hits] == ["D4", "D1"]
+    assert hits[0]["metadata"] == {"item_key": "ITEM1", "year": 2004}
+    # The index reads text from docs, and triggers follow later writes
+    store.upsert(ids=["D1"], documents=["rewritten"], embeddings=_vectors(1))
+    store.delete(ids=[ids[4]])
+    store.vacuum()
+    assert store.search_text("4") == []
+    assert [hit["id"] for hit in store.search_text("rewritten")] == ["D1"]
+    assert conn.execute(tables).fetchall() == [("docs_fts",)]
+    conn.close()
+
+
+def test_writers_in_two_processes_do_not_share_slots(tmp_path):
+    vectors = _vectors(20)
+    first = CompactVectorStore(tmp_path / "store")
+    second = CompactVectorStore(tmp_path / "store")
+    first.upsert(ids=["A0"], embeddings=vectors[:1])
+    second.count()  # caches the one-row layout
+
+    first.upsert(ids=[f"A{idx}" for idx in range(1, 10)], embeddings=vectors[1:10])
+    second.upsert(ids=[f"B{idx}" for idx in range(10)], embeddings=vectors[10:])
+    first.close()
+    second.close()
+
+    reopened = CompactVectorStore(tmp_path / "store")
+    assert reopened.count() == 20
+    for idx, doc_id in enumerate(
+        [f"A{idx}" for idx in range(10)] + [f"B{idx}" for idx in range(10)]
+    ):
+        hits = reopened.query(query_embeddings=vectors[idx : idx + 1], n_results=1)
+        assert hits["ids"] == [[doc_id]]
+
+
+def test_storage_bytes_counts_allocated_blocks(tmp_path):
+    store = CompactVectorStore(tmp_path / "store")
+    _fill(store, _vectors(10, dim=4096))
+    # Growth reserves MIN_GROWTH_ROWS rows, but only written rows use disk
+    apparent = (tmp_path / "store" / "vectors.bin").stat().st_size
+    assert apparent == store.MIN_GROWTH_ROWS * 4096
+
+    assert store.storage_bytes() < apparent
+
+
+def test_where_to_sql_matches_python_evaluation():
+    rows = [
+        {"item_type": "book", "year": 2001, "tag:ai": True, "tag:o'brien": True},
+        {"item_type": "thesis", "year": 2015},
+        {"item_type": "journalArticle"},
+    ]
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE docs (idx INTEGER, metadata TEXT)")
+    conn.executemany(
+        "INSERT INTO docs VALUES (?, ?)",
+        [(idx, json.dumps(row)) for idx, row in enumerate(rows)],
+    )
+    filters = [
+        {"tag:ai": True},
+        {"tag:o'brien": True},
+        {"tag:o'brien": {"$ne": True}},
+        {"item_type": {"$in": ["book", "thesis"]}},
+        {"item_type": {"$nin": ["book"]}},
+        {"year": {"$ne": 2015}},
+        {"$or": [{"year": {"$lt": 2010}}, {"item_type": "journalArticle"}]},
+        {"$and": [{"year": {"$gte": 2000}}, {"year": {"$lte": 2010}}]},
+    ]
+
+    for where in filters:
+        sql, params = where_to_sql(where)
+        selected = [
+            row[0] for row in conn.execute(f"SELECT idx FROM docs WHERE {sql}", params)
+        ]
+        expected = [idx for idx, row in enumerate(rows) if matches_where(row, where)]
+        assert selected == expected, where
+
+
+def test_vacuum_moves_live_rows_and_shrinks_files(tmp_path):
+    vectors = _vectors(2000)
+    store = CompactVectorStore(tmp_path / "store")
+    ids = _fill(store, vectors)
+    store.delete(ids=ids[:1500])
+    size_before = store.storage_bytes()
+
+    store.vacuum()
+
+    assert store.storage_bytes() < size_before
+    assert (tmp_path / "store" / "vectors.bin").stat().st_size == 500 * 16
+    assert store._load_state()["rows"] == 500
+    hits = store.query(query_embeddings=vectors[1999:], n_results=1)
+    assert hits["ids"] == [["D1999"]]
+    store.upsert(ids=["NEW"], documents=["new"], embeddings=vectors[:1])
+    assert store.count() == 501
@@ -0,0 +1,24 @@
+from zotero_mcp.clients.database.file_lock import FileLock
+
+
+def test_lock_excludes_other_holders_until_released(tmp_path):
+    holder = FileLock(tmp_path / "index.lock")
+    other = FileLock(tmp_path / "index.lock")
+
+    with holder.hold():
+        with holder.hold(shared=True):
+            assert not other.acquire(timeout=0.1)
+        assert not other.acquire(shared=True, timeout=0.1)
+
+    assert other.acquire(timeout=0.1)
+    other.release()
+
+
+def test_shared_holders_do_not_exclude_each_other(tmp_path):
+    first = FileLock(tmp_path / "index.lock")
+    second = FileLock(tmp_path / "index.lock")
+
+    with first.hold(shared=True):
+        assert second.acquire(shared=True, timeout=0.1)
+        assert not FileLock(tmp_path / "index.lock").acquire(timeout=0.1)
+        second.release()
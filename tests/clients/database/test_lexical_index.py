@@ -0,0 +1,63 @@
+from zotero_mcp.clients.database.lexical_index import LexicalIndex, build_lexical_query
+from zotero_mcp.clients.database.where import matches_where
+
+
+def test_build_lexical_query_quotes_tokens():
+    assert build_lexical_query('BERT "OR" bert-base') == '"bert" OR "or" OR "base"'
+    assert build_lexical_query("  ?! ") == ""
+
+
+def test_search_ranks_exact_term_matches_first(tmp_path):
+    index = LexicalIndex(tmp_path / "lexical.sqlite")
+    index.upsert(
+        ["a", "b", "c"],
+        [
+            "transformers for protein folding",
+            "TP53 mutation and TP53 signalling",
+            "a survey mentioning TP53 once among many other words",
+        ],
+        [{"year": 2020}, {"year": 2021}, {"year": 2019}],
+    )
+
+    hits = index.search("tp53", limit=5)
+    assert [hit["id"] for hit in hits] == ["b", "c"]
+    assert hits[0]["score"] > hits[1]["score"]
+
+    filtered = index.search("tp53", limit=5, where={"year": {"$lt": 2021}})
+    assert [hit["id"] for hit in filtered] == ["c"]
+    limited = index.search("tp53", limit=1, where={"year": {"$nin": [2021]}})
+    assert [hit["id"] for hit in limited] == ["c"]
+    # Keys are bound, so quotes in user data cannot break (or inject) SQL
+    quoted = index.search("tp53", where={"tag:o'brien') OR 1 --": True})
+    assert quoted == []
+    index.close()
+
+
+def test_upsert_replaces_and_delete_removes(tmp_path):
+    index = LexicalIndex(tmp_path / "lexical.sqlite")
+    index.upsert(["a"], ["old words"], [{}])
+    index.upsert(["a"], ["new words"], [{}])
+
+    assert index.count() == 1
+    assert index.search("old") == []
+    index.delete(["a"])
+    assert index.search("new") == []
+    index.close()
+
+
+def test_matches_where_operators():
+    metadata = {"item_type": "journalArticle", "year": 2020}
+
+    assert matches_where(metadata, None)
+    assert matches_where(metadata, {"item_type": "journalArticle"})
+    assert matches_where(
+        metadata,
+        {
+            "$and": [
+                {"year": {"$gte": 2020}},
+                {"item_type": {"$in": ["book", "journalArticle"]}},
+            ]
+        },
+    )
+    assert not matches_where(metadata, {"$or": [{"year": 1999}, {"item_type": "book"}]})
+    assert not matches_where(metadata, {"missing": {"$gt": 1}})
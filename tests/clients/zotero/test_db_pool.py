@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import threading
+
+import pytest
+
+from zotero_mcp.clients.zotero.db_pool import ReadConnectionPool
+from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient
+
+
+def test_each_thread_reuses_its_own_tuned_connection(zotero_db):
+    pool = ReadConnectionPool(mmap_bytes=1 << 20, cache_kib=512)
+    uri = f"file:{zotero_db.path}?mode=ro"
+
+    conn = pool.get(uri)
+    assert pool.get(uri) is conn
+    assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -512
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("DELETE FROM items")
+
+    others: list[sqlite3.Connection] = []
+    thread = threading.Thread(target=lambda: others.append(pool.get(uri)))
+    thread.start()
+    thread.join()
+    assert others[0] is not conn
+    assert pool.stats() == {"open": 2, "opened": 2}
+
+    pool.close()
+    assert pool.stats()["open"] == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        others[0].execute("SELECT 1")
+    # The pool reopens on the next read after shutdown
+    assert pool.get(uri) is not conn
+
+
+def test_switching_uri_closes_the_previous_connection(zotero_db, tmp_path):
+    pool = ReadConnectionPool()
+    old = pool.get(f"file:{zotero_db.path}?mode=ro")
+    snapshot = tmp_path / "snapshot.sqlite"
+    sqlite3.connect(snapshot).close()
+
+    new = pool.get(f"file:{snapshot}?mode=ro")
+
+    assert new is not old
+    with pytest.raises(sqlite3.ProgrammingError):
+        old.execute("SELECT 1")
+    assert pool.stats() == {"open": 1, "opened": 2}
+    pool.close()
+
+
+def test_client_serves_concurrent_reads_from_many_threads(zotero_db):
+    for idx in range(20):
+        zotero_db.add_item(f"ITEM{idx:04d}", fields={"title": f"Paper {idx}"})
+
+    barrier = threading.Barrier(4)
+
+    def read(_):
+        # All four reads are in flight at the same time
+        barrier.wait(timeout=10)
+        return len(client.get_items())
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(read, range(4)))
+        assert results == [20] * 4
+        assert client._pool.stats()["open"] == 4
+
+    assert client._pool.stats()["open"] == 0
@@ -0,0 +1,112 @@
+import sqlite3
+
+from zotero_mcp.clients.zotero.db_snapshot import DatabaseSnapshot
+from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient
+
+
+def _titles(client):
+    return [item.title for item in client.get_items()]
+
+
+def test_locked_database_is_read_from_refreshed_snapshots(zotero_db, tmp_path):
+    item_id = zotero_db.add_item("ITEM0001", fields={"title": "First"})
+    # Zotero keeps an exclusive lock on its database while it runs
+    zotero_db.conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    zotero_db.touch(item_id, "2026-02-01 00:00:00")
+
+    with LocalDatabaseClient(
+        db_path=zotero_db.path, snapshot_dir=tmp_path / "snapshots"
+    ) as client:
+        assert _titles(client) == ["First"]
+        assert client.reads_snapshot
+        snapshot = client._snapshot
+        first_path = snapshot.current()
+        assert snapshot.copies == 1
+
+        # Unchanged database: the snapshot is reused without copying
+        assert _titles(client) == ["First"]
+        assert snapshot.copies == 1
+
+        zotero_db.add_item("ITEM0002", fields={"title": "Second"})
+        # The stale snapshot is served while the copy runs in the background
+        assert snapshot.current() == first_path
+        snapshot.wait()
+        assert sorted(_titles(client)) == ["First", "Second"]
+        assert snapshot.copies == 2
+
+    assert not first_path.exists()
+
+
+def test_snapshot_folds_in_wal_and_is_reused_across_instances(tmp_path):
+    source = tmp_path / "live.sqlite"
+    writer = sqlite3.connect(source)
+    writer.execute("PRAGMA journal_mode=WAL")
+    writer.execute("PRAGMA wal_autocheckpoint=0")
+    writer.execute("CREATE TABLE t (value TEXT)")
+    writer.execute("INSERT INTO t VALUES ('only in the WAL')")
+    writer.commit()
+
+    snapshot = DatabaseSnapshot(source, tmp_path / "snapshots")
+    path = snapshot.current()
+    conn = sqlite3.connect(f"file:{path}?mode=ro&immutable=1", uri=True)
+    assert conn.execute("SELECT value FROM t").fetchall() == [("only in the WAL",)]
+    conn.close()
+
+    again = DatabaseSnapshot(source, tmp_path / "snapshots")
+    assert again.current() == path
+    assert again.copies == 0
+    writer.close()
+
+
+def test_never_mode_reads_live_database(zotero_db, tmp_path):
+    zotero_db.add_item("ITEM0001", fields={"title": "Live"})
+
+    with LocalDatabaseClient(
+        db_path=zotero_db.path,
+        snapshot_mode="never",
+        snapshot_dir=tmp_path / "snapshots",
+    ) as client:
+        assert _titles(client) == ["Live"]
+        assert not client.reads_snapshot
+    assert not (tmp_path / "snapshots").exists()
+
+
+def test_fresh_clients_share_one_snapshot(zotero_db, tmp_path):
+    zotero_db.add_item("ITEM0001", fields={"title": "First"})
+    zotero_db.conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    zotero_db.touch(1, "2026-02-01 00:00:00")
+
+    snapshots = []
+    for _ in range(3):
+        with LocalDatabaseClient(
+            db_path=zotero_db.path, snapshot_dir=tmp_path / "snapshots"
+        ) as client:
+            assert _titles(client) == ["First"]
+            snapshots.append(client._snapshot)
+
+    assert snapshots[0] is snapshots[1] is snapshots[2]
+    assert snapshots[0].copies == 1
+
+
+def test_first_copy_runs_in_background_when_an_older_snapshot_exists(tmp_path):
+    source = tmp_path / "live.sqlite"
+    writer = sqlite3.connect(source)
+    writer.execute("CREATE TABLE t (value TEXT)")
+    writer.execute("INSERT INTO t VALUES ('old')")
+    writer.commit()
+    old_path = DatabaseSnapshot(source, tmp_path / "snapshots").current()
+
+    writer.execute("INSERT INTO t VALUES ('new')")
+    writer.commit()
+    writer.close()
+
+    # A new process starts from the snapshot an earlier one left behind
+    snapshot = DatabaseSnapshot(source, tmp_path / "snapshots")
+    assert snapshot.current() == old_path
+    snapshot.wait()
+    assert snapshot.copies == 1
+    new_path = snapshot.current()
+    assert new_path != old_path
+    conn = sqlite3.connect(f"file:{new_path}?mode=ro&immutable=1", uri=True)
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone() == (2,)
+    conn.close()
@@ -0,0 +1,98 @@
+import pymupdf
+
+from zotero_mcp.clients.zotero.fts_index import build_match_query
+from zotero_mcp.clients.zotero.fulltext_cache import FulltextCache
+from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient
+
+
+def _client(zotero_db, tmp_path):
+    return LocalDatabaseClient(
+        db_path=zotero_db.path,
+        search_index_path=tmp_path / "fts.sqlite",
+    )
+
+
+def test_build_match_query_quotes_and_prefixes_tokens():
+    assert build_match_query('Li-ion "batt') == '"li"* "ion"* "batt"*'
+    assert build_match_query("  ") == ""
+
+
+def test_search_items_ranks_title_matches_first(zotero_db, tmp_path):
+    zotero_db.add_item(
+        "ABSTRACT",
+        fields={"title": "Other topic", "abstractNote": "mentions perovskite once"},
+        date_modified="2026-03-01 00:00:00",
+    )
+    zotero_db.add_item(
+        "TITLEHIT",
+        fields={"title": "Perovskite solar cells"},
+        date_modified="2026-01-01 00:00:00",
+    )
+    zotero_db.add_item("NOMATCH1", fields={"title": "Unrelated"})
+
+    with _client(zotero_db, tmp_path) as client:
+        results = client.search_items("perovsk")
+
+    assert [item.key for item in results] == ["TITLEHIT", "ABSTRACT"]
+
+
+def test_search_items_paginates_in_sql(zotero_db, tmp_path):
+    for idx in range(5):
+        zotero_db.add_item(f"PAGE{idx:04d}", fields={"title": f"graphene {idx}"})
+
+    with _client(zotero_db, tmp_path) as client:
+        first = client.search_items("graphene", limit=2, offset=0)
+        third = client.search_items("graphene", limit=2, offset=4)
+
+    assert len(first) == 2
+    assert len(third) == 1
+    assert third[0].key not in {item.key for item in first}
+
+
+def test_search_index_refreshes_incrementally(zotero_db, tmp_path):
+    keep = zotero_db.add_item("KEEP0001", fields={"title": "anode materials"})
+    gone = zotero_db.add_item("GONE0001", fields={"title": "anode coatings"})
+
+    with _client(zotero_db, tmp_path) as client:
+        index = client._get_search_index()
+        assert index.refresh(client)["indexed"] == 2
+        assert index.refresh(client)["skipped"] is True
+
+        zotero_db.add_note(keep, "NOTE0001", "<p>silicon anode swelling</p>")
+        zotero_db.touch(keep, "2026-05-01 00:00:00")
+        zotero_db.delete(gone)
+
+        stats = index.refresh(client)
+        assert stats["indexed"] == 1
+        assert stats["removed"] == 1
+        assert [item.key for item in client.search_items("swelling")] == ["KEEP0001"]
+        assert [item.key for item in client.search_items("anode")] == ["KEEP0001"]
+
+
+def test_search_items_matches_pdf_text_when_fulltext_is_included(zotero_db, tmp_path):
+    parent = zotero_db.add_item("PDFONLY1", fields={"title": "Battery study"})
+    zotero_db.add_attachment(parent, "ATT00001", path="storage:paper.pdf")
+    pdf_path = tmp_path / "storage" / "ATT00001" / "paper.pdf"
+    pdf_path.parent.mkdir(parents=True)
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), "Lithium dendrite suppression")
+    doc.save(pdf_path)
+    doc.close()
+
+    cache = FulltextCache(tmp_path / "cache.sqlite")
+    with LocalDatabaseClient(
+        db_path=zotero_db.path,
+        search_index_path=tmp_path / "fts.sqlite",
+        fulltext_cache=cache,
+    ) as client:
+        assert client.search_items("dendrite") == []
+        # The attachment text is added to the existing rows, not rebuilt
+        hits = client.search_items("dendrite", include_fulltext=True)
+        assert [item.key for item in hits] == ["PDFONLY1"]
+        assert hits[0].fulltext
+        index = client._get_search_index()
+        assert index.refresh(client, include_fulltext=True)["skipped"] is True
+        assert index.refresh(client)["skipped"] is True
+        assert client.search_items("dendrite") == []
+        assert [item.key for item in client.search_items("battery")] == ["PDFONLY1"]
+    cache.close()
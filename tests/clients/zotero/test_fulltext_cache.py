@@ -0,0 +1,113 @@
+import os
+
+from zotero_mcp.clients.zotero.fulltext_cache import FulltextCache
+from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient
+
+
+class _CountingExtractor:
+    def __init__(self, text="extracted"):
+        self.text = text
+        self.calls = 0
+
+    def __call__(self, source):
+        self.calls += 1
+        return self.text
+
+
+def test_get_or_extract_reuses_cached_text(tmp_path):
+    pdf = tmp_path / "ATT00001" / "paper.pdf"
+    pdf.parent.mkdir()
+    pdf.write_bytes(b"%PDF-1.4 original")
+    cache = FulltextCache(tmp_path / "cache.sqlite")
+    extract = _CountingExtractor()
+
+    assert cache.get_or_extract(pdf, "pdfminer:10", extract) == "extracted"
+    assert cache.get_or_extract(pdf, "pdfminer:10", extract) == "extracted"
+
+    assert extract.calls == 1
+    assert cache.hits == 1
+    cache.close()
+
+
+def test_get_or_extract_keys_on_extractor_and_content(tmp_path):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4 original")
+    cache = FulltextCache(tmp_path / "cache.sqlite")
+    extract = _CountingExtractor()
+
+    cache.get_or_extract(pdf, "pdfminer:10", extract)
+    cache.get_or_extract(pdf, "pdfminer:20", extract)
+    assert extract.calls == 2
+
+    pdf.write_bytes(b"%PDF-1.4 changed content")
+    stat = pdf.stat()
+    os.utime(pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.get_or_extract(pdf, "pdfminer:10", extract)
+    assert extract.calls == 3
+    cache.close()
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = FulltextCache(tmp_path / "cache.sqlite", max_bytes=600)
+    for idx in range(5):
+        blob = f"pdf-{idx}".encode()
+        cache.get_or_extract_bytes(
+            blob, "pymupdf", lambda _d, i=idx: os.urandom(100).hex() + str(i)
+        )
+
+    stats = cache.get_stats()
+    assert stats["stored_bytes"] <= 600
+    assert stats["entries"] < 5
+
+    extract = _CountingExtractor()
+    cache.get_or_extract_bytes(b"pdf-0", "pymupdf", extract)
+    assert extract.calls == 1
+    cache.close()
+
+
+def test_get_or_extract_bytes_caches_empty_results(tmp_path):
+    cache = FulltextCache(tmp_path / "cache.sqlite")
+    extract = _CountingExtractor(text=None)
+
+    assert cache.get_or_extract_bytes(b"scanned", "pymupdf", extract) is None
+    assert cache.get_or_extract_bytes(b"scanned", "pymupdf", extract) is None
+    assert extract.calls == 1
+    cache.close()
+
+
+def test_failed_extractions_are_not_cached(tmp_path, zotero_db, monkeypatch):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4 truncated")
+    cache = FulltextCache(tmp_path / "cache.sqlite")
+    calls = []
+
+    def flaky_parse(path):
+        calls.append(path)
+        if len(calls) == 1:
+            raise OSError("file is still syncing")
+        return "pdf body"
+
+    with LocalDatabaseClient(db_path=zotero_db.path, fulltext_cache=cache) as client:
+        monkeypatch.setattr(client, "_parse_pdf_text", flaky_parse)
+        assert client._extract_pdf_text(pdf) == ""
+        assert cache.get_stats()["entries"] == 0
+        assert client._extract_pdf_text(pdf) == "pdf body"
+        assert client._extract_pdf_text(pdf) == "pdf body"
+
+    assert len(calls) == 2
+    cache.close()
+
+
+def test_local_client_extracts_pdf_once(tmp_path, zotero_db, monkeypatch):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4 body")
+    extract = _CountingExtractor(text="pdf body")
+    cache = FulltextCache(tmp_path / "cache.sqlite")
+
+    with LocalDatabaseClient(db_path=zotero_db.path, fulltext_cache=cache) as client:
+        monkeypatch.setattr(client, "_parse_pdf_text", extract)
+        assert client._extract_pdf_text(pdf) == "pdf body"
+        assert client._extract_pdf_text(pdf) == "pdf body"
+
+    assert extract.calls == 1
+    cache.close()
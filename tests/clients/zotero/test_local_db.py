@@ -0,0 +1,293 @@
+from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient
+
+
+def _populate(zotero_db):
+    first = zotero_db.add_item(
+        "ITEM0001",
+        fields={"title": "Battery cathodes", "DOI": "10.1/abc"},
+        creators=[("Smith", "Alice")],
+        tags=["energy", "review"],
+        date_modified="2026-02-01 00:00:00",
+    )
+    attachment = zotero_db.add_attachment(first, "ATT00001", path="storage:a.pdf")
+    zotero_db.add_annotation(attachment, "ANN00001", text="highlighted")
+    zotero_db.add_item(
+        "ITEM0002",
+        fields={"title": "Solid electrolytes"},
+        tags=["energy"],
+        date_modified="2026-01-15 00:00:00",
+    )
+    return first
+
+
+def test_get_items_bulk_loads_tags_and_annotations(zotero_db):
+    _populate(zotero_db)
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        items = client.get_items()
+
+    assert [item.key for item in items] == ["ITEM0001", "ITEM0002"]
+    assert sorted(items[0].tags) == ["energy", "review"]
+    assert items[0].annotations == [
+        {"type": "highlight", "text": "highlighted", "comment": "", "page": "1"}
+    ]
+    assert items[1].tags == ["energy"]
+    assert items[1].annotations == []
+
+
+def test_get_items_issues_constant_query_count(zotero_db):
+    for idx in range(20):
+        zotero_db.add_item(f"BULK{idx:04d}", tags=[f"tag-{idx}"])
+
+    statements: list[str] = []
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        client._get_connection().set_trace_callback(statements.append)
+        client.get_items()
+        # The fields table is resolved once per client
+        assert len(statements) == 6
+        statements.clear()
+        items = client.get_items()
+
+    assert len(items) == 20
+    assert len(statements) == 5
+    assert client.last_load_stats["items"] == 20
+    assert client.last_load_stats["queries"] == 5
+    assert "total_ms" in client.last_load_stats
+
+
+def test_get_item_by_key_queries_single_item(zotero_db):
+    _populate(zotero_db)
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        item = client.get_item_by_key("ITEM0002")
+        missing = client.get_item_by_key("MISSING1")
+
+    assert item is not None
+    assert item.title == "Solid electrolytes"
+    assert item.tags == ["energy"]
+    assert client.last_load_stats["items"] == 0
+    assert missing is None
+
+
+def test_get_items_by_keys_preserves_requested_order(zotero_db):
+    _populate(zotero_db)
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        items = client.get_items_by_keys(["ITEM0002", "NOPE0000", "ITEM0001"])
+
+    assert [item.key for item in items] == ["ITEM0002", "ITEM0001"]
+    assert items[1].doi == "10.1/abc"
+
+
+def test_collection_membership_is_loaded_and_changes_stamp(zotero_db):
+    first = _populate(zotero_db)
+    collection = zotero_db.add_collection("COLL0001", "Energy")
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        before = client.get_item_stamps()[first]
+        zotero_db.add_to_collection(collection, first)
+        after = client.get_item_stamps()[first]
+        item = client.get_item_by_key("ITEM0001")
+
+    assert before != after
+    assert item is not None
+    assert item.collections == ["COLL0001"]
+
+
+def test_pdf_activity_uses_latest_modification_or_read(zotero_db):
+    first = _populate(zotero_db)
+    zotero_db.add_attachment(
+        first, "ATT00002", path="storage:b.pdf", date_modified="2026-02-10 00:00:00"
+    )
+    second = zotero_db.conn.execute(
+        "SELECT itemID FROM items WHERE key = 'ITEM0002'"
+    ).fetchone()[0]
+    read = zotero_db.add_attachment(second, "ATT00003", path="storage:c.pdf")
+    zotero_db.add_attachment(second, "ATT00004", content_type="text/html")
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        assert client.get_pdf_activity() == {
+            "ITEM0001": "2026-02-10 00:00:00",
+            "ITEM0002": "2026-01-15 00:00:00",
+        }
+
+    # Zotero 7 records when an attachment was last opened in the reader
+    zotero_db.conn.execute("ALTER TABLE itemAttachments ADD COLUMN lastRead INT")
+    zotero_db.conn.execute(
+        "UPDATE itemAttachments SET lastRead = 1772323200 WHERE itemID = ?", (read,)
+    )
+    zotero_db.conn.commit()
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        assert client.get_pdf_activity()["ITEM0002"] == "2026-03-01 00:00:00"
+
+
+def test_page_cursors_are_dropped_when_the_library_changes(zotero_db):
+    ids = [
+        zotero_db.add_item(
+            f"PAGE{idx:04d}", date_modified=f"2026-01-{idx + 1:02d} 00:00:00"
+        )
+        for idx in range(10)
+    ]
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        client.get_items(limit=4, offset=0)
+        # A new newest item shifts every later page by one
+        zotero_db.add_item("NEWEST01", date_modified="2026-02-01 00:00:00")
+        shifted = client.get_items(limit=4, offset=4)
+        client.get_items(limit=4, offset=0)
+        zotero_db.delete(ids[9])
+        after_delete = client.get_items(limit=4, offset=4)
+        everything = [item.key for item in client.get_items()]
+
+    assert [item.key for item in shifted] == [f"PAGE{idx:04d}" for idx in (6, 5, 4, 3)]
+    assert [item.key for item in after_delete] == everything[4:8]
+
+
+def test_api_shaped_reads_match_zotero_api_layout(zotero_db):
+    first = _populate(zotero_db)
+    zotero_db.add_note(first, "NOTE0001", "<p>Summary</p>")
+    collection = zotero_db.add_collection("COLL0001", "Batteries")
+    zotero_db.add_collection("COLL0002", "Cathodes", parent_id=collection)
+    zotero_db.add_to_collection(collection, first)
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        item = client.get_item_data("ITEM0001")
+        children = client.get_item_children_data("ITEM0001")
+        notes = client.get_item_children_data("ITEM0001", item_type="note")
+        annotations = client.get_annotations_data("ITEM0001")
+        collections = client.get_collections_data()
+        members = client.get_collection_items_data("COLL0001")
+        tags = client.get_tags_data(limit=1)
+
+        assert client.get_item_data("MISSING1") is None
+        assert client.get_item_children_data("MISSING1") is None
+        assert client.get_collection_items_data("MISSING1") is None
+
+    data = item["data"]
+    assert item["key"] == "ITEM0001"
+    assert data["itemType"] == "journalArticle"
+    assert data["title"] == "Battery cathodes"
+    assert data["DOI"] == "10.1/abc"
+    assert data["creators"] == [
+        {"creatorType": "author", "firstName": "Alice", "lastName": "Smith"}
+    ]
+    assert data["tags"] == [{"tag": "energy"}, {"tag": "review"}]
+    assert data["collections"] == ["COLL0001"]
+    assert data["dateModified"] == "2026-02-01T00:00:00Z"
+
+    assert [c["data"]["itemType"] for c in children] == ["attachment", "note"]
+    attachment = children[0]["data"]
+    assert attachment["parentItem"] == "ITEM0001"
+    assert attachment["contentType"] == "application/pdf"
+    assert attachment["filename"] == "a.pdf"
+    assert attachment["linkMode"] == "imported_file"
+    assert [n["data"]["note"] for n in notes] == ["<p>Summary</p>"]
+
+    assert len(annotations) == 1
+    assert annotations[0]["data"]["parentItem"] == "ATT00001"
+    assert annotations[0]["data"]["annotationType"] == "highlight"
+    assert annotations[0]["data"]["annotationText"] == "highlighted"
+
+    by_key = {c["key"]: c["data"] for c in collections}
+    assert by_key["COLL0001"]["parentCollection"] is False
+    assert by_key["COLL0002"]["parentCollection"] == "COLL0001"
+    assert [m["key"] for m in members] == ["ITEM0001"]
+    assert tags == [{"tag": "energy", "meta": {"type": 0, "numItems": 2}}]
+
+
+def test_api_shaped_reads_load_relations_and_skip_group_libraries(zotero_db):
+    first = _populate(zotero_db)
+    zotero_db.add_relation(first, "dc:relation", "http://zotero.org/users/1/items/B")
+    zotero_db.add_relation(first, "dc:relation", "http://zotero.org/users/1/items/C")
+    zotero_db.add_relation(first, "owl:sameAs", "http://zotero.org/groups/2/items/D")
+    group_item = zotero_db.add_item(
+        "ITEM0001", fields={"title": "Group copy"}, tags=["group"], library_id=2
+    )
+    zotero_db.add_note(group_item, "NOTE0009", "<p>Group note</p>")
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        item = client.get_item_data("ITEM0001")
+        children = client.get_item_children_data("ITEM0001")
+        tags = client.get_tags_data(limit=None)
+
+    assert item["data"]["title"] == "Battery cathodes"
+    assert item["data"]["relations"] == {
+        "dc:relation": [
+            "http://zotero.org/users/1/items/B",
+            "http://zotero.org/users/1/items/C",
+        ],
+        "owl:sameAs": "http://zotero.org/groups/2/items/D",
+    }
+    assert [c["key"] for c in children] == ["ATT00001"]
+    assert "group" not in [t["tag"] for t in tags]
+
+
+def test_get_items_pivots_every_item_field(zotero_db):
+    zotero_db.add_item(
+        "ITEM0001",
+        fields={
+            "title": "Battery cathodes",
+            "date": "2024-03-01",
+            "publicationTitle": "Energy Journal",
+            "url": "https://example.org/paper",
+            "volume": "12",
+        },
+    )
+    zotero_db.add_item("ITEM0002")
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        items = {item.key: item for item in client.get_items()}
+
+    first = items["ITEM0001"]
+    assert first.title == "Battery cathodes"
+    assert first.date == "2024-03-01"
+    assert first.fields["publicationTitle"] == "Energy Journal"
+    assert first.fields["url"] == "https://example.org/paper"
+    assert first.fields["volume"] == "12"
+    assert items["ITEM0002"].fields == {}
+    assert items["ITEM0002"].title is None
+
+
+def test_get_items_pages_with_keyset_cursor_and_sql_filters(zotero_db):
+    collection = zotero_db.add_collection("COLL0001", "Batteries")
+    for idx in range(30):
+        item_id = zotero_db.add_item(
+            f"PAGE{idx:04d}",
+            item_type="book" if idx % 3 == 0 else "journalArticle",
+            tags=["even"] if idx % 2 == 0 else [],
+            # Pairs share a timestamp so the itemID tiebreak matters
+            date_modified=f"2026-01-{idx // 2 + 1:02d} 00:00:00",
+        )
+        if idx < 10:
+            zotero_db.add_to_collection(collection, item_id)
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as client:
+        everything = [item.key for item in client.get_items()]
+        paged = []
+        for start in range(0, 30, 7):
+            paged += [item.key for item in client.get_items(limit=7, offset=start)]
+
+        statements: list[str] = []
+        client._get_connection().set_trace_callback(statements.append)
+        page = client.get_items(limit=7, offset=28)
+        # The remembered end of the previous page replaces OFFSET 28
+        page_query = next(sql for sql in statements if "LIMIT 7" in sql)
+        assert "LIMIT 7 OFFSET 0" in page_query
+        assert "i.dateModified < '2026-01-02 00:00:00'" in page_query
+        client._get_connection().set_trace_callback(None)
+
+        last = client.get_items(limit=5)[-1]
+        after = client.get_items(limit=5, after=(last.date_modified, last.item_id))
+        books = client.get_items(item_type="book")
+        members = client.get_items(collection_key="COLL0001", limit=3, offset=3)
+        tagged_books = client.get_items(item_type="book", tag="even")
+
+    assert everything == [f"PAGE{idx:04d}" for idx in reversed(range(30))]
+    assert paged == everything
+    assert [item.key for item in page] == everything[28:]
+    assert [item.key for item in after] == everything[5:10]
+    assert {item.key for item in books} == {f"PAGE{i:04d}" for i in range(0, 30, 3)}
+    assert [item.key for item in members] == everything[-10:][3:6]
+    assert {item.key for item in tagged_books} == {
+        f"PAGE{i:04d}" for i in range(0, 30, 6)
+    }
@@ -38,3 +38,282 @@ def mock_metadata_service():
     mock = MagicMock()
     mock.lookup_doi = AsyncMock(return_value=None)
     return mock
+
+
+class ZoteroDatabaseBuilder:
+    """Build a minimal zotero.sqlite with the tables LocalDatabaseClient reads."""
+
+    FIELDS = {
+        "title": 1,
+        "abstractNote": 2,
+        "date": 6,
+        "publicationTitle": 12,
+        "url": 13,
+        "extra": 16,
+        "volume": 19,
+        "DOI": 59,
+    }
+    ITEM_TYPES = {
+        "note": 1,
+        "journalArticle": 2,
+        "book": 3,
+        "attachment": 14,
+        "annotation": 37,
+    }
+
+    def __init__(self, path):
+        import sqlite3
+
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            """
+            CREATE TABLE itemTypes (itemTypeID INTEGER PRIMARY KEY, typeName TEXT);
+            CREATE TABLE items (
+                itemID INTEGER PRIMARY KEY,
+                itemTypeID INT NOT NULL,
+                dateAdded TEXT NOT NULL,
+                dateModified TEXT NOT NULL,
+                clientDateModified TEXT,
+                libraryID INT NOT NULL DEFAULT 1,
+                key TEXT NOT NULL,
+                version INT NOT NULL DEFAULT 0,
+                synced INT NOT NULL DEFAULT 0,
+                UNIQUE (libraryID, key)
+            );
+            CREATE TABLE libraries (libraryID INTEGER PRIMARY KEY, type TEXT);
+            CREATE TABLE relationPredicates (
+                predicateID INTEGER PRIMARY KEY, predicate TEXT UNIQUE
+            );
+            CREATE TABLE itemRelations (
+                itemID INT, predicateID INT, object TEXT,
+                PRIMARY KEY (itemID, predicateID, object)
+            );
+            CREATE TABLE fields (fieldID INTEGER PRIMARY KEY, fieldName TEXT);
+            CREATE TABLE itemDataValues (valueID INTEGER PRIMARY KEY, value UNIQUE);
+            CREATE TABLE itemData (
+                itemID INT, fieldID INT, valueID INT, PRIMARY KEY (itemID, fieldID)
+            );
+            CREATE TABLE itemNotes (
+                itemID INTEGER PRIMARY KEY, parentItemID INT, note TEXT, title TEXT
+            );
+            CREATE TABLE creators (
+                creatorID INTEGER PRIMARY KEY, firstName TEXT, lastName TEXT,
+                fieldMode INT
+            );
+            CREATE TABLE creatorTypes (
+                creatorTypeID INTEGER PRIMARY KEY, creatorType TEXT
+            );
+            CREATE TABLE itemCreators (
+                itemID INT, creatorID INT, creatorTypeID INT DEFAULT 1,
+                orderIndex INT DEFAULT 0,
+                PRIMARY KEY (itemID, creatorID, creatorTypeID, orderIndex)
+            );
+            CREATE TABLE tags (tagID INTEGER PRIMARY KEY, name TEXT UNIQUE);
+            CREATE TABLE itemTags (
+                itemID INT, tagID INT, type INT DEFAULT 0, PRIMARY KEY (itemID, tagID)
+            );
+            CREATE TABLE itemAttachments (
+                itemID INTEGER PRIMARY KEY, parentItemID INT, linkMode INT,
+                contentType TEXT, path TEXT
+            );
+            CREATE TABLE itemAnnotations (
+                itemID INTEGER PRIMARY KEY, parentItemID INT, annotationType TEXT,
+                text TEXT, comment TEXT, pageLabel TEXT
+            );
+            CREATE TABLE collections (
+                collectionID INTEGER PRIMARY KEY, collectionName TEXT,
+                parentCollectionID INT, libraryID INT DEFAULT 1,
+                key TEXT UNIQUE, version INT DEFAULT 0
+            );
+            CREATE TABLE collectionItems (
+                collectionID INT, itemID INT, orderIndex INT DEFAULT 0,
+                PRIMARY KEY (collectionID, itemID)
+            );
+            CREATE TABLE deletedItems (itemID INTEGER PRIMARY KEY, dateDeleted TEXT);
+            """
+        )
+        self.conn.executemany(
+            "INSERT INTO itemTypes VALUES (?, ?)",
+            [(v, k) for k, v in self.ITEM_TYPES.items()],
+        )
+        self.conn.executemany(
+            "INSERT INTO libraries VALUES (?, ?)", [(1, "user"), (2, "group")]
+        )
+        self.conn.executemany(
+            "INSERT INTO creatorTypes VALUES (?, ?)",
+            [(1, "author"), (2, "editor")],
+        )
+        self.conn.executemany(
+            "INSERT INTO fields VALUES (?, ?)",
+            [(v, k) for k, v in self.FIELDS.items()],
+        )
+        self.conn.commit()
+
+    def _insert_item(self, key, item_type, date_modified, version=0, library_id=1):
+        cursor = self.conn.execute(
+            "INSERT INTO items "
+            "(itemTypeID, dateAdded, dateModified, key, version, libraryID) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                self.ITEM_TYPES[item_type],
+                "2026-01-01 00:00:00",
+                date_modified,
+                key,
+                version,
+                library_id,
+            ),
+        )
+        return cursor.lastrowid
+
+    def set_field(self, item_id, field, value):
+        self.conn.execute(
+            "INSERT OR IGNORE INTO itemDataValues (value) VALUES (?)", (value,)
+        )
+        value_id = self.conn.execute(
+            "SELECT valueID FROM itemDataValues WHERE value = ?", (value,)
+        ).fetchone()[0]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO itemData VALUES (?, ?, ?)",
+            (item_id, self.FIELDS[field], value_id),
+        )
+        self.conn.commit()
+
+    def add_item(
+        self,
+        key,
+        item_type="journalArticle",
+        fields=None,
+        creators=(),
+        tags=(),
+        date_modified="2026-01-01 00:00:00",
+        version=0,
+        library_id=1,
+    ):
+        item_id = self._insert_item(key, item_type, date_modified, version, library_id)
+        for field, value in (fields or {}).items():
+            self.set_field(item_id, field, value)
+        for order, (last, first) in enumerate(creators):
+            creator_id = self.conn.execute(
+                "INSERT INTO creators (firstName, lastName, fieldMode) "
+                "VALUES (?, ?, 0)",
+                (first, last),
+            ).lastrowid
+            self.conn.execute(
+                "INSERT INTO itemCreators (itemID, creatorID, orderIndex) "
+                "VALUES (?, ?, ?)",
+                (item_id, creator_id, order),
+            )
+        for tag in tags:
+            self.add_tag(item_id, tag)
+        self.conn.commit()
+        return item_id
+
+    def add_tag(self, item_id, tag):
+        self.conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag,))
+        tag_id = self.conn.execute(
+            "SELECT tagID FROM tags WHERE name = ?", (tag,)
+        ).fetchone()[0]
+        self.conn.execute(
+            "INSERT OR IGNORE INTO itemTags (itemID, tagID) VALUES (?, ?)",
+            (item_id, tag_id),
+        )
+        self.conn.commit()
+
+    def add_relation(self, item_id, predicate, obj):
+        self.conn.execute(
+            "INSERT OR IGNORE INTO relationPredicates (predicate) VALUES (?)",
+            (predicate,),
+        )
+        predicate_id = self.conn.execute(
+            "SELECT predicateID FROM relationPredicates WHERE predicate = ?",
+            (predicate,),
+        ).fetchone()[0]
+        self.conn.execute(
+            "INSERT INTO itemRelations VALUES (?, ?, ?)", (item_id, predicate_id, obj)
+        )
+        self.conn.commit()
+
+    def add_note(self, parent_id, key, note, date_modified="2026-01-01 00:00:00"):
+        item_id = self._insert_item(key, "note", date_modified)
+        self.conn.execute(
+            "INSERT INTO itemNotes (itemID, parentItemID, note) VALUES (?, ?, ?)",
+            (item_id, parent_id, note),
+        )
+        self.conn.commit()
+        return item_id
+
+    def add_attachment(
+        self,
+        parent_id,
+        key,
+        content_type="application/pdf",
+        path=None,
+        date_modified="2026-01-01 00:00:00",
+    ):
+        item_id = self._insert_item(key, "attachment", date_modified)
+        self.conn.execute(
+            "INSERT INTO itemAttachments "
+            "(itemID, parentItemID, linkMode, contentType, path) "
+            "VALUES (?, ?, 0, ?, ?)",
+            (item_id, parent_id, content_type, path),
+        )
+        self.conn.commit()
+        return item_id
+
+    def add_annotation(
+        self,
+        attachment_id,
+        key,
+        text="",
+        comment="",
+        annotation_type="highlight",
+        page="1",
+    ):
+        item_id = self._insert_item(key, "annotation", "2026-01-01 00:00:00")
+        self.conn.execute(
+            "INSERT INTO itemAnnotations "
+            "(itemID, parentItemID, annotationType, text, comment, pageLabel) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (item_id, attachment_id, annotation_type, text, comment, page),
+        )
+        self.conn.commit()
+        return item_id
+
+    def add_collection(self, key, name, parent_id=None):
+        collection_id = self.conn.execute(
+            "INSERT INTO collections (collectionName, parentCollectionID, key) "
+            "VALUES (?, ?, ?)",
+            (name, parent_id, key),
+        ).lastrowid
+        self.conn.commit()
+        return collection_id
+
+    def add_to_collection(self, collection_id, item_id):
+        self.conn.execute(
+            "INSERT INTO collectionItems (collectionID, itemID) VALUES (?, ?)",
+            (collection_id, item_id),
+        )
+        self.conn.commit()
+
+    def touch(self, item_id, date_modified):
+        self.conn.execute(
+            "UPDATE items SET dateModified = ? WHERE itemID = ?",
+            (date_modified, item_id),
+        )
+        self.conn.commit()
+
+    def delete(self, item_id):
+        self.conn.execute("DELETE FROM items WHERE itemID = ?", (item_id,))
+        self.conn.execute("DELETE FROM itemData WHERE itemID = ?", (item_id,))
+        self.conn.execute("DELETE FROM itemNotes WHERE itemID = ?", (item_id,))
+        self.conn.execute("DELETE FROM itemAttachments WHERE itemID = ?", (item_id,))
+        self.conn.commit()
+
+
+@pytest.fixture
+def zotero_db(tmp_path):
+    """Fixture for a minimal on-disk Zotero database."""
+    builder = ZoteroDatabaseBuilder(tmp_path / "zotero.sqlite")
+    yield builder
+    builder.conn.close()
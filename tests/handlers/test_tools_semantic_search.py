@@ -0,0 +1,60 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from zotero_mcp.handlers.tools import ToolHandler
+from zotero_mcp.models.enums import ToolName
+
+
+def test_semantic_search_batch_tool_is_exposed():
+    names = {tool.name for tool in ToolHandler.get_tools()}
+    assert ToolName.SEMANTIC_SEARCH_BATCH in names
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_batch_returns_one_search_per_query(monkeypatch):
+    captured: dict = {}
+
+    async def fake_search_many(queries, limit, filters, mode, collapse_parents):
+        captured.update(queries=queries, limit=limit, collapse=collapse_parents)
+        return [
+            {
+                "query": query,
+                "results": [
+                    {"key": f"KEY{idx}", "title": query, "similarity_score": 0.5}
+                ],
+            }
+            for idx, query in enumerate(queries)
+        ]
+
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.semantic_search_many",
+        fake_search_many,
+    )
+    monkeypatch.setattr(
+        "zotero_mcp.handlers.tools.get_data_service",
+        lambda: MagicMock(),
+    )
+
+    contents = await ToolHandler().handle_tool(
+        ToolName.SEMANTIC_SEARCH_BATCH,
+        {
+            "queries": [" graph neural networks ", "protein folding"],
+            "limit": 3,
+            "collapse_parents": True,
+            "response_format": "json",
+        },
+    )
+
+    payload = json.loads(contents[0].text)
+    assert captured == {
+        "queries": ["graph neural networks", "protein folding"],
+        "limit": 3,
+        "collapse": True,
+    }
+    assert [search["query"] for search in payload["searches"]] == [
+        "semantic: graph neural networks",
+        "semantic: protein folding",
+    ]
+    assert payload["searches"][1]["items"][0]["key"] == "KEY1"
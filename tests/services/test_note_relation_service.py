@@ -197,7 +197,7 @@ async def test_relate_note_updates_only_target_note_content():
         },
     }
 
-    async def fake_get_item(key: str):
+    async def fake_get_item(key: str, for_update: bool = False):
         return copy.deepcopy(items_by_key[key])
 
     data_service.get_item = AsyncMock(side_effect=fake_get_item)
@@ -0,0 +1,210 @@
+from unittest.mock import MagicMock
+
+import pymupdf
+import pytest
+
+from zotero_mcp.clients.zotero.fulltext_cache import FulltextCache
+from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient, parse_pdf_text
+from zotero_mcp.services.zotero import fragment_extraction
+from zotero_mcp.services.zotero.fragment_extraction import (
+    chunk_text,
+    extract_and_chunk,
+)
+from zotero_mcp.services.zotero.semantic_search import ZoteroSemanticSearch
+
+
+def _write_pdf(path, *pages):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = pymupdf.open()
+    for text in pages:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+
+
+def test_chunk_text_prefers_whitespace_boundaries():
+    text = " ".join(f"word{idx}" for idx in range(200))
+
+    chunks = chunk_text(text, chunk_size=300, overlap=50, max_source_chars=0)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert all(not chunk.startswith(" ") for chunk in chunks)
+    assert chunks[0].startswith("word0 ")
+
+
+def test_extract_and_chunk_reports_errors_instead_of_raising(monkeypatch, tmp_path):
+    def broken_parse(file_path, max_pages, first_page=0):
+        raise RuntimeError("corrupt xref")
+
+    monkeypatch.setattr(fragment_extraction, "parse_pdf_text", broken_parse)
+
+    result = extract_and_chunk(str(tmp_path / "bad.pdf"), "pdf", 10, 100, 10, 0)
+
+    assert result.chunks == []
+    assert result.error == "RuntimeError: corrupt xref"
+
+
+@pytest.fixture
+def semantic_search(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.create_chroma_client",
+        lambda config_path=None: None,
+    )
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.get_zotero_client",
+        lambda: type("Wrapper", (), {"client": None})(),
+    )
+    return ZoteroSemanticSearch(config_path=str(tmp_path / "config.json"))
+
+
+def test_parallel_local_documents_keep_order_and_fill_cache(
+    semantic_search, zotero_db, tmp_path
+):
+    storage = tmp_path / "storage"
+    for idx in range(4):
+        parent = zotero_db.add_item(f"ITEM000{idx}", fields={"title": f"Paper {idx}"})
+        zotero_db.add_attachment(parent, f"PDF0000{idx}", path="storage:paper.pdf")
+        _write_pdf(storage / f"PDF0000{idx}" / "paper.pdf", f"Body of paper {idx}")
+    broken = zotero_db.add_item("ITEM0009", fields={"title": "Broken"})
+    zotero_db.add_attachment(broken, "PDF00009", path="storage:paper.pdf")
+    (storage / "PDF00009").mkdir()
+    (storage / "PDF00009" / "paper.pdf").write_bytes(b"not a pdf")
+
+    cache = FulltextCache(tmp_path / "cache.sqlite")
+    semantic_search.extraction_config["workers"] = 2
+    semantic_search.EXTRACTION_QUEUE_FACTOR = 1
+
+    with LocalDatabaseClient(db_path=zotero_db.path, fulltext_cache=cache) as reader:
+        local_items = reader.get_items()
+        documents = list(
+            semantic_search._iter_local_documents(reader, local_items, True)
+        )
+
+    assert [api_item["key"] for api_item, _ in documents] == [
+        item.key for item in local_items
+    ]
+    by_key = {api_item["key"]: fragments for api_item, fragments in documents}
+    assert by_key["ITEM0009"] == []
+    for idx in range(4):
+        fragments = by_key[f"ITEM000{idx}"]
+        assert [f["metadata"]["fragment_type"] for f in fragments] == ["pdf"]
+        assert f"Body of paper {idx}" in fragments[0]["document"]
+
+    # The unparseable PDF is not cached, so it is retried next time
+    assert cache.get_stats()["entries"] == 4
+    cache.close()
+
+
+def test_worker_failure_resubmits_to_pool_instead_of_parsing_in_process(
+    semantic_search, zotero_db, tmp_path, monkeypatch
+):
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+
+    from zotero_mcp.services.zotero.fragment_extraction import ExtractionResult
+
+    for idx in range(2):
+        parent = zotero_db.add_item(f"ITEM000{idx}", fields={"title": f"Paper {idx}"})
+        zotero_db.add_attachment(parent, f"PDF0000{idx}", path="storage:paper.pdf")
+        _write_pdf(tmp_path / "storage" / f"PDF0000{idx}" / "paper.pdf", "Body")
+
+    submitted = []
+
+    class FlakyPool:
+        def __init__(self, workers):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def submit(self, path, *args, **kwargs):
+            submitted.append(path.parent.name)
+            future = Future()
+            if path.parent.name == "PDF00001" or submitted.count("PDF00000") == 1:
+                # PDF00001 kills every worker; PDF00000 dies with the first pool
+                future.set_exception(BrokenProcessPool("worker died"))
+            else:
+                future.set_result(ExtractionResult(text="Body", chunks=["Body"]))
+            return future
+
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.AttachmentExtractionPool",
+        FlakyPool,
+    )
+    semantic_search.extraction_config["workers"] = 2
+
+    cache = FulltextCache(tmp_path / "cache.sqlite")
+    with LocalDatabaseClient(db_path=zotero_db.path, fulltext_cache=cache) as reader:
+        monkeypatch.setattr(
+            reader, "_extract_pdf_text", MagicMock(side_effect=AssertionError)
+        )
+        documents = list(
+            semantic_search._iter_local_documents(reader, reader.get_items(), True)
+        )
+
+    by_key = {api_item["key"]: fragments for api_item, fragments in documents}
+    assert sorted(submitted) == ["PDF00000", "PDF00000", "PDF00001", "PDF00001"]
+    assert [f["document"] for f in by_key["ITEM0000"]] == ["Body"]
+    assert by_key["ITEM0001"] == []
+    cache.close()
+
+
+def test_parse_pdf_text_can_start_after_leading_pages(tmp_path):
+    path = tmp_path / "paper.pdf"
+    _write_pdf(path, "Page one", "Page two", "Page three")
+
+    assert "Page one" in parse_pdf_text(path, 1)
+    assert "Page two" not in parse_pdf_text(path, 1)
+    tail = parse_pdf_text(path, 0, first_page=1)
+    assert "Page one" not in tail
+    assert "Page two" in tail and "Page three" in tail
+    assert "Page three" not in parse_pdf_text(path, 1, first_page=1)
+
+
+def test_parallel_backfill_indexes_remaining_pages(
+    semantic_search, zotero_db, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.is_local_mode", lambda: True
+    )
+    monkeypatch.setattr(
+        "zotero_mcp.clients.zotero.local_db.get_fulltext_cache", lambda: None
+    )
+    config = tmp_path / "config.json"
+    config.write_text(
+        '{"semantic_search": {"extraction": {"pdf_max_pages": 1, "workers": 2}}}'
+    )
+    semantic_search.config_path = str(config)
+    semantic_search.db_path = str(zotero_db.path)
+    semantic_search.extraction_config["workers"] = 2
+    semantic_search.chroma_client = MagicMock()
+    for idx in range(3):
+        parent = zotero_db.add_item(
+            f"ITEM000{idx}",
+            fields={"title": f"Paper {idx}"},
+            date_modified=f"2026-01-0{idx + 1} 00:00:00",
+        )
+        zotero_db.add_attachment(parent, f"PDF0000{idx}", path="storage:paper.pdf")
+        _write_pdf(
+            tmp_path / "storage" / f"PDF0000{idx}" / "paper.pdf",
+            f"Abstract of paper {idx}",
+            f"Results of paper {idx}",
+        )
+    semantic_search.update_database(extract_fulltext=True)
+    semantic_search.chroma_client.reset_mock()
+
+    stats = semantic_search.backfill_fulltext()
+
+    upserts = semantic_search.chroma_client.upsert_documents.call_args_list
+    documents = [doc for call in upserts for doc in call.args[0]]
+    ids = [doc_id for call in upserts for doc_id in call.args[2]]
+    assert ids == [f"ITEM000{idx}::pdf::PDF0000{idx}:tail::1" for idx in (2, 1, 0)]
+    assert all("Results of paper" in doc for doc in documents)
+    assert not any("Abstract" in doc for doc in documents)
+    assert stats["processed_items"] == 3
+    assert stats["remaining_items"] == 0
@@ -0,0 +1,185 @@
+import json
+import threading
+import time
+
+import pytest
+
+from zotero_mcp.services.zotero.index_scheduler import IndexUpdateScheduler
+
+
+class FakeEngine:
+    def __init__(self, due=True):
+        self.due = due
+        self.update_config = {"extract_fulltext": True}
+        self.extraction_config = {}
+        self.calls = []
+
+    def should_update_database(self):
+        return self.due
+
+    def default_extract_fulltext(self):
+        return self.update_config["extract_fulltext"]
+
+    def update_database(self, extract_fulltext=False, pause_hook=None):
+        self.calls.append(extract_fulltext)
+        if pause_hook is not None:
+            pause_hook()
+        return {"processed_items": 3}
+
+
+def _write_config(tmp_path, **update_config):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"semantic_search": {"update_config": update_config}}))
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    ("update_config", "due", "runs"),
+    [
+        ({"auto_update": False, "update_frequency": "daily"}, True, 0),
+        ({"auto_update": True, "update_frequency": "daily"}, False, 0),
+        ({"auto_update": True, "update_frequency": "daily"}, True, 2),
+        ({"auto_update": True, "update_frequency": "startup"}, True, 1),
+    ],
+)
+def test_run_once_follows_update_frequency(tmp_path, update_config, due, runs):
+    engine = FakeEngine(due=due)
+    scheduler = IndexUpdateScheduler(
+        config_path=_write_config(tmp_path, **update_config),
+        engine_factory=lambda: engine,
+        idle_seconds=0,
+    )
+
+    scheduler.run_once()
+    scheduler.run_once()
+
+    assert engine.calls == [True] * runs
+    assert scheduler.status()["runs"] == runs
+    if runs:
+        assert scheduler.status()["last_stats"] == {"processed_items": 3}
+
+
+def test_update_waits_for_interactive_calls(tmp_path):
+    engine = FakeEngine()
+    scheduler = IndexUpdateScheduler(
+        config_path=_write_config(tmp_path, auto_update=True, update_frequency="daily"),
+        engine_factory=lambda: engine,
+        idle_seconds=0.05,
+    )
+
+    with scheduler.interactive():
+        worker = threading.Thread(target=scheduler.run_once)
+        worker.start()
+        time.sleep(0.2)
+        assert engine.calls == []
+        assert scheduler.status()["state"] == "paused"
+        assert scheduler.status()["active_calls"] == 1
+
+    worker.join(timeout=5)
+    assert engine.calls == [True]
+    assert scheduler.status()["state"] == "idle"
+
+
+def test_stop_interrupts_background_thread(tmp_path):
+    engine = FakeEngine()
+    scheduler = IndexUpdateScheduler(
+        config_path=_write_config(tmp_path, auto_update=True, update_frequency="daily"),
+        engine_factory=lambda: engine,
+        check_interval=60,
+        idle_seconds=0,
+    )
+
+    scheduler.start()
+    deadline = time.monotonic() + 5
+    while not engine.calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    scheduler.stop(timeout=5)
+
+    assert engine.calls == [True]
+    assert scheduler.status()["state"] == "stopped"
+    assert scheduler.status()["alive"] is False
+
+
+def test_backfill_runs_in_slices_when_progressive(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.index_scheduler.is_local_mode", lambda: True
+    )
+    engine = FakeEngine(due=False)
+    engine.extraction_config = {"progressive": True}
+    pending = [f"ITEM{idx}" for idx in range(5)]
+    engine.pending_backfill = lambda: dict.fromkeys(pending, "stamp")
+
+    def backfill_fulltext(max_items=None, pause_hook=None):
+        del pending[:max_items]
+        pause_hook()
+        return {"processed_items": max_items, "remaining_items": len(pending)}
+
+    engine.backfill_fulltext = backfill_fulltext
+    scheduler = IndexUpdateScheduler(
+        config_path=_write_config(tmp_path, auto_update=True, update_frequency="daily"),
+        engine_factory=lambda: engine,
+        idle_seconds=0,
+    )
+    scheduler.BACKFILL_ITEMS_PER_RUN = 2
+
+    assert scheduler.run_backfill() is True
+    assert scheduler.run_backfill() is True
+    assert scheduler.run_backfill() is False
+    assert scheduler.run_backfill() is False
+    assert pending == []
+    assert scheduler.status()["last_backfill"]["remaining_items"] == 0
+
+    engine.extraction_config = {}
+    pending.append("ITEM9")
+    assert scheduler.run_backfill() is False
+    assert pending == ["ITEM9"]
+
+
+def test_scheduled_run_after_fulltext_build_reprocesses_nothing(
+    tmp_path, zotero_db, monkeypatch
+):
+    from unittest.mock import MagicMock
+
+    import pymupdf
+
+    from zotero_mcp.services.zotero.semantic_search import ZoteroSemanticSearch
+
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.create_chroma_client",
+        lambda config_path=None: MagicMock(),
+    )
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.get_zotero_client",
+        lambda: type("Wrapper", (), {"client": None})(),
+    )
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.is_local_mode", lambda: True
+    )
+    monkeypatch.setattr(
+        "zotero_mcp.clients.zotero.local_db.get_fulltext_cache", lambda: None
+    )
+    for idx in range(3):
+        parent = zotero_db.add_item(f"ITEM000{idx}", fields={"title": f"Paper {idx}"})
+        zotero_db.add_attachment(parent, f"PDF0000{idx}", path="storage:paper.pdf")
+        pdf_path = tmp_path / "storage" / f"PDF0000{idx}" / "paper.pdf"
+        pdf_path.parent.mkdir(parents=True)
+        doc = pymupdf.open()
+        doc.new_page().insert_text((72, 72), f"Body of paper {idx}")
+        doc.save(pdf_path)
+        doc.close()
+    config_path = _write_config(tmp_path, auto_update=True, update_frequency="daily")
+    engine = ZoteroSemanticSearch(config_path=config_path, db_path=str(zotero_db.path))
+    # What the CLI's db-update does by default
+    built = engine.update_database(extract_fulltext=True)
+    assert built["processed_items"] > 0
+    engine.chroma_client.reset_mock()
+
+    scheduler = IndexUpdateScheduler(
+        config_path=config_path, engine_factory=lambda: engine, idle_seconds=0
+    )
+    scheduler.is_due = lambda: True
+    stats = scheduler.run_once()
+
+    assert stats["processed_items"] == 0
+    engine.chroma_client.delete_documents.assert_not_called()
+    engine.close()
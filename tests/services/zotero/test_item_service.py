@@ -36,3 +36,64 @@ async def test_get_all_items_uses_api_for_child_item_types_when_local_db_enabled
     assert len(result) == 1
     assert result[0].key == "N1"
     assert result[0].item_type == "note"
+
+
+@pytest.mark.asyncio
+async def test_reads_use_local_database_and_fall_back_to_api(zotero_db):
+    from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient
+
+    parent = zotero_db.add_item("ITEM0001", fields={"title": "Local title"})
+    zotero_db.add_attachment(parent, "ATT00001", path="storage:a.pdf")
+    api_client = MagicMock()
+    api_client.get_item = AsyncMock(return_value={"key": "REMOTE01", "data": {}})
+    api_client.get_item_children = AsyncMock()
+    api_client.get_tags = AsyncMock()
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as local_client:
+        service = ItemService(api_client=api_client, local_client=local_client)
+        bundle = await service.get_item_bundle("ITEM0001")
+        remote = await service.get_item("REMOTE01")
+        tags = await service.get_tags()
+
+    assert bundle["metadata"]["data"]["title"] == "Local title"
+    assert [a["key"] for a in bundle["attachments"]] == ["ATT00001"]
+    assert bundle["annotations"] == []
+    api_client.get_item_children.assert_not_called()
+    api_client.get_tags.assert_not_called()
+    # Items missing from the local database are fetched from the API
+    assert remote["key"] == "REMOTE01"
+    api_client.get_item.assert_awaited_once_with("REMOTE01")
+    assert tags == []
+
+
+@pytest.mark.asyncio
+async def test_get_item_for_update_reads_from_api(zotero_db):
+    from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient
+
+    zotero_db.add_item("ITEM0001", fields={"title": "Local title"}, version=3)
+    api_client = MagicMock()
+    api_client.get_item = AsyncMock(
+        return_value={"key": "ITEM0001", "version": 7, "data": {"version": 7}}
+    )
+
+    with LocalDatabaseClient(db_path=zotero_db.path) as local_client:
+        service = ItemService(api_client=api_client, local_client=local_client)
+        local = await service.get_item("ITEM0001")
+        fresh = await service.get_item("ITEM0001", for_update=True)
+
+    assert local["version"] == 3
+    assert fresh["version"] == 7
+    api_client.get_item.assert_awaited_once_with("ITEM0001")
+
+
+@pytest.mark.asyncio
+async def test_get_all_items_pages_and_filters_in_local_database():
+    local_client = MagicMock()
+    local_client.get_items = MagicMock(return_value=[])
+    service = ItemService(api_client=MagicMock(), local_client=local_client)
+
+    await service.get_all_items(limit=20, start=4000, item_type="book")
+
+    local_client.get_items.assert_called_once_with(
+        limit=20, offset=4000, item_type="book", include_fulltext=False
+    )
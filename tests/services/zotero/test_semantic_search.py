@@ -1,4 +1,6 @@
+import os
 from pathlib import Path
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -24,6 +26,11 @@ def semantic_search(monkeypatch, tmp_path):
     return ZoteroSemanticSearch(config_path=str(tmp_path / "config.json"))
 
 
+def _stream(documents):
+    """Document source shaped like _iter_items_from_source (a generator)."""
+    yield from documents
+
+
 def test_should_update_daily_with_invalid_last_update(semantic_search):
     semantic_search.update_config = {
         "auto_update": True,
@@ -148,9 +155,11 @@ def test_get_items_from_local_db_builds_note_and_pdf_fragments(
         extra = ""
         date_added = "2026-02-23T00:00:00"
         date_modified = "2026-02-23T00:00:00"
+        date = "2026"
         creators = "Smith, Alice"
         notes = "legacy note field"
         tags = ["t1"]
+        collections = []
         annotations = []
 
     class FakeLocalDatabaseClient:
@@ -166,6 +175,9 @@ def test_get_items_from_local_db_builds_note_and_pdf_fragments(
         def get_items(self, limit=None, include_fulltext=False):
             return [FakeItem()]
 
+        def get_item_stamps(self):
+            return {1: ("ITEM1", "2026-02-23T00:00:00#2")}
+
         def get_item_notes(self, parent_item_id):
             return [{"key": "NOTE1", "note": "<p>Note content</p>"}]
 
@@ -186,8 +198,7 @@ def test_get_items_from_local_db_builds_note_and_pdf_fragments(
     )
 
     assert any(
-        not row.get("__semantic_fragment__") and row["key"] == "ITEM1"
-        for row in rows
+        not row.get("__semantic_fragment__") and row["key"] == "ITEM1" for row in rows
     )
     fragment_types = {
         row["metadata"]["fragment_type"]
@@ -295,3 +306,713 @@ def test_collect_local_fragments_skips_pdf_on_memory_error(
 
     assert len(records) == 1
     assert records[0]["metadata"]["fragment_type"] == "note"
+
+
+def test_update_database_upserts_while_source_is_streaming(semantic_search):
+    events: list[str] = []
+
+    def fake_source(**_kwargs):
+        for idx in range(120):
+            events.append(f"produce-{idx}")
+            yield {"key": f"ITEM{idx}", "data": {"title": f"Title {idx}"}}
+
+    def fake_upsert(documents, metadatas, ids):
+        events.append(f"upsert-{len(ids)}")
+
+    semantic_search.UPSERT_BATCH_SIZE = 50
+    semantic_search._iter_items_from_source = fake_source
+    semantic_search.chroma_client.upsert_documents = MagicMock(side_effect=fake_upsert)
+
+    stats = semantic_search.update_database()
+
+    assert events.index("upsert-50") < events.index("produce-50")
+    assert [e for e in events if e.startswith("upsert")] == [
+        "upsert-50",
+        "upsert-50",
+        "upsert-20",
+    ]
+    assert stats["total_documents"] == 120
+    assert stats["processed_items"] == 120
+
+
+def test_update_database_reports_error_raised_mid_stream(semantic_search):
+    def failing_source(**_kwargs):
+        for idx in range(60):
+            yield {"key": f"ITEM{idx}", "data": {"title": f"Title {idx}"}}
+        msg = "database disappeared"
+        raise RuntimeError(msg)
+
+    semantic_search.UPSERT_BATCH_SIZE = 50
+    semantic_search._iter_items_from_source = failing_source
+    semantic_search.chroma_client.upsert_documents = MagicMock()
+
+    stats = semantic_search.update_database()
+
+    assert stats["error"] == "database disappeared"
+    assert stats["added_items"] == 50
+    assert semantic_search.update_config["last_update"] is None
+
+
+def _upserted_ids(chroma):
+    return [
+        doc_id
+        for call in chroma.upsert_documents.call_args_list
+        for doc_id in call.args[2]
+    ]
+
+
+def _deleted_ids(chroma):
+    return [
+        doc_id
+        for call in chroma.delete_documents.call_args_list
+        for doc_id in call.args[0]
+    ]
+
+
+def test_update_database_local_is_incremental(semantic_search, zotero_db, monkeypatch):
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.is_local_mode", lambda: True
+    )
+    semantic_search.db_path = str(zotero_db.path)
+    chroma = semantic_search.chroma_client
+    first = zotero_db.add_item("ITEM0001", fields={"title": "Battery cathodes"})
+    note = zotero_db.add_note(first, "NOTE0001", "<p>Cathode note</p>")
+    second = zotero_db.add_item("ITEM0002", fields={"title": "Solid electrolytes"})
+
+    semantic_search.update_database()
+    assert sorted(_upserted_ids(chroma)) == [
+        "ITEM0001",
+        "ITEM0001::note::NOTE0001::1",
+        "ITEM0002",
+    ]
+
+    chroma.reset_mock()
+    stats = semantic_search.update_database()
+    assert stats["total_documents"] == 0
+    chroma.upsert_documents.assert_not_called()
+
+    zotero_db.delete(note)
+    zotero_db.delete(second)
+    zotero_db.touch(first, "2026-03-01 00:00:00")
+    chroma.reset_mock()
+    semantic_search.update_database()
+
+    assert _upserted_ids(chroma) == ["ITEM0001"]
+    assert sorted(_deleted_ids(chroma)) == ["ITEM0001::note::NOTE0001::1", "ITEM0002"]
+    assert set(semantic_search.manifest.get_stamps()) == {"ITEM0001"}
+
+
+def test_update_database_api_uses_since_library_version(semantic_search, monkeypatch):
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.is_local_mode", lambda: False
+    )
+    zotero = semantic_search.zotero_client
+    chroma = semantic_search.chroma_client
+    semantic_search.manifest.set_meta(
+        "metadata_version", str(semantic_search.METADATA_VERSION)
+    )
+    semantic_search.manifest.set_meta("library_version", "5")
+    semantic_search.manifest.record_items([("GONE0001", "3", ["GONE0001"])])
+    zotero.last_modified_version.return_value = 9
+    zotero.deleted.return_value = {"items": ["GONE0001"]}
+    zotero.items.side_effect = [
+        [{"key": "NEW00001", "version": 9, "data": {"title": "New paper"}}],
+    ]
+
+    semantic_search.update_database(scan_limit=10)
+
+    zotero.items.assert_called_once_with(start=0, limit=10, since=5)
+    zotero.deleted.assert_called_once_with(since=5)
+    assert _deleted_ids(chroma) == ["GONE0001"]
+    assert _upserted_ids(chroma) == ["NEW00001"]
+    assert semantic_search.manifest.get_meta("library_version") == "9"
+    assert semantic_search.manifest.get_stamps() == {"NEW00001": "9"}
+
+
+def test_enrich_search_results_batches_and_caches_parent_items(semantic_search):
+    zotero = semantic_search.zotero_client
+    zotero.items = MagicMock(
+        return_value=[
+            {"key": "ITEM1", "data": {"title": "First"}},
+            {"key": "ITEM2", "data": {"title": "Second"}},
+        ]
+    )
+    chroma_results = {
+        "ids": [["ITEM1::pdf::PDF1::1", "ITEM2", "ITEM1::note::NOTE1::1", "GONE"]],
+        "distances": [[0.1, 0.2, 0.3, 0.4]],
+        "documents": [["a", "b", "c", "d"]],
+        "metadatas": [
+            [
+                {"item_key": "ITEM1"},
+                {"item_key": "ITEM2"},
+                {"item_key": "ITEM1"},
+                {"item_key": "GONE"},
+            ]
+        ],
+    }
+
+    enriched = semantic_search._enrich_search_results(chroma_results, query="q")
+    semantic_search._enrich_search_results(chroma_results, query="q")
+
+    zotero.items.assert_called_once_with(itemKey="ITEM1,ITEM2,GONE", limit=3)
+    assert [r["zotero_item"]["data"]["title"] for r in enriched[:3]] == [
+        "First",
+        "Second",
+        "First",
+    ]
+    assert enriched[3]["error"] == "Item not found: GONE"
+
+
+def test_enrich_search_results_reads_local_db_in_local_mode(
+    semantic_search, zotero_db, monkeypatch
+):
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.is_local_mode", lambda: True
+    )
+    semantic_search.db_path = str(zotero_db.path)
+    zotero_db.add_item("ITEM0001", fields={"title": "Battery cathodes"})
+    chroma_results = {
+        "ids": [["ITEM0001"]],
+        "distances": [[0.1]],
+        "documents": [["doc"]],
+        "metadatas": [[{"item_key": "ITEM0001"}]],
+    }
+
+    enriched = semantic_search._enrich_search_results(chroma_results, query="q")
+
+    assert enriched[0]["zotero_item"]["data"]["title"] == "Battery cathodes"
+    semantic_search.zotero_client.item.assert_not_called()
+    semantic_search.zotero_client.items.assert_not_called()
+
+
+def test_get_semantic_search_reuses_engine_until_config_changes(monkeypatch, tmp_path):
+    from zotero_mcp.services.zotero import semantic_search as module
+
+    created = []
+
+    def fake_create(config_path=None, db_path=None):
+        engine = ZoteroSemanticSearch.__new__(ZoteroSemanticSearch)
+        engine.config_path = config_path
+        engine.config_mtime = engine._read_config_mtime()
+        engine.close = MagicMock()
+        created.append(engine)
+        return engine
+
+    monkeypatch.setattr(module, "create_semantic_search", fake_create)
+    module.reset_semantic_search()
+    config_path = tmp_path / "config.json"
+    config_path.write_text("{}")
+
+    first = module.get_semantic_search(str(config_path))
+    assert module.get_semantic_search(str(config_path)) is first
+
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = module.get_semantic_search(str(config_path))
+
+    assert second is not first
+    assert len(created) == 2
+    # The replaced engine is closed once its running update is done
+    first.close.assert_called_once_with()
+    module.reset_semantic_search()
+    second.close.assert_called_once_with()
+
+
+def test_engines_of_one_index_share_the_update_lock(semantic_search):
+    again = ZoteroSemanticSearch(config_path=semantic_search.config_path)
+    other = ZoteroSemanticSearch(config_path=semantic_search.config_path + ".2")
+
+    assert again._update_lock is semantic_search._update_lock
+    assert other._update_lock is not semantic_search._update_lock
+
+
+def test_updates_of_one_index_exclude_each_other_across_processes(semantic_search):
+    # Another process: its own thread lock, the same manifest and lock file
+    cli = ZoteroSemanticSearch(config_path=semantic_search.config_path, db_path="cli")
+    assert cli._update_lock is not semantic_search._update_lock
+
+    with semantic_search._exclusive_update():
+        with pytest.raises(RuntimeError, match="Another process"):
+            cli.collect_garbage(lock_timeout=0.1)
+
+        def run_cli_update():
+            with cli._exclusive_update(lock_timeout=1):
+                pass
+
+        # The paused run must not resume after the other process's run
+        with pytest.raises(InterruptedError, match="Another index update"):
+            semantic_search._pause(run_cli_update)
+    cli.close()
+
+
+def test_close_waits_for_running_update_and_stops_paused_run(semantic_search):
+    semantic_search._update_lock.acquire()
+    closer = threading.Thread(target=semantic_search.close)
+    closer.start()
+    closer.join(timeout=0.2)
+    # A running update holds the lock, so close waits for it
+    assert closer.is_alive()
+    semantic_search._update_lock.release()
+    closer.join(timeout=5)
+    assert not closer.is_alive()
+
+    with semantic_search._exclusive_update():
+        with pytest.raises(InterruptedError, match="closed"):
+            semantic_search._pause(lambda: None)
+
+
+def test_saving_update_config_keeps_engine_current(semantic_search):
+    semantic_search.update_config["last_update"] = "2026-03-01T00:00:00"
+    semantic_search._save_update_config()
+
+    assert semantic_search.config_mtime is not None
+    assert semantic_search.config_mtime == semantic_search._read_config_mtime()
+
+
+def test_hybrid_search_fuses_vector_and_lexical_rankings(semantic_search):
+    chroma = semantic_search.chroma_client
+    chroma.search.return_value = {
+        "ids": [["V1", "BOTH"]],
+        "documents": [["vector one", "shared"]],
+        "metadatas": [[{"item_key": "V1"}, {"item_key": "BOTH"}]],
+        "distances": [[0.1, 0.2]],
+    }
+    chroma.lexical_search.return_value = [
+        {
+            "id": "BOTH",
+            "document": "shared",
+            "metadata": {"item_key": "BOTH"},
+            "score": 9.0,
+        },
+        {
+            "id": "DOI",
+            "document": "10.1/abc",
+            "metadata": {"item_key": "DOI"},
+            "score": 5.0,
+        },
+    ]
+
+    fused = semantic_search._hybrid_search("10.1/abc", limit=3, filters={"year": 2020})
+
+    assert fused["ids"] == [["BOTH", "V1", "DOI"]]
+    assert fused["distances"][0][0] < fused["distances"][0][1]
+    chroma.search.assert_called_once_with(
+        query_texts=["10.1/abc"], n_results=12, where={"year": 2020}
+    )
+    chroma.lexical_search.assert_called_once_with(
+        "10.1/abc", n_results=12, where={"year": 2020}
+    )
+
+
+def test_hybrid_search_honours_lexical_weight(semantic_search):
+    chroma = semantic_search.chroma_client
+    chroma.search.return_value = {
+        "ids": [["V1"]],
+        "documents": [["vector"]],
+        "metadatas": [[{}]],
+        "distances": [[0.1]],
+    }
+    chroma.lexical_search.return_value = [
+        {"id": "L1", "document": "lexical", "metadata": {}, "score": 1.0}
+    ]
+    semantic_search.search_config["lexical_weight"] = 2.0
+
+    fused = semantic_search._hybrid_search("q", limit=2, filters=None)
+
+    assert fused["ids"] == [["L1", "V1"]]
+
+
+def test_search_collapses_fragments_to_distinct_parents(semantic_search):
+    chroma = semantic_search.chroma_client
+    chroma.search.return_value = {
+        "ids": [["A::pdf::P::1", "A::pdf::P::2", "B", "A::note::N::1", "C"]],
+        "documents": [["a1", "a2", "b", "a3", "c"]],
+        "metadatas": [
+            [
+                {"item_key": "A"},
+                {"item_key": "A"},
+                {"item_key": "B"},
+                {"item_key": "A"},
+                {"item_key": "C"},
+            ]
+        ],
+        "distances": [[0.1, 0.15, 0.2, 0.25, 0.3]],
+        "embeddings": [[[1, 0], [1, 0], [0, 1], [1, 0], [0.6, 0.8]]],
+    }
+    semantic_search.zotero_client.items = MagicMock(
+        return_value=[{"key": key, "data": {}} for key in ("A", "B", "C")]
+    )
+
+    result = semantic_search.search("q", limit=2, collapse_parents=True)
+
+    assert chroma.search.call_args.kwargs["n_results"] == 10
+    assert "embeddings" in chroma.search.call_args.kwargs["include"]
+    assert [(r["item_key"], r["fragment_count"]) for r in result["results"]] == [
+        ("A", 3),
+        ("B", 1),
+    ]
+    assert result["results"][0]["result_id"] == "A::pdf::P::1"
+
+
+def test_collapse_results_prefers_diverse_parents(semantic_search):
+    semantic_search.search_config["mmr_lambda"] = 0.5
+    results = {
+        "ids": [["A", "B", "C"]],
+        "documents": [["a", "b", "c"]],
+        "metadatas": [[{}, {}, {}]],
+        "distances": [[0.1, 0.12, 0.3]],
+        "embeddings": [[[1, 0], [1, 0.01], [0, 1]]],
+    }
+
+    collapsed = semantic_search._collapse_results(results, limit=2)
+
+    assert collapsed["ids"] == [["A", "C"]]
+    assert collapsed["fragment_counts"] == [[1, 1]]
+
+
+def test_search_many_runs_one_query_and_one_enrichment(semantic_search):
+    chroma = semantic_search.chroma_client
+    chroma.search.return_value = {
+        "ids": [["A", "B"], ["B::pdf::P::1", "C"]],
+        "documents": [["a", "b"], ["b1", "c"]],
+        "metadatas": [
+            [{"item_key": "A"}, {"item_key": "B"}],
+            [{"item_key": "B"}, {"item_key": "C"}],
+        ],
+        "distances": [[0.1, 0.2], [0.3, 0.4]],
+    }
+    zotero = semantic_search.zotero_client
+    zotero.items = MagicMock(
+        return_value=[{"key": key, "data": {"title": key}} for key in "ABC"]
+    )
+
+    result = semantic_search.search_many(["first", "second"], limit=2)
+
+    chroma.search.assert_called_once_with(
+        query_texts=["first", "second"], n_results=2, where=None, include=None
+    )
+    zotero.items.assert_called_once_with(itemKey="A,B,C", limit=3)
+    assert [search["query"] for search in result["searches"]] == ["first", "second"]
+    assert [
+        [r["item_key"] for r in search["results"]] for search in result["searches"]
+    ] == [["A", "B"], ["B", "C"]]
+
+
+def test_search_results_are_cached_until_index_changes(semantic_search):
+    chroma = semantic_search.chroma_client
+    chroma.search.return_value = {
+        "ids": [["ITEM1"]],
+        "documents": [["doc"]],
+        "metadatas": [[{"item_key": "ITEM1"}]],
+        "distances": [[0.1]],
+    }
+    semantic_search.zotero_client.item = MagicMock(
+        return_value={"key": "ITEM1", "data": {"title": "First"}}
+    )
+
+    first = semantic_search.search("q", limit=5)
+    first["results"].clear()
+    second = semantic_search.search("q", limit=5)
+    assert second is not first
+    assert second["total_found"] == len(second["results"]) == 1
+    semantic_search.search("q", limit=6)
+    assert chroma.search.call_count == 2
+
+    # A no-op update keeps the cache
+    semantic_search._iter_items_from_source = lambda **_kwargs: _stream([])
+    semantic_search.update_database()
+    semantic_search.search("q", limit=5)
+    assert chroma.search.call_count == 2
+
+    semantic_search._iter_items_from_source = lambda **_kwargs: _stream(
+        [{"key": "ITEM2", "data": {"title": "Second"}}]
+    )
+    semantic_search.update_database()
+    semantic_search.search("q", limit=5)
+    assert chroma.search.call_count == 3
+
+
+def test_build_metadata_filter_combines_conditions():
+    from zotero_mcp.services.zotero.semantic_search import build_metadata_filter
+
+    assert build_metadata_filter() is None
+    assert build_metadata_filter(item_type="book") == {"item_type": "book"}
+    assert build_metadata_filter(
+        filters={"has_fulltext": True},
+        collection_key="abc123",
+        tags=["Deep Learning", " "],
+        item_type=["book", "thesis"],
+        year_from=2015,
+        year_to=2020,
+    ) == {
+        "$and": [
+            {"has_fulltext": True},
+            {"collection:ABC123": True},
+            {"tag:deep learning": True},
+            {"item_type": {"$in": ["book", "thesis"]}},
+            {"year": {"$gte": 2015}},
+            {"year": {"$lte": 2020}},
+        ]
+    }
+
+
+def test_tag_filter_with_apostrophe_matches_indexed_items(tmp_path):
+    import numpy as np
+
+    from zotero_mcp.clients.database.compact_store import CompactVectorStore
+    from zotero_mcp.services.zotero.semantic_search import build_metadata_filter
+    from zotero_mcp.utils.data.mapper import ZoteroMapper
+
+    items = [
+        {"key": "ITEM1", "data": {"title": "Cohort A", "tags": [{"tag": "O'Brien"}]}},
+        {"key": "ITEM2", "data": {"title": "Cohort B", "tags": [{"tag": "Smith"}]}},
+    ]
+    store = CompactVectorStore(tmp_path / "store")
+    store.upsert(
+        ids=["ITEM1", "ITEM2"],
+        documents=["cohort study", "cohort study"],
+        metadatas=[ZoteroMapper.create_metadata(item) for item in items],
+        embeddings=np.eye(2, 8, dtype=np.float32),
+    )
+
+    where = build_metadata_filter(tags=["O'Brien "])
+    assert where == {"tag:o'brien": True}
+    results = store.query(
+        query_embeddings=np.ones((1, 8), dtype=np.float32), n_results=5, where=where
+    )
+    assert results["ids"] == [["ITEM1"]]
+    assert [hit["id"] for hit in store.search_text("cohort", where=where)] == ["ITEM1"]
+
+
+def test_update_database_indexes_collection_membership_and_reindexes_old_format(
+    semantic_search, zotero_db, monkeypatch
+):
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.is_local_mode", lambda: True
+    )
+    semantic_search.db_path = str(zotero_db.path)
+    chroma = semantic_search.chroma_client
+    item = zotero_db.add_item(
+        "ITEM0001", fields={"title": "Battery cathodes", "date": "2021-05-01"}
+    )
+    collection = zotero_db.add_collection("COLL0001", "Energy")
+    zotero_db.add_to_collection(collection, item)
+
+    semantic_search.update_database()
+    metadata = chroma.upsert_documents.call_args.args[1][0]
+    assert metadata["collection:COLL0001"] is True
+    assert metadata["year"] == 2021
+
+    # Indexes written before the current metadata format are rebuilt once
+    semantic_search.manifest.set_meta("metadata_version", "1")
+    chroma.reset_mock()
+    semantic_search.update_database()
+    assert _upserted_ids(chroma) == ["ITEM0001"]
+
+    chroma.reset_mock()
+    semantic_search.update_database()
+    chroma.upsert_documents.assert_not_called()
+
+
+def test_update_database_calls_pause_hook_between_batches(semantic_search):
+    semantic_search.UPSERT_BATCH_SIZE = 2
+    semantic_search._iter_items_from_source = lambda **_kwargs: _stream(
+        [{"key": f"ITEM{idx}", "data": {"title": f"Paper {idx}"}} for idx in range(5)]
+    )
+    pauses = []
+
+    stats = semantic_search.update_database(pause_hook=lambda: pauses.append(1))
+
+    assert "error" not in stats
+    assert stats["total_items"] == 5
+    assert len(pauses) == 3
+
+
+def test_update_database_builds_lexical_index_in_hybrid_mode(semantic_search):
+    chroma = semantic_search.chroma_client
+    chroma.ensure_lexical_index.return_value = 1.234
+    semantic_search._iter_items_from_source = lambda **_kwargs: _stream(
+        [{"key": "ITEM1", "data": {"title": "Paper"}}]
+    )
+
+    stats = semantic_search.update_database()
+    chroma.ensure_lexical_index.assert_not_called()
+    assert "lexical_index_seconds" not in stats
+
+    semantic_search.search_config["mode"] = "hybrid"
+    stats = semantic_search.update_database()
+    chroma.ensure_lexical_index.assert_called_once_with()
+    assert stats["lexical_index_seconds"] == 1.23
+
+
+def test_update_database_batches_by_character_budget(semantic_search):
+    semantic_search.extraction_config["batch_chars"] = 1000
+    semantic_search._iter_items_from_source = lambda **_kwargs: _stream(
+        [
+            {"key": "BIG00001", "data": {"title": "x" * 900}},
+            {"key": "BIG00002", "data": {"title": "y" * 900}},
+        ]
+        + [{"key": f"NOTE{idx:04d}", "data": {"title": "z" * 20}} for idx in range(30)]
+    )
+    batch_sizes = []
+    semantic_search.chroma_client.upsert_documents = MagicMock(
+        side_effect=lambda documents, metadatas, ids: batch_sizes.append(len(ids))
+    )
+
+    stats = semantic_search.update_database()
+
+    # The two long documents do not fit one budget; short notes fill batches
+    assert batch_sizes[0] == 1
+    assert max(batch_sizes) > 2
+    assert sum(batch_sizes) == 32
+    assert stats["upsert_seconds"] >= 0
+
+
+def test_backfill_fulltext_indexes_pdf_tails_by_recency_and_resumes(
+    semantic_search, zotero_db, monkeypatch
+):
+    from zotero_mcp.clients.zotero.local_db import LocalDatabaseClient
+
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.is_local_mode", lambda: True
+    )
+    monkeypatch.setattr(
+        "zotero_mcp.clients.zotero.local_db.get_fulltext_cache", lambda: None
+    )
+    monkeypatch.setattr(
+        LocalDatabaseClient, "_parse_pdf_text", lambda self, path: "First pages."
+    )
+    monkeypatch.setattr(
+        LocalDatabaseClient,
+        "_parse_pdf_tail_text",
+        lambda self, path: f"Remaining pages of {path.parent.name}.",
+    )
+    semantic_search.db_path = str(zotero_db.path)
+    chroma = semantic_search.chroma_client
+    items = []
+    for idx, modified in enumerate(["2026-01-01 00:00:00", "2026-02-01 00:00:00"]):
+        item = zotero_db.add_item(f"ITEM000{idx}", date_modified=modified)
+        zotero_db.add_attachment(item, f"PDF0000{idx}", path="storage:paper.pdf")
+        items.append(item)
+        pdf = zotero_db.path.parent / "storage" / f"PDF0000{idx}" / "paper.pdf"
+        pdf.parent.mkdir(parents=True)
+        pdf.write_bytes(b"%PDF")
+    zotero_db.add_item("ITEM0009")
+
+    semantic_search.update_database(extract_fulltext=True)
+    assert "ITEM0001::pdf::PDF00001::1" in _upserted_ids(chroma)
+    chroma.get_collection_info.return_value = {"count": 5}
+    status = semantic_search.get_database_status()
+    assert status["fulltext_backfill"]["pending_items"] == 3
+
+    # Most recently modified item first; items without PDFs need no work
+    chroma.reset_mock()
+    stats = semantic_search.backfill_fulltext(max_items=1)
+    assert _upserted_ids(chroma) == ["ITEM0001::pdf::PDF00001:tail::1"]
+    assert chroma.upsert_documents.call_args.args[0] == ["Remaining pages of PDF00001."]
+    assert stats["remaining_items"] == 1
+
+    chroma.reset_mock()
+    stats = semantic_search.backfill_fulltext()
+    assert _upserted_ids(chroma) == ["ITEM0000::pdf::PDF00000:tail::1"]
+    assert stats["remaining_items"] == 0
+
+    chroma.reset_mock()
+    assert semantic_search.backfill_fulltext()["pending_items"] == 0
+    chroma.upsert_documents.assert_not_called()
+
+    # Reindexing an item drops its tail, which is backfilled again
+    zotero_db.touch(items[0], "2026-03-01 00:00:00")
+    chroma.reset_mock()
+    semantic_search.update_database(extract_fulltext=True)
+    assert "ITEM0000::pdf::PDF00000:tail::1" in _deleted_ids(chroma)
+    assert list(semantic_search.pending_backfill()) == ["ITEM0000"]
+
+
+def test_collect_garbage_removes_orphans_and_stale_chunks(semantic_search, monkeypatch):
+    monkeypatch.setattr(
+        "zotero_mcp.services.zotero.semantic_search.is_local_mode", lambda: False
+    )
+    chroma = semantic_search.chroma_client
+    chroma.iter_document_ids.side_effect = lambda page_size: iter(
+        [
+            ["ITEM0001", "ITEM0001::pdf::PDF1::1", "ITEM0001::pdf::PDF1::2"],
+            ["ITEM0001::pdf::OLD1::1", "GONE0001", "GONE0001::note::N1::1"],
+            ["NEW00001", "NEW00001::note::N2::1"],
+        ]
+    )
+    chroma.storage_bytes.side_effect = [5000, 5000, 5000, 3000]
+    semantic_search.zotero_client.item_versions.return_value = {
+        "ITEM0001": 3,
+        "NEW00001": 4,
+    }
+    semantic_search.manifest.record_items(
+        [
+            ("ITEM0001", "s1", ["ITEM0001", "ITEM0001::pdf::PDF1::1"]),
+            ("GONE0001", "s2", ["GONE0001", "GONE0001::note::N1::1"]),
+        ]
+    )
+
+    preview = semantic_search.collect_garbage(dry_run=True)
+    assert preview["orphaned_documents"] == 2
+    assert preview["stale_documents"] == 2
+    chroma.delete_documents.assert_not_called()
+
+    stats = semantic_search.collect_garbage()
+
+    assert sorted(_deleted_ids(chroma)) == [
+        "GONE0001",
+        "GONE0001::note::N1::1",
+        "ITEM0001::pdf::OLD1::1",
+        "ITEM0001::pdf::PDF1::2",
+    ]
+    assert stats["scanned_documents"] == 8
+    assert stats["removed_documents"] == 4
+    assert stats["removed_items"] == 1
+    assert stats["bytes_reclaimed"] == 2000
+    chroma.vacuum.assert_called_once()
+    assert set(semantic_search.manifest.get_stamps()) == {"ITEM0001"}
+
+
+def test_update_tool_call_runs_while_scheduled_update_is_paused(semantic_search):
+    from zotero_mcp.services.zotero.index_scheduler import IndexUpdateScheduler
+
+    reached_pause = threading.Event()
+    tool_call_started = threading.Event()
+    runs = []
+
+    def fake_update_database(pause_hook=None, **kwargs):
+        runs.append("scheduled" if pause_hook else "tool")
+        if pause_hook is not None:
+            reached_pause.set()
+            tool_call_started.wait(5)
+            semantic_search._pause(pause_hook)
+        return {"processed_items": 1}
+
+    semantic_search._update_database = fake_update_database
+    scheduler = IndexUpdateScheduler(
+        engine_factory=lambda: semantic_search, idle_seconds=0.05
+    )
+    scheduler.is_due = lambda: True
+    background = threading.Thread(target=scheduler.run_once)
+    background.start()
+    assert reached_pause.wait(5)
+
+    with scheduler.interactive():
+        tool_call_started.set()
+        # Previously blocked forever on the lock held by the paused run
+        stats = semantic_search.update_database(lock_timeout=5)
+
+    background.join(timeout=5)
+    assert not background.is_alive()
+    assert stats == {"processed_items": 1}
+    assert runs == ["scheduled", "tool"]
+    # The paused run stops instead of resuming with stale state
+    assert "Another index update ran" in scheduler.status()["last_error"]
+    assert semantic_search._update_lock.acquire(blocking=False)
+
+
+def test_update_fails_fast_while_another_update_holds_the_lock(semantic_search):
+    with semantic_search._update_lock:
+        with pytest.raises(RuntimeError, match="already running"):
+            semantic_search.collect_garbage(lock_timeout=0)
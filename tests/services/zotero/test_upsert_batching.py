@@ -0,0 +1,49 @@
+from zotero_mcp.services.zotero.upsert_batching import AdaptiveBatcher
+
+
+def _docs(*sizes):
+    return [{"size": size} for size in sizes]
+
+
+def _sizes(batches):
+    return [[doc["size"] for doc in batch] for batch in batches]
+
+
+def test_batches_are_cut_by_char_budget_and_document_cap():
+    batcher = AdaptiveBatcher(initial_chars=100, min_chars=10, max_documents=3)
+
+    batches = batcher.batches(_docs(60, 30, 20, 250, 1, 1, 1, 1), lambda d: d["size"])
+
+    assert _sizes(batches) == [[60, 30], [20], [250], [1, 1, 1], [1]]
+
+
+def test_budget_changes_apply_to_the_next_batch():
+    batcher = AdaptiveBatcher(initial_chars=100, min_chars=10)
+    batches = batcher.batches(_docs(*[50] * 8), lambda d: d["size"])
+
+    assert _sizes([next(batches)]) == [[50, 50]]
+    batcher.budget = 200
+    assert _sizes([next(batches)]) == [[50, 50, 50, 50]]
+
+
+def test_record_climbs_while_throughput_improves_and_turns_back():
+    batcher = AdaptiveBatcher(initial_chars=1000, min_chars=100, max_chars=100_000)
+
+    batcher.record(1000, 1.0)  # 1000 chars/s
+    assert batcher.budget == 1500
+    batcher.record(1500, 1.0)  # faster: keep growing
+    assert batcher.budget == 2250
+    batcher.record(2250, 3.0)  # slower: turn around
+    assert batcher.budget == 1500
+
+    # Partially filled batches do not steer the budget
+    batcher.record(100, 0.01)
+    assert batcher.budget == 1500
+
+
+def test_slow_batches_shrink_the_budget_to_the_latency_target():
+    batcher = AdaptiveBatcher(initial_chars=40_000, min_chars=1_000, max_seconds=2.0)
+
+    batcher.record(40_000, 8.0)
+
+    assert batcher.budget == 10_000
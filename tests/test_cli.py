@@ -281,10 +281,12 @@ def test_tags_set_status_replaces_existing_status_tags(monkeypatch):
     class _FakeDataService:
         def __init__(self) -> None:
             self.get_item_key: str | None = None
+            self.for_update = False
             self.updated_item: dict | None = None
 
-        async def get_item(self, item_key: str) -> dict:
+        async def get_item(self, item_key: str, for_update: bool = False) -> dict:
             self.get_item_key = item_key
+            self.for_update = for_update
             return {
                 "key": item_key,
                 "data": {
@@ -320,6 +322,7 @@ def test_tags_set_status_replaces_existing_status_tags(monkeypatch):
 
     assert exit_code == 0
     assert fake.get_item_key == "ABC123"
+    assert fake.for_update is True
     assert fake.updated_item is not None
     assert fake.updated_item["data"]["tags"] == [
         {"tag": "focus/prep/synth"},
@@ -331,7 +334,7 @@ def test_tags_set_status_returns_error_for_invalid_status(monkeypatch):
     from zotero_mcp.cli_app.commands import tags
 
     class _FakeDataService:
-        async def get_item(self, item_key: str) -> dict:
+        async def get_item(self, item_key: str, for_update: bool = False) -> dict:
             return {"key": item_key, "data": {"tags": []}}
 
         async def update_item(self, item: dict) -> dict:
@@ -146,3 +146,28 @@ async def test_search_by_tag_returns_empty_when_include_tags_invalid(
     assert results == []
     mock_api_client.get_items_by_tag.assert_not_called()
 
+
+@pytest.mark.asyncio
+async def test_search_items_everything_uses_local_index_with_offset(
+    search_service, mock_local_client, mock_api_client
+):
+    local_item = MagicMock()
+    local_item.key = "LOCAL1"
+    local_item.title = "Local hit"
+    local_item.creators = ""
+    local_item.date_added = None
+    local_item.item_type = "journalArticle"
+    local_item.abstract = None
+    local_item.doi = None
+    local_item.tags = []
+    mock_local_client.search_items.return_value = [local_item]
+
+    results = await search_service.search_items(
+        "query", limit=10, offset=20, qmode="everything"
+    )
+
+    mock_local_client.search_items.assert_called_once_with(
+        "query", limit=10, offset=20, include_fulltext=False
+    )
+    mock_api_client.search_items.assert_not_called()
+    assert [item.key for item in results] == ["LOCAL1"]
@@ -43,3 +43,21 @@ def test_create_document_text_includes_fulltext_notes_tags_and_annotations():
     assert "PDF extracted content" in text
 
 
+def test_create_metadata_adds_filterable_year_tag_and_collection_keys():
+    item = {
+        "key": "ABCD1234",
+        "data": {
+            "itemType": "journalArticle",
+            "date": "March 2019",
+            "tags": [{"tag": "Machine  Learning"}, {"tag": " "}],
+            "collections": ["abc123", ""],
+        },
+    }
+
+    metadata = ZoteroMapper.create_metadata(item)
+
+    assert metadata["year"] == 2019
+    assert metadata["tag:machine learning"] is True
+    assert metadata["collection:ABC123"] is True
+    assert not any(key in metadata for key in ("tag:", "collection:"))
+    assert "year" not in ZoteroMapper.create_metadata({"data": {"date": "n.d."}})